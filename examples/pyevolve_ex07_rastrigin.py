@@ -4,6 +4,7 @@ from pyevolve.initializations.InitializationG1DList import G1DListInitializatorR
 from pyevolve.perturbations.MutatorG1DList import G1DListMutatorRealGaussian
 from pyevolve import Consts
 import math
+import numpy
 
 
 # This is the Rastrigin Function, a deception function
@@ -15,6 +16,13 @@ def rastrigin(genome):
     return (10 * n) + total
 
 
+# The same function, evaluating all the population at once, the
+# rows of the "genes" array are the individuals
+def rastrigin_batch(genes):
+    n = genes.shape[1]
+    return (10 * n) + (genes**2 - 10 * numpy.cos(2 * math.pi * genes)).sum(axis=1)
+
+
 def run_main():
     # Genome instance
     genome = G1DList.G1DList(20)
@@ -26,6 +34,7 @@ def run_main():
 
     # Genetic Algorithm Instance
     ga = GSimpleGA.GSimpleGA(genome)
+    ga.getPopulation().batchEvaluator.set(rastrigin_batch)
     ga.terminationCriteria.set(GSimpleGA.RawScoreCriteria)
     ga.setMinimax(Consts.minimaxType["minimize"])
     ga.setGenerations(3000)
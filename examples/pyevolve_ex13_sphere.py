@@ -12,6 +12,11 @@ def sphere(xlist):
     return total
 
 
+# The same function, evaluating all the population at once
+def sphere_batch(genes):
+    return (genes**2).sum(axis=1)
+
+
 def run_main():
     genome = G1DList.G1DList(140)
     genome.setParams(rangemin=-5.12, rangemax=5.13)
@@ -20,6 +25,7 @@ def run_main():
     genome.evaluator.set(sphere)
 
     ga = GSimpleGA.GSimpleGA(genome, seed=666)
+    ga.getPopulation().batchEvaluator.set(sphere_batch)
     ga.setMinimax(Consts.minimaxType["minimize"])
     ga.setGenerations(1500)
     ga.setMutationRate(0.01)
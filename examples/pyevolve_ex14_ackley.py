@@ -3,6 +3,7 @@ from pyevolve.initializations.InitializationG1DList import G1DListInitializatorR
 from pyevolve.perturbations.MutatorG1DList import G1DListMutatorRealGaussian
 from pyevolve import Consts, GSimpleGA
 import math
+import numpy
 
 
 # This is the Rastringin Function, a deception function
@@ -23,6 +24,14 @@ def ackley(xlist):
     return score
 
 
+# The same function, evaluating all the population at once, the
+# rows of the "genes" array are the individuals
+def ackley_batch(genes):
+    t1 = numpy.exp(-0.2 * numpy.sqrt((1.0 / 5.0) * (genes**2).sum(axis=1)))
+    t2 = numpy.exp((1.0 / 5.0) * numpy.cos(2.0 * math.pi * genes).sum(axis=1))
+    return 20 + math.exp(1) - 20 * t1 - t2
+
+
 def run_main():
     # Genome instance
     genome = G1DList.G1DList(5)
@@ -35,6 +44,7 @@ def run_main():
 
     # Genetic Algorithm Instance
     ga = GSimpleGA.GSimpleGA(genome)
+    ga.getPopulation().batchEvaluator.set(ackley_batch)
     ga.setMinimax(Consts.minimaxType["minimize"])
     ga.setGenerations(1000)
     ga.setMutationRate(0.04)
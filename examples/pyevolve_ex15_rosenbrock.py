@@ -12,6 +12,12 @@ def rosenbrock(xlist):
     return sum_var
 
 
+# The same function, evaluating all the population at once, the
+# rows of the "genes" array are the individuals
+def rosenbrock_batch(genes):
+    return (100.0 * (genes[:, 1:] - genes[:, :-1]**2)**2 + (1 - genes[:, :-1])**2).sum(axis=1)
+
+
 def run_main():
     # Genome instance
     genome = G1DList.G1DList(15)
@@ -24,6 +30,7 @@ def run_main():
 
     # Genetic Algorithm Instance
     ga = GSimpleGA.GSimpleGA(genome)
+    ga.getPopulation().batchEvaluator.set(rosenbrock_batch)
     ga.setMinimax(Consts.minimaxType["minimize"])
     ga.selector.set(Selectors.GRouletteWheel)
     ga.setGenerations(4000)
@@ -0,0 +1,42 @@
+# Run it with: mpirun -n 4 python pyevolve_ex34_mpi_async_migration.py
+from pyevolve.representations.G1DList import G1DList
+from pyevolve import GSimpleGA
+from pyevolve.Migration import AsyncMPIMigration
+
+
+# This function is the evaluation function, we want
+# to give high score to more zero'ed chromosomes
+def eval_func(genome):
+    score = 0.0
+    for value in genome:
+        if value == 0:
+            score += 1
+    return score
+
+
+def run_main():
+    genome = G1DList(50)
+    genome.setParams(rangemin=0, rangemax=10)
+    genome.evaluator.set(eval_func)
+
+    migration = AsyncMPIMigration()
+    migration.setMigrationRate(10)
+    migration.setNumIndividuals(5)
+    migration.setNumReplacement(5)
+
+    # Each node evolves its own island, with its own random stream
+    ga = GSimpleGA.GSimpleGA(genome, seed=42)
+    ga.setSeed(ga.spawnSeed(("node", migration.pid)))
+    ga.setGenerations(200)
+    ga.setMigrationAdapter(migration)
+
+    ga.evolve(freq_stats=50 if migration.pid == 0 else 0)
+
+    # The bests of the nodes are gathered on the node 0
+    if migration.pid == 0:
+        for node, best in enumerate(migration.getAllStars()):
+            print("Node %d best score: %.2f" % (node, best.score))
+
+
+if __name__ == "__main__":
+    run_main()
@@ -0,0 +1,264 @@
+"""
+
+:mod:`Checkpoint` -- the snapshots of the evolution
+=====================================================================
+
+This module writes and reads the checkpoints of the GA Engines (see
+:meth:`GSimpleGA.GSimpleGA.saveCheckpoint`). A checkpoint has the genotypes
+and the scores of the population, the current generation, the parameters of
+the engine, the state of the random number generators and the positions of
+the DB Adapter.
+
+The genotypes of the genomes which implement the *getGenotypeKey()* method,
+like the :class:`G1DList.G1DList` and the :class:`G2DList.G2DList`, are stored
+on flat arrays (:mod:`array` module) instead of pickled genome objects, the
+function slots and the parameters of the genomes are taken from the sample
+genome when the checkpoint is loaded. The other genomes, like the trees, are
+stored with the attributes returned by *getWireState()*.
+
+The files are written to a temporary file which replaces the checkpoint
+when it is complete, so a crash while writing keeps the previous checkpoint.
+
+"""
+
+import logging
+import os
+import pickle
+import random
+import threading
+from array import array
+
+from . import Util
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+#: The version of the checkpoint format
+CHECKPOINT_VERSION = 1
+
+# The array type codes of the genes, by the type of the genes
+_typeCodes = {int: "q", float: "d"}
+
+
+def _flatGenes(keys):
+    """ Returns the shape of the genotypes and the flat list of genes, the shape is
+    None when the genotypes haven't the same 1D or 2D shape """
+    first = keys[0]
+    if all(not isinstance(gene, tuple) for gene in first):
+        shape = (len(first),)
+        if any(len(key) != shape[0] for key in keys):
+            return None, None
+        return shape, [gene for key in keys for gene in key]
+
+    if not all(isinstance(row, tuple) for row in first):
+        return None, None
+    shape = (len(first), len(first[0]) if first else 0)
+    for key in keys:
+        if len(key) != shape[0] or any(len(row) != shape[1] or not isinstance(row, tuple) for row in key):
+            return None, None
+    return shape, [gene for key in keys for row in key for gene in row]
+
+
+def _packGenes(genes):
+    """ Returns the genes on an array, when they have the same numeric type,
+    or on a list """
+    gene_types = set(map(type, genes))
+    if len(gene_types) == 1:
+        typecode = _typeCodes.get(gene_types.pop())
+        if typecode is not None:
+            try:
+                return array(typecode, genes)
+            except OverflowError:
+                pass
+    return list(genes)
+
+
+def encodePopulation(population):
+    """ Returns the compact representation of the individuals of the population
+
+    :param population: the population (:class:`GPopulation.GPopulation`)
+    :rtype: a dict
+
+    """
+    individuals = population.internalPop
+    data = {
+        "size": len(individuals),
+        "scores": array("d", [ind.score for ind in individuals]),
+        "fitness": array("d", [ind.fitness for ind in individuals]),
+        "evaluated": bytes(bytearray(bool(ind.evaluated) for ind in individuals)),
+        "shape": None,
+        "genes": None,
+        "states": None,
+    }
+    if not individuals:
+        return data
+
+    keys = [ind.getGenotypeKey() for ind in individuals]
+    if all(isinstance(key, tuple) for key in keys):
+        shape, genes = _flatGenes(keys)
+        if shape is not None:
+            data["shape"] = shape
+            data["genes"] = _packGenes(genes)
+            return data
+
+    data["states"] = [ind.getWireState() for ind in individuals]
+    return data
+
+
+def decodePopulation(population, data):
+    """ Replaces the individuals of the population by the individuals stored
+    by :func:`encodePopulation`, they are cloned from the sample genome
+
+    :param population: the population (:class:`GPopulation.GPopulation`)
+    :param data: the dict returned by :func:`encodePopulation`
+
+    """
+    sample = population.oneSelfGenome
+    individuals = []
+
+    if data["states"] is not None:
+        for state in data["states"]:
+            genome = sample.clone()
+            for attr, value in state.items():
+                setattr(genome, attr, value)
+            individuals.append(genome)
+    else:
+        shape = data["shape"]
+        genes = data["genes"]
+        length = 1
+        for dimension in shape:
+            length *= dimension
+        for index in range(data["size"]):
+            flat = genes[index * length:(index + 1) * length]
+            if len(shape) == 1:
+                key = tuple(flat)
+            else:
+                key = tuple(tuple(flat[row * shape[1]:(row + 1) * shape[1]]) for row in range(shape[0]))
+            genome = sample.clone()
+            genome.setGenotypeKey(key)
+            individuals.append(genome)
+
+    for genome, score, fitness, evaluated in zip(individuals, data["scores"], data["fitness"], data["evaluated"]):
+        genome.score = score
+        genome.fitness = fitness
+        genome.evaluated = bool(evaluated)
+
+    population.internalPop = individuals
+    population.popSize = len(individuals)
+    population.clearFlags()
+
+
+def getRandomState():
+    """ Returns the state of the random number generators, the :mod:`random`
+    module and, when available, the numpy generator used by some operators
+
+    :rtype: a tuple with the states
+
+    """
+    return random.getstate(), (numpy.random.get_state() if HAS_NUMPY else None)
+
+
+def setRandomState(state):
+    """ Restores the state returned by :func:`getRandomState`
+
+    :param state: the tuple with the states
+
+    """
+    random.setstate(state[0])
+    if HAS_NUMPY and state[1] is not None:
+        numpy.random.set_state(state[1])
+
+
+def writeCheckpoint(path, snapshot):
+    """ Writes the snapshot to the file, the file is replaced only when the
+    snapshot is completely written
+
+    :param path: the checkpoint filename
+    :param snapshot: the dict with the state of the evolution
+
+    """
+    temp_path = "%s.tmp" % (path,)
+    with open(temp_path, "wb") as handle:
+        pickle.dump(snapshot, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+    logging.debug("The checkpoint of the generation %d was written on %s", snapshot["generation"], path)
+
+
+def readCheckpoint(path):
+    """ Reads the snapshot written by :func:`writeCheckpoint`
+
+    :param path: the checkpoint filename
+    :rtype: the dict with the state of the evolution
+
+    """
+    with open(path, "rb") as handle:
+        snapshot = pickle.load(handle)
+    if not isinstance(snapshot, dict) or snapshot.get("version") != CHECKPOINT_VERSION:
+        Util.raiseException("The file %s isn't a valid checkpoint" % (path,), ValueError)
+    return snapshot
+
+
+class CheckpointWriter(object):
+    """ CheckpointWriter Class - Writes the checkpoints on a background thread
+
+    Only one checkpoint is written at a time, when a new checkpoint is
+    requested while the previous one is still being written, it waits for it.
+
+    Example:
+       >>> writer = CheckpointWriter()
+       >>> writer.write("evolution.ckpt", snapshot)
+       >>> writer.wait()
+
+    """
+
+    def __init__(self):
+        """ The constructor of the CheckpointWriter """
+        self.thread = None
+        self.error = None
+
+    def __repr__(self):
+        """ The string representation of the writer """
+        return "CheckpointWriter [Writing: %s]" % (self.isWriting(),)
+
+    def isWriting(self):
+        """ Returns True if there is a checkpoint being written
+
+        :rtype: True or False
+
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def write(self, path, snapshot):
+        """ Starts the writing of the snapshot on the background
+
+        :param path: the checkpoint filename
+        :param snapshot: the dict with the state of the evolution
+
+        """
+        self.wait()
+        self.thread = threading.Thread(target=self.__run, args=(path, snapshot),
+                                       name="pyevolve-checkpoint", daemon=True)
+        self.thread.start()
+
+    def wait(self):
+        """ Waits for the checkpoint being written, the errors of the
+        writing are raised here """
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def __run(self, path, snapshot):
+        """ The body of the writer thread """
+        try:
+            writeCheckpoint(path, snapshot)
+        except Exception as error:
+            logging.error("The checkpoint %s couldn't be written: %s", path, error)
+            self.error = error
@@ -38,6 +38,26 @@ General constants
       >>> minmax = Consts.minimaxType["minimize"]
       >>> minmax = Consts.minimaxType["maximize"]
 
+.. attribute:: replacementType
+
+   The replacement scheme of the steady-state GA (:class:`GSteadyStateGA.GSteadyStateGA`),
+   the offspring replaces the worst individual or the loser of a tournament.
+
+   Example:
+      >>> replacement = Consts.replacementType["worst"]
+      >>> replacement = Consts.replacementType["tournament"]
+
+.. attribute:: duplicatesPolicy
+
+   What the GA Engine does with the duplicated offspring of a generation (see
+   :meth:`GSimpleGA.GSimpleGA.setDuplicatesPolicy`), keeps them, mutates them
+   again or replaces them by new random individuals.
+
+   Example:
+      >>> policy = Consts.duplicatesPolicy["none"]
+      >>> policy = Consts.duplicatesPolicy["mutate"]
+      >>> policy = Consts.duplicatesPolicy["replace"]
+
 .. attribute:: CDefESCKey
 
    The ESC key ASCII code. Used to start Interactive Mode.
@@ -119,6 +139,34 @@ Population constants (:class:`GPopulation.GPopulation`)
 
    Default scaling scheme.
 
+.. attribute:: CDefFitnessCacheSize
+
+   Default maximum number of scores kept by the fitness cache (:class:`FitnessCache.FitnessCache`).
+
+.. attribute:: CDefAsyncConcurrency
+
+   Default maximum number of concurrent evaluations of the "async" evaluation backend.
+
+.. attribute:: CDefEvalRetries
+
+   Default number of times the evaluation of an individual is retried after a failure
+   or a timeout on the "async" evaluation backend.
+
+.. attribute:: CDefStatsImprovementWindow
+
+   The number of generations of the *rawImprovement* statistic, see :class:`Statistics.Statistics`.
+
+.. attribute:: CDefDuplicatesRetries
+
+   The maximum number of times a duplicated individual is initialized again by the
+   *full_diversity* population initialization, or mutated again (or replaced) by the
+   duplicates policy of the GA Engine, before it's kept as a duplicate.
+
+.. attribute:: CDefPoolChunkTime
+
+   The target time (in seconds) spent by a worker process on each chunk of individuals
+   when the population is evaluated with the unordered multiprocessing mode.
+
 
 1D Binary String Defaults (:class:`G1DBinaryString.G1DBinaryString`)
 ----------------------------------------------------------------------------
@@ -265,6 +313,21 @@ GA Engine constants (:class:`GSimpleGA.GSimpleGA`)
 
    Default selector method.
 
+.. attribute:: CDefGADuplicatesPolicy
+
+   Default duplicates policy, the duplicated offspring are kept.
+
+Steady-state GA Engine constants (:class:`GSteadyStateGA.GSteadyStateGA`)
+----------------------------------------------------------------------------
+
+.. attribute:: CDefSSGAOffspring
+
+   Default number of offspring created on each step.
+
+.. attribute:: CDefSSGAReplacement
+
+   Default replacement scheme.
+
 DB Adapters constants (:mod:`DBAdapters`)
 ----------------------------------------------------------------------------
 Constants for the DB Adapters
@@ -376,6 +439,24 @@ Migration Constants (:mod:`Migration`)
 
    The default number of individuals to be replaced at the migration stage
 
+Network Constants (:mod:`Network`)
+----------------------------------------------------------------------------
+.. attribute:: CDefNetworkFlushInterval
+
+   The seconds the outgoing individuals wait to be batched on the datagrams
+
+.. attribute:: CDefNetworkMaxAge
+
+   The seconds the individuals received wait to be taken by the migration, the older ones are dropped
+
+.. attribute:: CDefNetworkMaxDatagram
+
+   The maximum size in bytes of the datagrams sent
+
+.. attribute:: CDefNetworkMaxMessage
+
+   The maximum size in bytes of the decompressed messages received
+
 
 """
 import logging
@@ -412,6 +493,22 @@ minimaxType = {"minimize": 0,
                "maximize": 1
                }
 
+# Replacement schemes of the steady-state GA
+# - worst: the offspring replaces the worst individual
+# - tournament: the offspring replaces the loser of a tournament
+replacementType = {"worst": 0,
+                   "tournament": 1
+                   }
+
+# Duplicates policies of the GA Engine
+# - none: the duplicated offspring are kept
+# - mutate: the duplicated offspring are mutated again
+# - replace: the duplicated offspring are replaced by new random individuals
+duplicatesPolicy = {"none": 0,
+                    "mutate": 1,
+                    "replace": 2
+                    }
+
 CDefESCKey = 27
 
 CDefImportList = {"visual.graph": "you must install VPython !",
@@ -442,6 +539,12 @@ CDefScaleBoltzStart = 40.0
 CDefPopSortType = sortType["scaled"]
 CDefPopMinimax = minimaxType["maximize"]
 CDefPopScale = Scaling.LinearScaling
+CDefFitnessCacheSize = 10000
+CDefPoolChunkTime = 0.05
+CDefAsyncConcurrency = 16
+CDefEvalRetries = 0
+CDefStatsImprovementWindow = 10
+CDefDuplicatesRetries = 20
 
 # - GA Engine defaults
 CDefGAGenerations = 100
@@ -450,6 +553,11 @@ CDefGACrossoverRate = 0.9
 CDefGAPopulationSize = 80
 CDefGASelector = Selectors.GRankSelector
 CDefGAElitismReplacement = 1
+CDefGADuplicatesPolicy = duplicatesPolicy["none"]
+
+# - Steady-state GA Engine defaults
+CDefSSGAOffspring = 2
+CDefSSGAReplacement = replacementType["worst"]
 
 # - This is general used by integer/real ranges defaults
 CDefRangeMin = 0
@@ -532,3 +640,16 @@ CDefXMLRPCStatsGenFreq = 20
 CDefBroadcastAddress = "255.255.255.255"
 nodeType = {"TERMINAL": 0, "NONTERMINAL": 1}
 
+
+# Migration Consts
+CDefGenMigrationRate = 20
+CDefMigrationNIndividuals = 3
+CDefGenMigrationReplacement = 3
+CDefNetworkIndividual = 1
+CDefNetworkInfo = 2
+
+# - Network defaults
+CDefNetworkFlushInterval = 0.05
+CDefNetworkMaxAge = 60.0
+CDefNetworkMaxDatagram = 60000
+CDefNetworkMaxMessage = 16 * 1024 * 1024
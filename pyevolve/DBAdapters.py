@@ -40,6 +40,7 @@ class DBBaseAdapter(object):
     def __init__(self, frequency, identify):
         """ The class constructor """
         self.statsGenFreq = frequency
+        self.statsFields = None
 
         if identify is None:
             self.identify = datetime.datetime.strftime(datetime.datetime.now(), "%d/%m/%y-%H:%M")
@@ -77,6 +78,30 @@ class DBBaseAdapter(object):
         """
         self.statsGenFreq = statsGenFreq
 
+    def getStatsFields(self):
+        """ Returns the keys of the statistics dumped by the adapter
+
+        :rtype: the list of keys, None for the standard statistics
+        """
+        return self.statsFields
+
+    def setStatsFields(self, fields):
+        """ Sets the keys of the statistics dumped by the adapter, the optional
+        and the extended statistics (see :class:`Statistics.Statistics`) are
+        dumped only when their keys are given
+
+        Example:
+           >>> adapter.setStatsFields(["rawMax", "rawMin", "rawMed", "uniqueGenotypes"])
+
+        :param fields: the list of keys, None for the standard statistics
+
+        .. versionadded:: 0.7
+           The `setStatsFields` method.
+        """
+        if fields is not None:
+            fields = Statistics.Statistics().getFields(fields)
+        self.statsFields = fields
+
     def open(self, ga_engine):
         """ This method is called one time to do the initialization of
         the DB Adapter
@@ -85,6 +110,24 @@ class DBBaseAdapter(object):
         """
         pass
 
+    def getCheckpointState(self, ga_engine):
+        """ Returns the position of the adapter stored on the checkpoints of the
+        evolution (see :meth:`GSimpleGA.GSimpleGA.saveCheckpoint`)
+
+        :param ga_engine: the GA Engine
+        :rtype: a dict with the position of the adapter
+        """
+        return {"identify": self.getIdentify(), "generation": ga_engine.getCurrentGeneration()}
+
+    def setCheckpointState(self, state):
+        """ Restores the position of the adapter when the evolution is resumed from
+        a checkpoint, the adapters which erase their data on *open* must keep the
+        data of the interrupted evolution until the checkpoint
+
+        :param state: the dict returned by :meth:`getCheckpointState`
+        """
+        self.setIdentify(state["identify"])
+
     def commitAndClose(self):
         """ This method is called at the end of the evolution, to closes the
         DB Adapter and commit the changes """
@@ -130,6 +173,7 @@ class DBFileCSV(DBBaseAdapter):
         self.csvWriter = None
         self.fHandle = None
         self.reset = reset
+        self.resumeOffset = None
 
     def __repr__(self):
         """ The string representation of adapter """
@@ -151,8 +195,34 @@ class DBFileCSV(DBBaseAdapter):
         logging.debug("Opening the CSV file to dump statistics [%s]", self.filename)
         open_mode = 'w' if self.reset else 'a'
         self.fHandle = open(self.filename, open_mode)
+        if self.resumeOffset is not None:
+            # Removes the lines written after the checkpoint
+            self.fHandle.truncate(self.resumeOffset)
+            self.resumeOffset = None
         self.csvWriter = self.csvmod.writer(self.fHandle, delimiter=';')
 
+    def getCheckpointState(self, ga_engine):
+        """ Returns the position of the adapter, which includes the size of the CSV file
+
+        :param ga_engine: the GA Engine
+        :rtype: a dict with the position of the adapter
+        """
+        state = super(DBFileCSV, self).getCheckpointState(ga_engine)
+        if self.fHandle is not None and not self.fHandle.closed:
+            self.fHandle.flush()
+            state["offset"] = self.fHandle.tell()
+        return state
+
+    def setCheckpointState(self, state):
+        """ Restores the position of the adapter, the file is opened to append
+        the lines and the lines written after the checkpoint are removed
+
+        :param state: the dict returned by :meth:`getCheckpointState`
+        """
+        super(DBFileCSV, self).setCheckpointState(state)
+        self.reset = False
+        self.resumeOffset = state.get("offset")
+
     def close(self):
         """ Closes the CSV file handle """
         logging.debug("Closing the CSV file [%s]", self.filename)
@@ -174,7 +244,7 @@ class DBFileCSV(DBBaseAdapter):
         stats = ga_engine.getStatistics()
         generation = ga_engine.getCurrentGeneration()
         line = [self.getIdentify(), generation]
-        line.extend(stats.asTuple())
+        line.extend(stats.asTuple(self.statsFields))
         self.csvWriter.writerow(line)
 
 
@@ -246,7 +316,7 @@ class DBURLPost(DBBaseAdapter):
         logging.debug("Sending http request to %s.", self.url)
         stats = ga_engine.getStatistics()
         response = None
-        params = stats.internalDict.copy()
+        params = dict(stats.items(self.statsFields))
         params["generation"] = ga_engine.getCurrentGeneration()
         params["identify"] = self.getIdentify()
         if self.post:  # POST
@@ -295,8 +365,9 @@ class DBSQLite(DBBaseAdapter):
         self.connection = None
         self.resetDB = resetDB
         self.resetIdentify = resetIdentify
+        self.resumeGeneration = None
         self.dbName = dbname
-        self.typeDict = {float: "real"}
+        self.typeDict = {float: "real", int: "integer"}
         self.cursorPool = None
         self.commitFreq = commit_freq
 
@@ -330,6 +401,10 @@ class DBSQLite(DBBaseAdapter):
         if self.resetIdentify:
             self.resetTableIdentify()
 
+        if self.resumeGeneration is not None:
+            self.resetTableGenerations(self.resumeGeneration)
+            self.resumeGeneration = None
+
     def commitAndClose(self):
         """ Commit changes on database and closes connection """
         self.commit()
@@ -369,7 +444,7 @@ class DBSQLite(DBBaseAdapter):
         """
         c = self.getCursor()
         pstmt = "create table if not exists %s(identify text, generation integer, " % (Consts.CDefSQLiteDBTable)
-        for k, v in list(stats.items()):
+        for k, v in stats.items(self.statsFields):
             pstmt += "%s %s, " % (k, self.typeDict[type(v)])
         pstmt = pstmt[:-2] + ")"
         logging.debug("Creating table %s: %s.", Consts.CDefSQLiteDBTable, pstmt)
@@ -381,6 +456,31 @@ class DBSQLite(DBBaseAdapter):
         c.execute(pstmt)
         self.commit()
 
+    def setCheckpointState(self, state):
+        """ Restores the position of the adapter, the records of the identify
+        from the generation of the checkpoint on are removed when the database is opened
+
+        :param state: the dict returned by :meth:`getCheckpointState`
+        """
+        super(DBSQLite, self).setCheckpointState(state)
+        self.resetDB = False
+        self.resetIdentify = False
+        self.resumeGeneration = state["generation"]
+
+    def resetTableGenerations(self, generation):
+        """ Delete the records of the identify from the generation on
+
+        :param generation: the first generation removed
+        """
+        c = self.getCursor()
+        stmt = "delete from %s where identify = ? and generation >= ?" % (Consts.CDefSQLiteDBTable)
+        stmt2 = "delete from %s where identify = ? and generation >= ?" % (Consts.CDefSQLiteDBTablePop)
+
+        logging.debug("Erasing data from the tables from the generation %d on", generation)
+        c.execute(stmt, (self.getIdentify(), generation))
+        c.execute(stmt2, (self.getIdentify(), generation))
+        self.commit()
+
     def resetTableIdentify(self):
         """ Delete all records on the table with the same Identify """
         c = self.getCursor()
@@ -424,10 +524,11 @@ class DBSQLite(DBBaseAdapter):
 
         c = self.getCursor()
         pstmt = "insert into %s values (?, ?, " % (Consts.CDefSQLiteDBTable)
-        for i in range(len(stats)):
+        values = stats.asTuple(self.statsFields)
+        for i in range(len(values)):
             pstmt += "?, "
         pstmt = pstmt[:-2] + ")"
-        c.execute(pstmt, (self.getIdentify(), generation) + stats.asTuple())
+        c.execute(pstmt, (self.getIdentify(), generation) + values)
 
         pstmt = "insert into %s values(?, ?, ?, ?, ?)" % (Consts.CDefSQLiteDBTablePop,)
         tups = []
@@ -515,7 +616,7 @@ class DBXMLRPC(DBBaseAdapter):
         """
         stats = ga_engine.getStatistics()
         generation = ga_engine.getCurrentGeneration()
-        di = stats.internalDict.copy()
+        di = dict(stats.items(self.statsFields))
         di.update({"identify": self.getIdentify(), "generation": generation})
         self.proxy.insert(di)
 
@@ -649,12 +750,13 @@ class DBMySQLAdapter(DBBaseAdapter):
         self.connection = None
         self.resetDB = resetDB
         self.resetIdentify = resetIdentify
+        self.resumeGeneration = None
         self.db = db
         self.host = host
         self.port = port
         self.user = user
         self.passwd = passwd
-        self.typeDict = {float: "DOUBLE(14,6)"}
+        self.typeDict = {float: "DOUBLE(14,6)", int: "INT"}
         self.cursorPool = None
         self.commitFreq = commit_freq
 
@@ -689,6 +791,10 @@ class DBMySQLAdapter(DBBaseAdapter):
         if self.resetIdentify:
             self.resetTableIdentify()
 
+        if self.resumeGeneration is not None:
+            self.resetTableGenerations(self.resumeGeneration)
+            self.resumeGeneration = None
+
     def commitAndClose(self):
         """ Commit changes on database and closes connection """
         self.commit()
@@ -728,7 +834,7 @@ class DBMySQLAdapter(DBBaseAdapter):
         """
         c = self.getCursor()
         pstmt = "create table if not exists %s(identify VARCHAR(80), generation INTEGER, " % (Consts.CDefMySQLDBTable)
-        for k, v in list(stats.items()):
+        for k, v in stats.items(self.statsFields):
             pstmt += "%s %s, " % (k, self.typeDict[type(v)])
         pstmt = pstmt[:-2] + ")"
         logging.debug("Creating table %s: %s.", Consts.CDefSQLiteDBTable, pstmt)
@@ -740,6 +846,31 @@ class DBMySQLAdapter(DBBaseAdapter):
         c.execute(pstmt)
         self.commit()
 
+    def setCheckpointState(self, state):
+        """ Restores the position of the adapter, the records of the identify
+        from the generation of the checkpoint on are removed when the database is opened
+
+        :param state: the dict returned by :meth:`getCheckpointState`
+        """
+        super(DBMySQLAdapter, self).setCheckpointState(state)
+        self.resetDB = False
+        self.resetIdentify = False
+        self.resumeGeneration = state["generation"]
+
+    def resetTableGenerations(self, generation):
+        """ Delete the records of the identify from the generation on
+
+        :param generation: the first generation removed
+        """
+        c = self.getCursor()
+        stmt = "delete from " + Consts.CDefMySQLDBTable + " where identify = %s and generation >= %s"
+        stmt2 = "delete from " + Consts.CDefMySQLDBTablePop + " where identify = %s and generation >= %s"
+
+        logging.debug("Erasing data from the tables from the generation %d on", generation)
+        c.execute(stmt, (self.getIdentify(), generation))
+        c.execute(stmt2, (self.getIdentify(), generation))
+        self.commit()
+
     def resetTableIdentify(self):
         """ Delete all records on the table with the same Identify """
         c = self.getCursor()
@@ -779,10 +910,11 @@ class DBMySQLAdapter(DBBaseAdapter):
 
         c = self.getCursor()
         pstmt = "insert into " + Consts.CDefMySQLDBTable + " values (%s, %s, "
-        for i in range(len(stats)):
+        values = stats.asTuple(self.statsFields)
+        for i in range(len(values)):
             pstmt += "%s, "
         pstmt = pstmt[:-2] + ")"
-        c.execute(pstmt, (self.getIdentify(), generation) + stats.asTuple())
+        c.execute(pstmt, (self.getIdentify(), generation) + values)
 
         pstmt = "insert into " + Consts.CDefMySQLDBTablePop + " values(%s, %s, %s, %s, %s)"
 
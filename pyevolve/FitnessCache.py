@@ -0,0 +1,99 @@
+"""
+
+:mod:`FitnessCache` -- the fitness cache module
+==========================================================================
+
+This module have the class which is reponsible to keep the raw scores of the
+already evaluated genotypes, so the duplicated individuals of the population
+(very common when the population has converged) are not sent to the evaluation
+function again.
+
+.. seealso::
+
+   Method :meth:`GSimpleGA.GSimpleGA.setFitnessCache`
+      The fitness cache is enabled in the GSimpleGA Class.
+
+"""
+
+from collections import OrderedDict
+
+from . import Consts
+from . import Util
+
+
+class FitnessCache(object):
+    """ FitnessCache Class - A bounded cache of raw scores keyed by genotype
+
+    The keys are the values returned by the *getGenotypeKey()* method of the
+    genomes, when the cache is full, the least recently used score is discarded.
+
+    Example:
+       >>> cache = FitnessCache(max_size=1000)
+       >>> cache.set(genome.getGenotypeKey(), genome.score)
+       >>> cache.get(genome.getGenotypeKey())
+       10.2
+       >>> cache.hits, cache.misses
+       (1, 0)
+
+    :param max_size: the maximum number of scores kept in the cache
+
+    """
+
+    def __init__(self, max_size=Consts.CDefFitnessCacheSize):
+        """ The FitnessCache Class creator """
+        if max_size < 1:
+            Util.raiseException("The fitness cache size must be >= 1", ValueError)
+        self.maxSize = max_size
+        self.internalDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """ Return the number of scores in the cache """
+        return len(self.internalDict)
+
+    def __contains__(self, key):
+        """ Used on: *key in cache*, doesn't change the hit/miss counters """
+        return key in self.internalDict
+
+    def __repr__(self):
+        """ Return a string representation of the cache """
+        ret = "- FitnessCache\n"
+        ret += "\tSize:\t\t %d/%d\n" % (len(self), self.maxSize)
+        ret += "\tHits/Misses:\t %d/%d\n" % (self.hits, self.misses)
+        return ret
+
+    def get(self, key):
+        """ Return the score cached for the genotype *key*
+
+        :param key: the genotype key
+        :rtype: the raw score or None if the genotype isn't cached
+
+        """
+        try:
+            score = self.internalDict[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.internalDict.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def set(self, key, score):
+        """ Store the score of the genotype *key*, discarding the least recently
+        used score when the cache is full
+
+        :param key: the genotype key
+        :param score: the raw score
+
+        """
+        self.internalDict[key] = score
+        self.internalDict.move_to_end(key)
+        if len(self.internalDict) > self.maxSize:
+            self.internalDict.popitem(last=False)
+
+    def clear(self):
+        """ Remove all scores and reset the hit/miss counters """
+        self.internalDict.clear()
+        self.hits = 0
+        self.misses = 0
@@ -177,7 +177,8 @@ class FunctionSlot(object):
             for f in self.funcList:
                 yield f(obj, **args)
         else:
-            v = rand_uniform(0, 1)
+            rng = args.get("rng")
+            v = rng.uniform(0, 1) if rng is not None else rand_uniform(0, 1)
             fobj = None
             for func, weight in zip(self.funcList, self.funcWeights):
                 fobj = func
@@ -26,30 +26,225 @@ Default Parameters
 
    The Linear Scaling scheme
 
+*Fitness Cache*
+
+   None
+
+   The scores of the genotypes aren't cached
+
+*Batch Evaluator*
+
+   Empty
+
+   The individuals are evaluated one by one by their own evaluation function
+
+Score Arrays
+-------------------------------------------------------------
+
+The population keeps the raw scores and the fitness of the individuals on
+contiguous arrays (NumPy arrays, or :class:`array.array` of doubles when NumPy
+isn't installed), see :meth:`GPopulation.getScores` and
+:meth:`GPopulation.getFitness`. The statistics, the scaling schemes, the sort
+and the selectors work on the arrays instead of reading the attributes of each
+individual. The best and the worst raw score individuals are found by a
+partial ranking of the scores (see :func:`partialRankIndexes`), the complete
+raw ranking is computed only when it's needed.
+
+The arrays are built on demand and dropped by :meth:`GPopulation.clearFlags`
+and :meth:`GPopulation.clearArrays`, so the code which changes the individuals
+behind the population must call one of them.
+
+Matrix Layout
+-------------------------------------------------------------
+
+The genes of the :class:`G1DList.G1DList` and
+:class:`G1DBinaryString.G1DBinaryString` individuals can be kept on the rows
+of one 2D NumPy array shared by all the generations, the individuals are
+views of their row, see :meth:`GPopulation.setMatrixLayout` and the
+:mod:`GenotypeMatrix` module.
+
+Parameters
+-------------------------------------------------------------
+
+The parameters are set with the :meth:`GPopulation.setParams` method.
+
+*evalTimeout*
+
+   None
+
+   The maximum time (in seconds) of the evaluation of an individual on the
+   "process" and "async" evaluation backends, see :meth:`GPopulation.evaluate`
+
+*evalPenalty*
+
+   None
+
+   The score of the individuals whose evaluation timed out, when None, the
+   worst score of the evaluated individuals is used
+
+*evalRetries*
+
+   :attr:`Consts.CDefEvalRetries`
+
+   The number of times a failed evaluation is retried on the "async" backend
+
 Class
 -------------------------------------------------------------
 
 
 """
 
-from functools import cmp_to_key
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count as itertools_count
+import asyncio
+import heapq
+import inspect
+import os
+import signal
+import weakref
 
 from . import Consts
 from . import Util
+from .FitnessCache import FitnessCache
 from .FunctionSlot import FunctionSlot
-from .Statistics import Statistics
+from .representations.GenomeBase import packWire, unpackWire
+from .representations.GenotypeMatrix import GenotypeMatrix
+from .Statistics import RunningStatistics, ScoreHistory, Statistics
 from math import sqrt as math_sqrt
+from time import perf_counter
 import logging
 
 try:
-    from multiprocessing import cpu_count, Pool
+    from multiprocessing import cpu_count, SimpleQueue
+    from multiprocessing.pool import Pool, ThreadPool
     CPU_COUNT = cpu_count()
     MULTI_PROCESSING = True if CPU_COUNT > 1 else False
     logging.debug("You have %d CPU cores, so the multiprocessing state is %s", CPU_COUNT, MULTI_PROCESSING)
 except ImportError:
+    CPU_COUNT = 1
     MULTI_PROCESSING = False
+    Pool = object
+    ThreadPool = None
     logging.debug("You don't have multiprocessing support for your Python version !")
 
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    logging.debug("You don't have numpy, the batch evaluator will receive the individuals !")
+
+
+def scoreArray(values):
+    """ Returns the values on a contiguous array of doubles, a NumPy array
+    or an :class:`array.array` when NumPy isn't installed
+
+    :param values: a sequence of numbers
+    :rtype: the array
+
+    .. versionadded:: 0.7
+       The `scoreArray` function.
+
+    """
+    if HAS_NUMPY:
+        return numpy.asarray(values, dtype=numpy.float64)
+    return array("d", values)
+
+
+def takeArray(values, indexes):
+    """ Returns a new array with the values of the indexes
+
+    :param values: the array of values, see :func:`scoreArray`
+    :param indexes: the list of indexes
+    :rtype: the new array
+
+    .. versionadded:: 0.7
+       The `takeArray` function.
+
+    """
+    if HAS_NUMPY:
+        return values[indexes]
+    return array("d", [values[i] for i in indexes])
+
+
+def rankIndexes(values, descending):
+    """ Returns the indexes of the values sorted, the ties keep their order
+
+    :param values: the array of values, see :func:`scoreArray`
+    :param descending: if True, the indexes go from the highest to the lowest value
+    :rtype: the list of indexes
+
+    .. versionadded:: 0.7
+       The `rankIndexes` function.
+
+    """
+    if HAS_NUMPY:
+        return numpy.argsort(-values if descending else values, kind="stable").tolist()
+    return sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+
+
+def partialRankIndexes(values, count, descending):
+    """ Returns the *count* first indexes of :func:`rankIndexes`, the values are
+    partitioned instead of sorted, it takes O(n + count log count) time with
+    NumPy and O(n log count) without it
+
+    Example:
+       >>> partialRankIndexes(scoreArray([3.0, 1.0, 2.0, 1.0]), 2, False)
+       [1, 3]
+
+    :param values: the array of values, see :func:`scoreArray`
+    :param count: the number of indexes
+    :param descending: if True, the indexes go from the highest to the lowest value
+    :rtype: the list of indexes
+
+    .. versionadded:: 0.7
+       The `partialRankIndexes` function.
+
+    """
+    size = len(values)
+    count = min(count, size)
+    if count <= 0:
+        return []
+    if not HAS_NUMPY:
+        if descending:
+            return heapq.nlargest(count, range(size), key=values.__getitem__)
+        return heapq.nsmallest(count, range(size), key=values.__getitem__)
+
+    keys = -values if descending else values
+    if count == size:
+        return numpy.argsort(keys, kind="stable").tolist()
+    kth = numpy.partition(keys, count - 1)[count - 1]
+    # The ties of the last value are taken in the order of the indexes
+    better = numpy.flatnonzero(keys < kth)
+    ties = numpy.flatnonzero(keys == kth)[:count - len(better)]
+    candidates = numpy.concatenate((better, ties))
+    return candidates[numpy.argsort(keys[candidates], kind="stable")].tolist()
+
+
+def weakProvider(method):
+    """ Returns a provider of extended statistics (see :meth:`Statistics.Statistics.setProvider`)
+    which calls the method without keeping its object alive, the provider
+    returns no statistics after the object is gone
+
+    :param method: the bound method which computes the statistics
+    :rtype: the provider function
+
+    .. versionadded:: 0.7
+       The `weakProvider` function.
+
+    """
+    reference = weakref.WeakMethod(method)
+
+    def provider():
+        bound = reference()
+        return bound() if bound is not None else {}
+    return provider
+
+
+#: The evaluation backends accepted by :meth:`GPopulation.setMultiProcessing`
+EVAL_BACKENDS = ("process", "thread", "async", "serial")
+
 
 def key_raw_score(individual):
     """ A key function to return raw score
@@ -75,16 +270,171 @@ def key_fitness_score(individual):
     return individual.fitness
 
 
-def multiprocessing_eval(ind):
+def multiprocessing_eval(data):
     """ Internal used by the multiprocessing """
+    ind = unpackWire(data, _workerTemplate)
     ind.evaluate()
     return ind.score
 
 
-def multiprocessing_eval_full(ind):
+def multiprocessing_eval_full(data):
     """ Internal used by the multiprocessing (full copy)"""
+    ind = unpackWire(data, _workerTemplate)
+    ind.evaluate()
+    return packWire(ind, _workerTemplate)
+
+
+# The sample genome of the worker processes, the individuals are sent in the
+# slim form (see :func:`GenomeBase.packWire`)
+_workerTemplate = None
+# The queue used by the worker processes to report the evaluations they start
+_workerEvents = None
+# The tokens which identify the evaluations sent with a timeout
+_evaluationTokens = itertools_count()
+
+
+def multiprocessing_init_worker(template, events):
+    """ Internal used by the multiprocessing, initializes the worker processes """
+    global _workerTemplate, _workerEvents
+    _workerTemplate = template
+    _workerEvents = events
+
+
+def multiprocessing_eval_timed(job):
+    """ Internal used by the multiprocessing with timeout, reports the worker
+    process which started the evaluation, so it can be killed if the evaluation
+    doesn't finish in time """
+    token, index = job[0], job[1]
+    _workerEvents.put((token, index, os.getpid()))
+    return multiprocessing_eval_indexed(job[1:])
+
+
+class EvaluationPool(Pool):
+    """ EvaluationPool Class - The process pool used to evaluate the population
+
+    The workers keep the sample genome, which unpacks the individuals sent in
+    the slim form (see :func:`GenomeBase.packWire`), and report the evaluations they
+    start, so the stragglers can be killed, the pool replaces them by new
+    worker processes.
+
+    :param processes: the number of worker processes
+    :param template: the sample genome
+
+    """
+
+    def __init__(self, processes, template):
+        self.startEvents = SimpleQueue()
+        self.stragglers = 0
+        super(EvaluationPool, self).__init__(processes, initializer=multiprocessing_init_worker,
+                                             initargs=(template, self.startEvents))
+
+    def killWorker(self, pid):
+        """ Kills the worker process which is running an evaluation that timed out,
+        the task is lost, so the pool must be terminated instead of closed """
+        try:
+            os.kill(pid, getattr(signal, "SIGKILL", signal.SIGTERM))
+        except OSError:
+            pass
+        self.stragglers += 1
+
+
+def release_pool(pool, terminate=False):
+    """ Closes the pool and waits for its workers, the pool is terminated if
+    there are tasks lost by killed workers
+
+    :param pool: the process or thread pool
+    :param terminate: if True, the workers are stopped immediately
+
+    """
+    if terminate or getattr(pool, "stragglers", 0):
+        pool.terminate()
+    else:
+        pool.close()
+    pool.join()
+
+
+def multiprocessing_eval_indexed(job):
+    """ Internal used by the unordered multiprocessing, returns the index
+    of the individual, the score (or the individual itself when full copy)
+    and the time spent on the evaluation """
+    index, data, full_copy = job
+    ind = unpackWire(data, _workerTemplate)
+    start = perf_counter()
     ind.evaluate()
-    return ind
+    elapsed = perf_counter() - start
+    return index, (packWire(ind, _workerTemplate) if full_copy else ind.score), elapsed
+
+
+class GenotypeIndex(object):
+    """ GenotypeIndex Class - A hashed index of the genotypes, used to find the
+    duplicated individuals without comparing each one with all the others
+
+    The individuals are indexed by their digest (see
+    :meth:`GenomeBase.GenomeBase.getGenotypeDigest`), the individuals with
+    equal digests are duplicates, unless they have a *compare* method, which
+    decides the collisions. The individuals without digest are never duplicates.
+
+    Example:
+       >>> index = GenotypeIndex()
+       >>> index.add(genome)
+       True
+       >>> index.add(genome.clone())
+       False
+
+    .. versionadded:: 0.7
+       The `GenotypeIndex` class.
+
+    """
+
+    def __init__(self, individuals=()):
+        """ The constructor of the GenotypeIndex, indexes the individuals """
+        self.buckets = {}
+        self.size = 0
+        for individual in individuals:
+            self.add(individual)
+
+    def __len__(self):
+        """ Returns the number of individuals indexed """
+        return self.size
+
+    def __contains__(self, individual):
+        """ Returns True if a duplicate of the individual is indexed """
+        bucket = self.buckets.get(individual.getGenotypeDigest())
+        return bucket is not None and self.__inBucket(individual, bucket)
+
+    def __inBucket(self, individual, bucket):
+        """ Returns True if the bucket has a duplicate of the individual """
+        if not hasattr(individual, "compare"):
+            return True
+        for other in bucket:
+            if individual.compare(other) == 0:
+                return True
+        return False
+
+    def add(self, individual):
+        """ Indexes the individual, unless it's a duplicate of an indexed one
+
+        :param individual: the individual
+        :rtype: True if the individual was indexed, False if it's a duplicate
+
+        """
+        digest = individual.getGenotypeDigest()
+        if digest is None:
+            return True
+        bucket = self.buckets.get(digest)
+        if bucket is None:
+            self.buckets[digest] = [individual]
+        elif self.__inBucket(individual, bucket):
+            return False
+        else:
+            bucket.append(individual)
+        self.size += 1
+        return True
+
+    def clear(self):
+        """ Removes all the individuals of the index """
+        self.buckets = {}
+        self.size = 0
 
 
 class GPopulation(object):
@@ -128,40 +478,258 @@ class GPopulation(object):
         if isinstance(genome, GPopulation):
             self.oneSelfGenome = genome.oneSelfGenome
             self.internalPop = []
-            self.internalPopRaw = []
+            self.scoreArray = None
+            self.fitnessArray = None
+            self.rawRanking = None
             self.popSize = genome.popSize
             self.sortType = genome.sortType
             self.sorted = False
+            self.scaled = False
             self.minimax = genome.minimax
             self.scaleMethod = genome.scaleMethod
-            self.allSlots = [self.scaleMethod]
+            self.batchEvaluator = genome.batchEvaluator
+            self.allSlots = [self.scaleMethod, self.batchEvaluator]
 
             self.internalParams = genome.internalParams
             self.multiProcessing = genome.multiProcessing
+            self.procPool = genome.procPool
+            self.evalLatency = genome.evalLatency
+            self.fitnessCache = genome.fitnessCache
+            self.genotypeMatrix = genome.genotypeMatrix
+            self.timedOut = []
 
+            self.scoreHistory = genome.scoreHistory
             self.statted = False
             self.stats = Statistics()
+            self.__setStatsProviders()
             return
 
         logging.debug("New population instance, %s class genomes.", genome.__class__.__name__)
         self.oneSelfGenome = genome
         self.internalPop = []
-        self.internalPopRaw = []
+        self.scoreArray = None
+        self.fitnessArray = None
+        self.rawRanking = None
         self.popSize = 0
         self.sortType = Consts.CDefPopSortType
         self.sorted = False
+        self.scaled = False
         self.minimax = Consts.CDefPopMinimax
         self.scaleMethod = FunctionSlot("Scale Method")
         self.scaleMethod.set(Consts.CDefPopScale)
-        self.allSlots = [self.scaleMethod]
+        self.batchEvaluator = FunctionSlot("Batch Evaluator")
+        self.allSlots = [self.scaleMethod, self.batchEvaluator]
 
         self.internalParams = {}
-        self.multiProcessing = (False, False, None)
+        self.multiProcessing = (False, False, None, False, "process")
+        self.procPool = None
+        self.evalLatency = None
+        self.fitnessCache = None
+        self.genotypeMatrix = None
+        self.timedOut = []
 
         # Statistics
         self.statted = False
         self.stats = Statistics()
+        self.scoreHistory = ScoreHistory()
+        self.__setStatsProviders()
+
+
+    def setMultiProcessing(self, flag=True, full_copy=False, max_processes=None, unordered=False,
+                           backend="process"):
+        """ Sets the flag to enable/disable the use of python multiprocessing module.
+        Use this option when you have more than one core on your CPU and when your
+        evaluation function is very slow.
+        The parameter "full_copy" defines where the individual data should be copied back
+        after the evaluation or not. This parameter is useful when you change the
+        individual in the evaluation function.
+        The parameter "unordered" enables the evaluation mode which sends the individuals
+        in small chunks and takes the results as they finish, see :meth:`evaluate`.
+        The parameter "backend" chooses where the individuals are evaluated: "process"
+        uses a pool of processes, "thread" uses a pool of threads which evaluate the
+        individuals in place (useful when the evaluation function releases the GIL, like
+        the numpy functions), "async" runs the evaluation functions defined with
+        *async def* concurrently on an event loop (useful when the evaluation waits
+        for a socket or an external process) and "serial" evaluates them on the current
+        thread.
+
+        :param flag: True (default) or False
+        :param full_copy: True or False (default)
+        :param max_processes: None (default) or an integer value, the number of threads
+                              when using the "thread" backend or the number of concurrent
+                              evaluations when using the "async" backend
+        :param unordered: True or False (default)
+        :param backend: "process" (default), "thread", "async" or "serial"
+
+        .. warning:: Use this option only when your evaluation function is slow, se you
+                     will get a good tradeoff between the process communication speed and the
+                     parallel evaluation.
+
+        """
+        if backend not in EVAL_BACKENDS:
+            Util.raiseException("Unknown evaluation backend '%s', use one of %s" % (backend, EVAL_BACKENDS),
+                                ValueError)
+        self.multiProcessing = (flag, full_copy, max_processes, unordered, backend)
+
+    def getEvaluationBackend(self):
+        """ Returns the backend effectively used to evaluate the population, the "process"
+        backend falls back to "serial" when there is no multiprocessing support or only
+        one CPU core
+
+        :rtype: "process", "thread", "async" or "serial"
+
+        """
+        if not self.multiProcessing[0]:
+            return "serial"
+        backend = self.multiProcessing[4]
+        if backend == "process" and not MULTI_PROCESSING:
+            return "serial"
+        if backend == "thread" and ThreadPool is None:
+            return "serial"
+        return backend
+
+    def openPool(self):
+        """ Creates the process (or thread) pool used by the multiprocessing evaluation
+
+        The pool is shared by all the populations cloned from this one, so it
+        can be reused along the generations, it must be released with the
+        :meth:`closePool` method.
+
+        """
+        if self.procPool is not None:
+            return
+        if self.getEvaluationBackend() in ("process", "thread"):
+            logging.debug("Creating the %s pool, max_processes=%s", self.multiProcessing[4], self.multiProcessing[2])
+            self.procPool = self.__createPool()
+
+    def __createPool(self):
+        """ Creates the pool of the backend, the workers of a process pool keep the
+        sample genome, so the individuals are sent in the slim form (see
+        :func:`GenomeBase.packWire`) """
+        if self.multiProcessing[4] == "thread":
+            return ThreadPool(processes=self.multiProcessing[2])
+        return EvaluationPool(self.multiProcessing[2], self.oneSelfGenome)
+
+    def closePool(self, terminate=False):
+        """ Releases the pool created by :meth:`openPool`
+
+        :param terminate: if True, the workers are stopped immediately without
+                          completing the outstanding work
+
+        """
+        if self.procPool is None:
+            return
+        logging.debug("Shutting down the process pool (terminate=%s)", terminate)
+        release_pool(self.procPool, terminate)
+        self.procPool = None
+
+    def setFitnessCache(self, cache):
+        """ Sets the cache of scores used by the evaluation, the individuals whose
+        genotype is in the cache aren't sent to the evaluation function
+
+        The cache is shared by all the populations cloned from this one.
+
+        Example:
+           >>> pop.setFitnessCache(FitnessCache(max_size=5000))
+
+        :param cache: a :class:`FitnessCache.FitnessCache` instance or None to disable it
+
+        """
+        if cache is not None and not isinstance(cache, FitnessCache):
+            Util.raiseException("The fitness cache must be a FitnessCache instance or None", TypeError)
+        self.fitnessCache = cache
+
+    def setMatrixLayout(self, flag=True):
+        """ Enables or disables the matrix layout of the genotypes, where the genes of
+        all the individuals are the rows of one 2D NumPy array, see :mod:`GenotypeMatrix`
+
+        The individuals become views of the matrix, which work with the same
+        operators, and the offspring cloned from them are views of the same
+        matrix. The matrix is shared by all the populations cloned from this
+        one, so the rows of the discarded individuals are reused by the next
+        generations. The individuals which aren't views (the migrants, for
+        example) are moved to the matrix by :meth:`packGenotypes`.
+
+        Example:
+           >>> ga_engine.getPopulation().setMatrixLayout(True)
+
+        :param flag: True or False, the genomes must be :class:`G1DList.G1DList`
+                     or :class:`G1DBinaryString.G1DBinaryString` instances
+
+        .. note:: The matrix layout needs NumPy.
+
+        .. versionadded:: 0.7
+           The `setMatrixLayout` method.
+
+        """
+        if not flag:
+            self.genotypeMatrix = None
+            self.internalPop = [ind.detach() if hasattr(ind, "detach") else ind for ind in self.internalPop]
+        elif self.genotypeMatrix is None:
+            genotype_matrix = GenotypeMatrix(self.oneSelfGenome.getListSize(), 2 * self.popSize)
+            self.internalPop = [genotype_matrix.view(ind) for ind in self.internalPop]
+            self.genotypeMatrix = genotype_matrix
+        self.clearFlags()
+
+    def packGenotypes(self):
+        """ Writes the genes changed through the *genomeList* of the individuals to
+        the rows of the genotype matrix, and moves the individuals which aren't
+        views to the matrix, see :meth:`setMatrixLayout`
+
+        The population is packed before and after the evaluation, so the operators
+        which change the matrix directly must call it when they take the
+        individuals from the operators.
+
+        .. versionadded:: 0.7
+           The `packGenotypes` method.
+
+        """
+        genotype_matrix = self.genotypeMatrix
+        if genotype_matrix is None:
+            return
+        for i, ind in enumerate(self.internalPop):
+            if genotype_matrix.owns(ind):
+                ind.pack()
+            else:
+                self.internalPop[i] = genotype_matrix.view(ind)
+
+    def getGenotypeMatrix(self):
+        """ Returns the genotype matrix packed, used by the vectorized operators
+
+        Example:
+           >>> genotype_matrix = pop.getGenotypeMatrix()
+           >>> rows = pop.getGenotypeRows()
+           >>> genotype_matrix.matrix[rows] += numpy.random.normal(0, 0.1, (len(rows), genotype_matrix.width))
+           >>> for ind in pop:
+           >>>    ind.invalidate()
+
+        :rtype: the :class:`GenotypeMatrix.GenotypeMatrix` instance, or None when
+                the matrix layout isn't enabled
+
+        .. note:: The individuals whose genes are changed directly on the matrix
+                  must be invalidated, see :meth:`GenomeBase.GenomeBase.invalidate`.
 
+        .. versionadded:: 0.7
+           The `getGenotypeMatrix` method.
+
+        """
+        self.packGenotypes()
+        return self.genotypeMatrix
+
+    def getGenotypeRows(self):
+        """ Returns the rows of the individuals on the genotype matrix, in the order
+        of the population, see :meth:`getGenotypeMatrix`
+
+        :rtype: a NumPy array of indexes
+
+        .. versionadded:: 0.7
+           The `getGenotypeRows` method.
+
+        """
+        if self.genotypeMatrix is None:
+            Util.raiseException("The matrix layout of the population isn't enabled", ValueError)
+        self.packGenotypes()
+        return self.genotypeMatrix.getRows(self.internalPop)
 
     def setMinimax(self, minimax):
         """ Sets the population minimax
@@ -206,9 +774,164 @@ class GPopulation(object):
         self.clearFlags()
 
     def clearFlags(self):
-        """ Clear the sorted and statted internal flags """
+        """ Clear the sorted and statted internal flags and drop the score arrays """
         self.sorted = False
         self.statted = False
+        self.clearArrays()
+
+    def clearArrays(self):
+        """ Drop the score arrays and the raw ranking, they are built again when
+        needed, it must be called when the individuals or their scores are
+        changed directly
+
+        .. versionadded:: 0.7
+           The `clearArrays` method.
+
+        """
+        self.scoreArray = None
+        self.fitnessArray = None
+        self.rawRanking = None
+        self.scaled = False
+        self.stats.clearLazy()
+
+    def __setStatsProviders(self):
+        """ Sets the functions which compute the extended statistics, they don't
+        keep the population alive, so the discarded generations are freed at once """
+        self.stats.setProvider(("rawQ1", "rawMed", "rawQ3"), weakProvider(self.__quartileStatistics))
+        self.stats.setProvider(("rawBest", "rawImprovement"), weakProvider(self.__historyStatistics))
+        self.stats.setProvider(("uniqueGenotypes",), weakProvider(self.__diversityStatistics))
+
+    def __quartileStatistics(self):
+        """ Computes the quartiles of the raw scores """
+        scores = self.getScores()
+        if HAS_NUMPY:
+            q1, median, q3 = numpy.percentile(scores, (25, 50, 75)).tolist()
+            return {"rawQ1": q1, "rawMed": median, "rawQ3": q3}
+
+        ordered = sorted(scores)
+        quartiles = {}
+        for key, fraction in (("rawQ1", 0.25), ("rawMed", 0.5), ("rawQ3", 0.75)):
+            # The linear interpolation between the closest ranks
+            position = (len(ordered) - 1) * fraction
+            lower = int(position)
+            upper = min(lower + 1, len(ordered) - 1)
+            quartiles[key] = ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+        return quartiles
+
+    def __historyStatistics(self):
+        """ Computes the best raw score so far and the improvement rate """
+        best = self.bestRaw().score
+        history_best = self.scoreHistory.getBest()
+        if history_best is not None:
+            if self.minimax == Consts.minimaxType["maximize"]:
+                best = max(best, history_best)
+            else:
+                best = min(best, history_best)
+        return {"rawBest": best, "rawImprovement": self.scoreHistory.getImprovementRate()}
+
+    def __diversityStatistics(self):
+        """ Counts the distinct genotypes, the individuals without genotype key
+        (see :meth:`GenomeBase.GenomeBase.getGenotypeKey`) are counted as distinct """
+        keys = set()
+        without_key = 0
+        for ind in self.internalPop:
+            key = ind.getGenotypeKey()
+            if key is None:
+                without_key += 1
+            else:
+                keys.add(key)
+        return {"uniqueGenotypes": len(keys) + without_key}
+
+    def recordBest(self, generation):
+        """ Records the best raw score of the population on the score history,
+        which is shared by the cloned populations, the engines call it at the
+        end of each generation
+
+        :param generation: the generation number
+
+        .. versionadded:: 0.7
+           The `recordBest` method.
+
+        """
+        if self.statted:
+            maximize = self.minimax == Consts.minimaxType["maximize"]
+            score = self.stats["rawMax"] if maximize else self.stats["rawMin"]
+        else:
+            score = self.bestRaw().score
+        self.scoreHistory.update(generation, score, self.minimax)
+        self.stats.clearLazy()
+
+    def getScores(self):
+        """ Return the raw scores of the individuals, in the order of the population
+
+        Example:
+           >>> scores = pop.getScores()
+           >>> scores[0] == pop[0].score
+           True
+
+        :rtype: the array of scores, see :func:`scoreArray`
+
+        .. note:: the array is kept until :meth:`clearArrays` is called, don't change it.
+
+        .. versionadded:: 0.7
+           The `getScores` method.
+
+        """
+        if self.scoreArray is None:
+            self.scoreArray = scoreArray([ind.score for ind in self.internalPop])
+        return self.scoreArray
+
+    def getFitness(self):
+        """ Return the scaled fitness of the individuals, in the order of the population
+
+        :rtype: the array of fitness, see :func:`scoreArray`
+
+        .. note:: the array is kept until :meth:`clearArrays` is called, don't change it.
+
+        .. versionadded:: 0.7
+           The `getFitness` method.
+
+        """
+        if self.fitnessArray is None:
+            self.fitnessArray = scoreArray([ind.fitness for ind in self.internalPop])
+        return self.fitnessArray
+
+    def setFitness(self, values):
+        """ Set the scaled fitness of the individuals, used by the scaling schemes
+
+        Example:
+           >>> pop.setFitness(pop.getScores() * 2.0)
+
+        :param values: a sequence with the fitness of each individual
+
+        .. versionadded:: 0.7
+           The `setFitness` method.
+
+        """
+        fitness = scoreArray(values)
+        if len(fitness) != len(self.internalPop):
+            Util.raiseException("The population has %d individuals, but %d fitness values were set" %
+                                (len(self.internalPop), len(fitness)), ValueError)
+        for ind, value in zip(self.internalPop, fitness.tolist()):
+            ind.fitness = value
+        self.fitnessArray = fitness
+        self.sorted = False
+
+    def getRawRanking(self):
+        """ Return the indexes of the individuals from the best to the worst raw score
+
+        :rtype: the list of indexes
+
+        .. note:: the ranking is computed on the first call and kept until
+                  :meth:`clearArrays` is called, don't change it.
+
+        .. versionadded:: 0.7
+           The `getRawRanking` method.
+
+        """
+        if self.rawRanking is None:
+            self.rawRanking = rankIndexes(self.getScores(), self.minimax == Consts.minimaxType["maximize"])
+        return self.rawRanking
 
     def getStatistics(self):
         """ Return a Statistics class for statistics
@@ -220,34 +943,35 @@ class GPopulation(object):
         return self.stats
 
     def statistics(self):
-        """ Do statistical analysis of population and set 'statted' to True """
+        """ Do statistical analysis of population and set 'statted' to True,
+        the extended statistics are computed only when they are asked """
         if self.statted:
             return
         logging.debug("Running statistical calculations")
-        raw_sum = 0
-
-        len_pop = len(self)
-        for ind in range(len_pop):
-            raw_sum += self[ind].score
-
-        self.stats["rawMax"] = max(self, key=key_raw_score).score
-        self.stats["rawMin"] = min(self, key=key_raw_score).score
-        self.stats["rawAve"] = raw_sum / float(len_pop)
-
-        tmpvar = 0.0
-        for ind in range(len_pop):
-            s = self[ind].score - self.stats["rawAve"]
-            s *= s
-            tmpvar += s
-
-        tmpvar /= float((len(self) - 1))
-        try:
-            self.stats["rawDev"] = math_sqrt(tmpvar)
-        except ValueError:  # TODO test needed
-            self.stats["rawDev"] = 0.0
-
+        scores = self.getScores()
+        len_pop = len(scores)
+
+        if HAS_NUMPY:
+            self.stats["rawMax"] = float(scores.max())
+            self.stats["rawMin"] = float(scores.min())
+            self.stats["rawAve"] = float(scores.mean())
+            tmpvar = float(scores.var(ddof=1)) if len_pop > 1 else 0.0
+        else:
+            # A single pass by the Welford's algorithm
+            running = RunningStatistics()
+            running.extend(scores)
+            self.stats["rawMax"] = running.maximum
+            self.stats["rawMin"] = running.minimum
+            self.stats["rawAve"] = running.mean
+            tmpvar = running.getVariance()
+
+        self.stats["rawDev"] = math_sqrt(tmpvar)
         self.stats["rawVar"] = tmpvar
 
+        if self.fitnessCache is not None:
+            self.stats["cacheHits"] = self.fitnessCache.hits
+            self.stats["cacheMisses"] = self.fitnessCache.misses
+
         self.statted = True
 
     def bestFitness(self, index=0):
@@ -278,12 +1002,18 @@ class GPopulation(object):
         .. versionadded:: 0.6
            The parameter `index`.
 
+        .. note:: the population isn't sorted, the best individual is found by a
+                  partial ranking and the others by the raw ranking (see
+                  :meth:`getRawRanking`), which is computed once
+
         """
-        if self.sortType == Consts.sortType["raw"]:
+        if self.sorted and self.sortType == Consts.sortType["raw"]:
             return self.internalPop[index]
-        else:
-            self.sort()
-            return self.internalPopRaw[index]
+        if index < 0:
+            index += len(self.internalPop)
+        if index == 0:
+            return self.internalPop[self.__bestRawIndexes(1)[0]]
+        return self.internalPop[self.getRawRanking()[index]]
 
     def worstRaw(self):
         """ Return the worst raw score individual of population
@@ -294,27 +1024,86 @@ class GPopulation(object):
            The parameter `index`.
 
         """
-        if self.sortType == Consts.sortType["raw"]:
+        if self.sorted and self.sortType == Consts.sortType["raw"]:
             return self.internalPop[-1]
-        else:
-            self.sort()
-            return self.internalPopRaw[-1]
+        return self.internalPop[self.worstRawIndexes(1)[0]]
+
+    def __bestRawIndexes(self, count):
+        """ Returns the indexes of the *count* best raw score individuals """
+        if self.rawRanking is not None:
+            return self.rawRanking[:count]
+        return partialRankIndexes(self.getScores(), count, self.minimax == Consts.minimaxType["maximize"])
+
+    def bestRawIndividuals(self, count):
+        """ Return the *count* best raw score individuals of population, from
+        the best to the worst, the ties keep the order of the population
+
+        Example:
+           >>> elite = pop.bestRawIndividuals(3)
+
+        :param count: the number of individuals
+        :rtype: the list of individuals
+
+        .. note:: the population isn't sorted, the individuals are picked
+                  by a partial ranking (see :func:`partialRankIndexes`)
+
+        .. versionadded:: 0.7
+           The `bestRawIndividuals` method.
+
+        """
+        if self.sorted and self.sortType == Consts.sortType["raw"]:
+            return self.internalPop[:count]
+        return [self.internalPop[i] for i in self.__bestRawIndexes(count)]
+
+    def worstRawIndexes(self, count):
+        """ Return the indexes of the *count* worst raw score individuals of
+        population, from the worst to the best, without sorting the population
+
+        Example:
+           >>> for index in pop.worstRawIndexes(2):
+           >>>     pop[index] = newGenome
+
+        :param count: the number of indexes
+        :rtype: the list of indexes
+
+        .. versionadded:: 0.7
+           The `worstRawIndexes` method.
+
+        """
+        size = len(self.internalPop)
+        if self.sorted and self.sortType == Consts.sortType["raw"]:
+            return list(range(size - 1, max(size - 1 - count, -1), -1))
+        if self.rawRanking is not None:
+            return self.rawRanking[::-1][:count]
+        # The ties are broken by the highest index, as on a sorted population,
+        # so the reversed scores are ranked
+        scores = self.getScores()
+        reversed_scores = scores[::-1] if HAS_NUMPY else array("d", reversed(scores))
+        maximize = self.minimax == Consts.minimaxType["maximize"]
+        return [size - 1 - i for i in partialRankIndexes(reversed_scores, count, not maximize)]
 
     def sort(self):
-        """ Sort the population """
+        """ Sort the population, by an argsort of the score arrays """
         if self.sorted:
             return
-        rev = (self.minimax == Consts.minimaxType["maximize"])
 
         if self.sortType == Consts.sortType["raw"]:
-            # TODO update to proper python3 sorting
-            # https://docs.python.org/3.3/howto/sorting.html
-            self.internalPop.sort(key=cmp_to_key(Util.cmp_individual_raw), reverse=rev)
+            order = self.getRawRanking()
         else:
-            self.scale()
-            self.internalPop.sort(key=cmp_to_key(Util.cmp_individual_scaled), reverse=rev)
-            self.internalPopRaw = self.internalPop[:]
-            self.internalPopRaw.sort(key=cmp_to_key(Util.cmp_individual_raw), reverse=rev)
+            if not self.scaled:
+                self.scale()
+            order = rankIndexes(self.getFitness(), self.minimax == Consts.minimaxType["maximize"])
+
+        internal_pop = self.internalPop
+        internal_pop[:] = [internal_pop[i] for i in order]
+        if self.scoreArray is not None:
+            self.scoreArray = takeArray(self.scoreArray, order)
+        if self.fitnessArray is not None:
+            self.fitnessArray = takeArray(self.fitnessArray, order)
+        if self.sortType == Consts.sortType["raw"]:
+            self.rawRanking = list(range(len(internal_pop)))
+        else:
+            self.rawRanking = None
 
         self.sorted = True
 
@@ -340,69 +1129,466 @@ class GPopulation(object):
     def setInitialPopulation(self, init_population):
         """ Add initial population to fill some or all the population """
         self.internalPop = init_population
+        self.clearFlags()
+
+    def __newIndividual(self):
+        """ Returns a clone of the sample genome, or a view of the genotype matrix
+        with its genes on the matrix layout """
+        if self.genotypeMatrix is not None:
+            return self.genotypeMatrix.view(self.oneSelfGenome)
+        return self.oneSelfGenome.clone()
 
     def create(self, **args):
         """ Clone the example genome to fill the population """
         self.minimax = args["minimax"]
         if not self.internalPop:
-            self.internalPop = [self.oneSelfGenome.clone() for i in range(self.popSize)]
+            self.internalPop = [self.__newIndividual() for i in range(self.popSize)]
             self.clearFlags()
         else:
             how_many_to_clone = self.popSize - len(self.internalPop)
-            new_population = [self.oneSelfGenome.clone() for i in range(how_many_to_clone)]
+            new_population = [self.__newIndividual() for i in range(how_many_to_clone)]
             self.internalPop = self.internalPop + new_population
             self.clearFlags()
 
-    def __findIndividual(self, individual, end):
-        for i in range(end):
-            if individual.compare(self.internalPop[i]) == 0:
-                return True
-
     def initialize(self, **args):
         """ Initialize all individuals of population,
-        this calls the initialize() of individuals """
+        this calls the initialize() of individuals
+
+        When the *full_diversity* parameter of the genome is True (the default) and
+        the genome has the *compare()* method, like the :class:`GTree.GTreeGP`, the
+        individuals which duplicate a previous one are initialized again, up to
+        :attr:`Consts.CDefDuplicatesRetries` times. The duplicates are found by a
+        :class:`GenotypeIndex`, so only the genomes with a digest (see
+        :meth:`GenomeBase.GenomeBase.getGenotypeDigest`) are checked.
+
+        """
         logging.debug("Initializing the population")
 
         if self.oneSelfGenome.getParam("full_diversity", True) and hasattr(self.oneSelfGenome, "compare"):
-            for i in range(len(self.internalPop)):
-                curr = self.internalPop[i]
-                curr.initialize(**args)
-                while self.__findIndividual(curr, i):
-                    curr.initialize(**args)
+            index = GenotypeIndex()
+            duplicates = 0
+            for ind in self.internalPop:
+                ind.initialize(**args)
+                retries = 0
+                while not index.add(ind):
+                    if retries == Consts.CDefDuplicatesRetries:
+                        duplicates += 1
+                        break
+                    ind.initialize(**args)
+                    retries += 1
+            if duplicates:
+                logging.debug("The population was initialized with %d duplicated individuals", duplicates)
         else:
             for gen in self.internalPop:
                 gen.initialize(**args)
+        self.packGenotypes()
+        self.scoreHistory.clear()
         self.clearFlags()
 
     def evaluate(self, **args):
         """ Evaluate all individuals in population, calls the evaluate() method of individuals
 
+        Only the individuals which aren't evaluated yet (see
+        :meth:`GenomeBase.GenomeBase.isEvaluated`) are sent to the evaluation function,
+        the unchanged individuals keep their scores. When the fitness cache is
+        enabled (see :meth:`setFitnessCache`), the genotypes already seen take
+        the cached score as well.
+
+        When the *evalTimeout* parameter is set (see :meth:`setParams`), the evaluations
+        which take more than *evalTimeout* seconds are abandoned and the individuals take
+        the *evalPenalty* score (or the worst score of the population, by default), the
+        worker processes running them are killed and replaced. The number of timeouts is
+        reported on the optional *evalTimeouts* statistic. The timeout is honored by the "process"
+        and "async" backends, the threads can't be cancelled, so the "thread" and
+        "serial" backends ignore it.
+
+        With the unordered multiprocessing mode (see :meth:`setMultiProcessing`), the
+        individuals are sent in chunks and their scores are written back as soon as
+        each chunk finishes, so the individuals which are slow to evaluate don't hold
+        the others. The fraction of time the workers were busy is reported on the
+        optional *evalUtilization* statistic.
+
+        If the batch evaluator slot has functions, they are called only once with
+        all the individuals to evaluate (see :meth:`getBatchGenotypes`), each
+        function must return a sequence with one score for each individual, the
+        scores of all the functions are summed.
+
+        Example:
+           >>> def sphere_batch(genes):
+           >>>    return (genes ** 2).sum(axis=1)
+           >>> population.batchEvaluator.set(sphere_batch)
+
         :param args: this params are passed to the evaluation function
 
         """
+        self.packGenotypes()
+        self.timedOut = []
+        pending = [i for i in range(len(self.internalPop)) if not self.internalPop[i].evaluated]
+        duplicated = []
+        if self.fitnessCache is not None:
+            pending, duplicated = self.__lookupCache(pending)
+        logging.debug("Evaluating %d of %d individuals", len(pending), len(self.internalPop))
+
+        self.__evaluateIndexes(pending, **args)
+
+        if self.fitnessCache is not None:
+            leftover = self.__storeCache(pending, duplicated)
+            self.__evaluateIndexes(leftover, **args)
+
+        self.packGenotypes()
+        self.clearFlags()
+
+    def __evaluateIndexes(self, indexes, **args):
+        """ Evaluates the individuals of the *indexes* using the batch evaluator,
+        the multiprocessing or the evaluate() method of the individuals """
+        if not indexes:
+            return
+
+        backend = self.getEvaluationBackend()
+
+        if not self.batchEvaluator.isEmpty():
+            self.__evaluateBatch(indexes, **args)
+
+        elif backend == "thread":
+            self.__evaluateThreaded(indexes, **args)
+
+        elif backend == "async":
+            self.__evaluateAsync(indexes, **args)
+
         # We have multiprocessing
-        if self.multiProcessing[0] and MULTI_PROCESSING:
-            logging.debug("Evaluating the population using the multiprocessing method")
-            proc_pool = Pool(processes=self.multiProcessing[2])
+        elif backend == "process":
+            self.__evaluateProcesses(indexes)
 
+        else:
+            for index in indexes:
+                self.internalPop[index].evaluate(**args)
+
+    def __evaluateProcesses(self, indexes):
+        """ Evaluates the individuals of the *indexes* using a pool of processes """
+        logging.debug("Evaluating the population using the multiprocessing method")
+        proc_pool = self.procPool
+        if proc_pool is None:
+            proc_pool = self.__createPool()
+
+        individuals = [self.internalPop[i] for i in indexes]
+        template = self.oneSelfGenome
+        try:
+            # Evaluation timeout parameter
+            if self.getParam("evalTimeout", None) is not None:
+                self.__evaluateWithTimeout(proc_pool, indexes)
+            # Multiprocessing unordered parameter
+            elif self.multiProcessing[3]:
+                self.__evaluateUnordered(proc_pool, indexes)
             # Multiprocessing full_copy parameter
-            if self.multiProcessing[1]:
-                results = proc_pool.map(multiprocessing_eval_full, self.internalPop)
-                proc_pool.close()
-                proc_pool.join()
-                for i in range(len(self.internalPop)):
-                    self.internalPop[i] = results[i]
+            elif self.multiProcessing[1]:
+                results = proc_pool.map(multiprocessing_eval_full, [packWire(ind, template) for ind in individuals])
+                for index, data in zip(indexes, results):
+                    self.internalPop[index] = unpackWire(data, template)
             else:
-                results = proc_pool.map(multiprocessing_eval, self.internalPop)
-                proc_pool.close()
-                proc_pool.join()
-                for individual, score in zip(self.internalPop, results):
+                results = proc_pool.map(multiprocessing_eval, [packWire(ind, template) for ind in individuals])
+                for individual, score in zip(individuals, results):
                     individual.score = score
+                    individual.evaluated = True
+        finally:
+            # A temporary pool, the population doesn't own a persistent one
+            if proc_pool is not self.procPool:
+                release_pool(proc_pool)
+
+    def __evaluateThreaded(self, indexes, **args):
+        """ Evaluates the individuals of the *indexes* in place using a pool of threads """
+        logging.debug("Evaluating the population using the thread backend")
+        thread_pool = self.procPool
+        if thread_pool is None:
+            thread_pool = self.__createPool()
+
+        def evaluate_individual(index):
+            self.internalPop[index].evaluate(**args)
+
+        try:
+            if self.multiProcessing[3]:
+                chunk_size = self.getChunkSize(len(indexes), self.multiProcessing[2] or CPU_COUNT)
+                for _ in thread_pool.imap_unordered(evaluate_individual, indexes, chunk_size):
+                    pass
+            else:
+                thread_pool.map(evaluate_individual, indexes)
+        finally:
+            if thread_pool is not self.procPool:
+                release_pool(thread_pool)
+
+    def __evaluateAsync(self, indexes, **args):
+        """ Evaluates the individuals of the *indexes* concurrently on an event loop,
+        the evaluation functions may be coroutine functions (*async def*) """
+        concurrency = self.multiProcessing[2] or Consts.CDefAsyncConcurrency
+        timeout = self.getParam("evalTimeout", None)
+        retries = self.getParam("evalRetries", Consts.CDefEvalRetries)
+        logging.debug("Evaluating the population using the async backend, concurrency=%d", concurrency)
+
+        timed_out = []
+
+        async def evaluate_individual(semaphore, index):
+            individual = self.internalPop[index]
+            async with semaphore:
+                for attempt in range(retries + 1):
+                    try:
+                        score = 0.0
+                        for result in individual.evaluator.applyFunctions(individual, **args):
+                            if inspect.isawaitable(result):
+                                result = await asyncio.wait_for(result, timeout)
+                            score += result
+                        break
+                    except asyncio.TimeoutError:
+                        if attempt == retries:
+                            timed_out.append(index)
+                            return
+                        logging.debug("Evaluation timed out, retrying")
+                    except Exception as exc:
+                        if attempt == retries:
+                            raise
+                        logging.debug("Evaluation failed (%r), retrying", exc)
+            individual.score = score
+            individual.evaluated = True
+
+        async def evaluate_all():
+            semaphore = asyncio.Semaphore(concurrency)
+            await asyncio.gather(*[evaluate_individual(semaphore, index) for index in indexes])
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(evaluate_all())
         else:
-            for ind in self.internalPop:
-                ind.evaluate(**args)
+            # The population is evaluated from a coroutine, the loop can't be
+            # nested, so the evaluation runs on its own loop in other thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(asyncio.run, evaluate_all()).result()
+
+        self.__penalizeTimeouts(timed_out)
+
+    def __evaluateWithTimeout(self, proc_pool, indexes):
+        """ Evaluates the individuals of the *indexes* one by one on the worker processes,
+        the workers which exceed the *evalTimeout* parameter are killed and their
+        individuals take the penalty score """
+        timeout = self.getParam("evalTimeout")
+        full_copy = self.multiProcessing[1]
+        token = next(_evaluationTokens)
+        events = proc_pool.startEvents
+        logging.debug("Evaluating %d individuals with a timeout of %ss", len(indexes), timeout)
+
+        pending = {}
+        for index in indexes:
+            job = (token, index, packWire(self.internalPop[index], self.oneSelfGenome), full_copy)
+            pending[index] = proc_pool.apply_async(multiprocessing_eval_timed, (job,))
+
+        started = {}
+        timed_out = []
+        while pending:
+            while not events.empty():
+                event_token, index, pid = events.get()
+                if event_token == token:
+                    started[index] = (pid, perf_counter())
+
+            now = perf_counter()
+            for index in list(pending):
+                result = pending[index]
+                if result.ready():
+                    _, value, _ = result.get()
+                    if full_copy:
+                        self.internalPop[index] = unpackWire(value, self.oneSelfGenome)
+                    else:
+                        individual = self.internalPop[index]
+                        individual.score = value
+                        individual.evaluated = True
+                    del pending[index]
+                elif index in started and now - started[index][1] > timeout:
+                    logging.warning("The evaluation of the individual %d timed out, killing the worker %d",
+                                    index, started[index][0])
+                    proc_pool.killWorker(started[index][0])
+                    timed_out.append(index)
+                    del pending[index]
+
+            if pending:
+                next(iter(pending.values())).wait(0.01)
+
+        self.__penalizeTimeouts(timed_out)
+
+    def __penalizeTimeouts(self, timed_out):
+        """ Sets the penalty score to the individuals whose evaluation timed out """
+        self.stats["evalTimeouts"] += len(timed_out)
+        if not timed_out:
+            return
+        self.timedOut.extend(timed_out)
+
+        penalty = self.getParam("evalPenalty", None)
+        if penalty is None:
+            scores = [ind.score for i, ind in enumerate(self.internalPop)
+                      if ind.evaluated and i not in timed_out]
+            if not scores:
+                Util.raiseException("All the evaluations timed out, set the 'evalPenalty' parameter",
+                                    RuntimeError)
+            if self.minimax == Consts.minimaxType["maximize"]:
+                penalty = min(scores)
+            else:
+                penalty = max(scores)
+
+        for index in timed_out:
+            individual = self.internalPop[index]
+            individual.score = penalty
+            individual.evaluated = True
+
+    def __evaluateUnordered(self, proc_pool, indexes):
+        """ Evaluates the individuals of the *indexes* in chunks, taking the results
+        in the order they finish, the chunk size is tuned using the evaluation
+        time measured on the previous generations """
+        full_copy = self.multiProcessing[1]
+        workers = self.multiProcessing[2] or CPU_COUNT
+        chunk_size = self.getChunkSize(len(indexes), workers)
+        logging.debug("Evaluating %d individuals in chunks of %d", len(indexes), chunk_size)
+
+        template = self.oneSelfGenome
+        jobs = [(index, packWire(self.internalPop[index], template), full_copy) for index in indexes]
+        busy_time = 0.0
+        start = perf_counter()
+        for index, result, elapsed in proc_pool.imap_unordered(multiprocessing_eval_indexed, jobs, chunk_size):
+            if full_copy:
+                self.internalPop[index] = unpackWire(result, template)
+            else:
+                individual = self.internalPop[index]
+                individual.score = result
+                individual.evaluated = True
+            busy_time += elapsed
+        wall_time = perf_counter() - start
+
+        latency = busy_time / len(indexes)
+        if self.evalLatency is None:
+            self.evalLatency = latency
+        else:
+            self.evalLatency = (self.evalLatency + latency) / 2.0
 
-        self.clearFlags()
+        if wall_time > 0.0:
+            self.stats["evalUtilization"] = min(1.0, busy_time / (wall_time * workers))
+        logging.debug("Evaluation latency %.6fs, worker utilization %.2f",
+                      latency, self.stats["evalUtilization"])
+
+    def getChunkSize(self, count, workers):
+        """ Returns the number of individuals sent to a worker process at once by
+        the unordered multiprocessing mode
+
+        The chunks take about :attr:`Consts.CDefPoolChunkTime` seconds to evaluate, using the
+        average evaluation time of the previous generations, but there are at least
+        four chunks for each worker, so the slow chunks don't stall the generation.
+
+        :param count: the number of individuals to evaluate
+        :param workers: the number of worker processes
+        :rtype: the chunk size
+
+        """
+        max_size = max(1, count // (workers * 4))
+        if not self.evalLatency:
+            return max_size
+        return max(1, min(max_size, int(Consts.CDefPoolChunkTime / self.evalLatency)))
+
+    def getBatchGenotypes(self, individuals):
+        """ Returns the genes of the individuals as they are sent to the batch evaluator
+
+        When numpy is available and the genomes are lists (:class:`G1DList.G1DList`,
+        :class:`G2DList.G2DList`, :class:`G1DBinaryString.G1DBinaryString`), the genes
+        are stacked on an array with one row for each individual (a 2D array for the
+        1D genomes and a 3D array for the 2D genomes), otherwise, the list of the
+        individuals is returned. On the matrix layout (see :meth:`setMatrixLayout`),
+        the rows of the individuals are taken from the genotype matrix at once.
+
+        :param individuals: the list of individuals
+        :rtype: a numpy array or the list of individuals
+
+        """
+        genotype_matrix = self.genotypeMatrix
+        if genotype_matrix is not None and all(genotype_matrix.owns(ind) and ind.isPacked() for ind in individuals):
+            return genotype_matrix.matrix[genotype_matrix.getRows(individuals)]
+        if HAS_NUMPY and all(hasattr(ind, "genomeList") for ind in individuals):
+            return numpy.array([ind.genomeList for ind in individuals])
+        return individuals
+
+    def __evaluateBatch(self, indexes, **args):
+        """ Evaluates the individuals of the *indexes* with a single call of each
+        function of the batch evaluator """
+        logging.debug("Evaluating %d individuals using the batch evaluator", len(indexes))
+        individuals = [self.internalPop[i] for i in indexes]
+        batch = self.getBatchGenotypes(individuals)
+
+        totals = [0.0] * len(individuals)
+        for scores in self.batchEvaluator.applyFunctions(batch, **args):
+            if len(scores) != len(totals):
+                Util.raiseException("The batch evaluator returned %d scores for %d individuals" %
+                                    (len(scores), len(totals)), ValueError)
+            for i, score in enumerate(scores):
+                totals[i] += float(score)
+
+        for individual, score in zip(individuals, totals):
+            individual.score = score
+            individual.evaluated = True
+
+    def __lookupCache(self, pending):
+        """ Takes the cached scores of the pending individuals
+
+        :param pending: the indexes of the individuals to evaluate
+        :rtype: a tuple with the indexes which must be evaluated and the indexes
+                of the individuals which have the same genotype of one of them
+
+        """
+        cache = self.fitnessCache
+        misses = []
+        duplicated = []
+        seen = set()
+        for index in pending:
+            individual = self.internalPop[index]
+            key = individual.getGenotypeKey()
+            if key is None:
+                misses.append(index)
+            elif key in seen:
+                duplicated.append(index)
+            else:
+                score = cache.get(key)
+                if score is None:
+                    seen.add(key)
+                    misses.append(index)
+                else:
+                    individual.score = score
+                    individual.evaluated = True
+        return misses, duplicated
+
+    def __storeCache(self, evaluated, duplicated):
+        """ Caches the scores of the evaluated individuals and sets the scores of the
+        individuals which were duplicated on the same generation, the penalty of
+        the evaluations which timed out isn't cached, only their duplicates take it
+
+        :rtype: the indexes of the duplicated individuals whose score was discarded
+                from the cache before they could take it
+
+        """
+        cache = self.fitnessCache
+        timed_out = set(self.timedOut)
+        penalized = {}
+        for index in evaluated:
+            individual = self.internalPop[index]
+            key = individual.getGenotypeKey()
+            if key is None:
+                continue
+            if index in timed_out:
+                penalized[key] = individual.score
+            else:
+                cache.set(key, individual.score)
+
+        leftover = []
+        for index in duplicated:
+            individual = self.internalPop[index]
+            key = individual.getGenotypeKey()
+            score = penalized[key] if key in penalized else cache.get(key)
+            if score is None:
+                leftover.append(index)
+            else:
+                individual.score = score
+                individual.evaluated = True
+        return leftover
 
     def scale(self, **args):
         """ Scale the population using the scaling method
@@ -410,18 +1596,36 @@ class GPopulation(object):
         :param args: this parameter is passed to the scale method
 
         """
+        # The scaling schemes set the fitness array, see setFitness()
+        self.fitnessArray = None
         for it in self.scaleMethod.applyFunctions(self, **args):
             pass
 
-        fit_sum = 0
-        for ind in range(len(self)):
-            fit_sum += self[ind].fitness
-
-        self.stats["fitMax"] = max(self, key=key_fitness_score).fitness
-        self.stats["fitMin"] = min(self, key=key_fitness_score).fitness
-        self.stats["fitAve"] = fit_sum / float(len(self))
+        fitness = self.getFitness()
+        if HAS_NUMPY:
+            self.stats["fitMax"] = float(fitness.max())
+            self.stats["fitMin"] = float(fitness.min())
+            self.stats["fitAve"] = float(fitness.mean())
+        else:
+            self.stats["fitMax"] = max(fitness)
+            self.stats["fitMin"] = min(fitness)
+            self.stats["fitAve"] = sum(fitness) / float(len(fitness))
 
         self.sorted = False
+        self.scaled = True
+
+    def prepareSelection(self):
+        """ Prepares the population for the selection, the scaled fitness is
+        computed when the population is sorted by it, but the population isn't
+        sorted, the selectors which need a complete ranking sort it on demand
+        (see :meth:`sort`)
+
+        .. versionadded:: 0.7
+           The `prepareSelection` method.
+
+        """
+        if self.sortType == Consts.sortType["scaled"] and not self.scaled:
+            self.scale()
 
     def printStats(self):
         """ Print statistics of the current population """
@@ -447,8 +1651,15 @@ class GPopulation(object):
         pop.sortType = self.sortType
         pop.minimax = self.minimax
         pop.scaleMethod = self.scaleMethod
+        pop.batchEvaluator = self.batchEvaluator
+        pop.allSlots = [pop.scaleMethod, pop.batchEvaluator]
         pop.internalParams = self.internalParams
         pop.multiProcessing = self.multiProcessing
+        pop.procPool = self.procPool
+        pop.evalLatency = self.evalLatency
+        pop.fitnessCache = self.fitnessCache
+        pop.genotypeMatrix = self.genotypeMatrix
+        pop.scoreHistory = self.scoreHistory
 
     def getParam(self, key, nvl=None):
         """ Gets an internal parameter
@@ -479,7 +1690,6 @@ class GPopulation(object):
     def clear(self):
         """ Remove all individuals from population """
         del self.internalPop[:]
-        del self.internalPopRaw[:]
         self.clearFlags()
 
     def clone(self):
@@ -55,6 +55,18 @@ Default Parameters
 
    The Rank Selection method
 
+*Checkpoints*
+
+   Default is **None**, see :meth:`GSimpleGA.setCheckpoint`
+
+*Phase Timings*
+
+   Default is **False**, see :meth:`GSimpleGA.setTimings`
+
+*Duplicates Policy*
+
+   Default is **Consts.duplicatesPolicy["none"]**, see :meth:`GSimpleGA.setDuplicatesPolicy`
+
 Class
 -------------------------------------------------------------
 
@@ -63,19 +75,30 @@ Class
 
 import random
 import logging
+import hashlib
 from time import time
 from sys import platform as sys_platform
 from sys import stdout as sys_stdout
 import code
 
-from .GPopulation import GPopulation
+from .GPopulation import GenotypeIndex, GPopulation, partialRankIndexes
+from .FitnessCache import FitnessCache
+from .Checkpoint import CheckpointWriter
+from . import Checkpoint
 from .FunctionSlot import FunctionSlot
 from .representations.GenomeBase import GenomeBase
 from .DBAdapters import DBBaseAdapter
+from .Statistics import Timings
 from . import Consts
 from . import Util
 import pyevolve
 
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # Platform dependant code for the Interactive Mode
 if sys_platform[:3] == "win":
     import msvcrt
@@ -118,7 +141,7 @@ def ConvergenceCriteria(ga_engine):
 
     """
     pop = ga_engine.getPopulation()
-    return pop[0] == pop[len(pop) - 1]
+    return pop.bestRaw() == pop.worstRaw()
 
 
 def RawStatsCriteria(ga_engine):
@@ -150,6 +173,23 @@ def FitnessStatsCriteria(ga_engine):
     return False
 
 
+def ImprovementCriteria(ga_engine):
+    """ Terminate the evolution when the best raw score didn't improve along
+    the last :attr:`Consts.CDefStatsImprovementWindow` generations (see the
+    *rawImprovement* statistic of :class:`Statistics.Statistics`)
+
+    Example:
+       >>> ga_engine.terminationCriteria.set(GSimpleGA.ImprovementCriteria)
+
+    .. versionadded:: 0.7
+       The `ImprovementCriteria` function.
+
+    """
+    if ga_engine.getCurrentGeneration() < Consts.CDefStatsImprovementWindow:
+        return False
+    return ga_engine.getStatistics()["rawImprovement"] <= 0.0
+
+
 class GSimpleGA(object):
     """ GA Engine Class - The Genetic Algorithm Core
 
@@ -165,6 +205,12 @@ class GSimpleGA(object):
 
     .. note:: if you use the same random seed, all the runs of algorithm will be the same
 
+    The engine has its own random number generator (see :meth:`getRandom`), which
+    is sent to the selectors, the crossovers, the mutators and the initializators
+    as the *rng* parameter, so the engines of the same process don't interfere with
+    each other. Without the seed, the seed of the engine is drawn from the
+    :mod:`random` module.
+
     """
 
     selector = None
@@ -197,24 +243,34 @@ class GSimpleGA(object):
     Now, when you run your GA, it will stop when the population converges.
 
     There are those termination criteria functions: :func:`GSimpleGA.RawScoreCriteria`,
-    :func:`GSimpleGA.ConvergenceCriteria`, :func:`GSimpleGA.RawStatsCriteria`, :func:`GSimpleGA.FitnessStatsCriteria`
+    :func:`GSimpleGA.ConvergenceCriteria`, :func:`GSimpleGA.RawStatsCriteria`, :func:`GSimpleGA.FitnessStatsCriteria`,
+    :func:`GSimpleGA.ImprovementCriteria`
 
     But you can create your own termination function, this function receives
     one parameter which is the GA Engine, follows an example: ::
 
        def ConvergenceCriteria(ga_engine):
           pop = ga_engine.getPopulation()
-          return pop[0] == pop[len(pop)-1]
+          return pop.bestRaw() == pop.worstRaw()
 
     When this function returns True, the GA Engine will stop the evolution and show
     a warning, if False, the evolution continues, this function is called every
     generation.
     """
 
+    #: The attributes of the engine stored on the checkpoints
+    checkpointAttributes = ("nGenerations", "pMutation", "pCrossover", "nElitismReplacement",
+                            "elitism", "minimax", "max_time", "seed", "duplicatesPolicy")
+
     def __init__(self, genome, seed=None, interactiveMode=True):
         """ Initializator of GSimpleGA """
         if seed:
             random.seed(seed)
+        else:
+            seed = random.getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.numpyRng = None
 
         if not isinstance(interactiveMode, bool):
             Util.raiseException("Interactive Mode option must be True or False", TypeError)
@@ -230,6 +286,7 @@ class GSimpleGA(object):
         self.setPopulationSize(Consts.CDefGAPopulationSize)
         self.minimax = Consts.minimaxType["maximize"]
         self.elitism = True
+        self.duplicatesPolicy = Consts.CDefGADuplicatesPolicy
 
         # Adapters
         self.dbAdapter = None
@@ -250,6 +307,16 @@ class GSimpleGA(object):
 
         self.currentGeneration = 0
 
+        # Checkpoints
+        self.checkpointPath = None
+        self.checkpointGenFreq = 0
+        self.checkpointTimeFreq = 0
+        self.checkpointWriter = CheckpointWriter()
+        self.lastCheckpoint = (0, 0.0)
+        self.resumedElapsed = None
+
+        # The phase timings, None when disabled
+        self.timings = None
 
         logging.debug("A GA Engine was created, nGenerations=%d", self.nGenerations)
 
@@ -334,6 +401,171 @@ class GSimpleGA(object):
             Util.raiseException("Replacement number must be >= 1", ValueError)
         self.nElitismReplacement = numreplace
 
+    def setMultiProcessing(self, flag=True, full_copy=False, max_processes=None, unordered=False,
+                           backend="process"):
+        """ Sets the flag to enable/disable the use of python multiprocessing module.
+        Use this option when you have more than one core on your CPU and when your
+        evaluation function is very slow.
+
+        Pyevolve will automaticly check if your Python version has **multiprocessing**
+        support and if you have more than one single CPU core. If you don't have support
+        or have just only one core, Pyevolve will not use the **multiprocessing**
+        feature.
+
+        Pyevolve uses the **multiprocessing** to execute the evaluation function over
+        the individuals, so the use of this feature will make sense if you have a
+        truly slow evaluation function (which is commom in GAs).
+
+        The process pool is created once when the evolution starts and it is reused
+        by all the generations, it is shut down when the evolution finishes, even
+        if it was interrupted or an error was raised.
+
+        The parameter "full_copy" defines where the individual data should be copied back
+        after the evaluation or not. This parameter is useful when you change the
+        individual in the evaluation function.
+
+        The parameter "unordered" sends the individuals to the workers in chunks sized
+        from the measured evaluation time and takes the scores as soon as each chunk
+        finishes, use it when the evaluation time varies a lot between individuals.
+        The worker utilization of each generation is reported on the optional
+        *evalUtilization* statistic.
+
+        The parameter "backend" can be "process" (default), "thread", "async" or "serial".
+        The "thread" backend evaluates the individuals in place on a pool of threads, without
+        the pickling of the individuals, use it when the evaluation function spends its
+        time on code which releases the GIL (numpy, scipy or an external process). The
+        "async" backend accepts evaluation functions defined with *async def* and runs
+        up to "max_processes" of them concurrently on an event loop, the timeout and the
+        retries of each evaluation are the *evalTimeout* and *evalRetries* parameters of
+        the population. The "serial" backend evaluates the population on the main thread.
+
+        Example:
+           >>> async def eval_func(chromosome):
+           >>>    reader, writer = await asyncio.open_connection("localhost", 8000)
+           >>>    (...)
+           >>> ga.setMultiProcessing(True, max_processes=50, backend="async")
+           >>> ga.getPopulation().setParams(evalTimeout=2.0, evalRetries=1)
+
+        :param flag: True (default) or False
+        :param full_copy: True or False (default)
+        :param max_processes: None (default) or an integer value
+        :param unordered: True or False (default)
+        :param backend: "process" (default), "thread", "async" or "serial"
+
+        .. warning:: Use this option only when your evaluation function is slow, so you'll
+                     get a good tradeoff between the process communication speed and the
+                     parallel evaluation. The use of the **multiprocessing** doesn't means
+                     always a better performance.
+
+        .. note:: To enable the multiprocessing option, you **MUST** add the *__main__* check
+                  on your application, otherwise, it will result in errors. See more on the
+                  `Python Docs <http://docs.python.org/library/multiprocessing.html#multiprocessing-programming>`__
+                  site.
+
+        """
+        if not isinstance(flag, bool):
+            Util.raiseException("Multiprocessing option must be True or False", TypeError)
+
+        if not isinstance(full_copy, bool):
+            Util.raiseException("Multiprocessing 'full_copy' option must be True or False", TypeError)
+
+        if not isinstance(unordered, bool):
+            Util.raiseException("Multiprocessing 'unordered' option must be True or False", TypeError)
+
+        self.internalPop.setMultiProcessing(flag, full_copy, max_processes, unordered, backend)
+
+    def setFitnessCache(self, flag=True, max_size=Consts.CDefFitnessCacheSize):
+        """ Enable/disable the cache of the scores of the genotypes already evaluated
+
+        When the population converges, a lot of individuals share the same genes,
+        with the cache enabled, those individuals take the score of the first
+        evaluation instead of calling the evaluation function again. The cache
+        is bounded by *max_size*, the least recently used scores are discarded.
+        The hits and the misses are reported on the optional *cacheHits* and
+        *cacheMisses* statistics.
+
+        The genome must implement the *getGenotypeKey()* method, the genomes which
+        return None (the default of :class:`GenomeBase.GenomeBase`) are always evaluated.
+
+        :param flag: True (default) or False
+        :param max_size: the maximum number of cached scores
+
+        .. warning:: Use this option only when your evaluation function is deterministic,
+                     the cached score is reused even if the evaluation could return a
+                     different value for the same genes.
+
+        """
+        if not isinstance(flag, bool):
+            Util.raiseException("Fitness cache option must be True or False", TypeError)
+
+        self.internalPop.setFitnessCache(FitnessCache(max_size) if flag else None)
+
+    def setEvaluationTimeout(self, seconds, penalty=None):
+        """ Sets the maximum time of the evaluation of each individual
+
+        The individuals whose evaluation takes more than *seconds* take the
+        *penalty* score and the worker process evaluating them is killed and
+        replaced, so one pathological individual can't hold the generation. Use
+        it together with :meth:`setMaxTime` on the unattended runs. The number of
+        timeouts of each generation is reported on the optional *evalTimeouts* statistic.
+
+        :param seconds: the timeout in seconds or None to disable it
+        :param penalty: the score of the individuals which timed out, None (default)
+                        uses the worst score of the evaluated individuals
+
+        .. note:: The timeout is honored only by the "process" and "async" evaluation
+                  backends, see :meth:`setMultiProcessing`, with the "process" backend,
+                  each individual is sent alone to the workers.
+
+        """
+        if seconds is not None and seconds <= 0:
+            Util.raiseException("The evaluation timeout must be greater than zero", ValueError)
+        self.internalPop.setParams(evalTimeout=seconds, evalPenalty=penalty)
+
+    def setTimings(self, flag=True):
+        """ Enable/disable the timing of the phases of the generations
+
+        The time spent on the selection, crossover, mutation, evaluation,
+        elitism, sort, callbacks and DB Adapter of each generation is measured
+        with :func:`time.perf_counter_ns` and stored on the optional *time*
+        statistics, see :class:`Statistics.Timings`. The DB Adapters dump them
+        when their keys are selected.
+
+        Example:
+           >>> ga_engine.setTimings(True)
+           >>> adapter.setStatsFields(["rawMax", "rawMin", "timeEvaluation"])
+           >>> ga_engine.evolve()
+           >>> print(ga_engine.getTimings().totals())
+
+        :param flag: True (default) or False
+
+        .. note:: When the timings are disabled, the cost of the instrumentation
+                  is a test for each phase.
+
+        """
+        if not isinstance(flag, bool):
+            Util.raiseException("Timings option must be True or False", TypeError)
+        if not flag:
+            self.timings = None
+        elif self.timings is None:
+            self.timings = Timings()
+
+    def getTimings(self):
+        """ Returns the timings of the phases of the generations
+
+        :rtype: the :class:`Statistics.Timings` instance or None when disabled
+
+        """
+        return self.timings
+
+    def getFitnessCache(self):
+        """ Returns the fitness cache used by the population
+
+        :rtype: the :class:`FitnessCache.FitnessCache` instance or None
+
+        """
+        return self.internalPop.fitnessCache
+
     def setInteractiveMode(self, flag=True):
         """ Enable/disable the interactive mode
 
@@ -359,6 +591,8 @@ class GSimpleGA(object):
         ret += "\tMinimax Type:\t\t %s\n" % minimax_type.capitalize()
         ret += "\tElitism:\t\t %s\n" % self.elitism
         ret += "\tElitism Replacement:\t %d\n" % self.nElitismReplacement
+        duplicates = Util.getTypeName(Consts.duplicatesPolicy, self.duplicatesPolicy)
+        ret += "\tDuplicates Policy:\t %s\n" % duplicates.capitalize()
         ret += "\tDB Adapter:\t\t %s\n" % self.dbAdapter
         for slot in self.allSlots:
             ret += "\t" + slot.__repr__()
@@ -489,6 +723,31 @@ class GSimpleGA(object):
             Util.raiseException("Elitism option must be True or False", TypeError)
         self.elitism = flag
 
+    def setDuplicatesPolicy(self, policy):
+        """ Sets what is done with the duplicated offspring of each generation,
+        Consts.duplicatesPolicy["none"] (the default) keeps them,
+        Consts.duplicatesPolicy["mutate"] mutates them again and
+        Consts.duplicatesPolicy["replace"] replaces them by new random individuals
+
+        The duplicates are found by a :class:`GPopulation.GenotypeIndex` before
+        the evaluation of the offspring, a duplicate is mutated again (or replaced)
+        up to :attr:`Consts.CDefDuplicatesRetries` times, the genomes without
+        digest (see :meth:`GenomeBase.GenomeBase.getGenotypeDigest`) are never
+        duplicates.
+
+        Example:
+           >>> ga_engine.setDuplicatesPolicy(Consts.duplicatesPolicy["mutate"])
+
+        :param policy: the duplicates policy
+
+        .. versionadded:: 0.7
+           The `setDuplicatesPolicy` method.
+
+        """
+        if policy not in list(Consts.duplicatesPolicy.values()):
+            Util.raiseException("Duplicates policy must be a Consts.duplicatesPolicy type", TypeError)
+        self.duplicatesPolicy = policy
+
     def getDBAdapter(self):
         """ Gets the DB Adapter of the GA Engine
 
@@ -511,6 +770,208 @@ class GSimpleGA(object):
         """
         return self.max_time
 
+    def setSeed(self, seed):
+        """ Sets the seed of the random number generators of the engine, they
+        are restarted from the new seed
+
+        Example:
+           >>> ga_engine.setSeed(ga_engine.spawnSeed(("island", 2)))
+
+        :param seed: the seed
+
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.numpyRng = None
+
+    def getSeed(self):
+        """ Returns the seed of the random number generator of the engine
+
+        :rtype: the seed
+
+        """
+        return self.seed
+
+    def getRandom(self):
+        """ Returns the random number generator of the engine, the operators
+        receive it as the *rng* parameter (see :func:`Util.getRandom`)
+
+        :rtype: the :class:`random.Random` instance
+
+        """
+        return self.rng
+
+    def getNumpyRandom(self):
+        """ Returns the numpy random number generator of the engine, it is created
+        from the seed of the engine, use it on the operators which draw many
+        random numbers at once
+
+        Example:
+           >>> rng = ga_engine.getNumpyRandom()
+           >>> rng.integers(0, 10, size=1000)
+
+        :rtype: the :class:`numpy.random.Generator` instance
+
+        """
+        if not HAS_NUMPY:
+            Util.raiseException("You must install numpy to use the numpy random generator", ImportError)
+        if self.numpyRng is None:
+            self.numpyRng = numpy.random.default_rng(numpy.random.SeedSequence(self.spawnSeed("numpy")))
+        return self.numpyRng
+
+    def spawnSeed(self, key):
+        """ Returns a seed derived from the seed of the engine and the key, the same
+        seed and key always give the same value, regardless of the order of the
+        calls, use it to seed the random number generators of the islands or of
+        the workers
+
+        Example:
+           >>> island_rng = random.Random(ga_engine.spawnSeed(("island", 3)))
+
+        :param key: a value with a stable representation, like a string or a tuple of integers
+        :rtype: a 64 bits integer
+
+        """
+        digest = hashlib.sha256(("%r:%r" % (self.seed, key)).encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "little")
+
+    def spawnRandom(self, key):
+        """ Returns a new random number generator seeded by :meth:`spawnSeed`
+
+        :param key: a value with a stable representation, like a string or a tuple of integers
+        :rtype: the :class:`random.Random` instance
+
+        """
+        return random.Random(self.spawnSeed(key))
+
+    def setCheckpoint(self, path, generations=0, seconds=0):
+        """ Enables the automatic checkpoints of the evolution, a checkpoint is
+        written every *generations* generations and/or every *seconds* seconds
+
+        The checkpoints are written on a background thread, so the evolution
+        doesn't wait for the disk. Use :meth:`resume` to continue an
+        evolution interrupted by a crash.
+
+        Example:
+           >>> ga.setCheckpoint("tsp.ckpt", generations=100, seconds=600)
+
+        :param path: the checkpoint filename, None disables the checkpoints
+        :param generations: the generation interval of the checkpoints, 0 to disable it
+        :param seconds: the time interval of the checkpoints, 0 to disable it
+
+        """
+        if path is not None:
+            if generations < 0 or seconds < 0:
+                Util.raiseException("The checkpoint intervals must be >= 0", ValueError)
+            if not generations and not seconds:
+                Util.raiseException("You must specify the generation or the time interval of the checkpoints",
+                                    ValueError)
+        self.checkpointPath = path
+        self.checkpointGenFreq = generations
+        self.checkpointTimeFreq = seconds
+
+    def getCheckpointState(self):
+        """ Returns the snapshot of the evolution stored on the checkpoints, it has
+        the genotypes and the scores of the population, the current generation, the
+        parameters of the engine, the state of the random number generators and
+        the position of the DB Adapter
+
+        :rtype: a dict with the state of the evolution
+
+        """
+        return {
+            "version": Checkpoint.CHECKPOINT_VERSION,
+            "engine": self.__class__.__name__,
+            "generation": self.currentGeneration,
+            "elapsed": time() - self.time_init if self.time_init else 0.0,
+            "params": dict((attr, getattr(self, attr)) for attr in self.checkpointAttributes),
+            "sortType": self.internalPop.sortType,
+            "population": Checkpoint.encodePopulation(self.internalPop),
+            "random": Checkpoint.getRandomState(),
+            "engineRandom": self.rng.getstate(),
+            "numpyRandom": self.numpyRng.bit_generator.state if self.numpyRng is not None else None,
+            "dbAdapter": self.dbAdapter.getCheckpointState(self) if self.dbAdapter else None,
+        }
+
+    def saveCheckpoint(self, path, background=False):
+        """ Saves the checkpoint of the evolution, it can be called on the step
+        callbacks, see :meth:`setCheckpoint` for the automatic checkpoints
+
+        Example:
+           >>> ga.saveCheckpoint("tsp.ckpt")
+
+        :param path: the checkpoint filename
+        :param background: if True, the file is written on a background thread
+
+        """
+        self.checkpointWriter.write(path, self.getCheckpointState())
+        if not background:
+            self.checkpointWriter.wait()
+        self.lastCheckpoint = (self.currentGeneration, time())
+
+    def loadCheckpoint(self, path):
+        """ Restores the evolution saved by :meth:`saveCheckpoint`, the next call
+        of :meth:`evolve` continues the evolution from the checkpoint
+
+        The engine must be created with the same sample genome and the same
+        function slots (selector, callbacks and adapters) of the saved evolution,
+        they aren't stored on the checkpoint.
+
+        :param path: the checkpoint filename
+
+        """
+        snapshot = Checkpoint.readCheckpoint(path)
+        if snapshot["engine"] != self.__class__.__name__:
+            Util.raiseException("The checkpoint was saved by the %s engine" % (snapshot["engine"],), TypeError)
+
+        for attr, value in snapshot["params"].items():
+            setattr(self, attr, value)
+        self.internalPop.sortType = snapshot["sortType"]
+        self.internalPop.minimax = self.minimax
+        Checkpoint.decodePopulation(self.internalPop, snapshot["population"])
+        self.currentGeneration = snapshot["generation"]
+        Checkpoint.setRandomState(snapshot["random"])
+        self.rng.setstate(snapshot["engineRandom"])
+        self.numpyRng = None
+        if snapshot["numpyRandom"] is not None:
+            self.getNumpyRandom().bit_generator.state = snapshot["numpyRandom"]
+
+        if self.dbAdapter and snapshot["dbAdapter"] is not None:
+            self.dbAdapter.setCheckpointState(snapshot["dbAdapter"])
+
+        self.resumedElapsed = snapshot["elapsed"]
+        logging.debug("The evolution was restored from the checkpoint of the generation %d", self.currentGeneration)
+
+    def resume(self, path, freq_stats=0):
+        """ Restores the evolution from the checkpoint and continues it, see
+        :meth:`loadCheckpoint`
+
+        Example:
+           >>> ga = GSimpleGA.GSimpleGA(genome)
+           >>> ga.setCheckpoint("tsp.ckpt", generations=100)
+           >>> if os.path.exists("tsp.ckpt"):
+           >>>    best = ga.resume("tsp.ckpt", freq_stats=10)
+           >>> else:
+           >>>    best = ga.evolve(freq_stats=10)
+
+        :param path: the checkpoint filename
+        :param freq_stats: if greater than 0, the statistics will be
+                           printed every freq_stats generation.
+        :rtype: returns the best individual of the evolution
+
+        """
+        self.loadCheckpoint(path)
+        return self.evolve(freq_stats)
+
+    def __checkpointDue(self):
+        """ Returns True if the automatic checkpoint must be written """
+        if self.checkpointPath is None:
+            return False
+        generation, last_time = self.lastCheckpoint
+        if self.checkpointGenFreq and self.currentGeneration - generation >= self.checkpointGenFreq:
+            return True
+        return bool(self.checkpointTimeFreq) and time() - last_time >= self.checkpointTimeFreq
+
     def bestIndividual(self):
         """ Returns the population best individual
 
@@ -551,6 +1012,25 @@ class GSimpleGA(object):
         """
         return self.internalPop.getStatistics()
 
+    def __removeDuplicates(self, population):
+        """ Mutates again or replaces the duplicated offspring, see :meth:`setDuplicatesPolicy` """
+        replace = self.duplicatesPolicy == Consts.duplicatesPolicy["replace"]
+        index = GenotypeIndex()
+        duplicates = 0
+        for ind in population.internalPop:
+            retries = 0
+            while not index.add(ind):
+                if retries == Consts.CDefDuplicatesRetries:
+                    duplicates += 1
+                    break
+                if replace:
+                    ind.initialize(ga_engine=self, rng=self.rng)
+                else:
+                    ind.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
+                retries += 1
+        if duplicates:
+            logging.debug("%d duplicated individuals were kept", duplicates)
+
     def step(self):
         """ Just do one step in evolution, one generation """
         newPop = GPopulation(self.internalPop)
@@ -562,67 +1042,110 @@ class GSimpleGA(object):
         if size_iterate % 2 != 0:
             size_iterate -= 1
 
-        crossover_empty = self.select(popID=self.currentGeneration).crossover.isEmpty()
+        crossover_empty = self.internalPop.oneSelfGenome.crossover.isEmpty()
+
+        timings = self.timings
+        if timings is not None:
+            timings.start()
+
+        # All the parents of the generation are selected at once
+        parents = self.selectBatch(len(self.internalPop) + len(self.internalPop) % 2,
+                                   popID=self.currentGeneration)
+
+        if timings is not None:
+            timings.lap("selection")
 
         for i in range(0, size_iterate, 2):
-            genomeMom = self.select(popID=self.currentGeneration)
-            genomeDad = self.select(popID=self.currentGeneration)
+            genomeMom = parents[i]
+            genomeDad = parents[i + 1]
 
             if not crossover_empty and self.pCrossover >= 1.0:
-                for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2):
+                for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2, rng=self.rng):
                     (sister, brother) = it
+                sister.invalidate()
+                brother.invalidate()
             else:
-                if not crossover_empty and Util.randomFlipCoin(self.pCrossover):
-                    for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2):
+                if not crossover_empty and Util.randomFlipCoin(self.pCrossover, self.rng):
+                    for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2, rng=self.rng):
                         (sister, brother) = it
+                    sister.invalidate()
+                    brother.invalidate()
                 else:
                     sister = genomeMom.clone()
                     brother = genomeDad.clone()
 
-            sister.mutate(pmut=self.pMutation, ga_engine=self)
-            brother.mutate(pmut=self.pMutation, ga_engine=self)
+            if timings is not None:
+                timings.lap("crossover")
+
+            sister.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
+            brother.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
+
+            if timings is not None:
+                timings.lap("mutation")
 
             newPop.internalPop.append(sister)
             newPop.internalPop.append(brother)
 
         if len(self.internalPop) % 2 != 0:
-            genomeMom = self.select(popID=self.currentGeneration)
-            genomeDad = self.select(popID=self.currentGeneration)
+            genomeMom = parents[-2]
+            genomeDad = parents[-1]
 
-            if Util.randomFlipCoin(self.pCrossover):
-                for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=1):
+            if Util.randomFlipCoin(self.pCrossover, self.rng):
+                for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=1, rng=self.rng):
                     (sister, brother) = it
+                sister.invalidate()
             else:
-                sister = random.choice([genomeMom, genomeDad])
+                sister = self.rng.choice([genomeMom, genomeDad])
                 sister = sister.clone()
-                sister.mutate(pmut=self.pMutation, ga_engine=self)
+                sister.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
 
             newPop.internalPop.append(sister)
 
+            if timings is not None:
+                timings.lap("crossover")
+
+        if self.duplicatesPolicy != Consts.duplicatesPolicy["none"]:
+            self.__removeDuplicates(newPop)
+
         logging.debug("Evaluating the new created population.")
         newPop.evaluate()
 
+        if timings is not None:
+            timings.lap("evaluation")
+
         if self.elitism:
             logging.debug("Doing elitism.")
-            if self.getMinimax() == Consts.minimaxType["maximize"]:
-                for i in range(self.nElitismReplacement):
-                    # re-evaluate before being sure this is the best
-                    self.internalPop.bestRaw(i).evaluate()
-                    if self.internalPop.bestRaw(i).score > newPop.bestRaw(i).score:
-                        newPop[len(newPop) - 1 - i] = self.internalPop.bestRaw(i)
-            elif self.getMinimax() == Consts.minimaxType["minimize"]:
-                for i in range(self.nElitismReplacement):
-                    # re-evaluate before being sure this is the best
-                    self.internalPop.bestRaw(i).evaluate()
-                    if self.internalPop.bestRaw(i).score < newPop.bestRaw(i).score:
-                        newPop[len(newPop) - 1 - i] = self.internalPop.bestRaw(i)
+            # The heaps pick the elite and the worst slots, no population is sorted
+            maximize = self.getMinimax() == Consts.minimaxType["maximize"]
+            elite = self.internalPop.bestRawIndividuals(self.nElitismReplacement)
+            worstIndexes = newPop.worstRawIndexes(self.nElitismReplacement)
+            # The replacements drop the arrays of the population, the scores
+            # array is kept here and updated with the elite already inserted
+            scores = newPop.getScores()
+            for i, (individual, index) in enumerate(zip(elite, worstIndexes)):
+                # evaluate before being sure this is the best, the individuals
+                # already evaluated keep their scores
+                if not individual.isEvaluated():
+                    individual.evaluate()
+                newBest = scores[partialRankIndexes(scores, i + 1, maximize)[i]]
+                if (maximize and individual.score > newBest) or (not maximize and individual.score < newBest):
+                    newPop[index] = individual
+                    scores[index] = individual.score
+
+        if timings is not None:
+            timings.lap("elitism")
 
         self.internalPop = newPop
-        self.internalPop.sort()
+        self.internalPop.prepareSelection()
 
         logging.debug("The generation %d was finished.", self.currentGeneration)
 
         self.currentGeneration += 1
+        self.internalPop.recordBest(self.currentGeneration)
+
+        if timings is not None:
+            timings.lap("sort")
+            timings.close(self.currentGeneration, self.internalPop.stats)
 
         if self.max_time:
             total_time = time() - self.time_init
@@ -679,7 +1202,13 @@ class GSimpleGA(object):
         stopFlagCallback = False
         stopFlagTerminationCriteria = False
 
-        self.time_init = time()
+        resumed = self.resumedElapsed is not None
+        if resumed:
+            self.time_init = time() - self.resumedElapsed
+            self.resumedElapsed = None
+        else:
+            self.time_init = time()
+        self.lastCheckpoint = (self.currentGeneration, time())
 
         logging.debug("Starting the DB Adapter and the Migration Adapter if any")
         if self.dbAdapter:
@@ -687,14 +1216,33 @@ class GSimpleGA(object):
         if self.migrationAdapter:
             self.migrationAdapter.start()
 
-
-        self.initialize()
-        self.internalPop.evaluate()
-        self.internalPop.sort()
-        logging.debug("Starting loop over evolutionary algorithm.")
+        self.internalPop.openPool()
 
         try:
+            # The population restored from a checkpoint is already evaluated
+            if not resumed:
+                self.initialize()
+            if self.timings is not None:
+                self.timings.start()
+            self.internalPop.evaluate()
+            if self.timings is not None:
+                self.timings.lap("evaluation")
+            self.internalPop.prepareSelection()
+            self.internalPop.recordBest(self.currentGeneration)
+            if self.timings is not None:
+                self.timings.lap("sort")
+                self.timings.close(self.currentGeneration, self.internalPop.stats)
+            logging.debug("Starting loop over evolutionary algorithm.")
+
             while True:
+                if self.migrationAdapter:
+                    logging.debug("Migration adapter: exchange")
+                    self.migrationAdapter.exchange()
+                    self.internalPop.clearFlags()
+                    self.internalPop.prepareSelection()
+
+                if self.timings is not None:
+                    self.timings.start()
 
                 if not self.stepCallback.isEmpty():
                     for it in self.stepCallback.applyFunctions(self):
@@ -704,13 +1252,20 @@ class GSimpleGA(object):
                     for it in self.terminationCriteria.applyFunctions(self):
                         stopFlagTerminationCriteria = it
 
+                if self.timings is not None:
+                    self.timings.lap("callbacks")
+
                 if freq_stats:
                     if (self.currentGeneration % freq_stats == 0) or (self.getCurrentGeneration() == 0):
                         self.printStats()
 
                 if self.dbAdapter:
                     if self.currentGeneration % self.dbAdapter.getStatsGenFreq() == 0:
+                        if self.timings is not None:
+                            self.timings.start()
                         self.dumpStatsDB()
+                        if self.timings is not None:
+                            self.timings.lap("database")
 
                 if stopFlagTerminationCriteria:
                     logging.debug("Evolution stopped by the Termination Criteria !")
@@ -728,11 +1283,24 @@ class GSimpleGA(object):
                 if self.step():
                     break
 
+                if self.__checkpointDue():
+                    self.saveCheckpoint(self.checkpointPath, background=True)
+
         except KeyboardInterrupt:
             logging.debug("CTRL-C detected, finishing evolution.")
+            self.internalPop.closePool(terminate=True)
             if freq_stats:
                 print("\n\tA break was detected, you have interrupted the evolution !\n")
 
+        except BaseException:
+            self.internalPop.closePool(terminate=True)
+            # The last checkpoint is completed before the error is raised
+            self.checkpointWriter.wait()
+            raise
+
+        self.internalPop.closePool()
+        self.checkpointWriter.wait()
+
         if freq_stats != 0:
             self.printStats()
             self.printTimeElapsed()
@@ -755,5 +1323,27 @@ class GSimpleGA(object):
         :param args: this parameters will be sent to the selector
 
         """
+        args.setdefault("rng", self.rng)
         for it in self.selector.applyFunctions(self.internalPop, **args):
             return it
+
+    def selectBatch(self, count, **args):
+        """ Select many individuals from population with a single call of the
+        selector, when it has a *batch* function (see :mod:`Selectors`),
+        otherwise the selector is called once for each individual
+
+        :param count: the number of individuals
+        :param args: this parameters will be sent to the selector
+        :rtype: the list of individuals
+
+        .. note:: When the random apply of the selector slot is enabled, the
+                  selector is drawn for each individual, so the single
+                  selection is used.
+
+        """
+        args.setdefault("rng", self.rng)
+        if not self.selector.isEmpty() and not self.selector.rand_apply:
+            batch = getattr(self.selector[0], "batch", None)
+            if batch is not None:
+                return batch(self.internalPop, count, **args)
+        return [self.select(**args) for i in range(count)]
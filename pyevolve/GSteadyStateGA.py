@@ -0,0 +1,504 @@
+"""
+
+:mod:`GSteadyStateGA` -- the steady-state genetic algorithm
+=====================================================================
+
+This module contains the steady-state GA Engine, instead of creating a
+new population on each generation, like the :class:`GSimpleGA.GSimpleGA`,
+it creates a few offspring on each step, which replace the worst
+individuals (or the losers of tournaments) of the population in place.
+
+The engine has the same API of the :class:`GSimpleGA.GSimpleGA`, the
+generations are counted as the number of steps needed to create as many
+offspring as the population size, so the termination criteria, the step
+callbacks, the statistics and the DB Adapters work the same way.
+
+Default Parameters
+-------------------------------------------------------------
+
+*Offspring*
+
+   Default is 2 offspring on each step
+
+*Replacement*
+
+   >>> Consts.replacementType["worst"]
+
+   The offspring replaces the worst individual
+
+*Asynchronous Mode*
+
+   Default is **False**
+
+*Sort Type*
+
+   >>> Consts.sortType["raw"]
+
+   The steady-state GA keeps the population sorted by the raw score, the
+   scaled sort type isn't supported, because the scaling depends on all
+   the individuals
+
+Class
+-------------------------------------------------------------
+
+"""
+
+import logging
+from bisect import bisect_right
+from itertools import count as itertools_count
+from queue import Queue
+from time import time, perf_counter
+
+from .GSimpleGA import GSimpleGA
+from .GPopulation import GPopulation, CPU_COUNT
+from .Statistics import RunningStatistics
+from . import Consts
+from . import Util
+
+
+def asynchronous_eval(individual, full_copy):
+    """ Internal used by the asynchronous mode, evaluates the individual and
+    returns the score (or the individual itself when full copy) and the time
+    spent on the evaluation """
+    start = perf_counter()
+    individual.evaluate()
+    elapsed = perf_counter() - start
+    return (individual if full_copy else individual.score), elapsed
+
+
+class GSteadyStateGA(GSimpleGA):
+    """ GSteadyStateGA Class - The steady-state GA Engine
+
+    Example:
+       >>> ga = GSteadyStateGA.GSteadyStateGA(genome)
+       >>> ga.setOffspringCount(4)
+       >>> ga.setReplacement(Consts.replacementType["tournament"])
+       >>> ga.evolve(freq_stats=10)
+
+    The population is kept sorted by inserting the offspring on their place
+    (using a binary search) and the statistics are updated incrementally, so
+    each step costs about the evaluation of the offspring. When the population
+    is evaluated by a process pool (see :meth:`GSimpleGA.GSimpleGA.setMultiProcessing`),
+    set the offspring count to the number of workers to keep all of them busy.
+
+    With the elitism enabled (the default), the tournament replacement never
+    replaces the best individuals (see :meth:`GSimpleGA.GSimpleGA.setElitismReplacement`).
+
+    :param genome: the :term:`Sample Genome`
+    :param interactiveMode: this flag enables the Interactive Mode, the default is True
+    :param seed: the random seed value
+
+    """
+
+    #: The attributes of the engine stored on the checkpoints
+    checkpointAttributes = GSimpleGA.checkpointAttributes + ("nOffspring", "replacement", "currentStep")
+
+    def __init__(self, genome, seed=None, interactiveMode=True):
+        """ Initializator of GSteadyStateGA """
+        super(GSteadyStateGA, self).__init__(genome, seed, interactiveMode)
+        self.internalPop.setSortType(Consts.sortType["raw"])
+        self.nOffspring = Consts.CDefSSGAOffspring
+        self.replacement = Consts.CDefSSGAReplacement
+        self.currentStep = 0
+
+        # The sort keys of the population, in the same order of the individuals
+        self.sortKeys = []
+        self.rawStatistics = RunningStatistics()
+
+        # The asynchronous mode state
+        self.asynchronous = False
+        self.asyncPool = None
+        self.asyncResults = None
+        self.asyncPending = {}
+        self.asyncTokens = itertools_count()
+
+        logging.debug("A steady-state GA Engine was created, nOffspring=%d", self.nOffspring)
+
+    def __repr__(self):
+        """ The string representation of the GA Engine """
+        replacement = list(Consts.replacementType.keys())[list(Consts.replacementType.values()).index(self.replacement)]
+        ret = super(GSteadyStateGA, self).__repr__().replace("- GSimpleGA\n", "- GSteadyStateGA\n", 1)
+        ret += "\tOffspring:\t\t %d\n" % self.nOffspring
+        ret += "\tReplacement:\t\t %s\n" % replacement.capitalize()
+        ret += "\tAsynchronous:\t\t %s\n" % self.asynchronous
+        return ret
+
+    def setAsynchronous(self, flag=True):
+        """ Enable/disable the asynchronous (barrier-free) mode
+
+        In the asynchronous mode, the offspring are sent one by one to the workers
+        of the evaluation pool (see :meth:`GSimpleGA.GSimpleGA.setMultiProcessing`),
+        as soon as any worker returns an evaluated individual, it is inserted on the
+        population and a new offspring is created and sent, so the workers are always
+        busy, even when the evaluation time varies a lot between the individuals.
+        The generations are counted as the number of individuals inserted, so the
+        step callbacks, the termination criteria and the DB Adapters are called
+        on every *population size* insertions.
+
+        Example:
+           >>> ga.setMultiProcessing(True, max_processes=8)
+           >>> ga.setAsynchronous(True)
+
+        :param flag: True (default) or False
+
+        .. note:: The asynchronous mode requires the "process" or the "thread"
+                  evaluation backend, otherwise (or when the population has a
+                  batch evaluator), the engine runs the synchronous steps. The
+                  evaluation timeout isn't supported by the asynchronous mode.
+
+        """
+        if not isinstance(flag, bool):
+            Util.raiseException("Asynchronous option must be True or False", TypeError)
+        self.asynchronous = flag
+
+    def isAsynchronous(self):
+        """ Returns True if the asynchronous mode will be used by the evolution,
+        which depends on the evaluation backend of the population
+
+        :rtype: True or False
+
+        """
+        population = self.internalPop
+        return (self.asynchronous and population.procPool is not None and
+                population.batchEvaluator.isEmpty() and
+                population.getEvaluationBackend() in ("process", "thread"))
+
+    def setSortType(self, sort_type):
+        """ Sets the sort type, only Consts.sortType["raw"] is supported
+
+        :param sort_type: the Sort Type
+
+        """
+        if sort_type != Consts.sortType["raw"]:
+            Util.raiseException("The steady-state GA supports only the raw sort type", ValueError)
+        super(GSteadyStateGA, self).setSortType(sort_type)
+
+    def setOffspringCount(self, count):
+        """ Sets the number of offspring created and evaluated on each step
+
+        :param count: the number of offspring
+
+        """
+        if count < 1:
+            Util.raiseException("The offspring count must be >= 1", ValueError)
+        self.nOffspring = count
+
+    def getOffspringCount(self):
+        """ Returns the number of offspring created on each step
+
+        :rtype: the number of offspring
+
+        """
+        return self.nOffspring
+
+    def setReplacement(self, replacement):
+        """ Sets the replacement scheme, Consts.replacementType["worst"] or
+        Consts.replacementType["tournament"]
+
+        The size of the tournament is the *tournamentPool* population parameter.
+
+        :param replacement: the replacement type
+
+        """
+        if replacement not in list(Consts.replacementType.values()):
+            Util.raiseException("Replacement must be a Consts.replacementType type", TypeError)
+        self.replacement = replacement
+
+    def getCurrentStep(self):
+        """ Gets the number of steps done since the begin of the evolution
+
+        :rtype: the current step
+
+        """
+        return self.currentStep
+
+    def select(self, **args):
+        """ Select one individual from population, the *popID* used by the selectors
+        to cache their data is the current step, because the population changes
+        on each step
+
+        :param args: this parameters will be sent to the selector
+
+        """
+        args["popID"] = ("steady-state", id(self), self.currentStep)
+        return super(GSteadyStateGA, self).select(**args)
+
+    def selectBatch(self, count, **args):
+        """ Select many individuals from population, see :meth:`select`
+
+        :param count: the number of individuals
+        :param args: this parameters will be sent to the selector
+        :rtype: the list of individuals
+
+        """
+        args["popID"] = ("steady-state", id(self), self.currentStep)
+        return super(GSteadyStateGA, self).selectBatch(count, **args)
+
+    def step(self):
+        """ Just do one generation, which is a sequence of steady-state steps which
+        create as many offspring as the population size """
+        self.__indexPopulation()
+        if "evalTimeouts" in self.internalPop.stats:
+            self.internalPop.stats["evalTimeouts"] = 0
+        if self.timings is not None:
+            self.timings.start()
+
+        if self.isAsynchronous():
+            self.__stepAsynchronous()
+        else:
+            for i in range(max(1, len(self.internalPop) // self.nOffspring)):
+                self.stepOffspring()
+
+        logging.debug("The generation %d was finished.", self.currentGeneration)
+
+        self.currentGeneration += 1
+        self.internalPop.recordBest(self.currentGeneration)
+
+        if self.timings is not None:
+            self.timings.close(self.currentGeneration, self.internalPop.stats)
+
+        if self.max_time:
+            total_time = time() - self.time_init
+            if total_time > self.max_time:
+                return True
+        return self.currentGeneration == self.nGenerations
+
+    def stepOffspring(self):
+        """ Just do one steady-state step, creates the offspring, evaluates
+        them and replaces individuals of the population """
+        population = self.internalPop
+        if len(self.sortKeys) != len(population):
+            self.__indexPopulation()
+
+        # The offspring are evaluated by a population which shares the
+        # process pool, the fitness cache and the batch evaluator
+        offspring = GPopulation(population)
+        offspring.internalPop = self.__createOffspring()
+        offspring.evaluate()
+        if "evalTimeouts" in offspring.stats:
+            population.stats["evalTimeouts"] += offspring.stats["evalTimeouts"]
+        if "evalUtilization" in offspring.stats:
+            population.stats["evalUtilization"] = offspring.stats["evalUtilization"]
+
+        if self.timings is not None:
+            self.timings.lap("evaluation")
+
+        for child in offspring.internalPop:
+            self.__replace(child)
+
+        self.currentStep += 1
+        self.__updateStatistics()
+
+        if self.timings is not None:
+            self.timings.lap("sort")
+
+    def __replace(self, child):
+        """ Inserts the evaluated child on its place of the sorted population,
+        replacing the individual chosen by the replacement scheme """
+        population = self.internalPop
+        victim = self.__chooseVictim()
+        removed = population.internalPop.pop(victim)
+        del self.sortKeys[victim]
+
+        key = self.__sortKey(child)
+        position = bisect_right(self.sortKeys, key)
+        self.sortKeys.insert(position, key)
+        population.internalPop.insert(position, child)
+        population.clearArrays()
+
+        self.rawStatistics.replace(removed.score, child.score)
+
+    def __stepAsynchronous(self):
+        """ Does one generation of the asynchronous mode, the offspring are sent to
+        the workers one by one and inserted on the population as soon as they are
+        evaluated, the evaluations which didn't finish when the generation ends
+        are inserted on the next generations """
+        population = self.internalPop
+        pool = population.procPool
+        if pool is not self.asyncPool:
+            # A new evolution (or a new pool), the pending evaluations were lost
+            self.asyncPool = pool
+            self.asyncResults = Queue()
+            self.asyncPending = {}
+
+        workers = population.multiProcessing[2] or CPU_COUNT
+        full_copy = population.multiProcessing[1] and population.getEvaluationBackend() == "process"
+        inserted = 0
+        busy_time = 0.0
+        start = perf_counter()
+
+        while inserted < len(population):
+            # Keeps two evaluations for each worker, so they don't wait for the master
+            inserted += self.__refillPending(pool, full_copy, workers * 2, len(population) - inserted)
+            if inserted >= len(population):
+                break
+
+            elapsed = self.__insertResult(full_copy)
+            if elapsed is not None:
+                busy_time += elapsed
+                inserted += 1
+
+        wall_time = perf_counter() - start
+        if wall_time > 0.0:
+            population.stats["evalUtilization"] = min(1.0, busy_time / (wall_time * workers))
+        self.__updateStatistics()
+
+    def __refillPending(self, pool, full_copy, max_pending, count):
+        """ Creates offspring and sends them to the pool until it has *max_pending*
+        evaluations or *count* offspring were inserted, the offspring whose scores
+        are on the fitness cache are inserted at once
+
+        :rtype: the number of offspring inserted
+
+        """
+        cache = self.internalPop.fitnessCache
+        inserted = 0
+        while inserted < count and len(self.asyncPending) < max_pending:
+            for child in self.__createOffspring():
+                key = child.getGenotypeKey() if cache is not None else None
+                score = cache.get(key) if key is not None else None
+                if score is not None:
+                    child.score = score
+                    child.evaluated = True
+                if child.isEvaluated():
+                    self.__replace(child)
+                    self.currentStep += 1
+                    inserted += 1
+                    continue
+                self.__dispatch(pool, child, full_copy)
+        return inserted
+
+    def __insertResult(self, full_copy):
+        """ Waits for the next result of the pool and inserts the evaluated child
+        on the population
+
+        :rtype: the time spent by the worker on the evaluation, None when the
+                result belongs to an evaluation lost
+
+        """
+        token, result, error = self.asyncResults.get()
+        if self.timings is not None:
+            self.timings.lap("evaluation")
+        child = self.asyncPending.pop(token, None)
+        if child is None:
+            return None
+        if error is not None:
+            raise error
+
+        value, elapsed = result
+        if full_copy:
+            child = value
+        else:
+            child.score = value
+            child.evaluated = True
+        cache = self.internalPop.fitnessCache
+        if cache is not None and child.getGenotypeKey() is not None:
+            cache.set(child.getGenotypeKey(), child.score)
+
+        self.__replace(child)
+        self.currentStep += 1
+        if self.timings is not None:
+            self.timings.lap("sort")
+        return elapsed
+
+    def __dispatch(self, pool, child, full_copy):
+        """ Sends the child to be evaluated by the pool, the result is put on the
+        results queue by the result handler thread of the pool """
+        token = next(self.asyncTokens)
+        results = self.asyncResults
+        self.asyncPending[token] = child
+        pool.apply_async(asynchronous_eval, (child, full_copy),
+                         callback=lambda result: results.put((token, result, None)),
+                         error_callback=lambda error: results.put((token, None, error)))
+
+    def __sortKey(self, individual):
+        """ The key of the individual on the sorted population, the best
+        individuals have the lowest keys """
+        if self.minimax == Consts.minimaxType["maximize"]:
+            return -individual.score
+        return individual.score
+
+    def __indexPopulation(self):
+        """ Sorts the population and computes the sort keys and the running statistics
+        used by the incremental statistics, it is done once per generation, so the
+        changes done on the population by the callbacks are taken and the rounding
+        errors of the removals don't accumulate """
+        population = self.internalPop
+        population.sort()
+        self.sortKeys = [self.__sortKey(ind) for ind in population]
+        self.rawStatistics = RunningStatistics()
+        self.rawStatistics.extend(ind.score for ind in population)
+
+    def __createOffspring(self):
+        """ Creates the offspring of a step by selection, crossover and mutation """
+        offspring = []
+        crossover_empty = self.internalPop.oneSelfGenome.crossover.isEmpty()
+
+        timings = self.timings
+        parents = self.selectBatch(self.nOffspring + self.nOffspring % 2)
+
+        if timings is not None:
+            timings.lap("selection")
+
+        for i in range(0, len(parents), 2):
+            genomeMom = parents[i]
+            genomeDad = parents[i + 1]
+
+            if not crossover_empty and Util.randomFlipCoin(self.pCrossover, self.rng):
+                for it in genomeMom.crossover.applyFunctions(mom=genomeMom, dad=genomeDad, count=2, rng=self.rng):
+                    (sister, brother) = it
+                sister.invalidate()
+                brother.invalidate()
+            else:
+                sister = genomeMom.clone()
+                brother = genomeDad.clone()
+
+            if timings is not None:
+                timings.lap("crossover")
+
+            sister.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
+            brother.mutate(pmut=self.pMutation, ga_engine=self, rng=self.rng)
+            offspring.append(sister)
+            offspring.append(brother)
+
+            if timings is not None:
+                timings.lap("mutation")
+
+        return offspring[:self.nOffspring]
+
+    def __chooseVictim(self):
+        """ Returns the index of the individual replaced by an offspring """
+        size = len(self.internalPop)
+        if self.replacement == Consts.replacementType["worst"]:
+            return size - 1
+
+        protected = min(self.nElitismReplacement, size - 1) if self.elitism else 0
+        pool_size = self.internalPop.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
+        # The population is sorted, so the loser is the highest index
+        return max(self.rng.randint(protected, size - 1) for i in range(pool_size))
+
+    def __updateStatistics(self):
+        """ Updates the raw statistics of the population using the running
+        statistics kept by the steps, without iterating over the individuals
+
+        The fitness statistics are computed only by the scaling of all the
+        individuals, so the population isn't marked as statted and
+        :meth:`GPopulation.GPopulation.statistics` computes them again when asked """
+        population = self.internalPop
+        stats = population.stats
+
+        if self.minimax == Consts.minimaxType["maximize"]:
+            stats["rawMax"], stats["rawMin"] = population[0].score, population[-1].score
+        else:
+            stats["rawMax"], stats["rawMin"] = population[-1].score, population[0].score
+
+        stats["rawAve"] = self.rawStatistics.mean
+        stats["rawVar"] = self.rawStatistics.getVariance()
+        stats["rawDev"] = self.rawStatistics.getDeviation()
+
+        if population.fitnessCache is not None:
+            stats["cacheHits"] = population.fitnessCache.hits
+            stats["cacheMisses"] = population.fitnessCache.misses
+
+        population.sorted = True
+        population.statted = False
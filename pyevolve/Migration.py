@@ -5,17 +5,24 @@
 This module contains all the migration schemes and the distributed
 GA related functions.
 
+The :class:`IslandModel` runs the islands of evolution as local processes,
+which exchange individuals through :mod:`multiprocessing` queues with the
+:class:`LocalMigration` scheme, no network or MPI runtime is needed.
+
 .. versionadded:: 0.6
    The :mod:`Migration` module.
 
 """
 
 from . import Util
-from random import randint as rand_randint, choice as rand_choice
-from . import Network
 from . import Consts
+from . import Network
 from .FunctionSlot import FunctionSlot
+from .GPopulation import CPU_COUNT
+from .representations.GenomeBase import packWire, unpackWire
 import logging
+import multiprocessing
+from queue import Empty
 
 try:
     from mpi4py import MPI
@@ -23,6 +30,12 @@ try:
 except ImportError:
     HAS_MPI4PY = False
 
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class MigrationScheme(object):
     """ This is the base class for all migration schemes """
@@ -48,14 +61,14 @@ class MigrationScheme(object):
     def getCompressionLevel(self):
         """ Get the zlib compression level of network data
 
-        The values are in the interval described on the :func:`Network.pickleAndCompress`
+        The values are in the interval described on the :func:`Network.compressMessage`
         """
         return self.networkCompression
 
     def setCompressionLevel(self, level):
         """ Set the zlib compression level of network data
 
-        The values are in the interval described on the :func:`Network.pickleAndCompress`
+        The values are in the interval described on the :func:`Network.compressMessage`
 
         :param level: the zlib compression level
         """
@@ -145,6 +158,12 @@ class MigrationScheme(object):
 class WANMigration(MigrationScheme):
     """ This is the Simple Migration class for distributed GA
 
+    The individuals are exchanged by the UDP transport of the :mod:`Network`
+    module, which runs on a background thread, so the migrations never block
+    the evolution. Only the genotypes (see *getGenotypeKey()*) and the scores
+    of the individuals are sent, the received individuals are cloned from the
+    sample genome of the GA Engine.
+
     Example:
        >>> mig = WANMigration("192.168.0.1", "10000", "group1")
 
@@ -164,8 +183,8 @@ class WANMigration(MigrationScheme):
         self.setMyself(host, port)
         self.setGroupName(group_name)
         self.topologyGraph = None
-        self.serverThread = Network.UDPThreadServer(host, port)
-        self.clientThread = Network.UDPThreadUnicastClient(self.myself[0], rand_randint(30000, 65534))
+        self.rng = None
+        self.transport = Network.UDPTransport(host, port, group_name)
 
     def setMyself(self, host, port):
         """ Which interface you will use to send/receive data
@@ -173,7 +192,7 @@ class WANMigration(MigrationScheme):
         :param host: your hostname
         :param port: your port
         """
-        self.myself = (host, port)
+        self.myself = (host, int(port))
 
     def getGroupName(self):
         """ Gets the group name
@@ -196,36 +215,66 @@ class WANMigration(MigrationScheme):
     def setTopology(self, graph):
         """ Sets the topology of the migrations
 
-        :param graph: the :class:`Util.Graph` instance
+        :param graph: the :class:`Util.Graph` instance, the nodes are (host, port) tuples
         """
         self.topologyGraph = graph
 
+    def setGAEngine(self, ga_engine):
+        """ Sets the GA Engine handler """
+        super(WANMigration, self).setGAEngine(ga_engine)
+        # The arrival of the migrants depends on the other islands, so they
+        # don't draw from the generator of the engine
+        self.rng = ga_engine.spawnRandom("migration")
+
     def start(self):
         """ Start capture of packets and initialize the migration scheme """
-        self.serverThread.start()
-
         if self.topologyGraph is None:
             Util.raiseException("You must add a topology graph to the migration scheme !")
 
-        targets = self.topologyGraph.getNeighbors(self.myself)
-        self.clientThread.setMultipleTargetHost(targets)
-        self.clientThread.start()
+        self.transport.groupName = self.getGroupName()
+        self.transport.compression = self.getCompressionLevel()
+        self.transport.start()
 
     def stop(self):
-        """ Stops the migration engine """
-        self.serverThread.shutdown()
-        self.clientThread.shutdown()
-        server_timeout = self.serverThread.timeout
-        client_timeout = self.clientThread.timeout
+        """ Stops the migration engine, the individuals not sent yet are sent """
+        self.transport.stop()
 
-        self.serverThread.join(server_timeout + 3)
-        self.clientThread.join(client_timeout + 3)
+    def encodeIndividual(self, individual):
+        """ Returns the network representation of the individual
 
-        if self.serverThread.isAlive():
-            logging.warning("warning: server thread not joined !")
-
-        if self.clientThread.isAlive():
-            logging.warning("warning: client thread not joined !")
+        :param individual: the individual
+        :rtype: a list with the genotype, the raw score and the fitness score
+        """
+        key = individual.getGenotypeKey()
+        if key is None:
+            Util.raiseException("The %s genome hasn't a genotype key, it can't migrate" %
+                                (individual.__class__.__name__,), TypeError)
+        return [key, individual.score, individual.fitness]
+
+    def decodeIndividual(self, item):
+        """ Returns the individual of the network representation created by
+        :meth:`encodeIndividual`, None if the representation isn't valid
+
+        :param item: the network representation
+        :rtype: the individual or None
+        """
+        population = self.GAEngine.getPopulation()
+        try:
+            genes, score, fitness = item
+            key = _toKey(genes)
+        except (TypeError, ValueError):
+            return None
+        if _keyShape(key) != _keyShape(population[0].getGenotypeKey()):
+            return None
+        if not isinstance(score, (int, float)) or not isinstance(fitness, (int, float)):
+            return None
+
+        individual = population.oneSelfGenome.clone()
+        individual.setGenotypeKey(key)
+        individual.score = score
+        individual.fitness = fitness
+        individual.evaluated = True
+        return individual
 
     def exchange(self):
         """ This is the main method, is where the individuals
@@ -234,25 +283,14 @@ class WANMigration(MigrationScheme):
         if not self.isReady():
             return
 
-        # Client section --------------------------------------
         # How many will migrate ?
         pool = self.selectPool(self.getNumIndividuals())
+        targets = self.topologyGraph.getNeighbors(self.myself)
+        self.transport.send([(host, int(port)) for host, port in targets],
+                            [self.encodeIndividual(individual) for individual in pool])
 
-        for individual in pool:
-            # (code, group name, individual)
-            networkObject = (Consts.CDefNetworkIndividual, self.getGroupName(), individual)
-            networkData = Network.pickleAndCompress(networkObject, self.getCompressionLevel())
-            # Send the individuals to the topology
-            self.clientThread.addData(networkData)
-
-        # Server section --------------------------------------
-        pool = []
-        while self.serverThread.isReady():
-            # (IP source, data)
-            networkData = self.serverThread.popPool()
-            networkObject = Network.unpickleAndDecompress(networkData[1])
-            # (code, group name, individual)
-            pool.append(networkObject)
+        pool = [self.decodeIndividual(item) for item in self.transport.receive()]
+        pool = [individual for individual in pool if individual is not None]
 
         # No individuals received
         if len(pool) <= 0:
@@ -260,14 +298,29 @@ class WANMigration(MigrationScheme):
 
         population = self.GAEngine.getPopulation()
 
-        for i in range(self.getNumReplacement()):
+        # The population isn't sorted, the worst are found by a partial ranking
+        for index in population.worstRawIndexes(self.getNumReplacement()):
             if len(pool) <= 0:
                 break
-            choice = rand_choice(pool)
+            choice = self.rng.choice(pool)
             pool.remove(choice)
+            population[index] = choice
+
 
-            # replace the worst
-            population[len(population) - 1 - i] = choice[2]
+def _toKey(genes):
+    """ Converts the JSON lists of the genes to the tuples of the genotype keys """
+    if isinstance(genes, list):
+        return tuple(_toKey(gene) for gene in genes)
+    if isinstance(genes, (int, float, str)):
+        return genes
+    raise TypeError("Invalid gene type")
+
+
+def _keyShape(key):
+    """ Returns the nested lengths of the genotype key """
+    if isinstance(key, tuple):
+        return (len(key),) + (_keyShape(key[0]) if key else ())
+    return ()
 
 
 class MPIMigration(MigrationScheme):
@@ -291,6 +344,20 @@ class MPIMigration(MigrationScheme):
         self.dest = (self.comm.rank + 1) % (self.comm.size)
 
         self.all_stars = None
+        self.rng = None
+
+    def setGAEngine(self, ga_engine):
+        """ Sets the GA Engine handler
+
+        The individuals are exchanged in the slim form of the sample genome of
+        the engine (see :func:`GenomeBase.packWire`), every node must use the
+        same sample genome settings.
+
+        """
+        super(MPIMigration, self).setGAEngine(ga_engine)
+        # The arrival of the migrants depends on the other nodes, so they
+        # don't draw from the generator of the engine
+        self.rng = ga_engine.spawnRandom("migration")
 
     def isReady(self):
         """ Returns true if is time to migrate """
@@ -308,8 +375,12 @@ class MPIMigration(MigrationScheme):
         Collect all the best individuals from the various populations. The
         result is stored in process 0
         '''
-        best_guy = self.select()
-        self.all_stars = self.comm.gather(sendobj=best_guy, root=0)
+        template = self.GAEngine.getPopulation().oneSelfGenome
+        best_guy = packWire(self.select(), template)
+        all_stars = self.comm.gather(sendobj=best_guy, root=0)
+        if all_stars is not None:
+            all_stars = [unpackWire(data, template) for data in all_stars]
+        self.all_stars = all_stars
 
     def exchange(self):
         """ This is the main method, is where the individuals
@@ -318,7 +389,8 @@ class MPIMigration(MigrationScheme):
         if not self.isReady():
             return
 
-        pool_to_send = self.selectPool(self.getNumIndividuals())
+        template = self.GAEngine.getPopulation().oneSelfGenome
+        pool_to_send = [packWire(individual, template) for individual in self.selectPool(self.getNumIndividuals())]
         pool_received = self.comm.sendrecv(sendobj=pool_to_send,
                                            dest=self.dest,
                                            sendtag=0,
@@ -328,15 +400,529 @@ class MPIMigration(MigrationScheme):
 
         population = self.GAEngine.getPopulation()
 
-        pool = pool_received
-        for i in range(self.getNumReplacement()):
+        pool = [unpackWire(data, template) for data in pool_received]
+        # The population isn't sorted, the worst are found by a partial ranking
+        for index in population.worstRawIndexes(self.getNumReplacement()):
             if len(pool) <= 0:
                 break
+            choice = self.rng.choice(pool)
+            pool.remove(choice)
+            population[index] = choice
+
+        self.gather_bests()
+
+
+def _flattenKey(key):
+    """ Returns the flat list of the genes of the genotype key """
+    if isinstance(key, tuple):
+        return [gene for item in key for gene in _flattenKey(item)]
+    return [key]
+
+
+def _reshapeGenes(genes, shape):
+    """ Returns the genotype key of the flat genes with the shape of :func:`_keyShape` """
+    if len(shape) <= 1:
+        return tuple(genes)
+    size = len(genes) // shape[0]
+    return tuple(_reshapeGenes(genes[i * size:(i + 1) * size], shape[1:]) for i in range(shape[0]))
+
+
+def packIndividuals(individuals):
+    """ Returns the contiguous buffer with the scores and the genotypes of the
+    individuals, used by the :class:`AsyncMPIMigration`
+
+    Each row of the buffer is an individual: the raw score, the fitness score
+    and the flat genes of its *getGenotypeKey()*.
+
+    :param individuals: the list of individuals, with the same numeric genotype shape
+    :rtype: a 2D numpy array of float64
+
+    """
+    rows = [[individual.score, individual.fitness] + _flattenKey(individual.getGenotypeKey())
+            for individual in individuals]
+    return numpy.ascontiguousarray(rows, dtype=numpy.float64)
+
+
+def unpackIndividuals(buffer, sample, shape, integer_genes=False):
+    """ Returns the individuals of the buffer created by :func:`packIndividuals`,
+    they are cloned from the sample genome
 
-            choice = rand_choice(pool)
+    :param buffer: the 2D numpy array
+    :param sample: the sample genome
+    :param shape: the shape of the genotype keys
+    :param integer_genes: if True, the genes are converted to int
+    :rtype: the list of individuals
+
+    """
+    individuals = []
+    for row in buffer.tolist():
+        genes = [int(gene) for gene in row[2:]] if integer_genes else row[2:]
+        individual = sample.clone()
+        individual.setGenotypeKey(_reshapeGenes(genes, shape))
+        individual.score = row[0]
+        individual.fitness = row[1]
+        individual.evaluated = True
+        individuals.append(individual)
+    return individuals
+
+
+class AsyncMPIMigration(MPIMigration):
+    """ This is the non-blocking MPIMigration
+
+    The migrants are sent to the next node of the ring with *Isend* and
+    received from the previous node with *Irecv*, as contiguous buffers of
+    scores and genotypes (see :func:`packIndividuals`) instead of pickled
+    individuals. The migrants are merged on the first generation after they
+    arrive, so the islands never wait for their neighbors. The best
+    individuals of the nodes are gathered on the node 0 by a non-blocking
+    *Igather* on each migration, see :meth:`getAllStars`.
+
+    Example:
+       >>> ga.setMigrationAdapter(AsyncMPIMigration())
+       >>> ga.evolve()
+
+    Run it with ``mpirun -n 4 python your_script.py``.
+
+    .. note:: The genomes must implement *getGenotypeKey()* and
+              *setGenotypeKey()* with numeric genes, every node must use the
+              same genome shape and migration settings. The numpy is required.
+
+    """
+
+    #: The MPI tag of the migrant messages
+    migrationTag = 1
+
+    def __init__(self):
+        # Delayed ImportError of numpy
+        if not HAS_NUMPY:
+            raise ImportError("No module named numpy, you must install numpy to use AsyncMPIMigration!")
+
+        super(AsyncMPIMigration, self).__init__()
+
+        self.shape = None
+        self.integerGenes = False
+        self.rowSize = 0
+        self.recvRequest = None
+        self.recvBuffer = None
+        self.sendRequests = []
+        self.gatherRequests = []
+        self.migrants = []
+        self.sent = 0
+        self.received = 0
+
+    def getAllStars(self):
+        """ Returns the best individuals of the nodes gathered by the last
+        completed reduction, only on the node 0
+
+        :rtype: the list of individuals, ordered by node, or None
+        """
+        return self.all_stars
+
+    def exchange(self):
+        """ This is the main method, is where the individuals
+        are exchanged, it never waits for the other nodes """
+        if self.recvBuffer is None:
+            self.__prepare()
+
+        self.__collectMigrants()
+
+        if self.isReady():
+            self.sendRequests = [(request, buffer) for request, buffer in self.sendRequests
+                                 if not request.Test()]
+            buffer = packIndividuals(self.selectPool(self.getNumIndividuals()))
+            request = self.comm.Isend([buffer, MPI.DOUBLE], dest=self.dest, tag=self.migrationTag)
+            self.sendRequests.append((request, buffer))
+            self.sent += 1
+            self.gather_bests()
+
+        self.__testGathers()
+        self.__mergeMigrants()
+
+    def gather_bests(self):
+        """ Starts the non-blocking gather of the best individuals of the nodes
+        on the node 0, the result is stored by :meth:`exchange` when complete """
+        sendbuf = packIndividuals([self.GAEngine.bestIndividual()])
+        recvbuf = numpy.empty((self.comm.size, self.rowSize), dtype=numpy.float64) if self.pid == 0 else None
+        request = self.comm.Igather([sendbuf, MPI.DOUBLE],
+                                    [recvbuf, MPI.DOUBLE] if recvbuf is not None else None, root=0)
+        self.gatherRequests.append((request, sendbuf, recvbuf))
+
+    def stop(self):
+        """ Stops the migration engine, it completes the pending gathers and
+        receives the migrants still in transit, so all the requests are finished """
+        if self.recvBuffer is not None:
+            MPI.Request.Waitall([request for request, sendbuf, recvbuf in self.gatherRequests])
+            self.__testGathers()
+
+            # The number of messages sent by the previous node
+            expected = self.comm.sendrecv(self.sent, dest=self.dest, source=self.source)
+            while self.received < expected:
+                self.recvRequest.Wait()
+                self.received += 1
+                if self.received < expected:
+                    self.__postReceive()
+                else:
+                    self.recvRequest = None
+            if self.recvRequest is not None:
+                self.recvRequest.Cancel()
+                self.recvRequest.Wait()
+                self.recvRequest = None
+
+            MPI.Request.Waitall([request for request, buffer in self.sendRequests])
+            self.sendRequests = []
+            self.recvBuffer = None
+        super(AsyncMPIMigration, self).stop()
+
+    def __prepare(self):
+        """ Computes the buffer layout from the population and posts the first receive """
+        key = self.GAEngine.getPopulation()[0].getGenotypeKey()
+        if key is None:
+            Util.raiseException("The genome hasn't a genotype key, it can't migrate", TypeError)
+        genes = _flattenKey(key)
+        self.shape = _keyShape(key)
+        self.integerGenes = all(isinstance(gene, int) for gene in genes)
+        self.rowSize = 2 + len(genes)
+        self.__postReceive()
+
+    def __postReceive(self):
+        """ Posts the receive of the next migrants """
+        self.recvBuffer = numpy.empty((self.getNumIndividuals(), self.rowSize), dtype=numpy.float64)
+        self.recvRequest = self.comm.Irecv([self.recvBuffer, MPI.DOUBLE], source=self.source, tag=self.migrationTag)
+
+    def __collectMigrants(self):
+        """ Keeps the migrants which arrived, without waiting """
+        sample = self.GAEngine.getPopulation().oneSelfGenome
+        while self.recvRequest.Test():
+            self.migrants.extend(unpackIndividuals(self.recvBuffer, sample, self.shape, self.integerGenes))
+            self.received += 1
+            self.__postReceive()
+
+    def __testGathers(self):
+        """ Stores the bests of the completed gathers """
+        while self.gatherRequests and self.gatherRequests[0][0].Test():
+            request, sendbuf, recvbuf = self.gatherRequests.pop(0)
+            if recvbuf is not None:
+                sample = self.GAEngine.getPopulation().oneSelfGenome
+                self.all_stars = unpackIndividuals(recvbuf, sample, self.shape, self.integerGenes)
+
+    def __mergeMigrants(self):
+        """ Replaces the worst individuals by the migrants received """
+        if not self.migrants:
+            return
+
+        population = self.GAEngine.getPopulation()
+        pool, self.migrants = self.migrants, []
+
+        # The population isn't sorted, the worst are found by a partial ranking
+        for index in population.worstRawIndexes(self.getNumReplacement()):
+            if len(pool) <= 0:
+                break
+            choice = self.rng.choice(pool)
             pool.remove(choice)
+            population[index] = choice
 
-            # replace the worst
-            population[len(population) - 1 - i] = choice
 
-        self.gather_bests()
+class LocalMigration(MigrationScheme):
+    """ This is the migration scheme of the islands running as local processes,
+    see :class:`IslandModel`
+
+    The individuals are sent to the queues of the neighbors of the island on
+    the topology graph and received from the queue of the island without
+    blocking, so the islands don't wait for each other.
+
+    Example:
+       >>> inboxes = {0: multiprocessing.Queue(), 1: multiprocessing.Queue()}
+       >>> mig = LocalMigration(0, inboxes)
+       >>> mig.setTopology(topology)
+
+    :param island: the node of the island on the topology graph
+    :param inboxes: the dict with the :class:`multiprocessing.Queue` of each island
+
+    """
+
+    def __init__(self, island, inboxes):
+        super(LocalMigration, self).__init__()
+        self.island = island
+        self.inboxes = inboxes
+        self.topologyGraph = None
+        self.rng = None
+
+    def setTopology(self, graph):
+        """ Sets the topology of the migrations
+
+        :param graph: the :class:`Util.Graph` instance
+        """
+        self.topologyGraph = graph
+
+    def setGAEngine(self, ga_engine):
+        """ Sets the GA Engine handler
+
+        The individuals are exchanged in the slim form of the sample genome of
+        the engine (see :func:`GenomeBase.packWire`).
+
+        """
+        super(LocalMigration, self).setGAEngine(ga_engine)
+        # The arrival of the migrants depends on the other islands, so they
+        # don't draw from the generator of the engine
+        self.rng = ga_engine.spawnRandom("migration")
+
+    def start(self):
+        """ Initializes the migration scheme """
+        if self.topologyGraph is None:
+            Util.raiseException("You must add a topology graph to the migration scheme !")
+
+    def stop(self):
+        """ Stops the migration engine, the migrants not received are discarded """
+        for inbox in self.inboxes.values():
+            inbox.cancel_join_thread()
+
+    def isReady(self):
+        """ Returns true if is time to migrate """
+        generation = self.GAEngine.getCurrentGeneration()
+        return generation > 0 and generation % self.nMigrationRate == 0
+
+    def receive(self):
+        """ Returns the individuals received by the island, without blocking
+
+        :rtype: list with individuals
+        """
+        pool = []
+        inbox = self.inboxes[self.island]
+        template = self.GAEngine.getPopulation().oneSelfGenome
+        while True:
+            try:
+                pool.extend(unpackWire(data, template) for data in inbox.get_nowait())
+            except Empty:
+                return pool
+
+    def exchange(self):
+        """ This is the main method, is where the individuals
+        are exchanged """
+
+        if not self.isReady():
+            return
+
+        template = self.GAEngine.getPopulation().oneSelfGenome
+        pool = [packWire(individual, template) for individual in self.selectPool(self.getNumIndividuals())]
+        for target in self.topologyGraph.getNeighbors(self.island):
+            self.inboxes[target].put(pool)
+
+        pool = self.receive()
+        population = self.GAEngine.getPopulation()
+
+        # The population isn't sorted, the worst are found by a partial ranking
+        for index in population.worstRawIndexes(self.getNumReplacement()):
+            if len(pool) <= 0:
+                break
+            choice = self.rng.choice(pool)
+            pool.remove(choice)
+            population[index] = choice
+
+
+def _runIsland(ga_engine, migration, freq_stats, results):
+    """ The body of the island processes of the :class:`IslandModel` """
+    island = migration.island
+    try:
+        ga_engine.setSeed(ga_engine.spawnSeed(("island", island)))
+        ga_engine.setMigrationAdapter(migration)
+        best = ga_engine.evolve(freq_stats)
+        results.put((island, best.getWireState(), None))
+    except Exception as error:
+        logging.exception("The island %s failed", island)
+        results.put((island, None, "%s: %s" % (error.__class__.__name__, error)))
+
+
+class IslandModel(object):
+    """ IslandModel Class - Runs a GA Engine on each island of evolution, the
+    islands are local processes which exchange individuals following the
+    topology graph
+
+    Each island is a copy of the GA Engine, seeded by its
+    :meth:`GSimpleGA.GSimpleGA.spawnSeed`, which evolves with a
+    :class:`LocalMigration` scheme. The best individual of each island is
+    gathered at the end of the evolution.
+
+    Example:
+       >>> ga = GSimpleGA.GSimpleGA(genome, seed=42)
+       >>> islands = IslandModel(ga, islands=8)
+       >>> islands.setMigrationRate(10)
+       >>> best = islands.evolve()
+
+    :param ga_engine: the GA Engine of the islands
+    :param islands: the number of islands, the default is the number of CPUs
+    :param topology: the :class:`Util.Graph` of the migrations, the nodes
+                     are the island numbers, the default is a ring
+
+    .. note:: The GA Engine is sent to the island processes, so it must be
+              picklable when the *spawn* start method is used.
+
+    """
+
+    def __init__(self, ga_engine, islands=None, topology=None):
+        """ The constructor of the IslandModel """
+        if islands is None:
+            islands = CPU_COUNT
+        if islands < 2:
+            Util.raiseException("The island model needs at least two islands", ValueError)
+
+        self.GAEngine = ga_engine
+        self.nIslands = islands
+        self.nMigrationRate = Consts.CDefGenMigrationRate
+        self.nIndividuals = Consts.CDefMigrationNIndividuals
+        self.nReplacement = Consts.CDefGenMigrationReplacement
+        self.topologyGraph = topology if topology is not None else self.ringTopology(islands)
+        self.bestIndividuals = {}
+
+    def __repr__(self):
+        """ The string representation of the island model """
+        ret = "- IslandModel\n"
+        ret += "\tIslands:\t\t %d\n" % self.nIslands
+        ret += "\tMigration Rate:\t\t %d\n" % self.nMigrationRate
+        ret += "\tMigrants:\t\t %d\n" % self.nIndividuals
+        ret += "\tReplacements:\t\t %d\n" % self.nReplacement
+        return ret
+
+    @staticmethod
+    def ringTopology(islands):
+        """ Returns the ring topology, each island exchanges individuals with
+        the previous and the next islands
+
+        :param islands: the number of islands
+        :rtype: the :class:`Util.Graph` instance
+        """
+        graph = Util.Graph()
+        for island in range(islands):
+            graph.addEdge(island, (island + 1) % islands)
+        return graph
+
+    def setTopology(self, graph):
+        """ Sets the topology of the migrations
+
+        :param graph: the :class:`Util.Graph` instance, the nodes are the island numbers
+        """
+        self.topologyGraph = graph
+
+    def setMigrationRate(self, generations):
+        """ Sets the generation frequency of the migrations
+
+        :param generations: the number of generations
+        """
+        self.nMigrationRate = generations
+
+    def setNumIndividuals(self, num_individuals):
+        """ Sets the number of individuals sent to each neighbor
+
+        :param num_individuals: the number of individuals
+        """
+        self.nIndividuals = num_individuals
+
+    def setNumReplacement(self, num_individuals):
+        """ Sets the number of individuals replaced by the migrants
+
+        :param num_individuals: the number of individuals to be replaced
+        """
+        self.nReplacement = num_individuals
+
+    def getBestIndividuals(self):
+        """ Returns the best individual of each island of the last evolution
+
+        :rtype: a dict with the island numbers and the individuals
+        """
+        return self.bestIndividuals
+
+    def evolve(self, freq_stats=0):
+        """ Runs the islands until all of them finish the evolution
+
+        :param freq_stats: if greater than 0, the statistics of the first
+                           island will be printed every freq_stats generation.
+        :rtype: returns the best individual of all islands
+
+        """
+        nodes = sorted(self.topologyGraph.getNodes())
+        if nodes != list(range(self.nIslands)):
+            Util.raiseException("The topology nodes must be the island numbers", ValueError)
+
+        results = multiprocessing.Queue()
+        processes = self.__startIslands(nodes, freq_stats, results)
+
+        states = {}
+        errors = []
+        try:
+            self.__collectResults(processes, results, states, errors)
+        finally:
+            self.__stopIslands(processes, errors or len(states) < len(processes))
+
+        if errors:
+            Util.raiseException("The islands failed, %s" % ("; ".join(errors),), RuntimeError)
+
+        sample = self.GAEngine.getPopulation().oneSelfGenome
+        self.bestIndividuals = {}
+        for island, state in states.items():
+            genome = sample.clone()
+            for attr, value in state.items():
+                setattr(genome, attr, value)
+            self.bestIndividuals[island] = genome
+
+        best = self.bestIndividuals.values()
+        if self.GAEngine.getMinimax() == Consts.minimaxType["minimize"]:
+            return min(best, key=lambda individual: individual.score)
+        return max(best, key=lambda individual: individual.score)
+
+    def __startIslands(self, nodes, freq_stats, results):
+        """ Starts a process for each island, the islands exchange the
+        migrants by their inbox queues
+
+        :param nodes: the island numbers
+        :param freq_stats: the frequency of the statistics of the first island
+        :param results: the queue which receives the results of the islands
+        :rtype: the list of processes
+        """
+        inboxes = dict((island, multiprocessing.Queue()) for island in nodes)
+        processes = []
+
+        for island in nodes:
+            migration = LocalMigration(island, inboxes)
+            migration.setTopology(self.topologyGraph)
+            migration.setMigrationRate(self.nMigrationRate)
+            migration.setNumIndividuals(self.nIndividuals)
+            migration.setNumReplacement(self.nReplacement)
+            process = multiprocessing.Process(target=_runIsland, name="pyevolve-island-%d" % island,
+                                              args=(self.GAEngine, migration,
+                                                    freq_stats if island == nodes[0] else 0, results))
+            processes.append(process)
+
+        logging.debug("Starting %d islands", len(processes))
+        for process in processes:
+            process.start()
+        return processes
+
+    def __collectResults(self, processes, results, states, errors):
+        """ Waits for the results of all the islands
+
+        :param processes: the processes of the islands
+        :param results: the queue which receives the results of the islands
+        :param states: the dict which receives the best individual state of each island
+        :param errors: the list which receives the errors of the islands
+        """
+        while len(states) + len(errors) < len(processes):
+            try:
+                island, state, error = results.get(timeout=1.0)
+            except Empty:
+                if any(not process.is_alive() and process.exitcode != 0 for process in processes):
+                    Util.raiseException("An island process died without results", RuntimeError)
+                continue
+            if error is not None:
+                errors.append("island %s: %s" % (island, error))
+            else:
+                states[island] = state
+
+    def __stopIslands(self, processes, terminate):
+        """ Waits for the island processes to finish
+
+        :param processes: the processes of the islands
+        :param terminate: if True, the processes are terminated first
+        """
+        for process in processes:
+            if terminate:
+                process.terminate()
+            process.join()
@@ -0,0 +1,361 @@
+"""
+
+:mod:`Network` -- the network transport of the migrations
+=====================================================================
+
+This module contains the UDP transport used by the
+:class:`Migration.WANMigration` to exchange individuals between the islands
+of evolution running on different hosts.
+
+The transport runs an :mod:`asyncio` event loop on a background thread, so
+the GA Engine never waits for the network: the individuals sent are queued
+and batched on one datagram (or a few, when they don't fit on one) for each
+neighbor, and the individuals received are kept until the engine asks for
+them.
+
+The messages are JSON documents compressed by :mod:`zlib`, nothing received
+is unpickled. The datagrams of a batch have the sequence number of the batch
+and their fragment index, the datagrams which aren't valid messages of the
+group, are duplicated or belong to a batch older than the last one received
+from the same sender are dropped. The age of the items is measured by the
+receiver from their arrival, so the clocks of the hosts don't need to be
+synchronized, the items not taken by the engine within the maximum age are
+dropped.
+
+.. versionadded:: 0.7
+   The asyncio based :mod:`Network` module.
+
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import zlib
+from collections import deque
+from time import monotonic
+
+from . import Consts
+from . import Util
+
+#: The version of the message format
+NETWORK_VERSION = 2
+
+
+def compressMessage(message, level=9):
+    """ Serializes the message to JSON and compresses it
+
+    Example:
+       >>> data = Network.compressMessage({"items": [1, 2, 3]}, 9)
+
+    :param message: the message, made of dicts, lists, strings and numbers
+    :param level: the zlib compression level, from 0 (no compression) to 9 (best compression)
+    :rtype: the compressed bytes
+
+    """
+    try:
+        data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    except TypeError as error:
+        Util.raiseException("The message can't be serialized: %s" % (error,), TypeError)
+    return zlib.compress(data, level)
+
+
+def decompressMessage(data, max_size=Consts.CDefNetworkMaxMessage):
+    """ Decompresses and parses the message created by :func:`compressMessage`
+
+    :param data: the compressed bytes
+    :param max_size: the maximum size of the decompressed message
+    :rtype: the message, a dict
+
+    .. note:: Raises ValueError when the data isn't a valid message.
+
+    """
+    decompressor = zlib.decompressobj()
+    try:
+        raw = decompressor.decompress(data, max_size)
+    except zlib.error as error:
+        raise ValueError("Invalid compressed data: %s" % (error,))
+    if decompressor.unconsumed_tail:
+        raise ValueError("The message is bigger than %d bytes" % (max_size,))
+    try:
+        message = json.loads(raw.decode("utf-8"))
+    except UnicodeDecodeError as error:
+        raise ValueError("Invalid message encoding: %s" % (error,))
+    if not isinstance(message, dict):
+        raise ValueError("The message isn't a JSON object")
+    return message
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """ Internal used to forward the datagrams to the transport """
+
+    def __init__(self, transport):
+        self.owner = transport
+
+    def datagram_received(self, data, addr):
+        self.owner.datagramReceived(data, addr)
+
+    def error_received(self, exc):
+        logging.debug("Network error received: %s", exc)
+
+
+class UDPTransport(object):
+    """ UDPTransport Class - Sends and receives the items of the migrations
+
+    The items are any values supported by :func:`compressMessage`, the
+    :class:`Migration.WANMigration` sends the genotypes and the scores of
+    the individuals.
+
+    Example:
+       >>> transport = UDPTransport("192.168.0.1", 10000, "group1")
+       >>> transport.start()
+       >>> transport.send([("192.168.0.2", 10000)], [item1, item2])
+       >>> items = transport.receive()
+       >>> transport.stop()
+
+    :param host: the hostname of the interface which receives the datagrams
+    :param port: the port number, 0 binds to a free port (see :meth:`getAddress`)
+    :param group_name: the group name, the messages of other groups are dropped
+    :param compression: the zlib compression level
+    :param max_age: the seconds the items received wait to be taken by :meth:`receive`,
+                    the older ones are dropped
+
+    """
+
+    def __init__(self, host, port, group_name, compression=9, max_age=Consts.CDefNetworkMaxAge):
+        """ The constructor of the UDPTransport """
+        self.address = (host, int(port))
+        self.groupName = group_name
+        self.compression = compression
+        self.maxAge = max_age
+        self.flushInterval = Consts.CDefNetworkFlushInterval
+        self.maxDatagram = Consts.CDefNetworkMaxDatagram
+
+        # Only used by the thread of the event loop
+        self.loop = None
+        self.endpoint = None
+        self.outgoing = {}
+        self.flushHandle = None
+        self.sequence = 0
+        self.lastBatch = {}
+        self.session = int.from_bytes(os.urandom(8), "little")
+
+        self.thread = None
+        self.ready = threading.Event()
+        self.error = None
+        self.received = deque()
+        self.sent = 0
+        self.accepted = 0
+        self.dropped = 0
+
+    def __repr__(self):
+        """ The string representation of the transport """
+        ret = "- UDPTransport\n"
+        ret += "\tAddress:\t\t %s:%s\n" % self.address
+        ret += "\tGroup:\t\t\t %s\n" % (self.groupName,)
+        ret += "\tSent/Accepted/Dropped:\t %d/%d/%d\n" % (self.sent, self.accepted, self.dropped)
+        return ret
+
+    def getAddress(self):
+        """ Returns the address which receives the datagrams, after the start
+        it has the port chosen by the system when the port is 0
+
+        :rtype: a tuple (host, port)
+        """
+        return self.address
+
+    def isRunning(self):
+        """ Returns True if the event loop is running
+
+        :rtype: True or False
+        """
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, timeout=10.0):
+        """ Binds the socket and starts the event loop on a background thread
+
+        :param timeout: the seconds to wait for the socket
+
+        """
+        if self.isRunning():
+            return
+        self.ready.clear()
+        self.error = None
+        self.thread = threading.Thread(target=self.__run, name="pyevolve-network", daemon=True)
+        self.thread.start()
+        if not self.ready.wait(timeout):
+            Util.raiseException("The network transport didn't start", RuntimeError)
+        if self.error is not None:
+            self.thread.join()
+            self.thread = None
+            raise self.error
+
+    def stop(self, timeout=5.0):
+        """ Sends the pending items and stops the event loop
+
+        :param timeout: the seconds to wait for the thread of the event loop
+
+        """
+        if not self.isRunning():
+            return
+        self.loop.call_soon_threadsafe(self.__shutdown)
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            logging.warning("warning: network thread not joined !")
+        self.thread = None
+
+    def send(self, targets, items):
+        """ Queues the items to be sent to the targets, it doesn't block,
+        the items queued within the flush interval are sent together
+
+        :param targets: the list of (host, port) addresses
+        :param items: the list of items
+
+        """
+        if not self.isRunning():
+            Util.raiseException("The network transport isn't running", RuntimeError)
+        self.loop.call_soon_threadsafe(self.__enqueue, [tuple(target) for target in targets], list(items))
+
+    def receive(self):
+        """ Returns the items received since the last call, it doesn't block,
+        the items which arrived more than the maximum age ago are dropped
+
+        :rtype: the list of items
+        """
+        items = []
+        now = monotonic()
+        while True:
+            try:
+                arrival, batch = self.received.popleft()
+            except IndexError:
+                return items
+            if now - arrival > self.maxAge:
+                logging.debug("Stale items dropped, they arrived %.1fs ago", now - arrival)
+                self.dropped += 1
+                continue
+            items.extend(batch)
+
+    def datagramReceived(self, data, addr):
+        """ Validates the datagram and keeps its items, called by the event loop """
+        try:
+            message = decompressMessage(data)
+            version = message["version"]
+            code = message["code"]
+            group = message["group"]
+            session = message["session"]
+            sequence = message["sequence"]
+            fragment = message["fragment"]
+            items = message["items"]
+        except (ValueError, KeyError) as error:
+            logging.debug("Invalid datagram from %s: %s", addr, error)
+            self.dropped += 1
+            return
+
+        if version != NETWORK_VERSION or code != Consts.CDefNetworkIndividual or group != self.groupName:
+            self.dropped += 1
+            return
+
+        if not isinstance(items, list) or not isinstance(sequence, int) or not isinstance(fragment, int):
+            self.dropped += 1
+            return
+
+        # The fragments of the last batch may arrive in any order
+        sender = (addr[0], addr[1], session)
+        last = self.lastBatch.get(sender)
+        if last is not None and (sequence < last[0] or (sequence == last[0] and fragment in last[1])):
+            logging.debug("Overtaken or duplicated datagram from %s dropped", addr)
+            self.dropped += 1
+            return
+        if last is not None and sequence == last[0]:
+            last[1].add(fragment)
+        else:
+            self.lastBatch[sender] = (sequence, {fragment})
+
+        self.accepted += 1
+        self.received.append((monotonic(), items))
+
+    def __run(self):
+        """ The body of the thread of the event loop """
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            endpoint, _ = loop.run_until_complete(
+                loop.create_datagram_endpoint(lambda: _DatagramProtocol(self), local_addr=self.address))
+        except Exception as error:
+            self.error = error
+            self.ready.set()
+            loop.close()
+            return
+
+        self.endpoint = endpoint
+        self.address = endpoint.get_extra_info("sockname")[:2]
+        self.ready.set()
+        logging.debug("Network transport listening on %s:%s", *self.address)
+
+        try:
+            loop.run_forever()
+        finally:
+            endpoint.close()
+            # Lets the transport release the socket
+            loop.run_until_complete(asyncio.sleep(0))
+            loop.close()
+
+    def __shutdown(self):
+        """ Sends the pending items and stops the loop """
+        self.__flush()
+        self.loop.stop()
+
+    def __enqueue(self, targets, items):
+        """ Adds the items to the batches of the targets """
+        for target in targets:
+            self.outgoing.setdefault(target, []).extend(items)
+        if self.flushHandle is None:
+            self.flushHandle = self.loop.call_later(self.flushInterval, self.__flush)
+
+    def __flush(self):
+        """ Sends the batches of the targets """
+        if self.flushHandle is not None:
+            self.flushHandle.cancel()
+            self.flushHandle = None
+        outgoing, self.outgoing = self.outgoing, {}
+        for target, items in outgoing.items():
+            for datagram in self.__pack(items):
+                try:
+                    self.endpoint.sendto(datagram, target)
+                    self.sent += 1
+                except OSError as error:
+                    logging.warning("The datagram to %s:%s wasn't sent: %s", target[0], target[1], error)
+
+    def __pack(self, items):
+        """ Returns the datagrams of a batch of items, the items are split on
+        many datagrams when they don't fit on one, all of them have the sequence
+        number of the batch """
+        self.sequence += 1
+        datagrams = []
+        self.__packFragments(items, datagrams)
+        return datagrams
+
+    def __packFragments(self, items, datagrams):
+        """ Appends the datagrams with the items to the list, the fragment index
+        is the position of the datagram on the batch """
+        message = {
+            "version": NETWORK_VERSION,
+            "code": Consts.CDefNetworkIndividual,
+            "group": self.groupName,
+            "session": self.session,
+            "sequence": self.sequence,
+            "fragment": len(datagrams),
+            "items": items,
+        }
+        datagram = compressMessage(message, self.compression)
+        if len(datagram) <= self.maxDatagram:
+            datagrams.append(datagram)
+            return
+        if len(items) == 1:
+            logging.warning("An item of %d bytes doesn't fit on a datagram and was dropped", len(datagram))
+            return
+        half = len(items) // 2
+        self.__packFragments(items[:half], datagrams)
+        self.__packFragments(items[half:], datagrams)
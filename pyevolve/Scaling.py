@@ -5,11 +5,22 @@
 
 This module have the *scaling schemes* like Linear scaling, etc.
 
+The scaling schemes read the raw scores of the population on a single array
+(see :meth:`GPopulation.GPopulation.getScores`) and set the fitness of all
+the individuals at once (see :meth:`GPopulation.GPopulation.setFitness`),
+the arrays are computed by NumPy when it's installed.
+
 """
 
 import math
 import logging
 
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 def LinearScaling(pop):
     """ Linear Scaling scheme
@@ -39,14 +50,14 @@ def LinearScaling(pop):
         a = pop_rawAve / delta
         b = -pop_rawMin * pop_rawAve / delta
 
-    for i in range(len(pop)):
-        f = pop[i].score
-        if f < 0.0:
-            Util.raiseException("Score %r is negative, linear scaling not supported !" % (f,), ValueError)
-        f = f * a + b
-        if f < 0:
-            f = 0.0
-        pop[i].fitness = f
+    if pop_rawMin < 0.0:
+        Util.raiseException("Score %r is negative, linear scaling not supported !" % (pop_rawMin,), ValueError)
+
+    scores = pop.getScores()
+    if HAS_NUMPY:
+        pop.setFitness(numpy.maximum(scores * a + b, 0.0))
+    else:
+        pop.setFitness([max(f * a + b, 0.0) for f in scores])
 
 
 def SigmaTruncScaling(pop):
@@ -57,12 +68,11 @@ def SigmaTruncScaling(pop):
     c = Consts.CDefScaleSigmaTruncMultiplier
     pop_rawAve = pop.stats["rawAve"]
     pop_rawDev = pop.stats["rawDev"]
-    for i in range(len(pop)):
-        f = pop[i].score - pop_rawAve
-        f += c * pop_rawDev
-        if f < 0:
-            f = 0.0
-        pop[i].fitness = f
+    scores = pop.getScores()
+    if HAS_NUMPY:
+        pop.setFitness(numpy.maximum(scores - pop_rawAve + c * pop_rawDev, 0.0))
+    else:
+        pop.setFitness([max(f - pop_rawAve + c * pop_rawDev, 0.0) for f in scores])
 
 
 def PowerLawScaling(pop):
@@ -75,12 +85,13 @@ def PowerLawScaling(pop):
     from . import Util
     logging.debug("Running power law scaling.")
     k = Consts.CDefScalePowerLawFactor
-    for i in range(len(pop)):
-        f = pop[i].score
-        if f < 0.0:
-            Util.raiseException("Score %r is negative, power law scaling not supported !" % (f,), ValueError)
-        f = math.pow(f, k)
-        pop[i].fitness = f
+    scores = pop.getScores()
+    if len(scores) and min(scores) < 0.0:
+        Util.raiseException("Score %r is negative, power law scaling not supported !" % (min(scores),), ValueError)
+    if HAS_NUMPY:
+        pop.setFitness(numpy.power(scores, k))
+    else:
+        pop.setFitness([math.pow(f, k) for f in scores])
 
 
 def BoltzmannScaling(pop):
@@ -103,18 +114,14 @@ def BoltzmannScaling(pop):
     boltz_temperature = max(boltz_temperature, boltz_min)
     pop.setParams(boltzTemperature=boltz_temperature)
 
-    boltz_e = []
-    avg = 0.0
-
-    for i in range(len(pop)):
-        val = math.exp(pop[i].score / boltz_temperature)
-        boltz_e.append(val)
-        avg += val
-
-    avg /= len(pop)
-
-    for i in range(len(pop)):
-        pop[i].fitness = boltz_e[i] / avg
+    scores = pop.getScores()
+    if HAS_NUMPY:
+        boltz_e = numpy.exp(scores / boltz_temperature)
+        pop.setFitness(boltz_e / boltz_e.mean())
+    else:
+        boltz_e = [math.exp(f / boltz_temperature) for f in scores]
+        avg = sum(boltz_e) / len(boltz_e)
+        pop.setFitness([val / avg for val in boltz_e])
 
 
 def ExponentialScaling(pop):
@@ -123,9 +130,11 @@ def ExponentialScaling(pop):
     .. versionadded: 0.6
        The `ExponentialScaling` function.
     """
-    for i in range(len(pop)):
-        score = pop[i].score
-        pop[i].fitness = math.exp(score)
+    scores = pop.getScores()
+    if HAS_NUMPY:
+        pop.setFitness(numpy.exp(scores))
+    else:
+        pop.setFitness([math.exp(f) for f in scores])
 
 
 def SaturatedScaling(pop):
@@ -134,22 +143,23 @@ def SaturatedScaling(pop):
     .. versionadded: 0.6
        The `SaturatedScaling` function.
     """
-    for i in range(len(pop)):
-        score = pop[i].score
-        pop[i].fitness = 1.0 - math.exp(score)
+    scores = pop.getScores()
+    if HAS_NUMPY:
+        pop.setFitness(1.0 - numpy.exp(scores))
+    else:
+        pop.setFitness([1.0 - math.exp(f) for f in scores])
+
 
 def RankScaling(pop):
     """ Rank Scaling Scheme. The fitness will be calculated according to rank.
 
+    The best raw score individual takes the fitness 1.0 and the individual of
+    the rank *n* takes the fitness 1/sqrt(n).
+
     .. versionadded: 0.7
        The `RankScaling` function.
     """
-    
-    pop.sort()
-    
-    for i in range(len(pop)):
-        n = i + 1
-        fitness = 1 / math.sqrt(n)
-        logging.debug(f"index: {index}, fitness: {fitness}")
-        pop[i].fitness = fitness
-
+    fitness = [0.0] * len(pop)
+    for rank, index in enumerate(pop.getRawRanking()):
+        fitness[index] = 1.0 / math.sqrt(rank + 1)
+    pop.setFitness(fitness)
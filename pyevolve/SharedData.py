@@ -0,0 +1,256 @@
+"""
+
+:mod:`SharedData` -- read-only problem data shared between processes
+==========================================================================
+
+This module keeps a registry of named read-only numpy arrays which are
+stored in shared memory (the :mod:`multiprocessing.shared_memory` module)
+or in a memory-mapped file. The problem data, like the distance matrix of
+a TSP instance, is registered once on the main process and the worker
+processes (see :meth:`GSimpleGA.GSimpleGA.setMultiProcessing`) or island
+processes attach to the same memory instead of holding private copies.
+
+The arrays returned by :func:`registerSharedArray` are pickled as a
+reference to the shared memory, so they can be stored on the parameters
+of the genomes:
+
+   >>> matrix = SharedData.registerSharedArray("distance_matrix", distance_matrix_list)
+   >>> genome.setParams(distance_matrix_list=matrix)
+
+or retrieved by name in the evaluation function, which is the only way
+when the processes are started independently, like the MPI nodes:
+
+   >>> def eval_func(chromosome):
+   >>>    matrix = SharedData.getSharedArray("distance_matrix")
+
+The owner process removes the shared memory when the array is unregistered
+or when the interpreter exits.
+
+.. note:: This module requires numpy, the memory-mapped file backend is used
+          when the :mod:`multiprocessing.shared_memory` module is not available
+          (Python < 3.8).
+
+"""
+
+import atexit
+import logging
+import os
+import tempfile
+
+from . import Util
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+    logging.debug("You don't have numpy, the shared arrays will not be available !")
+
+try:
+    from multiprocessing import shared_memory, resource_tracker, parent_process
+    HAS_SHARED_MEMORY = True
+except ImportError:
+    HAS_SHARED_MEMORY = False
+
+#: The shared memory backend
+BACKEND_SHARED_MEMORY = "shm"
+#: The memory-mapped file backend
+BACKEND_MEMMAP = "memmap"
+
+# The arrays created by this process: name -> (array, resource, pid of the creator)
+_ownedArrays = {}
+# The arrays attached by this process: name -> (array, resource)
+_attachedArrays = {}
+
+if HAS_NUMPY:
+    class SharedArray(numpy.ndarray):
+        """ SharedArray Class - A read-only numpy array backed by shared memory
+
+        The instances are created by :func:`registerSharedArray`, when pickled,
+        only the reference to the memory is sent and the receiving process
+        attaches to it. The views and slices of the array are regular arrays.
+
+        """
+
+        def __array_finalize__(self, obj):
+            self.descriptor = None
+
+        def __reduce_ex__(self, protocol):
+            if self.descriptor is None:
+                return numpy.asarray(self).__reduce_ex__(protocol)
+            return _attachSharedArray, self.descriptor
+else:
+    SharedArray = None
+
+
+def _wrapArray(buffer_array, descriptor):
+    """ Returns the read-only SharedArray view of the buffer """
+    array = buffer_array.view(SharedArray)
+    array.flags.writeable = False
+    array.descriptor = descriptor
+    return array
+
+
+def _attachSharedArray(name, backend, location, shape, dtype):
+    """ Internal used to unpickle the shared arrays """
+    if name in _ownedArrays:
+        return _ownedArrays[name][0]
+    if name in _attachedArrays and _attachedArrays[name][0].descriptor[2] == location:
+        return _attachedArrays[name][0]
+
+    descriptor = (name, backend, location, shape, dtype)
+    if backend == BACKEND_SHARED_MEMORY:
+        resource = shared_memory.SharedMemory(name=location)
+        # The owner process is responsible for the removal of the shared memory,
+        # the resource tracker of an unrelated process (an MPI node, for example)
+        # would remove the memory when it exits, the processes started by the
+        # multiprocessing share the resource tracker of the owner
+        if parent_process() is None:
+            resource_tracker.unregister(resource._name, "shared_memory")
+        buffer_array = numpy.ndarray(shape, dtype=dtype, buffer=resource.buf)
+    else:
+        resource = None
+        buffer_array = numpy.memmap(location, dtype=dtype, mode="r", shape=shape)
+
+    logging.debug("Attached to the shared array '%s' (%s)", name, location)
+    array = _wrapArray(buffer_array, descriptor)
+    _attachedArrays[name] = (array, resource)
+    return array
+
+
+def registerSharedArray(name, data, backend=None):
+    """ Copies the data to the shared memory and registers it with the name
+
+    Example:
+       >>> matrix = SharedData.registerSharedArray("distance_matrix", distance_matrix_list)
+       >>> matrix[10][20]
+       35.0
+
+    :param name: the name of the array
+    :param data: an array or a sequence which can be converted to a numpy array
+    :param backend: "shm" (default when available) to use the shared memory or
+                    "memmap" to use a temporary memory-mapped file
+    :rtype: the read-only :class:`SharedArray` instance
+
+    """
+    if not HAS_NUMPY:
+        Util.raiseException("You must install numpy to use the shared arrays", ImportError)
+
+    if name in _ownedArrays or name in _attachedArrays:
+        Util.raiseException("The shared array '%s' is already registered" % (name,), KeyError)
+
+    if backend is None:
+        backend = BACKEND_SHARED_MEMORY if HAS_SHARED_MEMORY else BACKEND_MEMMAP
+
+    source = numpy.ascontiguousarray(data)
+    if source.dtype.hasobject:
+        Util.raiseException("The shared array '%s' must have a numeric type" % (name,), TypeError)
+
+    if backend == BACKEND_SHARED_MEMORY:
+        if not HAS_SHARED_MEMORY:
+            Util.raiseException("The shared memory backend requires Python 3.8 or newer", ValueError)
+        resource = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+        location = resource.name
+        buffer_array = numpy.ndarray(source.shape, dtype=source.dtype, buffer=resource.buf)
+        buffer_array[...] = source
+    elif backend == BACKEND_MEMMAP:
+        handle, location = tempfile.mkstemp(prefix="pyevolve_%s_" % (name,), suffix=".dat")
+        os.close(handle)
+        resource = None
+        if source.nbytes:
+            buffer_array = numpy.memmap(location, dtype=source.dtype, mode="w+", shape=source.shape)
+            buffer_array[...] = source
+            buffer_array.flush()
+        else:
+            buffer_array = source.copy()
+    else:
+        Util.raiseException("Unknown shared array backend '%s'" % (backend,), ValueError)
+
+    descriptor = (name, backend, location, source.shape, source.dtype.str)
+    array = _wrapArray(buffer_array, descriptor)
+    _ownedArrays[name] = (array, resource, os.getpid())
+    logging.debug("Registered the shared array '%s' %s on %s", name, source.shape, location)
+    return array
+
+
+def getSharedArray(name, nvl=None):
+    """ Returns the shared array registered or attached by this process
+
+    :param name: the name of the array
+    :param nvl: if the array doesn't exist, the nvl will be returned
+    :rtype: the :class:`SharedArray` instance
+
+    """
+    for registry in (_ownedArrays, _attachedArrays):
+        if name in registry:
+            return registry[name][0]
+    return nvl
+
+
+def getSharedArrayDescriptor(name):
+    """ Returns the descriptor used to attach to the array on other processes, it
+    is needed only when the array can't be pickled to the other process, see
+    :func:`attachSharedArray`
+
+    :param name: the name of the array
+    :rtype: a tuple
+
+    """
+    array = getSharedArray(name)
+    if array is None:
+        Util.raiseException("The shared array '%s' isn't registered" % (name,), KeyError)
+    return array.descriptor
+
+
+def attachSharedArray(descriptor):
+    """ Attaches to the shared array created by other process
+
+    :param descriptor: the descriptor returned by :func:`getSharedArrayDescriptor`
+    :rtype: the :class:`SharedArray` instance
+
+    """
+    return _attachSharedArray(*descriptor)
+
+
+def unregisterSharedArray(name):
+    """ Releases the shared array, if this process created the array, the memory is
+    removed, the arrays attached by other processes remain valid until they release it
+
+    :param name: the name of the array
+
+    """
+    if name in _ownedArrays:
+        array, resource, pid = _ownedArrays.pop(name)
+        # The forked processes inherit the registry, but only the creator removes the memory
+        _releaseArray(array, resource, owner=(pid == os.getpid()))
+    elif name in _attachedArrays:
+        array, resource = _attachedArrays.pop(name)
+        _releaseArray(array, resource, owner=False)
+
+
+def clearSharedArrays():
+    """ Releases all the shared arrays of this process """
+    for name in list(_ownedArrays) + list(_attachedArrays):
+        unregisterSharedArray(name)
+
+
+def _releaseArray(array, resource, owner):
+    """ Internal used to close and remove the shared memory """
+    backend, location = array.descriptor[1], array.descriptor[2]
+    if backend == BACKEND_SHARED_MEMORY:
+        try:
+            resource.close()
+        except BufferError:
+            # There are still views of the array, the memory is kept mapped
+            # until they are released
+            logging.debug("The shared array '%s' is still in use", array.descriptor[0])
+        if owner:
+            resource.unlink()
+    elif owner:
+        try:
+            os.remove(location)
+        except OSError:
+            pass
+
+
+atexit.register(clearSharedArrays)
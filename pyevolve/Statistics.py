@@ -6,8 +6,21 @@
 This module have the class which is reponsible to keep statistics of each
 generation. This class is used by the adapters and other statistics dump objects.
 
+It also has the :class:`Timings` class, which measures the time spent on each
+phase of the generations (see :meth:`GSimpleGA.GSimpleGA.setTimings`), the
+:class:`RunningStatistics` class, which computes the mean and the variance of
+a stream of scores on a single pass, and the :class:`ScoreHistory` class, which
+keeps the best score of the generations.
+
 """
 
+from collections import deque
+from math import sqrt as math_sqrt
+from time import perf_counter_ns
+
+from . import Consts
+from . import Util
+
 
 class Statistics(object):
     """ Statistics Class - A class bean-like to store the statistics
@@ -26,12 +39,77 @@ class Statistics(object):
     **rawTot, fitTot**
        The total (sum) of raw scores and the fitness scores
 
+    The optional statistics are measured only by the features which report
+    them, so they aren't part of :meth:`asTuple`, :meth:`items` and :func:`len`
+    unless their keys are given (see :meth:`DBAdapters.DBBaseAdapter.setStatsFields`),
+    they are printed only when measured:
+
+    **cacheHits, cacheMisses**
+       The accumulated hits and misses of the fitness cache, zero when the
+       cache isn't enabled
+
+    **evalUtilization**
+       The fraction of time the worker processes were busy evaluating the
+       individuals of the generation, only measured by the unordered
+       multiprocessing mode
+
+    **evalTimeouts**
+       The number of evaluations which timed out on the generation, only
+       measured when the evaluation timeout is set
+
+    **timeSelection, timeCrossover, timeMutation, timeEvaluation, timeElitism, timeSort, timeCallbacks, timeDatabase**
+       The seconds spent on each phase of the creation of the generation,
+       zero when the timings aren't enabled (see :class:`Timings`)
+
+    The extended statistics are computed only when they are asked, so they
+    aren't part of :meth:`asTuple`, :meth:`items` and :func:`len` unless their
+    keys are given (see :meth:`DBAdapters.DBBaseAdapter.setStatsFields`):
+
+    **rawQ1, rawMed, rawQ3**
+       The first quartile, the median and the third quartile of raw scores
+
+    **rawBest**
+       The best raw score found by the evolution so far
+
+    **rawImprovement**
+       The improvement of the best raw score per generation, along the last
+       :attr:`Consts.CDefStatsImprovementWindow` generations
+
+    **uniqueGenotypes**
+       The number of distinct genotypes of the population
+
     Example:
        >>> stats = ga_engine.getStatistics()
        >>> st["rawMax"]
        10.2
     """
 
+    #: The keys and the default values of the optional statistics
+    optionalFields = {
+        "cacheHits": 0,
+        "cacheMisses": 0,
+        "evalUtilization": 0.0,
+        "evalTimeouts": 0,
+        "timeSelection": 0.0,
+        "timeCrossover": 0.0,
+        "timeMutation": 0.0,
+        "timeEvaluation": 0.0,
+        "timeElitism": 0.0,
+        "timeSort": 0.0,
+        "timeCallbacks": 0.0,
+        "timeDatabase": 0.0,
+    }
+
+    #: The keys and the default values of the extended statistics
+    extendedFields = {
+        "rawQ1": 0.0,
+        "rawMed": 0.0,
+        "rawQ3": 0.0,
+        "rawBest": 0.0,
+        "rawImprovement": 0.0,
+        "uniqueGenotypes": 0,
+    }
+
     def __init__(self):
         """ The Statistics Class creator """
 
@@ -56,15 +134,61 @@ class Statistics(object):
             "fitMax": "Maximum fitness",
             "fitMin": "Minimum fitness",
             "fitAve": "Fitness average",
+            "cacheHits": "Fitness cache hits",
+            "cacheMisses": "Fitness cache misses",
+            "evalUtilization": "Worker utilization of the evaluation",
+            "evalTimeouts": "Evaluation timeouts",
+            "timeSelection": "Selection time (seconds)",
+            "timeCrossover": "Crossover time (seconds)",
+            "timeMutation": "Mutation time (seconds)",
+            "timeEvaluation": "Evaluation time (seconds)",
+            "timeElitism": "Elitism time (seconds)",
+            "timeSort": "Sort time (seconds)",
+            "timeCallbacks": "Callbacks time (seconds)",
+            "timeDatabase": "DB Adapter time (seconds)",
+            "rawQ1": "First quartile of raw scores",
+            "rawMed": "Median of raw scores",
+            "rawQ3": "Third quartile of raw scores",
+            "rawBest": "Best raw score so far",
+            "rawImprovement": "Best raw score improvement per generation",
+            "uniqueGenotypes": "Distinct genotypes",
         }
 
+        # The values of the optional statistics measured
+        self.optionalValues = {}
+
+        # The functions which compute the extended statistics and their values
+        self.providers = {}
+        self.lazyValues = {}
+
     def __getitem__(self, key):
-        """ Return the specific statistic by key """
-        return self.internalDict[key]
+        """ Return the specific statistic by key, the extended statistics
+        are computed by their providers on the first access """
+        try:
+            return self.internalDict[key]
+        except KeyError:
+            if key in self.optionalFields:
+                return self.optionalValues.get(key, self.optionalFields[key])
+            if key not in self.extendedFields:
+                raise
+        if key not in self.lazyValues:
+            provider = self.providers.get(key)
+            if provider is None:
+                return self.extendedFields[key]
+            self.lazyValues.update(provider())
+        return self.lazyValues.get(key, self.extendedFields[key])
 
     def __setitem__(self, key, value):
         """ Set the statistic """
-        self.internalDict[key] = value
+        if key in self.optionalFields:
+            self.optionalValues[key] = value
+        else:
+            self.internalDict[key] = value
+
+    def __contains__(self, key):
+        """ Returns True if the statistic is a standard one or an optional
+        statistic already measured """
+        return key in self.internalDict or key in self.optionalValues
 
     def __len__(self):
         """ Return the length of internal stats dictionary """
@@ -75,20 +199,84 @@ class Statistics(object):
         strBuff = "- Statistics\n"
         for k, v in list(self.internalDict.items()):
             strBuff += "\t%-45s = %.2f\n" % (self.descriptions.get(k, k), v)
+        for k, v in list(self.optionalValues.items()):
+            valueFormat = "%d" if isinstance(self.optionalFields[k], int) else "%.2f"
+            strBuff += ("\t%-45s = " + valueFormat + "\n") % (self.descriptions.get(k, k), v)
         return strBuff
 
-    def asTuple(self):
-        """ Returns the stats as a python tuple """
-        return tuple(self.internalDict.values())
+    def setProvider(self, keys, provider):
+        """ Sets the function which computes extended statistics on demand
+
+        Example:
+           >>> stats.setProvider(("rawMed",), lambda: {"rawMed": 1.0})
+
+        :param keys: the keys of the extended statistics computed by the provider
+        :param provider: a function without parameters which returns a dict
+                         with the values of the keys
+
+        .. versionadded:: 0.7
+           The `setProvider` method.
+
+        """
+        for key in keys:
+            if key not in self.extendedFields:
+                Util.raiseException("The %r isn't an extended statistic" % (key,), KeyError)
+            self.providers[key] = provider
+
+    def clearLazy(self):
+        """ Drops the extended statistics computed, they are computed again
+        by their providers when asked
+
+        .. versionadded:: 0.7
+           The `clearLazy` method.
+
+        """
+        self.lazyValues.clear()
+
+    def getFields(self, fields=None):
+        """ Returns the keys of the statistics
+
+        :param fields: the keys asked, validated against the known statistics,
+                       when None, the keys of the standard statistics
+        :rtype: the list of keys
+
+        .. versionadded:: 0.7
+           The `getFields` method.
+
+        """
+        if fields is None:
+            return list(self.internalDict.keys())
+        for key in fields:
+            if key not in self.internalDict and key not in self.optionalFields and key not in self.extendedFields:
+                Util.raiseException("Unknown statistic %r" % (key,), KeyError)
+        return list(fields)
+
+    def asTuple(self, fields=None):
+        """ Returns the stats as a python tuple
+
+        :param fields: the keys of the statistics, the standard ones by default
+
+        """
+        if fields is None:
+            return tuple(self.internalDict.values())
+        return tuple(self[key] for key in self.getFields(fields))
 
     def clear(self):
         """ Set all statistics to zero """
         for k in list(self.internalDict.keys()):
             self.internalDict[k] = 0
+        self.optionalValues.clear()
+        self.lazyValues.clear()
 
-    def items(self):
-        """ Return a tuple (name, value) for all stored statistics """
-        return list(self.internalDict.items())
+    def items(self, fields=None):
+        """ Return a tuple (name, value) for all stored statistics
+
+        :param fields: the keys of the statistics, the standard ones by default
+
+        """
+        if fields is None:
+            return list(self.internalDict.items())
+        return [(key, self[key]) for key in self.getFields(fields)]
 
     def clone(self):
         """ Instantiate a new Statistic class with the same contents """
@@ -104,3 +292,292 @@ class Statistics(object):
         """
         obj.internalDict = self.internalDict.copy()
         obj.descriptions = self.descriptions.copy()
+        obj.optionalValues = self.optionalValues.copy()
+        obj.lazyValues = self.lazyValues.copy()
+
+
+class Timings(object):
+    """ Timings Class - Accumulates the time spent on each phase of the generations
+
+    The engine calls :meth:`start` before a phase and :meth:`lap` at the end
+    of each phase, the time between the calls is added to the phase. When the
+    generation is created, :meth:`close` stores the record of the generation
+    and copies it to the *time* keys of the :class:`Statistics`, so the DB
+    Adapters dump the timings when these keys are selected (see
+    :meth:`DBAdapters.DBBaseAdapter.setStatsFields`).
+
+    The phases are:
+
+    **selection, crossover, mutation, evaluation, elitism, sort**
+       The phases of the step which created the generation
+
+    **callbacks, database**
+       The step callbacks, the termination criteria and the DB Adapter run
+       before the step which created the generation
+
+    Example:
+       >>> ga_engine.setTimings(True)
+       >>> ga_engine.evolve()
+       >>> ga_engine.getTimings()[-1]["evaluation"]
+       0.0123
+
+    .. note:: The clock is the :func:`time.perf_counter_ns`, the records have
+              the times in seconds.
+
+    """
+
+    phases = ("selection", "crossover", "mutation", "evaluation", "elitism", "sort", "callbacks", "database")
+
+    def __init__(self):
+        """ The Timings Class creator """
+        self.current = dict.fromkeys(self.phases, 0)
+        self.records = []
+        self.mark = perf_counter_ns()
+
+    def __repr__(self):
+        """ Return a string representation of the timings """
+        strBuff = "- Timings (%d generations)\n" % (len(self.records),)
+        for phase, elapsed in self.totals().items():
+            strBuff += "\t%-45s = %.6f\n" % (phase, elapsed)
+        return strBuff
+
+    def __len__(self):
+        """ Return the number of generation records """
+        return len(self.records)
+
+    def start(self):
+        """ Starts the timing of a phase """
+        self.mark = perf_counter_ns()
+
+    def lap(self, phase):
+        """ Adds the time since the last call of :meth:`start` or :meth:`lap`
+        to the phase and starts the timing of the next phase
+
+        :param phase: the name of the phase, one of the :attr:`phases`
+
+        """
+        now = perf_counter_ns()
+        self.current[phase] += now - self.mark
+        self.mark = now
+
+    def close(self, generation, stats=None):
+        """ Stores the record of the generation and starts a new one
+
+        :param generation: the generation number
+        :param stats: the :class:`Statistics` which receives the times, optional
+        :rtype: the record, a dict with the generation and the seconds of each phase
+
+        """
+        record = {"generation": generation}
+        for phase, elapsed in self.current.items():
+            record[phase] = elapsed / 1e9
+            self.current[phase] = 0
+        self.records.append(record)
+
+        if stats is not None:
+            for phase in self.phases:
+                stats["time" + phase[0].upper() + phase[1:]] = record[phase]
+        return record
+
+    def totals(self):
+        """ Returns the seconds spent on each phase on all the generations
+
+        :rtype: a dict with the phase names and the seconds
+
+        """
+        totals = dict.fromkeys(self.phases, 0.0)
+        for record in self.records:
+            for phase in self.phases:
+                totals[phase] += record[phase]
+        return totals
+
+    def clear(self):
+        """ Removes the records and the current times """
+        self.current = dict.fromkeys(self.phases, 0)
+        self.records = []
+
+
+class RunningStatistics(object):
+    """ RunningStatistics Class - The count, mean, variance and extremes of a
+    stream of values, computed on a single pass by the Welford's algorithm
+
+    The values can be removed as well, so the steady-state engine keeps the
+    statistics of the population while the individuals are replaced. Unlike
+    the sums of the values and of their squares, the algorithm doesn't lose
+    the precision when the variance is small compared to the mean.
+
+    Example:
+       >>> running = RunningStatistics()
+       >>> running.extend([1.0, 2.0, 3.0])
+       >>> running.getVariance()
+       1.0
+
+    .. note:: the minimum and the maximum are the extremes of all values
+              pushed, :meth:`remove` doesn't change them.
+
+    .. versionadded:: 0.7
+       The :class:`RunningStatistics` class.
+
+    """
+
+    def __init__(self):
+        """ The RunningStatistics Class creator """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def __repr__(self):
+        """ Return a string representation of the running statistics """
+        return "RunningStatistics(count=%d, mean=%r, variance=%r)" % (self.count, self.mean, self.getVariance())
+
+    def push(self, value):
+        """ Adds a value
+
+        :param value: the value
+
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.count == 1:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+
+    def extend(self, values):
+        """ Adds the values, on a single pass
+
+        :param values: an iterable of values
+
+        """
+        count, mean, m2 = self.count, self.mean, self.m2
+        minimum, maximum = self.minimum, self.maximum
+        for value in values:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+            if count == 1:
+                minimum = maximum = value
+            elif value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+        self.count, self.mean, self.m2 = count, mean, m2
+        self.minimum, self.maximum = minimum, maximum
+
+    def remove(self, value):
+        """ Removes a value which was added before
+
+        :param value: the value
+
+        """
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    def replace(self, old_value, new_value):
+        """ Replaces a value which was added before
+
+        :param old_value: the value removed
+        :param new_value: the value added
+
+        """
+        self.remove(old_value)
+        self.push(new_value)
+
+    def getVariance(self):
+        """ Returns the sample variance, zero with less than two values """
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def getDeviation(self):
+        """ Returns the sample standard deviation """
+        return math_sqrt(self.getVariance())
+
+
+class ScoreHistory(object):
+    """ ScoreHistory Class - Keeps the best raw score found so far and the best
+    scores of the last generations, used by the *rawBest* and *rawImprovement*
+    statistics (see :class:`Statistics`)
+
+    Example:
+       >>> history = ScoreHistory()
+       >>> history.update(0, 10.0, Consts.minimaxType["minimize"])
+       >>> history.update(2, 6.0, Consts.minimaxType["minimize"])
+       >>> history.getImprovementRate()
+       2.0
+
+    :param window: the number of generations of the improvement rate
+
+    .. versionadded:: 0.7
+       The :class:`ScoreHistory` class.
+
+    """
+
+    def __init__(self, window=Consts.CDefStatsImprovementWindow):
+        """ The ScoreHistory Class creator """
+        self.window = window
+        self.best = None
+        self.records = deque(maxlen=window + 1)
+
+    def __repr__(self):
+        """ Return a string representation of the history """
+        return "ScoreHistory(best=%r, generations=%d)" % (self.best, len(self.records))
+
+    def update(self, generation, score, minimax):
+        """ Records the best score of the generation, a new record of the same
+        generation replaces the previous one
+
+        :param generation: the generation number
+        :param score: the best raw score of the generation
+        :param minimax: the :attr:`Consts.minimaxType` of the scores
+
+        """
+        if self.best is None:
+            self.best = score
+        elif minimax == Consts.minimaxType["maximize"]:
+            self.best = max(self.best, score)
+        else:
+            self.best = min(self.best, score)
+        # The improvement is positive for the both minimax types
+        signed = self.best if minimax == Consts.minimaxType["maximize"] else -self.best
+        if self.records and self.records[-1][0] == generation:
+            self.records.pop()
+        self.records.append((generation, signed))
+
+    def getBest(self):
+        """ Returns the best score so far, None before the first update """
+        return self.best
+
+    def getImprovementRate(self):
+        """ Returns the improvement of the best score per generation along the
+        window, zero with less than two generations
+
+        :rtype: the improvement rate, never negative
+
+        """
+        if len(self.records) < 2:
+            return 0.0
+        first_generation, first = self.records[0]
+        last_generation, last = self.records[-1]
+        if last_generation == first_generation:
+            return 0.0
+        return (last - first) / float(last_generation - first_generation)
+
+    def clear(self):
+        """ Forgets the scores """
+        self.best = None
+        self.records.clear()
@@ -8,12 +8,34 @@ use, like list item swap, random utilities and etc.
 
 """
 
+import random
 from random import random as rand_random
 from math import sqrt as math_sqrt
 import logging
 
 
-def randomFlipCoin(p):
+def getRandom(args):
+    """ Returns the random number generator which must be used by the operators,
+    it's the *rng* parameter sent by the GA Engine (see :meth:`GSimpleGA.GSimpleGA.getRandom`),
+    or the :mod:`random` module when the operator is called without it
+
+    Example:
+       >>> def G1DListMutatorSwap(genome, **args):
+       >>>    rng = Util.getRandom(args)
+       >>>    index = rng.randint(0, len(genome) - 1)
+
+    :param args: the parameters received by the operator
+    :rtype: a :class:`random.Random` instance or the :mod:`random` module
+
+    """
+    rng = args.get("rng")
+    if rng is None:
+        ga_engine = args.get("ga_engine")
+        rng = ga_engine.getRandom() if ga_engine is not None else random
+    return rng
+
+
+def randomFlipCoin(p, rng=None):
     """Returns True with the *p* probability. If *p* is 1, the
     function will always return True. If *p* is 0, the function will
     return always False.
@@ -23,6 +45,7 @@ def randomFlipCoin(p):
        True
 
     :param p: probability, between 0.0 and 1.0
+    :param rng: the random number generator, the default is the :mod:`random` module
     :rtype: True or False
 
     """
@@ -31,6 +54,8 @@ def randomFlipCoin(p):
     if p == 0.0:
         return False
 
+    if rng is not None:
+        return rng.random() <= p
     return rand_random() <= p
 
 
@@ -72,6 +97,28 @@ def list2DSwapElement(lst, indexa, indexb):
     lst[indexb[0]][indexb[1]] = temp
 
 
+def getTypeName(types, value):
+    """ Returns the name of a type value, the reverse of the type dicts
+    of the :mod:`Consts` module.
+
+    Example:
+       >>> Util.getTypeName(Consts.minimaxType, 1)
+       'maximize'
+
+    :param types: the dict of the type names and values
+    :param value: the type value
+    :rtype: the type name
+
+    .. versionadded:: 0.7
+       The `getTypeName` function.
+
+    """
+    for name, type_value in types.items():
+        if type_value == value:
+            return name
+    raiseException("Unknown type value %r" % (value,), ValueError)
+
+
 def raiseException(message, expt=None):
     """ Raise an exception and logs the message.
 
@@ -9,10 +9,10 @@ is above this namespace, for example, to import :mod:`Mutators`:
 
 
 """
-__all__ = ["Consts", "DBAdapters", "FunctionSlot",
+__all__ = ["Checkpoint", "Consts", "DBAdapters", "FitnessCache", "FunctionSlot",
            "GAllele", "GenomeBase", "GPopulation",
-           "GSimpleGA","Scaling"
-           "Statistics", "Util"]
+           "GSimpleGA", "GSteadyStateGA", "Migration", "Scaling",
+           "SharedData", "Statistics", "Util"]
 
 __version__ = '0.7'
 __author__ = 'Christian S. Perone'
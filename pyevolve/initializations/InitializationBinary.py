@@ -1,11 +1,11 @@
-from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
 from .. import Util
 # 1D Binary String
 
 
 def G1DBinaryStringInitializator(genome, **args):
     """ 1D Binary String initializator """
-    genome.genomeList = [rand_choice((0, 1)) for _ in range(genome.getListSize())]
+    rng = Util.getRandom(args)
+    genome.genomeList = [rng.choice((0, 1)) for _ in range(genome.getListSize())]
 
 
 # 2D Binary String
@@ -16,9 +16,10 @@ def G2DBinaryStringInitializator(genome, **args):
     .. versionadded:: 0.6
        The *G2DBinaryStringInitializator* function
     """
+    rng = Util.getRandom(args)
     genome.clearString()
 
     for i in range(genome.getHeight()):
         for j in range(genome.getWidth()):
-            random_gene = rand_choice((0, 1))
+            random_gene = rng.choice((0, 1))
             genome.setItem(i, j, random_gene)
@@ -16,7 +16,6 @@ choosing random data.
 
 # 1D List
 
-from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
 from .. import Util
 
 def G1DListInitializatorAllele(genome, **args):
@@ -26,12 +25,12 @@ def G1DListInitializatorAllele(genome, **args):
     :class:`GAllele.GAlleles` instance.
 
     """
-
+    rng = Util.getRandom(args)
     allele = genome.getParam("allele", None)
     if allele is None:
         Util.raiseException("to use the G1DListInitializatorAllele, you must specify the 'allele' parameter")
 
-    genome.genomeList = [allele[i].getRandomAllele() for i in range(genome.getListSize())]
+    genome.genomeList = [allele[i].getRandomAllele(rng) for i in range(genome.getListSize())]
 
 
 def G1DListInitializatorInteger(genome, **args):
@@ -40,10 +39,11 @@ def G1DListInitializatorInteger(genome, **args):
     This initializator accepts the *rangemin* and *rangemax* genome parameters.
 
     """
+    rng = Util.getRandom(args)
     range_min = genome.getParam("rangemin", 0)
     range_max = genome.getParam("rangemax", 100)
 
-    genome.genomeList = [rand_randint(range_min, range_max) for i in range(genome.getListSize())]
+    genome.genomeList = [rng.randint(range_min, range_max) for i in range(genome.getListSize())]
 
 
 def G1DListInitializatorReal(genome, **args):
@@ -52,7 +52,8 @@ def G1DListInitializatorReal(genome, **args):
     This initializator accepts the *rangemin* and *rangemax* genome parameters.
 
     """
+    rng = Util.getRandom(args)
     range_min = genome.getParam("rangemin", 0)
     range_max = genome.getParam("rangemax", 100)
 
-    genome.genomeList = [rand_uniform(range_min, range_max) for i in range(genome.getListSize())]
+    genome.genomeList = [rng.uniform(range_min, range_max) for i in range(genome.getListSize())]
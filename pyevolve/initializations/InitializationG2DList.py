@@ -1,5 +1,4 @@
 
-from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
 from .. import Util
 
 # 2D List
@@ -10,11 +9,12 @@ def G2DListInitializatorInteger(genome, **args):
     This initializator accepts the *rangemin* and *rangemax* genome parameters.
 
     """
+    rng = Util.getRandom(args)
     genome.clearList()
 
     for i in range(genome.getHeight()):
         for j in range(genome.getWidth()):
-            randomInteger = rand_randint(genome.getParam("rangemin", 0),
+            randomInteger = rng.randint(genome.getParam("rangemin", 0),
                                          genome.getParam("rangemax", 100))
             genome.setItem(i, j, randomInteger)
 
@@ -25,11 +25,12 @@ def G2DListInitializatorReal(genome, **args):
     This initializator accepts the *rangemin* and *rangemax* genome parameters.
 
     """
+    rng = Util.getRandom(args)
     genome.clearList()
 
     for i in range(genome.getHeight()):
         for j in range(genome.getWidth()):
-            randomReal = rand_uniform(genome.getParam("rangemin", 0),
+            randomReal = rng.uniform(genome.getParam("rangemin", 0),
                                       genome.getParam("rangemax", 100))
             genome.setItem(i, j, randomReal)
 
@@ -43,7 +44,7 @@ def G2DListInitializatorAllele(genome, **args):
     .. warning:: the :class:`GAllele.GAlleles` instance must have the homogeneous flag enabled
 
     """
-
+    rng = Util.getRandom(args)
     allele = genome.getParam("allele", None)
     if allele is None:
         Util.raiseException("to use the G2DListInitializatorAllele, you must specify the 'allele' parameter")
@@ -55,5 +56,5 @@ def G2DListInitializatorAllele(genome, **args):
 
     for i in range(genome.getHeight()):
         for j in range(genome.getWidth()):
-            random_allele = allele[0].getRandomAllele()
+            random_allele = allele[0].getRandomAllele(rng)
             genome.setItem(i, j, random_allele)
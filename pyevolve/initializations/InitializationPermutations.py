@@ -1,7 +1,9 @@
-import random
+from .. import Util
+
 
 def G1DListTSPInitializatorRandom(genome, **args):
     """ The initializator for the TSP """
+    rng = Util.getRandom(args)
     lst = [i for i in range(genome.getListSize())]
-    random.shuffle(lst)
+    rng.shuffle(lst)
     genome.setInternalList(lst)
@@ -1,7 +1,6 @@
 # Tree
 
 
-from random import randint as rand_randint, uniform as rand_uniform, choice as rand_choice
 from ..representations import GTree
 from .. import Util
 
@@ -24,6 +23,7 @@ def GTreeInitializatorInteger(genome, **args):
     .. versionadded:: 0.6
        The *GTreeInitializatorInteger* function.
     """
+    rng = Util.getRandom(args)
     max_depth = genome.getParam("max_depth", 5)
     max_siblings = genome.getParam("max_siblings", 2)
 
@@ -31,19 +31,19 @@ def GTreeInitializatorInteger(genome, **args):
     range_max = genome.getParam("rangemax", 100)
 
     def lambda_generator():
-        return rand_randint(range_min, range_max)
+        return rng.randint(range_min, range_max)
 
     method = genome.getParam("method", "grow")
 
     if method == "grow":
-        root = GTree.buildGTreeGrow(0, lambda_generator, max_siblings, max_depth)
+        root = GTree.buildGTreeGrow(0, lambda_generator, max_siblings, max_depth, rng)
     elif method == "full":
-        root = GTree.buildGTreeFull(0, lambda_generator, max_siblings, max_depth)
+        root = GTree.buildGTreeFull(0, lambda_generator, max_siblings, max_depth, rng)
     elif method == "ramped":
-        if Util.randomFlipCoin(0.5):
-            root = GTree.buildGTreeGrow(0, lambda_generator, max_siblings, max_depth)
+        if Util.randomFlipCoin(0.5, rng):
+            root = GTree.buildGTreeGrow(0, lambda_generator, max_siblings, max_depth, rng)
         else:
-            root = GTree.buildGTreeFull(0, lambda_generator, max_siblings, max_depth)
+            root = GTree.buildGTreeFull(0, lambda_generator, max_siblings, max_depth, rng)
     else:
         Util.raiseException("Unknown tree initialization method [%s] !" % method)
 
@@ -63,6 +63,7 @@ def GTreeInitializatorAllele(genome, **args):
     .. versionadded:: 0.6
        The *GTreeInitializatorAllele* function.
     """
+    rng = Util.getRandom(args)
     max_depth = genome.getParam("max_depth", 5)
     max_siblings = genome.getParam("max_siblings", 2)
     method = genome.getParam("method", "grow")
@@ -74,15 +75,18 @@ def GTreeInitializatorAllele(genome, **args):
     if not allele.homogeneous:
         Util.raiseException("to use the GTreeInitializatorAllele, the 'allele' must be homogeneous")
 
+    def allele_generator():
+        return allele[0].getRandomAllele(rng)
+
     if method == "grow":
-        root = GTree.buildGTreeGrow(0, allele[0].getRandomAllele, max_siblings, max_depth)
+        root = GTree.buildGTreeGrow(0, allele_generator, max_siblings, max_depth, rng)
     elif method == "full":
-        root = GTree.buildGTreeFull(0, allele[0].getRandomAllele, max_siblings, max_depth)
+        root = GTree.buildGTreeFull(0, allele_generator, max_siblings, max_depth, rng)
     elif method == "ramped":
-        if Util.randomFlipCoin(0.5):
-            root = GTree.buildGTreeGrow(0, allele[0].getRandomAllele, max_siblings, max_depth)
+        if Util.randomFlipCoin(0.5, rng):
+            root = GTree.buildGTreeGrow(0, allele_generator, max_siblings, max_depth, rng)
         else:
-            root = GTree.buildGTreeFull(0, allele[0].getRandomAllele, max_siblings, max_depth)
+            root = GTree.buildGTreeFull(0, allele_generator, max_siblings, max_depth, rng)
     else:
         Util.raiseException("Unknown tree initialization method [%s] !" % method)
 
@@ -105,20 +109,21 @@ def GTreeGPInitializator(genome, **args):
     .. versionadded:: 0.6
        The *GTreeGPInitializator* function.
     """
+    rng = Util.getRandom(args)
 
     max_depth = genome.getParam("max_depth", 5)
     method = genome.getParam("method", "grow")
     ga_engine = args["ga_engine"]
 
     if method == "grow":
-        root = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth)
+        root = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth, rng)
     elif method == "full":
-        root = GTree.buildGTreeGPFull(ga_engine, 0, max_depth)
+        root = GTree.buildGTreeGPFull(ga_engine, 0, max_depth, rng)
     elif method == "ramped":
-        if Util.randomFlipCoin(0.5):
-            root = GTree.buildGTreeGPFull(ga_engine, 0, max_depth)
+        if Util.randomFlipCoin(0.5, rng):
+            root = GTree.buildGTreeGPFull(ga_engine, 0, max_depth, rng)
         else:
-            root = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth)
+            root = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth, rng)
     else:
         Util.raiseException("Unknown tree initialization method [%s] !" % method)
 
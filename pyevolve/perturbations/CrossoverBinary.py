@@ -8,8 +8,6 @@ In this module we have the genetic operators of crossover (or recombination) for
 """
 
 
-from random import randint as rand_randint, choice as rand_choice
-from random import random as rand_random
 import math
 from .. import Util
 from .. import Consts
@@ -23,6 +21,7 @@ def G1DBinaryStringXSinglePoint(genome, **args):
     .. warning:: You can't use this crossover method for binary strings with length of 1.
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -32,7 +31,7 @@ def G1DBinaryStringXSinglePoint(genome, **args):
         Util.raiseException(
             "The Binary String have one element, can't use the Single Point Crossover method !", TypeError)
 
-    cut = rand_randint(1, len(gMom) - 1)
+    cut = rng.randint(1, len(gMom) - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -53,6 +52,7 @@ def G1DBinaryStringXTwoPoint(genome, **args):
     .. warning:: You can't use this crossover method for binary strings with length of 1.
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -61,7 +61,7 @@ def G1DBinaryStringXTwoPoint(genome, **args):
     if len(gMom) == 1:
         Util.raiseException("The Binary String have one element, can't use the Two Point Crossover method !", TypeError)
 
-    cuts = [rand_randint(1, len(gMom) - 1), rand_randint(1, len(gMom) - 1)]
+    cuts = [rng.randint(1, len(gMom) - 1), rng.randint(1, len(gMom) - 1)]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
@@ -81,6 +81,7 @@ def G1DBinaryStringXTwoPoint(genome, **args):
 
 def G1DBinaryStringXUniform(genome, **args):
     """ The G1DList Uniform Crossover """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -93,7 +94,7 @@ def G1DBinaryStringXUniform(genome, **args):
     brother.resetStats()
 
     for i in range(len(gMom)):
-        if Util.randomFlipCoin(Consts.CDefG1DBinaryStringUniformProb):
+        if Util.randomFlipCoin(Consts.CDefG1DBinaryStringUniformProb, rng):
             temp = sister[i]
             sister[i] = brother[i]
             brother[i] = temp
@@ -109,6 +110,7 @@ def G2DBinaryStringXUniform(genome, **args):
     .. versionadded:: 0.6
        The *G2DBinaryStringXUniform* function
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -124,7 +126,7 @@ def G2DBinaryStringXUniform(genome, **args):
 
     for i in range(h):
         for j in range(w):
-            if Util.randomFlipCoin(Consts.CDefG2DBinaryStringUniformProb):
+            if Util.randomFlipCoin(Consts.CDefG2DBinaryStringUniformProb, rng):
                 temp = sister.getItem(i, j)
                 sister.setItem(i, j, brother.getItem(i, j))
                 brother.setItem(i, j, temp)
@@ -138,12 +140,13 @@ def G2DBinaryStringXSingleVPoint(genome, **args):
     .. versionadded:: 0.6
        The *G2DBinaryStringXSingleVPoint* function
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
     gDad = args["dad"]
 
-    cut = rand_randint(1, gMom.getWidth() - 1)
+    cut = rng.randint(1, gMom.getWidth() - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -167,12 +170,13 @@ def G2DBinaryStringXSingleHPoint(genome, **args):
        The *G2DBinaryStringXSingleHPoint* function
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
     gDad = args["dad"]
 
-    cut = rand_randint(1, gMom.getHeight() - 1)
+    cut = rng.randint(1, gMom.getHeight() - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -1,5 +1,3 @@
-from random import randint as rand_randint, choice as rand_choice
-from random import random as rand_random
 import math
 from .. import Util
 
@@ -19,6 +17,7 @@ def G1DListCrossoverSinglePoint(genome, **args):
     .. warning:: You can't use this crossover method for lists with just one element.
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -27,7 +26,7 @@ def G1DListCrossoverSinglePoint(genome, **args):
     if len(gMom) == 1:
         Util.raiseException("The 1D List have one element, can't use the Single Point Crossover method !", TypeError)
 
-    cut = rand_randint(1, len(gMom) - 1)
+    cut = rng.randint(1, len(gMom) - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -49,6 +48,7 @@ def G1DListCrossoverTwoPoint(genome, **args):
     .. warning:: You can't use this crossover method for lists with just one element.
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -57,7 +57,7 @@ def G1DListCrossoverTwoPoint(genome, **args):
     if len(gMom) == 1:
         Util.raiseException("The 1D List have one element, can't use the Two Point Crossover method !", TypeError)
 
-    cuts = [rand_randint(1, len(gMom) - 1), rand_randint(1, len(gMom) - 1)]
+    cuts = [rng.randint(1, len(gMom) - 1), rng.randint(1, len(gMom) - 1)]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
@@ -81,6 +81,7 @@ def G1DListCrossoverUniform(genome, **args):
     Each gene has a 50% chance of being swapped between mom and dad
 
     """
+    rng = Util.getRandom(args)
     from .. import Consts
     sister = None
     brother = None
@@ -93,7 +94,7 @@ def G1DListCrossoverUniform(genome, **args):
     brother.resetStats()
 
     for i in range(len(gMom)):
-        if Util.randomFlipCoin(Consts.CDefG1DListCrossUniformProb):
+        if Util.randomFlipCoin(Consts.CDefG1DListCrossUniformProb, rng):
             temp = sister[i]
             sister[i] = brother[i]
             brother[i] = temp
@@ -111,6 +112,7 @@ def G1DListCrossoverRealSBX(genome, **args):
     .. warning:: This crossover method is Data Type Dependent, which means that
                  must be used for 1D genome of real values.
     """
+    rng = Util.getRandom(args)
     from . import Consts
 
     EPS = Consts.CDefG1DListSBXEPS
@@ -139,7 +141,7 @@ def G1DListCrossoverRealSBX(genome, **args):
                 gDad[i] = temp
 
             # random number betwn. 0 & 1
-            u = rand_random()
+            u = rng.random()
 
             beta = 1.0 + 2 * (gMom[i] - lb) / (1.0 * (gDad[i] - gMom[i]))
             alpha = 2.0 - beta ** (-(eta_c + 1.0))
@@ -171,7 +173,7 @@ def G1DListCrossoverRealSBX(genome, **args):
             if sister[i] < lb:
                 sister[i] = lb
 
-            if rand_random() > 0.5:
+            if rng.random() > 0.5:
                 # Swap
                 temp = sister[i]
                 sister[i] = brother[i]
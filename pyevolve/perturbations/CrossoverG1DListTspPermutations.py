@@ -1,7 +1,4 @@
-from random import randint as rand_randint, choice as rand_choice
-from random import random as rand_random
 import math
-import random
 from pyevolve.perturbations import DoublyCircularLinkedList as dcll
 from .. import Util
 
@@ -30,6 +27,7 @@ def checkTspListIntegrity(gMom,gDad,sister,brother):
 
 def G1DListCrossoverOX(genome, **args):
     """ The OX Crossover for G1DList  (order crossover) """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -37,10 +35,10 @@ def G1DListCrossoverOX(genome, **args):
     listSize = len(gMom)
 
 
-    c1, c2 = [rand_randint(1, listSize - 1), rand_randint(1, listSize - 1)]
+    c1, c2 = [rng.randint(1, listSize - 1), rng.randint(1, listSize - 1)]
 
     while c1 == c2:
-        c2 = rand_randint(1, listSize - 1)
+        c2 = rng.randint(1, listSize - 1)
 
     if c1 > c2:
         h = c1
@@ -72,6 +70,7 @@ def G1DListCrossoverEdge(genome, **args):
     <http://en.wikipedia.org/wiki/Edge_recombination_operator>`_
     Wikipedia entry.
     """
+    rng = Util.getRandom(args)
     gMom, sisterl = args["mom"], []
     gDad, brotherl = args["dad"], []
     listSize = len(gMom)
@@ -80,16 +79,16 @@ def G1DListCrossoverEdge(genome, **args):
     for c, u in (sisterl, set(gMom)), (brotherl, set(gDad)):
         curr = None
         for i in range(listSize):
-            curr = rand_choice(tuple(u)) if not curr else curr
+            curr = rng.choice(tuple(u)) if not curr else curr
             c.append(curr)
             u.remove(curr)
             d = [v for v in merge_edges.get(curr, []) if v in u]
             if d:
-                curr = rand_choice(d)
+                curr = rng.choice(d)
             else:
                 s = [v for v in mom_edges.get(curr, []) if v in u]
                 s += [v for v in dad_edges.get(curr, []) if v in u]
-                curr = rand_choice(s) if s else None
+                curr = rng.choice(s) if s else None
 
     sister = gMom.clone()
     brother = gDad.clone()
@@ -106,6 +105,7 @@ def G1DListCrossoverEdge(genome, **args):
 def G1DListCrossoverCutCrossfill(genome, **args):
     """ The crossover of G1DList, Cut and crossfill, for permutations
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -115,7 +115,7 @@ def G1DListCrossoverCutCrossfill(genome, **args):
     if listSize == 1:
         Util.raiseException("The 1D List have one element, can't use the Single Point Crossover method !", TypeError)
 
-    cut = rand_randint(1, listSize - 1)
+    cut = rng.randint(1, listSize - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -156,6 +156,7 @@ def G1DListCrossoverPMX(genome, **args):
     proposed by Goldberg, David E. and Lingle, Robert in
     Alleles Loci and the Traveling Salesman Problem in 1985
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -164,10 +165,10 @@ def G1DListCrossoverPMX(genome, **args):
     listSize = len(gMom)
 
 
-    c1, c2 = [rand_randint(1, listSize - 1), rand_randint(1, listSize - 1)]
+    c1, c2 = [rng.randint(1, listSize - 1), rng.randint(1, listSize - 1)]
 
     while c1 == c2:
-        c2 = rand_randint(1, listSize - 1)
+        c2 = rng.randint(1, listSize - 1)
 
     if c1 > c2:
         h = c1
@@ -272,6 +273,7 @@ def G1DListCrossoverOX2(genome, **args):
     See more information in the `Order-based (OX2) Crossover Operator
     <https://www.researchgate.net/publication/335991207_Izmir_Iktisat_Dergisi_Gezgin_Satici_Probleminin_Genetik_Algoritmalar_Kullanarak_Cozumunde_Caprazlama_Operatorlerinin_Ornek_Olaylar_Bazli_Incelenmesi_Investigation_Of_Crossover_Operators_Using_Genetic_>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -281,10 +283,10 @@ def G1DListCrossoverOX2(genome, **args):
 
     indexs=[]
 
-    numberOfIndex = rand_randint(1, listSize - 1)
+    numberOfIndex = rng.randint(1, listSize - 1)
 
     while len(indexs) < numberOfIndex:
-        c2 = rand_randint(1, listSize - 1)
+        c2 = rng.randint(1, listSize - 1)
         if c2 not in indexs:
             indexs.append(c2)
 
@@ -338,6 +340,7 @@ def G1DListCrossoverPOS(genome, **args):
     See more information in the `Position-Based (POS) Crossover Operator
     <https://www.researchgate.net/publication/335991207_Izmir_Iktisat_Dergisi_Gezgin_Satici_Probleminin_Genetik_Algoritmalar_Kullanarak_Cozumunde_Caprazlama_Operatorlerinin_Ornek_Olaylar_Bazli_Incelenmesi_Investigation_Of_Crossover_Operators_Using_Genetic_>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -347,10 +350,10 @@ def G1DListCrossoverPOS(genome, **args):
 
     indexs=[]
 
-    numberOfIndex = rand_randint(1, listSize - 1)
+    numberOfIndex = rng.randint(1, listSize - 1)
 
     while len(indexs) < numberOfIndex:
-        c2 = rand_randint(1, listSize - 1)
+        c2 = rng.randint(1, listSize - 1)
         if c2 not in indexs:
             indexs.append(c2)
 
@@ -429,6 +432,7 @@ def G1DListCrossoverMPX(genome, **args):
     See more information in the `Maximal Preservative (MPX) Crossover Operator
     <https://www.researchgate.net/publication/335991207_Izmir_Iktisat_Dergisi_Gezgin_Satici_Probleminin_Genetik_Algoritmalar_Kullanarak_Cozumunde_Caprazlama_Operatorlerinin_Ornek_Olaylar_Bazli_Incelenmesi_Investigation_Of_Crossover_Operators_Using_Genetic_>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -438,10 +442,10 @@ def G1DListCrossoverMPX(genome, **args):
 
     indexs=[]
 
-    c1, c2 = [rand_randint(1, listSize - 1), rand_randint(1, listSize - 1)]
+    c1, c2 = [rng.randint(1, listSize - 1), rng.randint(1, listSize - 1)]
 
     while c1 == c2:
-        c2 = rand_randint(1, listSize - 1)
+        c2 = rng.randint(1, listSize - 1)
 
     if c1 > c2:
         h = c1
@@ -531,6 +535,7 @@ def G1DListCrossoverEPMX(genome, **args):
     <https://ieeexplore.ieee.org/stamp/stamp.jsp?arnumber=4666932>`_
     <https://www.researchgate.net/publication/260973230_Study_of_Some_Recent_Crossovers_Effects_on_Speed_and_Accuracy_of_Genetic_Algorithm_Using_Symmetric_Travelling_Salesman_Problem>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -539,7 +544,7 @@ def G1DListCrossoverEPMX(genome, **args):
     listSize = len(gMom)
 
 
-    c1 = rand_randint(1, len(gMom.genomeList) - 1)
+    c1 = rng.randint(1, len(gMom.genomeList) - 1)
 
     c2=listSize-c1
     sister = gMom.clone()
@@ -600,6 +605,7 @@ def G1DListCrossoverGreedy(genome, **args):
     <https://arxiv.org/ftp/arxiv/papers/1209/1209.5339.pdf>`_
     <https://www.researchgate.net/publication/260973230_Study_of_Some_Recent_Crossovers_Effects_on_Speed_and_Accuracy_of_Genetic_Algorithm_Using_Symmetric_Travelling_Salesman_Problem>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -609,10 +615,10 @@ def G1DListCrossoverGreedy(genome, **args):
 
 
     distance_matrix_list = gMom.internalParams.get("distance_matrix_list", None)
-    if distance_matrix_list == None:
+    if distance_matrix_list is None:
         raise ValueError("Distance matrix list is required for  Greedy Crossover(GX) ")
 
-    c1Inital = rand_randint(0, len(gMom.genomeList) - 1)
+    c1Inital = rng.randint(0, len(gMom.genomeList) - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -720,6 +726,7 @@ def G1DListCrossoverIGX(genome, **args):
     See more information in the `Impoved Greedy Crossover (IGX) Crossover Operator
     <https://arxiv.org/ftp/arxiv/papers/1209/1209.5339.pdf>`_
     """
+    rng = Util.getRandom(args)
 
     sister = None
     brother = None
@@ -730,7 +737,7 @@ def G1DListCrossoverIGX(genome, **args):
 
 
     distance_matrix_list = gMom.internalParams.get("distance_matrix_list", None)
-    if distance_matrix_list == None:
+    if distance_matrix_list is None:
         raise ValueError("Distance matrix list is required for Impoved Greedy Crossover (IGX) Crossover Operator")
 
 
@@ -751,7 +758,7 @@ def G1DListCrossoverIGX(genome, **args):
 
         for i in range(0, len(gMom.genomeList) - 1):
             if i == 0:
-                first = random.choice(gMom.genomeList)
+                first = rng.choice(gMom.genomeList)
                 ind = fatherdll.getindex(stepcounter, first)
                 indm = motherdll.getindex(stepcounter, first)
 
@@ -819,7 +826,7 @@ def G1DListCrossoverIGX(genome, **args):
 
         for i in range(0, len(gMom.genomeList) - 1):
             if i == 0:
-                first = random.choice(gDad.genomeList)
+                first = rng.choice(gDad.genomeList)
                 ind = fatherdll.getindex(stepcounter, first)
                 indm = motherdll.getindex(stepcounter, first)
 
@@ -890,7 +897,7 @@ def G1DListCrossoverSequentialConstructive(genome, **args):
 
 
     distance_matrix_list = gMom.internalParams.get("distance_matrix_list", None)
-    if distance_matrix_list == None:
+    if distance_matrix_list is None:
         raise ValueError("Distance matrix list is required for Sequential Constructive Crossover SCX")
 
     if args["count"] >= 1:
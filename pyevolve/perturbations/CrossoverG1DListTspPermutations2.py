@@ -1,7 +1,7 @@
-from random import randint as rand_randint
 
 from pyevolve.perturbations.CrossoverG1DListTspPermutations import G1DListCrossoverOX, G1DListCrossoverPMX
 from pyevolve.perturbations.G1DListCrossoverSRX_Helper import connect_sub_tours, generate_genome
+from .. import Util
 
 """
 g_mom.genomeList -> 1D List
@@ -22,6 +22,7 @@ def G1DListCrossoverOX6(genome, **kwargs):
     using genetic algorithm based on heuristic crossover and mutation operator
     <https://www.impactjournals.us/index.php/download/archives/--1391174555-4.%20Eng-Solving%20Travelling%20Salesman-Kanchan%20Rani.pdf>'
     """
+    rng = Util.getRandom(kwargs)
 
     sister = None
     brother = None
@@ -29,10 +30,10 @@ def G1DListCrossoverOX6(genome, **kwargs):
     g_dad = kwargs["dad"]
     list_size = len(g_mom)
 
-    c1, c2 = rand_randint(0, list_size - 1), rand_randint(0, list_size - 1)
+    c1, c2 = rng.randint(0, list_size - 1), rng.randint(0, list_size - 1)
 
     while c1 == c2:
-        c2 = rand_randint(0, list_size - 1)
+        c2 = rng.randint(0, list_size - 1)
 
     if c1 > c2:
         c1, c2 = c2, c1
@@ -97,6 +98,7 @@ def G1DListCrossoverTPX(genome, **kwargs):
     <https://scholar.google.com/scholar?output=instlink&q=info:7d_ZB2LqT3QJ:scholar.google.com/&hl=tr&as_sdt=0,5&scillfp=480710777611443790&oi=lle>
     <https://scholar.archive.org/work/yxts2ace4rcxfjugvhdjby2o3a/access/wayback/https://www.isr-publications.com/jmcs/691/download-ccgdc-a-new-crossover-operator-for-genetic-data-clustering>
     """
+    rng = Util.getRandom(kwargs)
 
     sister = None
     brother = None
@@ -104,10 +106,10 @@ def G1DListCrossoverTPX(genome, **kwargs):
     g_dad = kwargs["dad"]
     list_size = len(g_mom)
 
-    c1, c2 = rand_randint(0, list_size - 1), rand_randint(0, list_size - 1)
+    c1, c2 = rng.randint(0, list_size - 1), rng.randint(0, list_size - 1)
 
     while c1 == c2:
-        c2 = rand_randint(0, list_size - 1)
+        c2 = rng.randint(0, list_size - 1)
 
     if c1 > c2:
         c1, c2 = c2, c1
@@ -141,6 +143,7 @@ def G1DListCrossoverSRX(genome, **kwargs):
     Preliminary experiments revealed that the appropriate length of sub-tours 
     is around sqrt(N), where N is the number of cities.
     """
+    rng = Util.getRandom(kwargs)
     g_mom, sister_genome_list = kwargs["mom"], []
     g_dad, brother_genome_list = kwargs["dad"], []
     g_mom_genome_list, g_dad_genome_list = g_mom.genomeList[:], g_dad.genomeList[:]
@@ -153,11 +156,13 @@ def G1DListCrossoverSRX(genome, **kwargs):
     brother.resetStats()
 
     if kwargs["count"] >= 1:
-        sister_genome_list = generate_genome(sister_genome_list, g_mom_genome_list, g_dad_genome_list, sub_tour_length)
+        sister_genome_list = generate_genome(sister_genome_list, g_mom_genome_list, g_dad_genome_list,
+                                             sub_tour_length, rng)
         sister_genome_list = connect_sub_tours(sister_genome_list)
 
     if kwargs["count"] == 2:
-        brother_genome_list = generate_genome(sister_genome_list, g_mom_genome_list, g_dad_genome_list, sub_tour_length)
+        brother_genome_list = generate_genome(sister_genome_list, g_mom_genome_list, g_dad_genome_list,
+                                              sub_tour_length, rng)
         brother_genome_list = connect_sub_tours(brother_genome_list) if kwargs["count"] == 2 else g_dad.genomeList
 
     sister.genomeList = sister_genome_list
@@ -172,11 +177,12 @@ def G1DListCrossoverCSOX(genome, **kwargs):
 
         <https://ieeexplore.ieee.org/abstract/document/9895081>
     """
+    rng = Util.getRandom(kwargs)
     g_mom, g_dad = kwargs["mom"], kwargs["dad"]
     O = [None] * 6
     g_mom_len = len(g_mom)
 
-    r1, r2 = rand_randint(1, g_mom_len - 2), rand_randint(1, g_mom_len - 2)
+    r1, r2 = rng.randint(1, g_mom_len - 2), rng.randint(1, g_mom_len - 2)
 
     for i in range(3):
         if i == 0:
@@ -224,12 +230,13 @@ def G1DListCrossoverUX(genome, **kwargs):
         Ccgdc: A new crossover operator for genetic data clustering
         <https://scholar.archive.org/work/yxts2ace4rcxfjugvhdjby2o3a/access/wayback/https://www.isr-publications.com/jmcs/691/download-ccgdc-a-new-crossover-operator-for-genetic-data-clustering>
     """
+    rng = Util.getRandom(kwargs)
 
     g_mom, g_dad = kwargs["mom"], kwargs["dad"]
     sister, brother = None, None
 
     g_mom_length = len(g_mom)
-    mask = [rand_randint(0, 1) for _ in range(g_mom_length)]
+    mask = [rng.randint(0, 1) for _ in range(g_mom_length)]
 
     if kwargs["count"] >= 1:
         sister = g_mom.clone()
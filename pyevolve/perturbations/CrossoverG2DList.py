@@ -1,5 +1,3 @@
-from random import randint as rand_randint, choice as rand_choice
-from random import random as rand_random
 import math
 from .. import Util
 from .. import Consts
@@ -10,6 +8,7 @@ from .. import Consts
 
 def G2DListCrossoverUniform(genome, **args):
     """ The G2DList Uniform Crossover """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
@@ -24,7 +23,7 @@ def G2DListCrossoverUniform(genome, **args):
 
     for i in range(h):
         for j in range(w):
-            if Util.randomFlipCoin(Consts.CDefG2DListCrossUniformProb):
+            if Util.randomFlipCoin(Consts.CDefG2DListCrossUniformProb, rng):
                 temp = sister.getItem(i, j)
                 sister.setItem(i, j, brother.getItem(i, j))
                 brother.setItem(i, j, temp)
@@ -34,12 +33,13 @@ def G2DListCrossoverUniform(genome, **args):
 
 def G2DListCrossoverSingleVPoint(genome, **args):
     """ The crossover of G2DList, Single Vertical Point """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
     gDad = args["dad"]
 
-    cut = rand_randint(1, gMom.getWidth() - 1)
+    cut = rng.randint(1, gMom.getWidth() - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -58,12 +58,13 @@ def G2DListCrossoverSingleVPoint(genome, **args):
 
 def G2DListCrossoverSingleHPoint(genome, **args):
     """ The crossover of G2DList, Single Horizontal Point """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"]
     gDad = args["dad"]
 
-    cut = rand_randint(1, gMom.getHeight() - 1)
+    cut = rng.randint(1, gMom.getHeight() - 1)
 
     if args["count"] >= 1:
         sister = gMom.clone()
@@ -1,5 +1,3 @@
-from random import randint as rand_randint, choice as rand_choice
-from random import random as rand_random
 import math
 from .. import Util
 
@@ -8,6 +6,7 @@ from .. import Util
 
 def GTreeCrossoverSinglePoint(genome, **args):
     """ The crossover for GTree, Single Point """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
     gMom = args["mom"].clone()
@@ -44,12 +43,12 @@ def GTreeCrossoverSinglePoint(genome, **args):
     if len(all_dad_nodes) == 1:
         nodeDad = all_dad_nodes[0]
     else:
-        nodeDad = rand_choice(all_dad_nodes)
+        nodeDad = rng.choice(all_dad_nodes)
 
     if len(all_mom_nodes) == 1:
         nodeMom = all_mom_nodes[0]
     else:
-        nodeMom = rand_choice(all_mom_nodes)
+        nodeMom = rng.choice(all_mom_nodes)
 
     nodeMom_parent = nodeMom.getParent()
     nodeDad_parent = nodeDad.getParent()
@@ -82,6 +81,7 @@ def GTreeCrossoverSinglePointStrict(genome, **args):
     of leaf selection when findin random nodes for crossover.
 
     """
+    rng = Util.getRandom(args)
     sister = None
     brother = None
 
@@ -108,18 +108,18 @@ def GTreeCrossoverSinglePointStrict(genome, **args):
     for i in range(max_attempt):
 
         if distr_leaf is None:
-            dadRandom = gDad.getRandomNode()
-            momRandom = gMom.getRandomNode()
+            dadRandom = gDad.getRandomNode(rng=rng)
+            momRandom = gMom.getRandomNode(rng=rng)
         else:
-            if Util.randomFlipCoin(distr_leaf):
-                momRandom = gMom.getRandomNode(1)
+            if Util.randomFlipCoin(distr_leaf, rng):
+                momRandom = gMom.getRandomNode(1, rng)
             else:
-                momRandom = gMom.getRandomNode(2)
+                momRandom = gMom.getRandomNode(2, rng)
 
-            if Util.randomFlipCoin(distr_leaf):
-                dadRandom = gDad.getRandomNode(1)
+            if Util.randomFlipCoin(distr_leaf, rng):
+                dadRandom = gDad.getRandomNode(1, rng)
             else:
-                dadRandom = gDad.getRandomNode(2)
+                dadRandom = gDad.getRandomNode(2, rng)
 
         assert momRandom is not None
         assert dadRandom is not None
@@ -181,8 +181,9 @@ def GTreeGPCrossoverSinglePoint(genome, **args):
 
     Accepts the *max_attempt* parameter, *max_depth* (required).
     """
-    from . import Consts
+    from .. import Consts
 
+    rng = Util.getRandom(args)
     sister = None
     brother = None
 
@@ -207,12 +208,12 @@ def GTreeGPCrossoverSinglePoint(genome, **args):
 
     for i in range(max_attempt):
 
-        dadRandom = gDad.getRandomNode()
+        dadRandom = gDad.getRandomNode(rng=rng)
 
         if dadRandom.getType() == Consts.nodeType["TERMINAL"]:
-            momRandom = gMom.getRandomNode(1)
+            momRandom = gMom.getRandomNode(1, rng)
         elif dadRandom.getType() == Consts.nodeType["NONTERMINAL"]:
-            momRandom = gMom.getRandomNode(2)
+            momRandom = gMom.getRandomNode(2, rng)
 
         mD = gMom.getNodeDepth(momRandom)
         dD = gDad.getNodeDepth(dadRandom)
@@ -1,4 +1,4 @@
-from random import randint as rand_randint
+import random
 from typing import List
 
 
@@ -63,11 +63,12 @@ def find_nearest_sub_tour(sub_tour: list, sub_tours: List[list]) -> (list, int):
     return nearest_sub_tour, nearest_index, nearest_edges
 
 
-def generate_genome(child: list, g_mom_genome_list: list, g_dad_genome_list: list, sub_tour_length: int) -> list:
+def generate_genome(child: list, g_mom_genome_list: list, g_dad_genome_list: list, sub_tour_length: int,
+                    rng=random) -> list:
     genome_set = set()
 
     while g_mom_genome_list or g_dad_genome_list:
-        city_index = rand_randint(0, len(g_mom_genome_list) - 1)
+        city_index = rng.randint(0, len(g_mom_genome_list) - 1)
         sub_tour = []
 
         while len(sub_tour) < sub_tour_length and city_index < len(g_mom_genome_list):
@@ -84,7 +85,7 @@ def generate_genome(child: list, g_mom_genome_list: list, g_dad_genome_list: lis
         if sub_tour:
             child.append(sub_tour)
 
-        city_index = rand_randint(0, len(g_dad_genome_list) - 1) if g_dad_genome_list else 0
+        city_index = rng.randint(0, len(g_dad_genome_list) - 1) if g_dad_genome_list else 0
         sub_tour = []
 
         while len(sub_tour) < sub_tour_length and city_index < len(g_dad_genome_list):
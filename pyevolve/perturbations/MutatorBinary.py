@@ -1,12 +1,11 @@
 from .. import Util
-from random import randint as rand_randint, gauss as rand_gauss, uniform as rand_uniform
-from random import choice as rand_choice
 
 
 # 1D Binary String
 
 def G1DBinaryStringMutatorSwap(genome, **args):
     """ The 1D Binary String Swap Mutator """
+    rng = Util.getRandom(args)
 
     if args["pmut"] <= 0.0:
         return 0
@@ -16,20 +15,21 @@ def G1DBinaryStringMutatorSwap(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(stringLength):
-            if Util.randomFlipCoin(args["pmut"]):
-                Util.listSwapElement(genome, it, rand_randint(0, stringLength - 1))
+            if Util.randomFlipCoin(args["pmut"], rng):
+                Util.listSwapElement(genome, it, rng.randint(0, stringLength - 1))
                 mutations += 1
 
     else:
         for it in range(int(round(mutations))):
-            Util.listSwapElement(genome, rand_randint(0, stringLength - 1),
-                                 rand_randint(0, stringLength - 1))
+            Util.listSwapElement(genome, rng.randint(0, stringLength - 1),
+                                 rng.randint(0, stringLength - 1))
 
     return int(mutations)
 
 
 def G1DBinaryStringMutatorFlip(genome, **args):
     """ The classical flip mutator for binary strings """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     stringLength = len(genome)
@@ -38,7 +38,7 @@ def G1DBinaryStringMutatorFlip(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(stringLength):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 if genome[it] == 0:
                     genome[it] = 1
                 else:
@@ -47,7 +47,7 @@ def G1DBinaryStringMutatorFlip(genome, **args):
 
     else:
         for it in range(int(round(mutations))):
-            which = rand_randint(0, stringLength - 1)
+            which = rng.randint(0, stringLength - 1)
             if genome[which] == 0:
                 genome[which] = 1
             else:
@@ -64,6 +64,7 @@ def G2DBinaryStringMutatorSwap(genome, **args):
     .. versionadded:: 0.6
        The *G2DBinaryStringMutatorSwap* function
     """
+    rng = Util.getRandom(args)
 
     if args["pmut"] <= 0.0:
         return 0
@@ -76,14 +77,14 @@ def G2DBinaryStringMutatorSwap(genome, **args):
         mutations = 0
         for i in range(height):
             for j in range(width):
-                if Util.randomFlipCoin(args["pmut"]):
-                    index_b = (rand_randint(0, height - 1), rand_randint(0, width - 1))
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    index_b = (rng.randint(0, height - 1), rng.randint(0, width - 1))
                     Util.list2DSwapElement(genome.genomeString, (i, j), index_b)
                     mutations += 1
     else:
         for it in range(int(round(mutations))):
-            index_a = (rand_randint(0, height - 1), rand_randint(0, width - 1))
-            index_b = (rand_randint(0, height - 1), rand_randint(0, width - 1))
+            index_a = (rng.randint(0, height - 1), rng.randint(0, width - 1))
+            index_b = (rng.randint(0, height - 1), rng.randint(0, width - 1))
             Util.list2DSwapElement(genome.genomeString, index_a, index_b)
 
     return int(mutations)
@@ -95,6 +96,7 @@ def G2DBinaryStringMutatorFlip(genome, **args):
     .. versionadded:: 0.6
        The *G2DBinaryStringMutatorFlip* function
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     height, width = genome.getSize()
@@ -107,7 +109,7 @@ def G2DBinaryStringMutatorFlip(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
+                if Util.randomFlipCoin(args["pmut"], rng):
                     if genome[i][j] == 0:
                         genome.setItem(i, j, 1)
                     else:
@@ -116,8 +118,8 @@ def G2DBinaryStringMutatorFlip(genome, **args):
     else:  # TODO very suspicious branch
 
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
 
             if genome[i][j] == 0:
                 genome.setItem(which_y, which_x, 1)
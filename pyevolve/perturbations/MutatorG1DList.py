@@ -1,6 +1,4 @@
 from .. import Util
-from random import randint as rand_randint, gauss as rand_gauss, uniform as rand_uniform
-from random import choice as rand_choice
 
 
 from .. import Consts
@@ -15,6 +13,7 @@ def G1DListMutatorSwap(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     listSize = len(genome)
@@ -23,12 +22,12 @@ def G1DListMutatorSwap(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                Util.listSwapElement(genome, it, rand_randint(0, listSize - 1))
+            if Util.randomFlipCoin(args["pmut"], rng):
+                Util.listSwapElement(genome, it, rng.randint(0, listSize - 1))
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            Util.listSwapElement(genome, rand_randint(0, listSize - 1), rand_randint(0, listSize - 1))
+            Util.listSwapElement(genome, rng.randint(0, listSize - 1), rng.randint(0, listSize - 1))
 
     return int(mutations)
 
@@ -39,19 +38,20 @@ def G1DListMutatorSIM(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
     mutations = 0
     if args["pmut"] <= 0.0:
         return 0
 
-    cuts = [rand_randint(0, len(genome)), rand_randint(0, len(genome))]
+    cuts = [rng.randint(0, len(genome)), rng.randint(0, len(genome))]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
 
     if (cuts[1] - cuts[0]) <= 0:
-        cuts[1] = rand_randint(cuts[0], len(genome))
+        cuts[1] = rng.randint(cuts[0], len(genome))
 
-    if Util.randomFlipCoin(args["pmut"]):
+    if Util.randomFlipCoin(args["pmut"], rng):
         part = genome[cuts[0]:cuts[1]]
         if len(part) == 0:
             return 0
@@ -68,6 +68,7 @@ def G1DListMutatorIntegerRange(genome, **args):
     Accepts the *rangemin* and *rangemax* genome parameters, both optional.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -78,15 +79,15 @@ def G1DListMutatorIntegerRange(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                genome[it] = rand_randint(genome.getParam("rangemin", Consts.CDefRangeMin),
+            if Util.randomFlipCoin(args["pmut"], rng):
+                genome[it] = rng.randint(genome.getParam("rangemin", Consts.CDefRangeMin),
                                           genome.getParam("rangemax", Consts.CDefRangeMax))
                 mutations += 1
 
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            genome[which_gene] = rand_randint(genome.getParam("rangemin", Consts.CDefRangeMin),
+            which_gene = rng.randint(0, listSize - 1)
+            genome[which_gene] = rng.randint(genome.getParam("rangemin", Consts.CDefRangeMin),
                                               genome.getParam("rangemax", Consts.CDefRangeMax))
 
     return int(mutations)
@@ -98,6 +99,7 @@ def G1DListMutatorRealRange(genome, **args):
     Accepts the *rangemin* and *rangemax* genome parameters, both optional.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -108,15 +110,15 @@ def G1DListMutatorRealRange(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                genome[it] = rand_uniform(genome.getParam("rangemin", Consts.CDefRangeMin),
+            if Util.randomFlipCoin(args["pmut"], rng):
+                genome[it] = rng.uniform(genome.getParam("rangemin", Consts.CDefRangeMin),
                                           genome.getParam("rangemax", Consts.CDefRangeMax))
                 mutations += 1
 
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            genome[which_gene] = rand_uniform(genome.getParam("rangemin", Consts.CDefRangeMin),
+            which_gene = rng.randint(0, listSize - 1)
+            genome[which_gene] = rng.uniform(genome.getParam("rangemin", Consts.CDefRangeMin),
                                               genome.getParam("rangemax", Consts.CDefRangeMax))
 
     return int(mutations)
@@ -134,6 +136,7 @@ def G1DListMutatorIntegerGaussianGradient(genome, **args):
     1 the random value falls on) and cast to integer
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -147,8 +150,8 @@ def G1DListMutatorIntegerGaussianGradient(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                final_value = int(genome[it] * abs(rand_gauss(mu, sigma)))
+            if Util.randomFlipCoin(args["pmut"], rng):
+                final_value = int(genome[it] * abs(rng.gauss(mu, sigma)))
 
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -157,8 +160,8 @@ def G1DListMutatorIntegerGaussianGradient(genome, **args):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            final_value = int(genome[which_gene] * abs(rand_gauss(mu, sigma)))
+            which_gene = rng.randint(0, listSize - 1)
+            final_value = int(genome[which_gene] * abs(rng.gauss(mu, sigma)))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -176,6 +179,7 @@ def G1DListMutatorIntegerGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -195,8 +199,8 @@ def G1DListMutatorIntegerGaussian(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                final_value = genome[it] + int(rand_gauss(mu, sigma))
+            if Util.randomFlipCoin(args["pmut"], rng):
+                final_value = genome[it] + int(rng.gauss(mu, sigma))
 
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -205,8 +209,8 @@ def G1DListMutatorIntegerGaussian(genome, **args):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            final_value = genome[which_gene] + int(rand_gauss(mu, sigma))
+            which_gene = rng.randint(0, listSize - 1)
+            final_value = genome[which_gene] + int(rng.gauss(mu, sigma))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -224,6 +228,7 @@ def G1DListMutatorRealGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -243,8 +248,8 @@ def G1DListMutatorRealGaussian(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                final_value = genome[it] + rand_gauss(mu, sigma)
+            if Util.randomFlipCoin(args["pmut"], rng):
+                final_value = genome[it] + rng.gauss(mu, sigma)
 
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -253,8 +258,8 @@ def G1DListMutatorRealGaussian(genome, **args):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            final_value = genome[which_gene] + rand_gauss(mu, sigma)
+            which_gene = rng.randint(0, listSize - 1)
+            final_value = genome[which_gene] + rng.gauss(mu, sigma)
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -281,6 +286,7 @@ def G1DListMutatorRealGaussianGradient(genome, **args):
     no matter how large it is.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -294,8 +300,8 @@ def G1DListMutatorRealGaussianGradient(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                final_value = genome[it] * abs(rand_gauss(mu, sigma))
+            if Util.randomFlipCoin(args["pmut"], rng):
+                final_value = genome[it] * abs(rng.gauss(mu, sigma))
 
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -304,8 +310,8 @@ def G1DListMutatorRealGaussianGradient(genome, **args):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            final_value = genome[which_gene] * abs(rand_gauss(mu, sigma))
+            which_gene = rng.randint(0, listSize - 1)
+            final_value = genome[which_gene] * abs(rng.gauss(mu, sigma))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -321,6 +327,7 @@ def G1DListMutatorIntegerBinary(genome, **args):
     This mutator will random change the 0 and 1 elements of the 1D List.
 
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     listSize = len(genome)
@@ -329,7 +336,7 @@ def G1DListMutatorIntegerBinary(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 if genome[it] == 0:
                     genome[it] = 1
                 elif genome[it] == 1:
@@ -338,7 +345,7 @@ def G1DListMutatorIntegerBinary(genome, **args):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
+            which_gene = rng.randint(0, listSize - 1)
             if genome[which_gene] == 0:
                 genome[which_gene] = 1
             elif genome[which_gene] == 1:
@@ -354,6 +361,7 @@ def G1DListMutatorAllele(genome, **args):
     :class:`GAllele.GAlleles` instance.
 
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     listSize = len(genome)
@@ -366,14 +374,14 @@ def G1DListMutatorAllele(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(args["pmut"]):
-                new_val = allele[it].getRandomAllele()
+            if Util.randomFlipCoin(args["pmut"], rng):
+                new_val = allele[it].getRandomAllele(rng)
                 genome[it] = new_val
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            new_val = allele[which_gene].getRandomAllele()
+            which_gene = rng.randint(0, listSize - 1)
+            new_val = allele[which_gene].getRandomAllele(rng)
             genome[which_gene] = new_val
 
     return int(mutations)
@@ -386,6 +394,7 @@ def G1DListMutatorAlleleGaussian(genome, **arguments):
     respectively represents the mean and the std. dev. of the random
     distribution.
     """
+    rng = Util.getRandom(arguments)
     
 
     if arguments["pmut"] <= 0.0:
@@ -407,8 +416,8 @@ def G1DListMutatorAlleleGaussian(genome, **arguments):
     if mutations < 1.0:
         mutations = 0
         for it in range(listSize):
-            if Util.randomFlipCoin(arguments["pmut"]):
-                final_value = genome[it] + rand_gauss(mu, sigma)
+            if Util.randomFlipCoin(arguments["pmut"], rng):
+                final_value = genome[it] + rng.gauss(mu, sigma)
                 assert len(allele[it].beginEnd) == 1, "only single ranges are supported"
                 rangemin, rangemax = allele[it].beginEnd[0]
                 final_value = min(final_value, rangemax)
@@ -417,8 +426,8 @@ def G1DListMutatorAlleleGaussian(genome, **arguments):
                 mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_gene = rand_randint(0, listSize - 1)
-            final_value = genome[which_gene] + rand_gauss(mu, sigma)
+            which_gene = rng.randint(0, listSize - 1)
+            final_value = genome[which_gene] + rng.gauss(mu, sigma)
             assert len(allele[which_gene].beginEnd) == 1, "only single ranges are supported"
             rangemin, rangemax = allele[which_gene].beginEnd[0]
             final_value = min(final_value, rangemax)
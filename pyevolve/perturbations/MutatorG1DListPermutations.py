@@ -1,8 +1,5 @@
 from .. import Util
-from random import randint as rand_randint, gauss as rand_gauss, uniform as rand_uniform
-from random import choice as rand_choice
 from ..representations.G1DList import G1DList
-import numpy as np
 
 from .MutatorG1DList import G1DListMutatorSwap
 
@@ -12,20 +9,21 @@ def G1DListMutatorSwap(genome: G1DList, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
     listSize = len(genome)
     
     
-    to_remove = rand_randint(0, listSize - 1)
+    to_remove = rng.randint(0, listSize - 1)
     while True:
-        to_insert = rand_randint(0, listSize - 1)
+        to_insert = rng.randint(0, listSize - 1)
         if to_remove != to_insert:
             break
 
@@ -40,21 +38,22 @@ def G1DListMutatorSimpleInversion(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
-    cuts = [rand_randint(0, len(genome)), rand_randint(0, len(genome))]
+    cuts = [rng.randint(0, len(genome)), rng.randint(0, len(genome))]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
 
     if (cuts[1] - cuts[0]) <= 0:
-        cuts[1] = rand_randint(cuts[0], len(genome))
+        cuts[1] = rng.randint(cuts[0], len(genome))
 
         part = genome[cuts[0]:cuts[1]]
 
@@ -71,25 +70,26 @@ def G1DListMutatorScramble(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
-    cuts = [rand_randint(0, len(genome)), rand_randint(0, len(genome))]
+    cuts = [rng.randint(0, len(genome)), rng.randint(0, len(genome))]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
 
     if (cuts[1] - cuts[0]) <= 0:
-        cuts[1] = rand_randint(cuts[0], len(genome))
+        cuts[1] = rng.randint(cuts[0], len(genome))
 
         part = genome[cuts[0]:cuts[1]]
 
-        np.random.shuffle(part)
+        rng.shuffle(part)
         genome[cuts[0]:cuts[1]] = part
         mutations += 1
 
@@ -102,27 +102,28 @@ def G1DListMutatorDisplacement(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
-    cuts = [rand_randint(0, len(genome)), rand_randint(0, len(genome))]
+    cuts = [rng.randint(0, len(genome)), rng.randint(0, len(genome))]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
 
     if (cuts[1] - cuts[0]) <= 0:
-        cuts[1] = rand_randint(cuts[0], len(genome))
+        cuts[1] = rng.randint(cuts[0], len(genome))
 
     part = genome[cuts[0]:cuts[1]]
 
     del genome.genomeList[cuts[0]:cuts[1]]
 
-    cut = [rand_randint(0, len(genome))]
+    cut = [rng.randint(0, len(genome))]
     for i in range(0, len(part)):
         genome.genomeList.insert(cut[0]+i,part[i])
     mutations += 1
@@ -135,27 +136,28 @@ def G1DListMutatorInversion(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
-    cuts = [rand_randint(0, len(genome)), rand_randint(0, len(genome))]
+    cuts = [rng.randint(0, len(genome)), rng.randint(0, len(genome))]
 
     if cuts[0] > cuts[1]:
         Util.listSwapElement(cuts, 0, 1)
 
     if (cuts[1] - cuts[0]) <= 0:
-        cuts[1] = rand_randint(cuts[0], len(genome))
+        cuts[1] = rng.randint(cuts[0], len(genome))
 
     part = genome[cuts[0]:cuts[1]]
 
     del genome.genomeList[cuts[0]:cuts[1]]
 
-    cut = [rand_randint(0, len(genome))]
+    cut = [rng.randint(0, len(genome))]
     part.reverse()
     for i in range(0, len(part)):
         genome.genomeList.insert(cut[0]+i,part[i])
@@ -169,18 +171,19 @@ def G1DListMutatorInsertion(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
     mutations = 0
     pmut = args["pmut"]
     if pmut <= 0.0:
         return mutations
-    if not Util.randomFlipCoin(pmut):
+    if not Util.randomFlipCoin(pmut, rng):
         return mutations
 
     listSize = len(genome)
 
-    to_remove = rand_randint(0, listSize - 1)
+    to_remove = rng.randint(0, listSize - 1)
     while True:
-        to_insert = rand_randint(0, listSize - 1)
+        to_insert = rng.randint(0, listSize - 1)
         if to_remove != to_insert:
             break
 
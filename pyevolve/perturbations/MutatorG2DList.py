@@ -1,6 +1,4 @@
 from .. import Util
-from random import randint as rand_randint, gauss as rand_gauss, uniform as rand_uniform
-from random import choice as rand_choice
 
 from .. import Consts
 
@@ -13,6 +11,7 @@ def G2DListMutatorSwap(genome, **args):
     .. note:: this mutator is :term:`Data Type Independent`
 
     """
+    rng = Util.getRandom(args)
 
     if args["pmut"] <= 0.0:
         return 0
@@ -25,14 +24,14 @@ def G2DListMutatorSwap(genome, **args):
         mutations = 0
         for i in range(height):
             for j in range(width):
-                if Util.randomFlipCoin(args["pmut"]):
-                    index_b = (rand_randint(0, height - 1), rand_randint(0, width - 1))
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    index_b = (rng.randint(0, height - 1), rng.randint(0, width - 1))
                     Util.list2DSwapElement(genome.genomeList, (i, j), index_b)
                     mutations += 1
     else:
         for it in range(int(round(mutations))):
-            index_a = (rand_randint(0, height - 1), rand_randint(0, width - 1))
-            index_b = (rand_randint(0, height - 1), rand_randint(0, width - 1))
+            index_a = (rng.randint(0, height - 1), rng.randint(0, width - 1))
+            index_b = (rng.randint(0, height - 1), rng.randint(0, width - 1))
             Util.list2DSwapElement(genome.genomeList, index_a, index_b)
 
     return int(mutations)
@@ -44,6 +43,7 @@ def G2DListMutatorIntegerRange(genome, **args):
     Accepts the *rangemin* and *rangemax* genome parameters, both optional.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -60,16 +60,16 @@ def G2DListMutatorIntegerRange(genome, **args):
         mutations = 0
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    random_int = rand_randint(range_min, range_max)
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    random_int = rng.randint(range_min, range_max)
                     genome.setItem(i, j, random_int)
                     mutations += 1
 
     else:
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
-            random_int = rand_randint(range_min, range_max)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
+            random_int = rng.randint(range_min, range_max)
             genome.setItem(which_y, which_x, random_int)
 
     return int(mutations)
@@ -85,6 +85,7 @@ def G2DListMutatorIntegerGaussianGradient(genome, **args):
     no matter how large it is.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -102,8 +103,8 @@ def G2DListMutatorIntegerGaussianGradient(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    final_value = int(genome[i][j] * abs(rand_gauss(mu, sigma)))
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    final_value = int(genome[i][j] * abs(rng.gauss(mu, sigma)))
 
                     final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                     final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -113,10 +114,10 @@ def G2DListMutatorIntegerGaussianGradient(genome, **args):
     else:
 
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
 
-            final_value = int(genome[which_y][which_x] * abs(rand_gauss(mu, sigma)))
+            final_value = int(genome[which_y][which_x] * abs(rng.gauss(mu, sigma)))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -134,6 +135,7 @@ def G2DListMutatorIntegerGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -157,8 +159,8 @@ def G2DListMutatorIntegerGaussian(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    final_value = genome[i][j] + int(rand_gauss(mu, sigma))
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    final_value = genome[i][j] + int(rng.gauss(mu, sigma))
 
                     final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                     final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -168,10 +170,10 @@ def G2DListMutatorIntegerGaussian(genome, **args):
     else:
 
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
 
-            final_value = genome[which_y][which_x] + int(rand_gauss(mu, sigma))
+            final_value = genome[which_y][which_x] + int(rng.gauss(mu, sigma))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -190,6 +192,7 @@ def G2DListMutatorAllele(genome, **args):
     .. warning:: the :class:`GAllele.GAlleles` instance must have the homogeneous flag enabled
 
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     listSize = genome.getHeight() * genome.getWidth() - 1
@@ -207,16 +210,16 @@ def G2DListMutatorAllele(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    new_val = allele[0].getRandomAllele()
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    new_val = allele[0].getRandomAllele(rng)
                     genome.setItem(i, j, new_val)
                     mutations += 1
     else:
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getHeight() - 1)
-            which_y = rand_randint(0, genome.getWidth() - 1)
+            which_x = rng.randint(0, genome.getHeight() - 1)
+            which_y = rng.randint(0, genome.getWidth() - 1)
 
-            new_val = allele[0].getRandomAllele()
+            new_val = allele[0].getRandomAllele(rng)
             genome.setItem(which_x, which_y, new_val)
 
     return int(mutations)
@@ -230,6 +233,7 @@ def G2DListMutatorRealGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -253,8 +257,8 @@ def G2DListMutatorRealGaussian(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    final_value = genome[i][j] + rand_gauss(mu, sigma)
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    final_value = genome[i][j] + rng.gauss(mu, sigma)
 
                     final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                     final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -264,10 +268,10 @@ def G2DListMutatorRealGaussian(genome, **args):
     else:
 
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
 
-            final_value = genome[which_y][which_x] + rand_gauss(mu, sigma)
+            final_value = genome[which_y][which_x] + rng.gauss(mu, sigma)
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -286,6 +290,7 @@ def G2DListMutatorRealGaussianGradient(genome, **args):
     for a smooth gradient drift about the value.
 
     """
+    rng = Util.getRandom(args)
     
 
     if args["pmut"] <= 0.0:
@@ -303,8 +308,8 @@ def G2DListMutatorRealGaussianGradient(genome, **args):
 
         for i in range(genome.getHeight()):
             for j in range(genome.getWidth()):
-                if Util.randomFlipCoin(args["pmut"]):
-                    final_value = genome[i][j] * abs(rand_gauss(mu, sigma))
+                if Util.randomFlipCoin(args["pmut"], rng):
+                    final_value = genome[i][j] * abs(rng.gauss(mu, sigma))
 
                     final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                     final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
@@ -314,10 +319,10 @@ def G2DListMutatorRealGaussianGradient(genome, **args):
     else:
 
         for it in range(int(round(mutations))):
-            which_x = rand_randint(0, genome.getWidth() - 1)
-            which_y = rand_randint(0, genome.getHeight() - 1)
+            which_x = rng.randint(0, genome.getWidth() - 1)
+            which_y = rng.randint(0, genome.getHeight() - 1)
 
-            final_value = genome[which_y][which_x] * abs(rand_gauss(mu, sigma))
+            final_value = genome[which_y][which_x] * abs(rng.gauss(mu, sigma))
 
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
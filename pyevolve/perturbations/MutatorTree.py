@@ -8,8 +8,6 @@ In this module we have the genetic operators of mutation for each chromosome rep
 """
 
 from .. import Util
-from random import randint as rand_randint, gauss as rand_gauss, uniform as rand_uniform
-from random import choice as rand_choice
 from ..representations import GTree
 
 
@@ -21,6 +19,7 @@ def GTreeMutatorSwap(genome, **args):
     .. versionadded:: 0.6
        The *GTreeMutatorSwap* function
     """
+    rng = Util.getRandom(args)
     if args["pmut"] <= 0.0:
         return 0
     elements = len(genome)
@@ -29,15 +28,15 @@ def GTreeMutatorSwap(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                nodeOne = genome.getRandomNode()
-                nodeTwo = genome.getRandomNode()
+                nodeOne = genome.getRandomNode(rng=rng)
+                nodeTwo = genome.getRandomNode(rng=rng)
                 nodeOne.swapNodeData(nodeTwo)
     else:
         for it in range(int(round(mutations))):
-            nodeOne = genome.getRandomNode()
-            nodeTwo = genome.getRandomNode()
+            nodeOne = genome.getRandomNode(rng=rng)
+            nodeTwo = genome.getRandomNode(rng=rng)
             nodeOne.swapNodeData(nodeTwo)
 
     return int(mutations)
@@ -51,7 +50,8 @@ def GTreeMutatorIntegerRange(genome, **args):
     .. versionadded:: 0.6
        The *GTreeMutatorIntegerRange* function
     """
-    from . import Consts
+    rng = Util.getRandom(args)
+    from .. import Consts
 
     if args["pmut"] <= 0.0:
         return 0
@@ -64,16 +64,16 @@ def GTreeMutatorIntegerRange(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                rand_node = genome.getRandomNode()
-                random_int = rand_randint(range_min, range_max)
+                rand_node = genome.getRandomNode(rng=rng)
+                random_int = rng.randint(range_min, range_max)
                 rand_node.setData(random_int)
 
     else:
         for it in range(int(round(mutations))):
-            rand_node = genome.getRandomNode()
-            random_int = rand_randint(range_min, range_max)
+            rand_node = genome.getRandomNode(rng=rng)
+            random_int = rng.randint(range_min, range_max)
             rand_node.setData(random_int)
 
     return int(mutations)
@@ -87,7 +87,8 @@ def GTreeMutatorRealRange(genome, **args):
     .. versionadded:: 0.6
        The *GTreeMutatorRealRange* function
     """
-    from . import Consts
+    rng = Util.getRandom(args)
+    from .. import Consts
 
     if args["pmut"] <= 0.0:
         return 0
@@ -100,16 +101,16 @@ def GTreeMutatorRealRange(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                rand_node = genome.getRandomNode()
-                random_real = rand_uniform(range_min, range_max)
+                rand_node = genome.getRandomNode(rng=rng)
+                random_real = rng.uniform(range_min, range_max)
                 rand_node.setData(random_real)
 
     else:
         for it in range(int(round(mutations))):
-            rand_node = genome.getRandomNode()
-            random_real = rand_uniform(range_min, range_max)
+            rand_node = genome.getRandomNode(rng=rng)
+            random_real = rng.uniform(range_min, range_max)
             rand_node.setData(random_real)
 
     return int(mutations)
@@ -123,7 +124,8 @@ def GTreeMutatorIntegerGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
-    from . import Consts
+    rng = Util.getRandom(args)
+    from .. import Consts
 
     if args["pmut"] <= 0.0:
         return 0
@@ -136,17 +138,17 @@ def GTreeMutatorIntegerGaussian(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                rand_node = genome.getRandomNode()
-                final_value = rand_node.getData() + int(rand_gauss(mu, sigma))
+                rand_node = genome.getRandomNode(rng=rng)
+                final_value = rand_node.getData() + int(rng.gauss(mu, sigma))
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
                 rand_node.setData(final_value)
     else:
         for it in range(int(round(mutations))):
-            rand_node = genome.getRandomNode()
-            final_value = rand_node.getData() + int(rand_gauss(mu, sigma))
+            rand_node = genome.getRandomNode(rng=rng)
+            final_value = rand_node.getData() + int(rng.gauss(mu, sigma))
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
             rand_node.setData(final_value)
@@ -162,7 +164,8 @@ def GTreeMutatorRealGaussian(genome, **args):
     represents the mean and the std. dev. of the random distribution.
 
     """
-    from . import Consts
+    rng = Util.getRandom(args)
+    from .. import Consts
     if args["pmut"] <= 0.0:
         return 0
     elements = len(genome)
@@ -174,17 +177,17 @@ def GTreeMutatorRealGaussian(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                rand_node = genome.getRandomNode()
-                final_value = rand_node.getData() + rand_gauss(mu, sigma)
+                rand_node = genome.getRandomNode(rng=rng)
+                final_value = rand_node.getData() + rng.gauss(mu, sigma)
                 final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
                 final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
                 rand_node.setData(final_value)
     else:
         for it in range(int(round(mutations))):
-            rand_node = genome.getRandomNode()
-            final_value = rand_node.getData() + rand_gauss(mu, sigma)
+            rand_node = genome.getRandomNode(rng=rng)
+            final_value = rand_node.getData() + rng.gauss(mu, sigma)
             final_value = min(final_value, genome.getParam("rangemax", Consts.CDefRangeMax))
             final_value = max(final_value, genome.getParam("rangemin", Consts.CDefRangeMin))
             rand_node.setData(final_value)
@@ -200,7 +203,8 @@ def GTreeGPMutatorOperation(genome, **args):
     .. versionadded:: 0.6
        The *GTreeGPMutatorOperation* function
     """
-    from . import Consts
+    rng = Util.getRandom(args)
+    from .. import Consts
     if args["pmut"] <= 0.0:
         return 0
     elements = len(genome)
@@ -216,12 +220,12 @@ def GTreeGPMutatorOperation(genome, **args):
     if mutations < 1.0:
         mutations = 0
         for i in range(len(genome)):
-            if Util.randomFlipCoin(args["pmut"]):
+            if Util.randomFlipCoin(args["pmut"], rng):
                 mutations += 1
-                rand_node = genome.getRandomNode()
+                rand_node = genome.getRandomNode(rng=rng)
                 assert rand_node is not None
                 if rand_node.getType() == Consts.nodeType["TERMINAL"]:
-                    term_operator = rand_choice(gp_terminals)
+                    term_operator = rng.choice(gp_terminals)
                 else:
                     op_len = gp_function_set[rand_node.getData()]
                     fun_candidates = []
@@ -232,14 +236,14 @@ def GTreeGPMutatorOperation(genome, **args):
                     if len(fun_candidates) <= 0:
                         continue
 
-                    term_operator = rand_choice(fun_candidates)
+                    term_operator = rng.choice(fun_candidates)
                 rand_node.setData(term_operator)
     else:
         for _ in range(int(round(mutations))):  # TODO probably inoptimal
-            rand_node = genome.getRandomNode()
+            rand_node = genome.getRandomNode(rng=rng)
             assert rand_node is not None
             if rand_node.getType() == Consts.nodeType["TERMINAL"]:
-                term_operator = rand_choice(gp_terminals)
+                term_operator = rng.choice(gp_terminals)
             else:
                 op_len = gp_function_set[rand_node.getData()]
                 fun_candidates = []
@@ -250,7 +254,7 @@ def GTreeGPMutatorOperation(genome, **args):
                 if len(fun_candidates) <= 0:
                     continue
 
-                term_operator = rand_choice(fun_candidates)
+                term_operator = rng.choice(fun_candidates)
             rand_node.setData(term_operator)
 
     return int(mutations)
@@ -264,6 +268,7 @@ def GTreeGPMutatorSubtree(genome, **args):
     .. versionadded:: 0.6
        The *GTreeGPMutatorSubtree* function
     """
+    rng = Util.getRandom(args)
 
     if args["pmut"] <= 0.0:
         return 0
@@ -286,11 +291,11 @@ def GTreeGPMutatorSubtree(genome, **args):
         node = branch_list[i]
         assert node is not None
 
-        if Util.randomFlipCoin(args["pmut"]):
+        if Util.randomFlipCoin(args["pmut"], rng):
             depth = genome.getNodeDepth(node)
             mutations += 1
 
-            root_subtree = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth - depth)
+            root_subtree = GTree.buildGTreeGPGrow(ga_engine, 0, max_depth - depth, rng)
             node_parent = node.getParent()
 
             if node_parent is None:
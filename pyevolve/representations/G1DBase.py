@@ -27,6 +27,7 @@ class G1DBase(GenomeBase):
     def __iadd__(self, item):
         """ To add more items using the += operator """
         self.genomeList.append(item)
+        self.invalidate()
         return self
 
     def __eq__(self, other):
@@ -56,6 +57,7 @@ class G1DBase(GenomeBase):
     def __setitem__(self, key, value):
         """ Set the specified value for an gene of List """
         self.genomeList[key] = value
+        self.invalidate()
 
     def __iter__(self):
         """ Iterator support to the list """
@@ -86,6 +88,7 @@ class G1DBase(GenomeBase):
 
         """
         self.genomeList.append(value)
+        self.invalidate()
 
     def remove(self, value):
         """ Removes an item from the list
@@ -97,10 +100,12 @@ class G1DBase(GenomeBase):
 
         """
         self.genomeList.remove(value)
+        self.invalidate()
 
     def clearList(self):
         """ Remove all genes from Genome """
         del self.genomeList[:]
+        self.invalidate()
 
     def copy(self, g):
         """ Copy genome to 'g'
@@ -114,6 +119,21 @@ class G1DBase(GenomeBase):
         g.genomeSize = self.genomeSize
         g.genomeList = self.genomeList[:]
 
+    def getGenotypeKey(self):
+        """ Returns a hashable key of the genes, see :meth:`GenomeBase.getGenotypeKey`
+
+        :rtype: a tuple with the genes
+        """
+        return tuple(self.genomeList)
+
+    def setGenotypeKey(self, key):
+        """ Sets the genes from a key, see :meth:`GenomeBase.setGenotypeKey`
+
+        :param key: a tuple with the genes
+        """
+        self.genomeList = list(key)
+        self.genomeSize = len(self.genomeList)
+
     def getInternalList(self):
         """ Returns the internal list of the genome
 
@@ -128,3 +148,4 @@ class G1DBase(GenomeBase):
         :param lst: the list to assign the internal list of the chromosome
         """
         self.genomeList = lst
+        self.invalidate()
@@ -76,6 +76,16 @@ class G1DBinaryString(G1DBase):
         >>> g[4]
         0
 
+        """
+        self.checkValue(value)
+        G1DBase.__setitem__(self, key, value)
+
+    def checkValue(self, value):
+        """ Raises ValueError when the gene, or a gene of the list used on a slice,
+        isn't zero (0) or one (1)
+
+        :param value: the gene or the list of genes
+
         """
         if isinstance(value, int) and value not in (0, 1):  # TODO add type check
             Util.raiseException("The value must be zero (0) or one (1), used (%s)" % value, ValueError)
@@ -83,7 +93,6 @@ class G1DBinaryString(G1DBase):
             # if slice notation is used we check all passed values
             vals = set(value) - set([0, 1])  # TODO check what to do with slice key
             Util.raiseException("The value must be zero (0) or one (1), used (%s)" % vals, ValueError)
-        G1DBase.__setitem__(self, key, value)
 
     def __repr__(self):
         """ Return a string representation of Genome """
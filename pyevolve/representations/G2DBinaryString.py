@@ -110,6 +110,7 @@ class G2DBinaryString(GenomeBase):
         if value not in [0, 1]:
             Util.raiseException("The item value must be 0 or 1 in the G2DBinaryString chromosome", ValueError)
         self.genomeString[x][y] = value
+        self.invalidate()
 
     def __getitem__(self, key):
         """ Return the specified gene of List """
@@ -119,6 +120,20 @@ class G2DBinaryString(GenomeBase):
         """ Iterator support to the list """
         return iter(self.genomeString)
 
+    def getGenotypeKey(self):
+        """ Returns a hashable key of the genes, see :meth:`GenomeBase.GenomeBase.getGenotypeKey`
+
+        :rtype: a tuple with one tuple of genes for each row
+        """
+        return tuple(map(tuple, self.genomeString))
+
+    def setGenotypeKey(self, key):
+        """ Sets the genes from a key, see :meth:`GenomeBase.GenomeBase.setGenotypeKey`
+
+        :param key: a tuple with one tuple of genes for each row
+        """
+        self.genomeString = [list(row) for row in key]
+
     def getHeight(self):
         """ Return the height (lines) of the List """
         return self.height
@@ -169,6 +184,7 @@ class G2DBinaryString(GenomeBase):
         self.genomeString = [None] * self.height
         for i in range(self.height):
             self.genomeString[i] = [None] * self.width
+        self.invalidate()
 
     def copy(self, g):
         """ Copy genome to 'g'
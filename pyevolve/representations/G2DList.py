@@ -140,6 +140,7 @@ class G2DList(GenomeBase):
 
         """
         self.genomeList[x][y] = value
+        self.invalidate()
 
     def __getitem__(self, key):  # TODO __setitem__ is needed
         """ Return the specified gene of List """
@@ -149,6 +150,20 @@ class G2DList(GenomeBase):
         """ Iterator support to the list """
         return iter(self.genomeList)
 
+    def getGenotypeKey(self):
+        """ Returns a hashable key of the genes, see :meth:`GenomeBase.GenomeBase.getGenotypeKey`
+
+        :rtype: a tuple with one tuple of genes for each row
+        """
+        return tuple(map(tuple, self.genomeList))
+
+    def setGenotypeKey(self, key):
+        """ Sets the genes from a key, see :meth:`GenomeBase.GenomeBase.setGenotypeKey`
+
+        :param key: a tuple with one tuple of genes for each row
+        """
+        self.genomeList = [list(row) for row in key]
+
     def getHeight(self):
         """ Return the height (lines) of the List """
         return self.height
@@ -201,6 +216,7 @@ class G2DList(GenomeBase):
         self.genomeList = [None] * self.height
         for i in range(self.height):
             self.genomeList[i] = [None] * self.width
+        self.invalidate()
 
     def copy(self, g):
         """ Copy genome to 'g'
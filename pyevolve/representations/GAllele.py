@@ -129,9 +129,12 @@ class GAlleleList(object):
         """ Removes all the allele options from the list """
         del self.options[:]
 
-    def getRandomAllele(self):
-        """ Returns one random choice from the options list """
-        return random.choice(self.options)
+    def getRandomAllele(self, rng=random):
+        """ Returns one random choice from the options list
+
+        :param rng: the random number generator, the default is the :mod:`random` module
+        """
+        return rng.choice(self.options)
 
     def add(self, option):
         """ Appends one option to the options list
@@ -254,14 +257,17 @@ class GAlleleRange(object):
         # TODO might crash if we access minimum immediately after
         # processminmax is needed
 
-    def getRandomAllele(self):
-        """ Returns one random choice between the range """
-        rand_func = random.uniform if self.real else random.randint
+    def getRandomAllele(self, rng=random):
+        """ Returns one random choice between the range
+
+        :param rng: the random number generator, the default is the :mod:`random` module
+        """
+        rand_func = rng.uniform if self.real else rng.randint
 
         if len(self.beginEnd) <= 1:  # TODO crashes after clear
             choice = 0
         else:
-            choice = random.randint(0, len(self.beginEnd) - 1)  # TODO refactor needed
+            choice = rng.randint(0, len(self.beginEnd) - 1)  # TODO refactor needed
         return rand_func(self.beginEnd[choice][0], self.beginEnd[choice][1])
 
     def setReal(self, flag=True):
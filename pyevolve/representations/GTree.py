@@ -169,7 +169,7 @@ class GTreeNode(GTreeNodeBase):
 #################################
 
 
-def buildGTreeGrow(depth, value_callback, max_siblings, max_depth):
+def buildGTreeGrow(depth, value_callback, max_siblings, max_depth, rng=random):
     """ Random generates a Tree structure using the value_callback
     for data generation and the method "Grow"
 
@@ -178,6 +178,7 @@ def buildGTreeGrow(depth, value_callback, max_siblings, max_depth):
                            values for nodes
     :param max_siblings: the maximum number of sisters of a node
     :param max_depth: the maximum depth of the tree
+    :param rng: the random number generator, the default is the :mod:`random` module
 
     :rtype: the root node of created tree
     """
@@ -188,14 +189,14 @@ def buildGTreeGrow(depth, value_callback, max_siblings, max_depth):
     if depth == max_depth:
         return n
 
-    for i in range(random.randint(0, abs(max_siblings))):
-        child = buildGTreeGrow(depth + 1, value_callback, max_siblings, max_depth)
+    for i in range(rng.randint(0, abs(max_siblings))):
+        child = buildGTreeGrow(depth + 1, value_callback, max_siblings, max_depth, rng)
         child.setParent(n)
         n.addChild(child)
     return n
 
 
-def buildGTreeFull(depth, value_callback, max_siblings, max_depth):
+def buildGTreeFull(depth, value_callback, max_siblings, max_depth, rng=random):
     """ Random generates a Tree structure using the value_callback
     for data generation and the method "Full"
 
@@ -204,6 +205,7 @@ def buildGTreeFull(depth, value_callback, max_siblings, max_depth):
                            values for nodes
     :param max_siblings: the maximum number of sisters of a node
     :param max_depth: the maximum depth of the tree
+    :param rng: the random number generator, the default is the :mod:`random` module
 
     :rtype: the root node of created tree
     """
@@ -217,10 +219,10 @@ def buildGTreeFull(depth, value_callback, max_siblings, max_depth):
     if max_siblings < 0:
         range_val = abs(max_siblings)
     else:
-        range_val = random.randint(1, abs(max_siblings))
+        range_val = rng.randint(1, abs(max_siblings))
 
     for i in range(range_val):
-        child = buildGTreeFull(depth + 1, value_callback, max_siblings, max_depth)
+        child = buildGTreeFull(depth + 1, value_callback, max_siblings, max_depth, rng)
         child.setParent(n)
         n.addChild(child)
     return n
@@ -550,6 +552,23 @@ class GTreeGP(GTreeBase):
 
         return 0
 
+    def getGenotypeDigest(self):
+        """ Returns a digest of the nodes, see :meth:`GenomeBase.getGenotypeDigest`,
+        the trees with equal digests are checked by :meth:`compare`
+
+        :rtype: an integer, or None when the tree is empty
+        """
+        stack = [self.getRoot()]
+        if stack[0] is None:
+            return None
+        nodes = []
+        while stack:
+            node = stack.pop()
+            childs = node.getChilds()
+            nodes.append((node.node_type, node.node_data, len(childs)))
+            stack.extend(childs)
+        return hash(tuple(nodes))
+
     @staticmethod
     def writePopulationDot(ga_engine, filename, format="jpeg", start=0, end=0):
         """ Writes to a graphical file using pydot, the population of trees
@@ -654,16 +673,17 @@ def checkTerminal(terminal):
         return terminal
 
 
-def buildGTreeGPGrow(ga_engine, depth, max_depth):
+def buildGTreeGPGrow(ga_engine, depth, max_depth, rng=None):
     """ Creates a new random GTreeGP root node with subtrees using
     the "Grow" method.
 
     :param ga_engine: the GA Core
     :param depth: the initial depth
     :max_depth: the maximum depth of the tree
+    :param rng: the random number generator, the default is the one of the GA Core
     :rtype: the root node
     """
-    
+    rng = Util.getRandom({"rng": rng, "ga_engine": ga_engine})
     gp_terminals = ga_engine.getParam("gp_terminals")
     assert gp_terminals is not None
 
@@ -671,16 +691,16 @@ def buildGTreeGPGrow(ga_engine, depth, max_depth):
     assert gp_function_set is not None
 
     if depth == max_depth:
-        random_terminal = checkTerminal(random.choice(gp_terminals))
+        random_terminal = checkTerminal(rng.choice(gp_terminals))
         n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"])
         return n
     else:
         # Do not generate degenerative trees
         if depth == 0:
-            random_node = random.choice(list(gp_function_set.keys()))
+            random_node = rng.choice(list(gp_function_set.keys()))
         else:
-            fchoice = random.choice([list(gp_function_set.keys()), gp_terminals])
-            random_node = random.choice(fchoice)
+            fchoice = rng.choice([list(gp_function_set.keys()), gp_terminals])
+            random_node = rng.choice(fchoice)
 
         if random_node in gp_terminals:
             n = GTreeNodeGP(checkTerminal(random_node), Consts.nodeType["TERMINAL"])
@@ -689,23 +709,24 @@ def buildGTreeGPGrow(ga_engine, depth, max_depth):
 
     if n.getType() == Consts.nodeType["NONTERMINAL"]:
         for i in range(gp_function_set[n.getData()]):
-            child = buildGTreeGPGrow(ga_engine, depth + 1, max_depth)
+            child = buildGTreeGPGrow(ga_engine, depth + 1, max_depth, rng)
             child.setParent(n)
             n.addChild(child)
 
     return n
 
 
-def buildGTreeGPFull(ga_engine, depth, max_depth):
+def buildGTreeGPFull(ga_engine, depth, max_depth, rng=None):
     """ Creates a new random GTreeGP root node with subtrees using
     the "Full" method.
 
     :param ga_engine: the GA Core
     :param depth: the initial depth
     :max_depth: the maximum depth of the tree
+    :param rng: the random number generator, the default is the one of the GA Core
     :rtype: the root node
     """
-    
+    rng = Util.getRandom({"rng": rng, "ga_engine": ga_engine})
 
     gp_terminals = ga_engine.getParam("gp_terminals")
     assert gp_terminals is not None
@@ -714,16 +735,16 @@ def buildGTreeGPFull(ga_engine, depth, max_depth):
     assert gp_function_set is not None
 
     if depth == max_depth:
-        random_terminal = checkTerminal(random.choice(gp_terminals))
+        random_terminal = checkTerminal(rng.choice(gp_terminals))
         n = GTreeNodeGP(random_terminal, Consts.nodeType["TERMINAL"])
         return n
     else:
-        random_oper = random.choice(list(gp_function_set.keys()))
+        random_oper = rng.choice(list(gp_function_set.keys()))
         n = GTreeNodeGP(random_oper, Consts.nodeType["NONTERMINAL"])
 
     if n.getType() == Consts.nodeType["NONTERMINAL"]:
         for i in range(gp_function_set[n.getData()]):
-            child = buildGTreeGPFull(ga_engine, depth + 1, max_depth)
+            child = buildGTreeGPFull(ga_engine, depth + 1, max_depth, rng)
             child.setParent(n)
             n.addChild(child)
 
@@ -138,16 +138,19 @@ class GTreeBase(GenomeBase):
             callback(child_node)
             self.traversal(callback, child_node)
 
-    def getRandomNode(self, node_type=0):
+    def getRandomNode(self, node_type=0, rng=None):
         """ Returns a random node from the Tree
 
         :param node_type: 0 = Any, 1 = Leaf, 2 = Branch
+        :param rng: the random number generator, the default is the :mod:`random` module
         :rtype: random node
         """
         lists = (self.nodes_list, self.nodes_leaf, self.nodes_branch)
         cho = lists[node_type]
         if len(cho) <= 0:
             return None
+        if rng is not None:
+            return rng.choice(cho)
         return rand_choice(cho)
 
     def getAllNodes(self):
@@ -15,10 +15,90 @@ import inspect
 from ..FunctionSlot import FunctionSlot
 from .. import Util
 
+#: The attributes which are shared by all the genomes cloned from the same
+#: sample genome, they aren't sent in the slim form (see :func:`packWire`)
+WIRE_SHARED_ATTRIBUTES = ("evaluator", "initializator", "mutator", "crossover", "internalParams")
+
+
+class WireGenome(object):
+    """ WireGenome Class - The slim form of a genome, created by :func:`packWire`
+
+    :param genome_class: the class of the genome
+    :param state: the attributes returned by :meth:`GenomeBase.getWireState`
+
+    .. versionadded:: 0.7
+       The `WireGenome` class.
+
+    """
+    __slots__ = ["genomeClass", "state"]
+
+    def __init__(self, genome_class, state):
+        self.genomeClass = genome_class
+        self.state = state
+
+
+def packWire(genome, template):
+    """ Returns the slim form of the genome, which is sent to the worker processes
+    and to the other MPI nodes instead of the genome
+
+    When the genome shares the function slots and parameters of the template,
+    the slim form carries only the genotype and the scores, the receiver takes
+    the slots and parameters from its own copy of the template (see
+    :func:`unpackWire`). It avoids sending, for example, the distance matrix
+    of a TSP problem with every individual. The pickling of the genomes
+    isn't changed, this function is called only by the transports.
+
+    Example:
+       >>> data = GenomeBase.packWire(genome, sample_genome)
+       >>> GenomeBase.unpackWire(data, sample_genome).getInternalList() == genome.getInternalList()
+       True
+
+    :param genome: the genome
+    :param template: the sample genome, the receiver must have the same one
+    :rtype: a :class:`WireGenome` instance, or the genome itself when it
+            doesn't share the attributes of the template
+
+    .. versionadded:: 0.7
+       The `packWire` function.
+
+    """
+    if genome is template or genome.__class__ is not template.__class__:
+        return genome
+    for attr in WIRE_SHARED_ATTRIBUTES:
+        if getattr(genome, attr) is not getattr(template, attr):
+            return genome
+    return WireGenome(genome.__class__, genome.getWireState())
+
+
+def unpackWire(data, template):
+    """ Returns the genome of the slim form created by :func:`packWire`
+
+    :param data: the :class:`WireGenome` instance, or a genome, which is returned as is
+    :param template: the sample genome, the new genome shares its function slots and parameters
+    :rtype: the genome
+
+    .. versionadded:: 0.7
+       The `unpackWire` function.
+
+    """
+    if not isinstance(data, WireGenome):
+        return data
+    genome_class = data.genomeClass
+    if genome_class is not template.__class__:
+        Util.raiseException("The %s genome can't be unpacked with a %s template" %
+                            (genome_class.__name__, template.__class__.__name__), TypeError)
+    genome = genome_class.__new__(genome_class)
+    for attr in WIRE_SHARED_ATTRIBUTES:
+        setattr(genome, attr, getattr(template, attr))
+    for attr, value in data.state.items():
+        setattr(genome, attr, value)
+    return genome
+
 
 class GenomeBase(object):
     """ GenomeBase Class - The base of all chromosome representation """
-    __slots__ = ["evaluator", "initializator", "mutator", "crossover", "internalParams", "score", "fitness"]
+    __slots__ = ["evaluator", "initializator", "mutator", "crossover", "internalParams", "score", "fitness",
+                 "evaluated"]
 
     def __init__(self):
         """Genome Constructor"""
@@ -30,6 +110,30 @@ class GenomeBase(object):
         self.internalParams = {}
         self.score = 0.0
         self.fitness = 0.0
+        self.evaluated = False
+
+    def getWireState(self):
+        """ Returns the attributes of the genome which aren't shared with the other
+        genomes, which are the genotype and the scores
+
+        :rtype: a dict with the attribute names and values
+
+        """
+        state = {}
+        for klass in self.__class__.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for attr in slots:
+                if attr in WIRE_SHARED_ATTRIBUTES or attr in ("__dict__", "__weakref__"):
+                    continue
+                if hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+        if hasattr(self, "__dict__"):
+            for attr, value in self.__dict__.items():
+                if attr not in WIRE_SHARED_ATTRIBUTES:
+                    state[attr] = value
+        return state
 
     def getRawScore(self):
         """ Get the Raw Score of the genome
@@ -97,6 +201,64 @@ class GenomeBase(object):
         """ Clear score and fitness of genome """
         self.score = 0.0
         self.fitness = 0.0
+        self.evaluated = False
+
+    def isEvaluated(self):
+        """ Returns True if the score of the genome is up to date with its genes
+
+        .. note:: the population only evaluates the individuals which aren't
+                  evaluated, see :meth:`invalidate`.
+        """
+        return self.evaluated
+
+    def invalidate(self):
+        """ Marks the score of the genome as outdated, the genome will be
+        evaluated again in the next population evaluation
+
+        .. note:: If you are planning to create a new chromosome representation, every
+                  method that changes the genes **must** call this method.
+        """
+        self.evaluated = False
+
+    def getGenotypeKey(self):
+        """ Returns a hashable value which identifies the genes of the genome,
+        two genomes with the same genes must have equal keys
+
+        It is used to cache scores of genotypes already evaluated, the base
+        class returns None, which means that the genome can't be cached.
+
+        :rtype: a hashable key or None
+
+        .. note:: If you are planning to create a new chromosome representation,
+                  you should implement this method on your class.
+        """
+        return None
+
+    def getGenotypeDigest(self):
+        """ Returns a hashable digest of the genes, used to find the duplicated
+        genomes (see :class:`GPopulation.GenotypeIndex`), two genomes with the
+        same genes must have equal digests
+
+        The genomes with equal digests are duplicates, unless they have a
+        *compare* method, which decides the collisions. The base class returns
+        the genotype key (see :meth:`getGenotypeKey`), None means that the
+        duplicates of the genome can't be found.
+
+        :rtype: a hashable digest or None
+
+        .. versionadded:: 0.7
+           The `getGenotypeDigest` method.
+        """
+        return self.getGenotypeKey()
+
+    def setGenotypeKey(self, key):
+        """ Sets the genes from a key returned by :meth:`getGenotypeKey`, it is used
+        to restore the genomes stored on the checkpoints (see :mod:`Checkpoint`)
+
+        :param key: the key of the genes
+
+        """
+        Util.raiseException("This genome can't be restored from a genotype key", NotImplementedError)
 
     def evaluate(self, **args):
         """ Called to evaluate genome
@@ -107,6 +269,7 @@ class GenomeBase(object):
         self.resetStats()
         for it in self.evaluator.applyFunctions(self, **args):
             self.score += it
+        self.evaluated = True
 
     def initialize(self, **args):
         """ Called to initialize genome
@@ -116,6 +279,7 @@ class GenomeBase(object):
         """
         for it in self.initializator.applyFunctions(self, **args):
             pass
+        self.invalidate()
 
     def mutate(self, **args):
         """ Called to mutate the genome
@@ -127,6 +291,8 @@ class GenomeBase(object):
         nmuts = 0
         for it in self.mutator.applyFunctions(self, **args):
             nmuts += it
+        if nmuts:
+            self.invalidate()
         return nmuts
 
     def copy(self, g):
@@ -140,6 +306,7 @@ class GenomeBase(object):
         """
         g.score = self.score
         g.fitness = self.fitness
+        g.evaluated = self.evaluated
         g.evaluator = self.evaluator
         g.initializator = self.initializator
         g.mutator = self.mutator
@@ -0,0 +1,395 @@
+"""
+
+:mod:`GenotypeMatrix` -- the matrix layout of the 1D list genomes
+================================================================
+
+This module has the matrix which keeps the genes of the
+:class:`G1DList.G1DList` and :class:`G1DBinaryString.G1DBinaryString`
+individuals of a population on the rows of one 2D NumPy array, and the
+genome views, which are genomes of the same classes whose genes are a row
+of the matrix.
+
+The initializators, mutators, crossovers and evaluators keep working on the
+views: the reads and writes of genes and slices (*genome[i]*,
+*genome[a:b]*) go straight to the row, while the operators which take or
+assign the whole *genomeList* work on a private list of the view, which is
+written back to the row when the view is packed (see :meth:`GenotypeView.pack`).
+The rows of the views destroyed are reused by the new views, so the
+generations of the GA Engine share the same matrix.
+
+The vectorized operators can change the matrix directly, see
+:meth:`GPopulation.GPopulation.getGenotypeMatrix`.
+
+.. versionadded:: 0.7
+   The :mod:`GenotypeMatrix` module.
+
+"""
+
+from .. import Util
+from .GenomeBase import GenomeBase
+from .G1DBase import G1DBase
+from .G1DBinaryString import G1DBinaryString
+from .G1DList import G1DList
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _unpickleDetached(genome):
+    """ Internal used to unpickle the views as common genomes """
+    return genome
+
+
+class GenotypeMatrix(object):
+    """ GenotypeMatrix Class - The genes of the individuals on the rows of one 2D NumPy array
+
+    The matrix grows when all the rows are taken, so the rows must always be
+    accessed by their index, see :meth:`getRows`. It starts as an integer
+    matrix and it's promoted to a wider type when the genes written don't fit
+    (to floats when a real gene is written, or to objects when the genes
+    aren't numbers).
+
+    Example:
+       >>> genotype_matrix = GenotypeMatrix(10, 100)
+       >>> view = genotype_matrix.view(genome)
+       >>> genotype_matrix.matrix[view.genotypeRow]
+       array([...])
+
+    :param width: the number of genes of the genomes
+    :param capacity: the initial number of rows
+
+    """
+
+    def __init__(self, width, capacity=0):
+        """ The constructor of the GenotypeMatrix """
+        if not HAS_NUMPY:
+            Util.raiseException("The genotype matrix needs NumPy", ImportError)
+        self.width = width
+        self.matrix = numpy.zeros((capacity, width), dtype=numpy.int64)
+        self.freeRows = list(range(capacity - 1, -1, -1))
+
+    def __len__(self):
+        """ Returns the number of rows taken """
+        return len(self.matrix) - len(self.freeRows)
+
+    def __repr__(self):
+        """ The string representation of the matrix """
+        ret = "- GenotypeMatrix\n"
+        ret += "\tShape:\t\t %s\n" % (self.matrix.shape,)
+        ret += "\tType:\t\t %s\n" % (self.matrix.dtype,)
+        ret += "\tRows Taken:\t %d\n" % (len(self),)
+        return ret
+
+    def allocate(self):
+        """ Takes a free row, the matrix grows when there isn't one
+
+        :rtype: the index of the row
+        """
+        if not self.freeRows:
+            capacity = len(self.matrix)
+            grown = max(2 * capacity, 1)
+            matrix = numpy.zeros((grown, self.width), dtype=self.matrix.dtype)
+            matrix[:capacity] = self.matrix
+            self.matrix = matrix
+            self.freeRows = list(range(grown - 1, capacity - 1, -1))
+        return self.freeRows.pop()
+
+    def release(self, row):
+        """ Returns the row to the free rows
+
+        :param row: the index of the row
+        """
+        self.freeRows.append(row)
+
+    def read(self, row, key):
+        """ Reads the genes of the row
+
+        :param row: the index of the row
+        :param key: the index or the slice of the genes
+        :rtype: the gene, or a list with the genes of the slice
+
+        """
+        value = self.matrix[row, key]
+        if isinstance(value, (numpy.ndarray, numpy.generic)):
+            return value.tolist()
+        return value
+
+    def write(self, row, key, value):
+        """ Writes the genes on the row, the matrix is promoted to a wider type
+        when the genes don't fit on it
+
+        :param row: the index of the row
+        :param key: the index or the slice of the genes
+        :param value: the gene, or a sequence with the genes of the slice
+
+        .. note:: Raises ValueError when the number of genes doesn't match the slice,
+                  the rows of the matrix have a fixed length.
+
+        """
+        genes = numpy.asarray(value)
+        if isinstance(key, slice) and genes.ndim and len(genes) != len(range(*key.indices(self.width))):
+            Util.raiseException("The genomes of the matrix have %d genes, %d genes were written on %s" %
+                                (self.width, len(genes), key), ValueError)
+        # The empty arrays are floats, they must not promote the matrix
+        if genes.size == 0:
+            return
+        if not numpy.can_cast(genes.dtype, self.matrix.dtype):
+            self.promote(genes.dtype)
+        self.matrix[row, key] = genes
+
+    def promote(self, dtype):
+        """ Converts the matrix to a type which fits its genes and the genes of the *dtype*
+
+        :param dtype: the NumPy type of the new genes
+        """
+        if dtype.kind in "biuf" and self.matrix.dtype.kind in "biuf":
+            dtype = numpy.promote_types(self.matrix.dtype, dtype)
+        else:
+            dtype = numpy.dtype(object)
+        self.matrix = self.matrix.astype(dtype)
+
+    def getRows(self, individuals):
+        """ Returns the rows of the individuals, used by the vectorized operators
+
+        Example:
+           >>> rows = genotype_matrix.getRows(population)
+           >>> genotype_matrix.matrix[rows] *= 2
+
+        :param individuals: the views of the matrix
+        :rtype: a NumPy array of indexes
+
+        """
+        return numpy.fromiter((ind.genotypeRow for ind in individuals), dtype=numpy.intp,
+                              count=len(individuals))
+
+    def owns(self, individual):
+        """ Returns True if the individual is a view of the matrix
+
+        :param individual: the genome
+        :rtype: True or False
+        """
+        return isinstance(individual, GenotypeView) and individual.genotypeMatrix is self
+
+    def view(self, genome):
+        """ Returns a view of the matrix with the genes and the scores of the genome
+
+        :param genome: a :class:`G1DList.G1DList` or :class:`G1DBinaryString.G1DBinaryString`
+                       genome, or a view of the matrix, which is returned as is
+        :rtype: the view
+
+        """
+        if self.owns(genome):
+            return genome
+        if isinstance(genome, GenotypeView):
+            view_class = genome.__class__
+        else:
+            view_class = VIEW_CLASSES.get(genome.__class__)
+        if view_class is None:
+            Util.raiseException("The %s genomes can't be views of a genotype matrix" %
+                                (genome.__class__.__name__,), TypeError)
+        view = view_class.__new__(view_class)
+        view.attach(self)
+        for attr in view_class.viewAttributes:
+            setattr(view, attr, getattr(genome, attr))
+        genome.copy(view)
+        return view
+
+
+class GenotypeView(object):
+    """ GenotypeView Class - The base of the genomes whose genes are a row of a
+    :class:`GenotypeMatrix`, the views are created by :meth:`GenotypeMatrix.view`
+
+    The *genomeList* of a view is a private list, taken from the row on the
+    first access, which the operators can change or replace as the list of a
+    common genome, and which is written back to the row by :meth:`pack`.
+
+    .. note:: The views are pickled (for the multiprocessing evaluation and the
+              migration, for example) as common genomes, see :meth:`detach`.
+
+    """
+    __slots__ = ()
+
+    #: The attributes of the genome copied to its views, besides the ones of *copy()*
+    viewAttributes = ()
+
+    def __del__(self):
+        """ Returns the row of the view to the matrix """
+        genotype_matrix = getattr(self, "genotypeMatrix", None)
+        if genotype_matrix is not None:
+            genotype_matrix.release(self.genotypeRow)
+
+    def __reduce_ex__(self, protocol):
+        """ Used by the pickle, the view is pickled as a common genome """
+        return _unpickleDetached, (self.detach(),)
+
+    def __getGenomeList(self):
+        if self.genotypeCache is None:
+            self.genotypeCache = self.genotypeMatrix.read(self.genotypeRow, slice(None))
+        return self.genotypeCache
+
+    def __setGenomeList(self, value):
+        self.genotypeCache = value
+
+    genomeList = property(__getGenomeList, __setGenomeList)
+
+    def __getitem__(self, key):
+        """ Returns the gene, or the list of genes of the slice """
+        if self.genotypeCache is None:
+            return self.genotypeMatrix.read(self.genotypeRow, key)
+        return self.genotypeCache[key]
+
+    def __setitem__(self, key, value):
+        """ Sets the gene, or the genes of the slice """
+        if self.genotypeCache is None:
+            if isinstance(key, int):
+                self.genotypeMatrix.write(self.genotypeRow, key, value)
+                self.invalidate()
+                return
+            if isinstance(key, slice):
+                genes = list(value)
+                if len(genes) == len(range(*key.indices(self.genotypeMatrix.width))):
+                    self.genotypeMatrix.write(self.genotypeRow, key, genes)
+                    self.invalidate()
+                    return
+                value = genes
+        self.genomeList[key] = value
+        self.invalidate()
+
+    def __iter__(self):
+        """ Iterator support to the genes """
+        return iter(self.getGenes())
+
+    def __len__(self):
+        """ Returns the number of genes """
+        if self.genotypeCache is None:
+            return self.genotypeMatrix.width
+        return len(self.genotypeCache)
+
+    def __contains__(self, value):
+        """ Used on: *value in genome* """
+        return value in self.getGenes()
+
+    def __eq__(self, other):
+        """ Compares the genes of the view with another chromosome """
+        if not isinstance(other, G1DBase):
+            return NotImplemented
+        return self.genomeSize == other.genomeSize and self.getGenes() == list(other)
+
+    def __hash__(self):
+        """ The hash of the genes, as :meth:`G1DList.G1DList.__hash__` """
+        return hash(str(self.getGenes()))
+
+    def attach(self, genotype_matrix):
+        """ Takes a row of the matrix for the view, used by :meth:`GenotypeMatrix.view`
+
+        :param genotype_matrix: the :class:`GenotypeMatrix` instance
+        """
+        self.genotypeMatrix = genotype_matrix
+        self.genotypeRow = genotype_matrix.allocate()
+        self.genotypeCache = None
+
+    def isPacked(self):
+        """ Returns True if the genes of the view are on its row
+
+        :rtype: True or False
+        """
+        return self.genotypeCache is None
+
+    def pack(self):
+        """ Writes the private *genomeList* of the view back to its row """
+        if self.genotypeCache is not None:
+            self.genotypeMatrix.write(self.genotypeRow, slice(None), self.genotypeCache)
+            self.genotypeCache = None
+
+    def getGenes(self):
+        """ Returns a list with the genes, the changes on the list don't change the view
+
+        :rtype: the list of genes
+        """
+        if self.genotypeCache is None:
+            return self.genotypeMatrix.read(self.genotypeRow, slice(None))
+        return list(self.genotypeCache)
+
+    def getGenotypeKey(self):
+        """ Returns a hashable key of the genes, see :meth:`GenomeBase.GenomeBase.getGenotypeKey`
+
+        :rtype: a tuple with the genes
+        """
+        return tuple(self.getGenes())
+
+    def setGenotypeKey(self, key):
+        """ Sets the genes from a key, see :meth:`GenomeBase.GenomeBase.setGenotypeKey`
+
+        :param key: a tuple with the genes
+        """
+        self.genotypeCache = list(key)
+        self.genomeSize = len(self.genotypeCache)
+
+    def copy(self, g):
+        """ Copy genome to 'g', the rows are copied when 'g' is a view of the same matrix
+
+        :param g: the destination genome
+        """
+        GenomeBase.copy(self, g)
+        g.genomeSize = self.genomeSize
+        if self.genotypeCache is None and self.genotypeMatrix.owns(g):
+            self.genotypeMatrix.matrix[g.genotypeRow] = self.genotypeMatrix.matrix[self.genotypeRow]
+            g.genotypeCache = None
+        else:
+            g.genomeList = self.getGenes()
+
+    def clone(self):
+        """ Return a new view of the same matrix with a copy of the genes
+
+        :rtype: the view
+        """
+        newcopy = self.__class__.__new__(self.__class__)
+        newcopy.attach(self.genotypeMatrix)
+        for attr in self.viewAttributes:
+            setattr(newcopy, attr, getattr(self, attr))
+        self.copy(newcopy)
+        return newcopy
+
+    def detach(self):
+        """ Returns a common genome, which isn't a view, with the genes and the scores of the view
+
+        :rtype: a :class:`G1DList.G1DList` or :class:`G1DBinaryString.G1DBinaryString` instance
+        """
+        genome = self.newGenome()
+        GenomeBase.copy(self, genome)
+        genome.genomeSize = self.genomeSize
+        genome.genomeList = self.getGenes()
+        return genome
+
+
+class G1DListView(GenotypeView, G1DList):
+    """ G1DListView Class - The :class:`G1DList.G1DList` whose genes are a row of a :class:`GenotypeMatrix` """
+    __slots__ = ["genotypeMatrix", "genotypeRow", "genotypeCache"]
+
+    def newGenome(self):
+        """ Returns an empty :class:`G1DList.G1DList`, used by :meth:`GenotypeView.detach` """
+        return G1DList(self.genomeSize, True)
+
+
+class G1DBinaryStringView(GenotypeView, G1DBinaryString):
+    """ G1DBinaryStringView Class - The :class:`G1DBinaryString.G1DBinaryString` whose
+    genes are a row of a :class:`GenotypeMatrix` """
+    __slots__ = ["genotypeMatrix", "genotypeRow", "genotypeCache"]
+
+    viewAttributes = ("stringLength",)
+
+    def __setitem__(self, key, value):
+        """ Sets the gene, or the genes of the slice, which must be zero (0) or one (1) """
+        self.checkValue(value)
+        GenotypeView.__setitem__(self, key, value)
+
+    def newGenome(self):
+        """ Returns an empty :class:`G1DBinaryString.G1DBinaryString`, used by :meth:`GenotypeView.detach` """
+        return G1DBinaryString(self.stringLength)
+
+
+#: The view classes of the genome classes supported by the :class:`GenotypeMatrix`
+VIEW_CLASSES = {G1DList: G1DListView, G1DBinaryString: G1DBinaryStringView}
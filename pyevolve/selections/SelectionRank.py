@@ -1,6 +1,7 @@
-import random
+from itertools import accumulate
 
 from ..GPopulation import GPopulation
+from .. import Util
 
 exploration_weight= 0.8
 exploitation_weight=0.2
@@ -10,12 +11,29 @@ def SelectorFitnessProportional(population: GPopulation, **args):
     See more information in the `SRS Selection Operator
     <https://www.tandfonline.com/doi/full/10.1080/00949655.2023.2217463?casa_token=-Bl8otfKRMUAAAAA%3AvnyhGaBQku8ComC-8InY2ig3uWKd0XAaJvW0-3A1lz2531_rBRh8W3TjUim2hGfY0NCaYeTLKVlH>`_
     """
+    rng = Util.getRandom(args)
 
+    popSize = len(population)
+    cum_weights = SelectorFitnessProportional_Weights(population, args["popID"])
+    selected = rng.choices(range(popSize), cum_weights=cum_weights)[0]
+
+    return population[selected]
+
+
+def SelectorFitnessProportional_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorFitnessProportional` """
+    rng = Util.getRandom(args)
+    cum_weights = SelectorFitnessProportional_Weights(population, args["popID"])
+    return rng.choices(population.internalPop, cum_weights=cum_weights, k=count)
+
+
+def SelectorFitnessProportional_Weights(population: GPopulation, popID):
+    """ Returns the cumulative weights of the individuals, cached by the popID """
     popSize = len(population)
     if not population.sorted:
         population.sort()
 
-    if args["popID"] != SelectorFitnessProportional.cachePopID:
+    if popID != SelectorFitnessProportional.cachePopID:
 
         start = popSize
         prob_counts = [0] * popSize
@@ -27,19 +45,16 @@ def SelectorFitnessProportional(population: GPopulation, **args):
 
         total = sum(prob_counts)
         prob_weights = [a / total for a in prob_counts]
-        SelectorFitnessProportional.cachePopID = args["popID"]
+        SelectorFitnessProportional.cachePopID = popID
         SelectorFitnessProportional.probabilityWeights = prob_weights
+        SelectorFitnessProportional.cumulativeWeights = list(accumulate(prob_weights))
 
-    else:
-        prob_weights = SelectorFitnessProportional.probabilityWeights
-
-    selected = random.choices(list(range(popSize)), weights=prob_weights)[0]
-
-    x = population[selected]
-    return population[selected]
+    return SelectorFitnessProportional.cumulativeWeights
 
 
 SelectorFitnessProportional.cachePopID = None
+SelectorFitnessProportional.cumulativeWeights = None
+SelectorFitnessProportional.batch = SelectorFitnessProportional_Batch
 SelectorFitnessProportional.probabilityWeights = None
 
 
@@ -50,7 +65,24 @@ def SelectorLinearRanking(population: GPopulation, **args):
     <https://eprints.ukh.ac.id/id/eprint/201/1/2015_Book_IntroductionToEvolutionaryComp.pdf>`_
     page:82
     """
+    rng = Util.getRandom(args)
+
+    popSize = len(population)
+    cum_weights = SelectorLinearRanking_Weights(population, args["popID"])
+    selected = rng.choices(range(popSize), cum_weights=cum_weights)[0]
+
+    return population[selected]
+
 
+def SelectorLinearRanking_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorLinearRanking` """
+    rng = Util.getRandom(args)
+    cum_weights = SelectorLinearRanking_Weights(population, args["popID"])
+    return rng.choices(population.internalPop, cum_weights=cum_weights, k=count)
+
+
+def SelectorLinearRanking_Weights(population: GPopulation, popID):
+    """ Returns the cumulative weights of the individuals, cached by the popID """
     selection_pressure=1.5
 
     popSize = len(population)
@@ -58,7 +90,7 @@ def SelectorLinearRanking(population: GPopulation, **args):
     if not population.sorted:
         population.sort()
 
-    if args["popID"] != SelectorLinearRanking.cachePopID:
+    if popID != SelectorLinearRanking.cachePopID:
 
         start = popSize
         prob_counts = [0] * popSize
@@ -71,18 +103,16 @@ def SelectorLinearRanking(population: GPopulation, **args):
         prob_weights = [];
         for i in prob_counts:
             prob_weights.append((2 - selection_pressure) / popSize + (2 * i * (selection_pressure- 1) / (popSize * (popSize - 1))))
-        SelectorLinearRanking.cachePopID = args["popID"]
+        SelectorLinearRanking.cachePopID = popID
         SelectorLinearRanking.probabilityWeights = prob_weights
+        SelectorLinearRanking.cumulativeWeights = list(accumulate(prob_weights))
 
-    else:
-        prob_weights = SelectorLinearRanking.probabilityWeights
-
-    selected = random.choices(list(range(popSize)), weights=prob_weights)[0]
-
-    return population[selected]
+    return SelectorLinearRanking.cumulativeWeights
 
 SelectorLinearRanking.probabilityWeights = None
 SelectorLinearRanking.cachePopID = None
+SelectorLinearRanking.cumulativeWeights = None
+SelectorLinearRanking.batch = SelectorLinearRanking_Batch
 
 def SelectorExponentialRanking(population: GPopulation, **args):
     """ The Exponential Ranking Selector
@@ -90,13 +120,30 @@ def SelectorExponentialRanking(population: GPopulation, **args):
    See more information in the `ERS Selection Operator
     <https://tik-old.ee.ethz.ch/file/6c0e384dceb283cd4301339a895b72b8/TIK-Report11.pdf>`_
     """
+    rng = Util.getRandom(args)
+
+    popSize = len(population)
+    cum_weights = SelectorExponentialRanking_Weights(population, args["popID"])
+    selected = rng.choices(range(popSize), cum_weights=cum_weights)[0]
 
+    return population[selected]
+
+
+def SelectorExponentialRanking_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorExponentialRanking` """
+    rng = Util.getRandom(args)
+    cum_weights = SelectorExponentialRanking_Weights(population, args["popID"])
+    return rng.choices(population.internalPop, cum_weights=cum_weights, k=count)
+
+
+def SelectorExponentialRanking_Weights(population: GPopulation, popID):
+    """ Returns the cumulative weights of the individuals, cached by the popID """
     c = 0.99;
     popSize = len(population)
     if not population.sorted:
         population.sort()
 
-    if args["popID"] != SelectorExponentialRanking.cachePopID:
+    if popID != SelectorExponentialRanking.cachePopID:
 
         start = popSize
         prob_counts = [0] * popSize
@@ -109,19 +156,17 @@ def SelectorExponentialRanking(population: GPopulation, **args):
         prob_weights = [];
         for i in prob_counts:
             prob_weights.append(((c - 1) / ((pow(c, popSize)) - 1) * (pow(c, (popSize - i)))))
-        SelectorExponentialRanking.cachePopID = args["popID"]
+        SelectorExponentialRanking.cachePopID = popID
         SelectorExponentialRanking.probabilityWeights = prob_weights
+        SelectorExponentialRanking.cumulativeWeights = list(accumulate(prob_weights))
 
-    else:
-        prob_weights = SelectorExponentialRanking.probabilityWeights
-
-    selected = random.choices(list(range(popSize)), weights=prob_weights)[0]
-
-    return population[selected]
+    return SelectorExponentialRanking.cumulativeWeights
 
 
 SelectorExponentialRanking.probabilityWeights = None
 SelectorExponentialRanking.cachePopID = None
+SelectorExponentialRanking.cumulativeWeights = None
+SelectorExponentialRanking.batch = SelectorExponentialRanking_Batch
 
 
 def SelectorSplitRanking(population: GPopulation, **args):
@@ -130,14 +175,31 @@ def SelectorSplitRanking(population: GPopulation, **args):
     See more information in the `SRS Selection Operator
     <https://www.tandfonline.com/doi/full/10.1080/00949655.2023.2217463?casa_token=-Bl8otfKRMUAAAAA%3AvnyhGaBQku8ComC-8InY2ig3uWKd0XAaJvW0-3A1lz2531_rBRh8W3TjUim2hGfY0NCaYeTLKVlH>`_
     """
+    rng = Util.getRandom(args)
+
+    popSize = len(population)
+    cum_weights = SelectorSplitRanking_Weights(population, args["popID"])
+    selected = rng.choices(range(popSize), cum_weights=cum_weights)[0]
+
+    return population[selected]
+
+
+def SelectorSplitRanking_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorSplitRanking` """
+    rng = Util.getRandom(args)
+    cum_weights = SelectorSplitRanking_Weights(population, args["popID"])
+    return rng.choices(population.internalPop, cum_weights=cum_weights, k=count)
 
+
+def SelectorSplitRanking_Weights(population: GPopulation, popID):
+    """ Returns the cumulative weights of the individuals, cached by the popID """
     lamda1 = 0.3;
     lamda2 = 0.7;
     popSize = len(population)
     if not population.sorted:
         population.sort()
 
-    if args["popID"] != SelectorSplitRanking.cachePopID:
+    if popID != SelectorSplitRanking.cachePopID:
 
         start = popSize
         prob_counts = [0] * popSize
@@ -153,19 +215,17 @@ def SelectorSplitRanking(population: GPopulation, **args):
                 prob_weights.append(lamda1 * ((8 * i) / popSize * (popSize + 2)));
             else:
                 prob_weights.append(lamda2 * ((8 * i) / popSize * (3 * popSize + 2)));
-        SelectorSplitRanking.cachePopID = args["popID"]
+        SelectorSplitRanking.cachePopID = popID
         SelectorSplitRanking.probabilityWeights = prob_weights
+        SelectorSplitRanking.cumulativeWeights = list(accumulate(prob_weights))
 
-    else:
-        prob_weights = SelectorSplitRanking.probabilityWeights
-
-    selected = random.choices(list(range(popSize)), weights=prob_weights)[0]
-
-    return population[selected]
+    return SelectorSplitRanking.cumulativeWeights
 
 
 SelectorSplitRanking.probabilityWeights = None
 SelectorSplitRanking.cachePopID = None
+SelectorSplitRanking.cumulativeWeights = None
+SelectorSplitRanking.batch = SelectorSplitRanking_Batch
 
 
 def SelectorNewTournament(population: GPopulation, **args):
@@ -174,12 +234,29 @@ def SelectorNewTournament(population: GPopulation, **args):
     See more information in the `NTS Selection Operator
     <https://www.tandfonline.com/doi/full/10.1080/00949655.2023.2217463?casa_token=-Bl8otfKRMUAAAAA%3AvnyhGaBQku8ComC-8InY2ig3uWKd0XAaJvW0-3A1lz2531_rBRh8W3TjUim2hGfY0NCaYeTLKVlH>`_
     """
+    rng = Util.getRandom(args)
+
+    popSize = len(population)
+    cum_weights = SelectorNewTournament_Weights(population, args["popID"])
+    selected = rng.choices(range(popSize), cum_weights=cum_weights)[0]
 
+    return population[selected]
+
+
+def SelectorNewTournament_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorNewTournament` """
+    rng = Util.getRandom(args)
+    cum_weights = SelectorNewTournament_Weights(population, args["popID"])
+    return rng.choices(population.internalPop, cum_weights=cum_weights, k=count)
+
+
+def SelectorNewTournament_Weights(population: GPopulation, popID):
+    """ Returns the cumulative weights of the individuals, cached by the popID """
     popSize = len(population)
     if not population.sorted:
         population.sort()
 
-    if args["popID"] != SelectorNewTournament.cachePopID:
+    if popID != SelectorNewTournament.cachePopID:
 
         start = popSize
         prob_counts = [0] * popSize
@@ -192,19 +269,17 @@ def SelectorNewTournament(population: GPopulation, **args):
         prob_weights = [];
         for i in prob_counts:
             prob_weights.append(2*((3*i) - 1) / popSize *((3*popSize)+1));
-        SelectorNewTournament.cachePopID = args["popID"]
+        SelectorNewTournament.cachePopID = popID
         SelectorNewTournament.probabilityWeights = prob_weights
+        SelectorNewTournament.cumulativeWeights = list(accumulate(prob_weights))
 
-    else:
-        prob_weights = SelectorNewTournament.probabilityWeights
-
-    selected = random.choices(list(range(popSize)), weights=prob_weights)[0]
-
-    return population[selected]
+    return SelectorNewTournament.cumulativeWeights
 
 
 SelectorNewTournament.probabilityWeights = None
 SelectorNewTournament.cachePopID = None
+SelectorNewTournament.cumulativeWeights = None
+SelectorNewTournament.batch = SelectorNewTournament_Batch
 
 def SelectorExplorationExploitationBalance(population: GPopulation, **args):
     """ The Exploration Exploitation Balance Selector
@@ -212,6 +287,7 @@ def SelectorExplorationExploitationBalance(population: GPopulation, **args):
     See more information in the `EEBS Selection Operator
     <https://link.springer.com/article/10.1007/s12065-025-01028-8>`_
     """
+    rng = Util.getRandom(args)
 
     global exploration_weight, exploitation_weight
 
@@ -230,11 +306,23 @@ def SelectorExplorationExploitationBalance(population: GPopulation, **args):
     if exploitation_ratio < exploration_ratio:
         exploration_weight = max(0.1, exploration_weight * 0.9)
         exploitation_weight = min(1.0, exploitation_weight * 1.1)
-        selected_individual = random.choice(exploration_candidates)
+        selected_individual = rng.choice(exploration_candidates)
     elif exploitation_ratio > exploration_ratio:
         exploration_weight = min(1.0, exploration_weight * 1.1)
         exploitation_weight = max(0.1, exploitation_weight * 0.9)
-        selected_individual = random.choice(exploitation_candidates)
+        selected_individual = rng.choice(exploitation_candidates)
     else:
-        selected_individual = random.choice(population)
-    return selected_individual
\ No newline at end of file
+        selected_individual = rng.choice(population)
+    return selected_individual
+
+
+def SelectorExplorationExploitationBalance_Batch(population: GPopulation, count, **args):
+    """ The batch version of the :func:`SelectorExplorationExploitationBalance`, the
+    weights are updated after each individual, like the single selections, but the
+    population is sorted only once """
+    if not population.sorted:
+        population.sort()
+    return [SelectorExplorationExploitationBalance(population, **args) for i in range(count)]
+
+
+SelectorExplorationExploitationBalance.batch = SelectorExplorationExploitationBalance_Batch
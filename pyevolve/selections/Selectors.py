@@ -5,10 +5,37 @@
 
 This module have the *selection methods*, like roulette wheel, tournament, ranking, etc.
 
+Batch Selection
+-------------------------------------------------------------
+
+The selectors may have a *batch* function attribute, which selects many
+individuals with a single call, it's used by the GA Engines to select all
+the parents of a generation at once (see :meth:`GSimpleGA.GSimpleGA.selectBatch`): ::
+
+   def MySelector(population, **args):
+      ...
+   def MySelector_Batch(population, count, **args):
+      ...
+   MySelector.batch = MySelector_Batch
+
+The batch function receives the same parameters of the selector and the number
+of individuals, it returns a list of *count* individuals. All the selectors of
+this module have a batch function, the selectors without it are called once
+for each individual.
+
 """
 
-import random
+from bisect import bisect_right
+from itertools import accumulate
+import weakref
 from .. import Consts
+from .. import Util
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 
 ## TODO Check this one, why it seems to be always same individual being selected
@@ -16,9 +43,28 @@ def GRankSelector(population, **args):
     """ The Rank Selector - This selector will pick the best individual of
     the population every time.
     """
-    
+    rng = Util.getRandom(args)
+    indices = GRankSelector_BestIndices(population, args["popID"])
+
+    # If for some reason we found no best indices, fall back to uniform selection
+    if not indices:
+        return population[rng.randint(0, len(population) - 1)]
+
+    return population[rng.choice(indices)]
+
+
+def isSelectorCached(selector, population, popID):
+    """ Returns True when the cache of the selector was built for the population
+    and the popID, the populations aren't sorted, so the cache of a population
+    can't be used by other one with the same popID (another engine or island) """
+    cached = selector.cachePopulation
+    return popID == selector.cachePopID and cached is not None and cached() is population
+
+
+def GRankSelector_BestIndices(population, popID):
+    """ Returns the indices of the best individuals, cached by the popID """
     # Build or retrieve cached list of indices that have the best value
-    if args["popID"] != GRankSelector.cachePopID:
+    if not isSelectorCached(GRankSelector, population, popID):
         if population.sortType == Consts.sortType["scaled"]:
             best_val = population.bestFitness().fitness
             indices = [i for i in range(len(population)) if population[i].fitness == best_val]
@@ -26,25 +72,42 @@ def GRankSelector(population, **args):
             best_val = population.bestRaw().score
             indices = [i for i in range(len(population)) if population[i].score == best_val]
 
-        GRankSelector.cachePopID = args["popID"]
+        GRankSelector.cachePopID = popID
+        GRankSelector.cachePopulation = weakref.ref(population)
         GRankSelector.cacheIndices = indices
     else:
         indices = GRankSelector.cacheIndices
+    return indices
 
-    # If for some reason we found no best indices, fall back to uniform selection
-    if not indices:
-        return population[random.randint(0, len(population) - 1)]
 
-    return population[random.choice(indices)]
+def GRankSelector_Batch(population, count, **args):
+    """ The batch version of the :func:`GRankSelector` """
+    rng = Util.getRandom(args)
+    indices = GRankSelector_BestIndices(population, args["popID"])
+    if not indices:
+        return GUniformSelector_Batch(population, count, **args)
+    return [population[i] for i in rng.choices(indices, k=count)]
 
 
 GRankSelector.cachePopID = None
+GRankSelector.cachePopulation = None
 GRankSelector.cacheIndices = None
+GRankSelector.batch = GRankSelector_Batch
 
 
 def GUniformSelector(population, **args):
     """ The Uniform Selector """
-    return population[random.randint(0, len(population) - 1)]
+    rng = Util.getRandom(args)
+    return population[rng.randint(0, len(population) - 1)]
+
+
+def GUniformSelector_Batch(population, count, **args):
+    """ The batch version of the :func:`GUniformSelector` """
+    rng = Util.getRandom(args)
+    return rng.choices(population.internalPop, k=count)
+
+
+GUniformSelector.batch = GUniformSelector_Batch
 
 
 def GTournamentSelector(population, **args):
@@ -77,6 +140,30 @@ def GTournamentSelector(population, **args):
     return choosen
 
 
+def GTournamentSelector_Batch(population, count, **args):
+    """ The batch version of the :func:`GTournamentSelector`, the pools of all
+    the tournaments are picked with a single call of the Roulette Wheel """
+    poolSize = population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
+    candidates = GRouletteWheel_Batch(population, count * poolSize, **args)
+    return GTournament_Winners(population, candidates, poolSize)
+
+
+GTournamentSelector.batch = GTournamentSelector_Batch
+
+
+def GTournament_Winners(population, candidates, poolSize):
+    """ Returns the winners of the tournaments, each tournament is a
+    consecutive slice of *poolSize* candidates """
+    should_minimize = population.minimax == Consts.minimaxType["minimize"]
+    minimax_operator = min if should_minimize else max
+    if population.sortType == Consts.sortType["scaled"]:
+        key = lambda ind: ind.fitness
+    else:
+        key = lambda ind: ind.score
+    return [minimax_operator(candidates[i:i + poolSize], key=key)
+            for i in range(0, len(candidates), poolSize)]
+
+
 def GTournamentSelectorAlternative(population, **args):
     """ The alternative Tournament Selector
 
@@ -88,12 +175,13 @@ def GTournamentSelectorAlternative(population, **args):
        Added the GTournamentAlternative function.
 
     """
+    rng = Util.getRandom(args)
     
     pool_size = population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
     len_pop = len(population)
     should_minimize = population.minimax == Consts.minimaxType["minimize"]
     minimax_operator = min if should_minimize else max
-    tournament_pool = [population[random.randint(0, len_pop - 1)] for i in range(pool_size)]
+    tournament_pool = [population[rng.randint(0, len_pop - 1)] for i in range(pool_size)]
 
     if population.sortType == Consts.sortType["scaled"]:
         choosen = minimax_operator(tournament_pool, key=lambda ind: ind.fitness)
@@ -103,17 +191,23 @@ def GTournamentSelectorAlternative(population, **args):
     return choosen
 
 
+def GTournamentSelectorAlternative_Batch(population, count, **args):
+    """ The batch version of the :func:`GTournamentSelectorAlternative` """
+    rng = Util.getRandom(args)
+    pool_size = population.getParam("tournamentPool", Consts.CDefTournamentPoolSize)
+    candidates = rng.choices(population.internalPop, k=count * pool_size)
+    return GTournament_Winners(population, candidates, pool_size)
+
+
+GTournamentSelectorAlternative.batch = GTournamentSelectorAlternative_Batch
+
+
 def GRouletteWheel(population, **args):
     """ The Roulette Wheel selector """
-    psum = None
-    if args["popID"] != GRouletteWheel.cachePopID:
-        GRouletteWheel.cachePopID = args["popID"]
-        psum = GRouletteWheel_PrepareWheel(population)
-        GRouletteWheel.cacheWheel = psum
-    else:
-        psum = GRouletteWheel.cacheWheel
+    rng = Util.getRandom(args)
+    psum = GRouletteWheel_Wheel(population, args["popID"])
 
-    cutoff = random.random()
+    cutoff = rng.random()
     lower = 0
     upper = len(population) - 1
     while(upper >= lower):
@@ -129,61 +223,65 @@ def GRouletteWheel(population, **args):
     return population.bestFitness(lower)
 
 
+def GRouletteWheel_Batch(population, count, **args):
+    """ The batch version of the :func:`GRouletteWheel`, the population is
+    sorted once and each individual is picked by a binary search on the wheel """
+    rng = Util.getRandom(args)
+    psum = GRouletteWheel_Wheel(population, args["popID"])
+    population.sort()
+    last = len(population) - 1
+    individuals = population.internalPop
+    return [individuals[min(last, bisect_right(psum, rng.random()))] for i in range(count)]
+
+
+def GRouletteWheel_Wheel(population, popID):
+    """ Returns the wheel of the population, cached by the popID """
+    if not isSelectorCached(GRouletteWheel, population, popID):
+        GRouletteWheel.cachePopID = popID
+        GRouletteWheel.cachePopulation = weakref.ref(population)
+        GRouletteWheel.cacheWheel = GRouletteWheel_PrepareWheel(population)
+    return GRouletteWheel.cacheWheel
+
+
 GRouletteWheel.cachePopID = None
+GRouletteWheel.cachePopulation = None
 GRouletteWheel.cacheWheel = None
+GRouletteWheel.batch = GRouletteWheel_Batch
 
 
 def GRouletteWheel_PrepareWheel(population):
-    """ A preparation for Roulette Wheel selection """
+    """ A preparation for Roulette Wheel selection, the wheel is the cumulative
+    sum of the scores (or fitness) of the sorted population """
 
     len_pop = len(population)
 
-    psum = [i for i in range(len_pop)]
-
     population.statistics()
 
     if population.sortType == Consts.sortType["scaled"]:
-        pop_fitMax = population.stats["fitMax"]
-        pop_fitMin = population.stats["fitMin"]
-
-        if pop_fitMax == pop_fitMin:
-            for index in range(len_pop):
-                psum[index] = (index + 1) / float(len_pop)
-        elif (pop_fitMax > 0 and pop_fitMin >= 0) or (pop_fitMax <= 0 and pop_fitMin < 0):
-            population.sort()
-            if population.minimax == Consts.minimaxType["maximize"]:
-                psum[0] = population[0].fitness
-                for i in range(1, len_pop):
-                    psum[i] = population[i].fitness + psum[i - 1]
-                for i in range(len_pop):
-                    psum[i] /= float(psum[len_pop - 1])
-            else:
-                psum[0] = -population[0].fitness + pop_fitMax + pop_fitMin
-                for i in range(1, len_pop):
-                    psum[i] = -population[i].fitness + pop_fitMax + pop_fitMin + psum[i - 1]
-                for i in range(len_pop):
-                    psum[i] /= float(psum[len_pop - 1])
+        pop_max = population.stats["fitMax"]
+        pop_min = population.stats["fitMin"]
+    else:
+        pop_max = population.stats["rawMax"]
+        pop_min = population.stats["rawMin"]
+
+    if pop_max == pop_min:
+        return [(index + 1) / float(len_pop) for index in range(len_pop)]
+
+    if not ((pop_max > 0 and pop_min >= 0) or (pop_max <= 0 and pop_min < 0)):
+        return [i for i in range(len_pop)]
+
+    population.sort()
+    if population.sortType == Consts.sortType["scaled"]:
+        values = population.getFitness()
     else:
-        pop_rawMax = population.stats["rawMax"]
-        pop_rawMin = population.stats["rawMin"]
-
-        if pop_rawMax == pop_rawMin:
-            for index in range(len_pop):
-                psum[index] = (index + 1) / float(len_pop)
-
-        elif (pop_rawMax > 0 and pop_rawMin >= 0) or (pop_rawMax <= 0 and pop_rawMin < 0):
-            population.sort()
-            if population.minimax == Consts.minimaxType["maximize"]:
-                psum[0] = population[0].score
-                for i in range(1, len_pop):
-                    psum[i] = population[i].score + psum[i - 1]
-                for i in range(len_pop):
-                    psum[i] /= float(psum[len_pop - 1])
-            else:
-                psum[0] = - population[0].score + pop_rawMax + pop_rawMin
-                for i in range(1, len_pop):
-                    psum[i] = - population[i].score + pop_rawMax + pop_rawMin + psum[i - 1]
-                for i in range(len_pop):
-                    psum[i] /= float(psum[len_pop - 1])
-
-    return psum
+        values = population.getScores()
+    maximize = population.minimax == Consts.minimaxType["maximize"]
+
+    if HAS_NUMPY:
+        psum = numpy.cumsum(values if maximize else -values + pop_max + pop_min)
+        psum /= psum[-1]
+        return psum.tolist()
+
+    psum = list(accumulate(values if maximize else [-value + pop_max + pop_min for value in values]))
+    total = float(psum[-1])
+    return [value / total for value in psum]
@@ -352,6 +352,34 @@ def graph_compare_fitness(pop, minimize, id_list, filesave=None):
         pylab.show()
 
 
+def graph_timings(pop, minimize, filesave=None):
+    phases = [("timeSelection", "Selection"), ("timeCrossover", "Crossover"), ("timeMutation", "Mutation"),
+              ("timeEvaluation", "Evaluation"), ("timeElitism", "Elitism"), ("timeSort", "Sort"),
+              ("timeCallbacks", "Callbacks"), ("timeDatabase", "DB Adapter")]
+
+    if "timeEvaluation" not in pop[0].keys():
+        print("No timings found, enable them with the setTimings() method of the GA Engine !")
+        return
+
+    x = [it["generation"] for it in pop]
+    y = [[it[column] for it in pop] for column, label in phases]
+
+    pylab.figure()
+    pylab.stackplot(x, y, labels=[label for column, label in phases], alpha=0.8)
+
+    pylab.xlabel("Generation (#)")
+    pylab.ylabel("Time (seconds)")
+    pylab.title("Plot of evolution identified by '%s' (phase timings)" % (options.identify))
+    pylab.grid(True)
+    pylab.legend(prop=FontProperties(size="smaller"), loc="upper left")
+
+    if filesave:
+        pylab.savefig(filesave)
+        print("Graph saved to %s file !" % (filesave,))
+    else:
+        pylab.show()
+
+
 if __name__ == "__main__":
     from pyevolve import __version__ as pyevolve_version
     from pyevolve import __author__ as pyevolve_author
@@ -425,6 +453,9 @@ if __name__ == "__main__":
     group.add_option("-9", action="store_true",
                      help="Show a heat map of population fitness score distribution between generations.",
                      dest="pop_heatmap_fitness")
+    group.add_option("-t", "--timings", action="store_true",
+                     help="Time spent on each phase of the generations (see the setTimings() method of the GA Engine).",
+                     dest="timings")
 
     parser.add_option_group(group)
 
@@ -433,7 +464,7 @@ if __name__ == "__main__":
     if options.identify and (not options.errorbars_raw and not options.errorbars_fitness and not
                              options.maxmin_raw and not options.maxmin_fitness and not options.diff_raw and not
                              options.all_graphs and not options.compare_raw and not options.pop_heatmap_raw and not
-                             options.pop_heatmap_fitness and not options.compare_fitness):
+                             options.pop_heatmap_fitness and not options.compare_fitness and not options.timings):
         parser.error("You must choose one graph type !")
 
     if (not options.identify) or (not options.dbfile):
@@ -601,6 +632,12 @@ if __name__ == "__main__":
         else:
             graph_diff_raw(pop, options.minimize)
 
+    if options.timings:
+        if options.outfile:
+            graph_timings(pop, options.minimize, options.outfile + "." + options.extension)
+        else:
+            graph_timings(pop, options.minimize)
+
     if options.all_graphs:
         all_graph_functions = [graph_errorbars_raw, graph_errorbars_fitness, graph_maxmin_raw,
                                graph_maxmin_fitness, graph_diff_raw]
@@ -0,0 +1,72 @@
+import threading
+
+from pyevolve import Consts
+from pyevolve import GSimpleGA
+from pyevolve.initializations.InitializationPermutations import G1DListTSPInitializatorRandom
+from pyevolve.perturbations.CrossoverG1DListTspPermutations import G1DListCrossoverPMX
+from pyevolve.perturbations.MutatorG1DListPermutations import G1DListMutatorSwap
+from pyevolve.representations.G1DBinaryString import G1DBinaryString
+from pyevolve.representations.G1DList import G1DList
+from pyevolve.selections.Selectors import GTournamentSelector
+
+
+def displacement_eval(genome):
+    """ Sum of the distances between each gene and its position """
+    return sum(abs(gene - pos) for pos, gene in enumerate(genome))
+
+
+def binary_eval(chromosome):
+    """ Number of ones of the binary string """
+    return float(sum(chromosome))
+
+
+def make_genome(size=8):
+    genome = G1DList(size)
+    genome.evaluator.set(displacement_eval)
+    genome.initializator.set(G1DListTSPInitializatorRandom)
+    genome.mutator.set(G1DListMutatorSwap)
+    genome.crossover.set(G1DListCrossoverPMX)
+    return genome
+
+
+def make_engine(genome=None, generations=5, population_size=10):
+    if genome is None:
+        genome = make_genome()
+    ga = GSimpleGA.GSimpleGA(genome, seed=42)
+    ga.setMinimax(Consts.minimaxType["minimize"])
+    ga.setGenerations(generations)
+    ga.setPopulationSize(population_size)
+    return ga
+
+
+def make_binary_engine(size=20, population_size=20, genome_class=G1DBinaryString):
+    genome = genome_class(size)
+    genome.evaluator.set(binary_eval)
+    ga = GSimpleGA.GSimpleGA(genome, seed=42)
+    ga.setPopulationSize(population_size)
+    ga.selector.set(GTournamentSelector)
+    ga.setElitism(False)
+    return ga
+
+
+class CountingEvaluator(object):
+    """ Evaluator which counts how many times it was called """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, genome):
+        self.calls += 1
+        return displacement_eval(genome)
+
+
+class ThreadCountingEvaluator(CountingEvaluator):
+    """ Evaluator which records the threads which called it """
+
+    def __init__(self):
+        super(ThreadCountingEvaluator, self).__init__()
+        self.threads = set()
+
+    def __call__(self, genome):
+        self.threads.add(threading.current_thread().name)
+        return super(ThreadCountingEvaluator, self).__call__(genome)
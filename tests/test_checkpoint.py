@@ -0,0 +1,147 @@
+import os
+import pickle
+import shutil
+import tempfile
+from array import array
+from unittest import TestCase
+from unittest.mock import Mock
+
+from pyevolve import Checkpoint
+from pyevolve import Consts
+from pyevolve.DBAdapters import DBFileCSV, DBMySQLAdapter
+from pyevolve.GPopulation import GPopulation
+from pyevolve.GSteadyStateGA import GSteadyStateGA
+from pyevolve.representations.G2DList import G2DList
+from tests.helpers import make_engine, make_genome
+
+
+class StopEvolution(Exception):
+    pass
+
+
+def stop_at(generation):
+    def callback(engine):
+        if engine.getCurrentGeneration() == generation:
+            raise StopEvolution()
+    return callback
+
+
+class CheckpointEncodingTestCase(TestCase):
+
+    def make_population(self, genome):
+        population = GPopulation(genome)
+        population.setPopulationSize(6)
+        population.create(minimax=Consts.minimaxType["minimize"])
+        population.initialize()
+        population.evaluate()
+        return population
+
+    def test_1d_genotypes_are_stored_on_arrays(self):
+        population = self.make_population(make_genome())
+        data = Checkpoint.encodePopulation(population)
+        self.assertIsInstance(data["genes"], array)
+        self.assertEqual(data["shape"], (8,))
+
+        restored = GPopulation(population)
+        Checkpoint.decodePopulation(restored, pickle.loads(pickle.dumps(data)))
+        self.assertEqual([ind.getInternalList() for ind in restored], [ind.getInternalList() for ind in population])
+        self.assertEqual([ind.score for ind in restored], [ind.score for ind in population])
+        self.assertTrue(all(ind.isEvaluated() for ind in restored))
+        self.assertIs(restored[0].evaluator, population.oneSelfGenome.evaluator)
+
+    def test_2d_genotypes(self):
+        genome = G2DList(3, 4)
+        genome.evaluator.set(lambda chromosome: sum(map(sum, chromosome)))
+        population = self.make_population(genome)
+        data = Checkpoint.encodePopulation(population)
+        self.assertEqual(data["shape"], (3, 4))
+
+        restored = GPopulation(population)
+        Checkpoint.decodePopulation(restored, data)
+        self.assertEqual([ind.getGenotypeKey() for ind in restored], [ind.getGenotypeKey() for ind in population])
+
+
+class EngineCheckpointTestCase(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "evolution.ckpt")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def genotypes(self, ga):
+        return [(ind.getInternalList(), ind.score) for ind in ga.getPopulation()]
+
+    def test_resume_continues_the_evolution(self):
+        expected = make_engine(generations=10)
+        expected.evolve()
+
+        ga = make_engine(generations=10)
+        ga.setCheckpoint(self.path, generations=4)
+        ga.stepCallback.set(stop_at(6))
+        self.assertRaises(StopEvolution, ga.evolve)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        resumed = make_engine(generations=10)
+        resumed.resume(self.path)
+        self.assertEqual(resumed.getCurrentGeneration(), 10)
+        self.assertEqual(self.genotypes(resumed), self.genotypes(expected))
+
+    def test_save_and_load(self):
+        ga = make_engine(generations=3)
+        ga.setMutationRate(0.3)
+        ga.evolve()
+        ga.saveCheckpoint(self.path)
+
+        loaded = make_engine(generations=50)
+        loaded.loadCheckpoint(self.path)
+        self.assertEqual(loaded.getCurrentGeneration(), 3)
+        self.assertEqual(loaded.getGenerations(), 3)
+        self.assertEqual(loaded.pMutation, 0.3)
+        self.assertEqual(self.genotypes(loaded), self.genotypes(ga))
+
+    def test_steady_state_engine(self):
+        ga = GSteadyStateGA(make_genome(), seed=42)
+        ga.setGenerations(4)
+        ga.setPopulationSize(10)
+        ga.evolve()
+        ga.saveCheckpoint(self.path)
+
+        loaded = GSteadyStateGA(make_genome())
+        loaded.loadCheckpoint(self.path)
+        self.assertEqual(loaded.getCurrentStep(), ga.getCurrentStep())
+        self.assertRaises(TypeError, make_engine().loadCheckpoint, self.path)
+
+    def test_csv_adapter_position(self):
+        csv_path = os.path.join(self.directory, "stats.csv")
+        ga = make_engine(generations=10)
+        ga.setDBAdapter(DBFileCSV(filename=csv_path, identify="run", frequency=1))
+        ga.setCheckpoint(self.path, generations=4)
+        ga.stepCallback.set(stop_at(6))
+        self.assertRaises(StopEvolution, ga.evolve)
+        ga.getDBAdapter().commitAndClose()
+
+        resumed = make_engine(generations=10)
+        resumed.setDBAdapter(DBFileCSV(filename=csv_path, identify="other", frequency=1))
+        resumed.resume(self.path)
+        with open(csv_path) as handle:
+            lines = [line.split(";")[:2] for line in handle.read().splitlines()]
+        self.assertEqual(lines, [["run", str(gen)] for gen in range(10)])
+
+    def test_mysql_adapter_position(self):
+        adapter = DBMySQLAdapter("user", "passwd", identify="run")
+        adapter.connection = Mock()
+        adapter.resetTableGenerations(4)
+        cursor = adapter.connection.cursor.return_value
+        stmts = [call[0] for call in cursor.execute.call_args_list]
+        self.assertEqual(stmts, [("delete from " + table + " where identify = %s and generation >= %s", ("run", 4))
+                                 for table in (Consts.CDefMySQLDBTable, Consts.CDefMySQLDBTablePop)])
+
+    def test_invalid_settings(self):
+        ga = make_engine()
+        self.assertRaises(ValueError, ga.setCheckpoint, self.path)
+        self.assertRaises(ValueError, ga.setCheckpoint, self.path, generations=-1)
+        with open(self.path, "wb") as handle:
+            pickle.dump({"version": 0}, handle)
+        self.assertRaises(ValueError, ga.loadCheckpoint, self.path)
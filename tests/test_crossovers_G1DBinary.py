@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from pyevolve.representations.G1DBinaryString import G1DBinaryString
 
@@ -18,38 +18,40 @@ class G1DBinaryStringCrossoversTestCase(CrossoverTestCase):
         self.dad.append(0)
         self.dad.append(1)
 
-    @patch('pyevolve.perturbations.CrossoverBinary.rand_randint')
-    def test_single_point(self, rand_mock):
+    def test_single_point(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G1DBinaryStringXSinglePoint,
             [1, 0, 1],
             [0, 0, 0],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
         self.assertCrossoverResultsEqual(
             G1DBinaryStringXSinglePoint,
             [1, 0, 1],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
 
-    @patch('pyevolve.perturbations.CrossoverBinary.rand_randint')
-    def test_two_point(self, rand_mock):
+    def test_two_point(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G1DBinaryStringXTwoPoint,
             [1, 0, 0],
             [0, 0, 1],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
         self.assertCrossoverResultsEqual(
             G1DBinaryStringXTwoPoint,
             [1, 0, 0],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
 
     @patch('pyevolve.Util.randomFlipCoin')
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from pyevolve.representations.G1DList import G1DList
 
@@ -14,36 +14,38 @@ class G1DListCrossoversTestCase(CrossoverTestCase):
         self.dad = G1DList(3)
         self.dad.genomeList = [4, 5, 6]
 
-    @patch('pyevolve.perturbations.CrossoverG1DList.rand_randint')
-    def test_single_point(self, rand_mock):
+    def test_single_point(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G1DListCrossoverSinglePoint,
             [1, 5, 6],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G1DListCrossoverSinglePoint,
             [1, 5, 6],
             [4, 2, 3],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
-    @patch('pyevolve.perturbations.CrossoverG1DList.rand_randint')
-    def test_two_points(self, rand_mock):
+    def test_two_points(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G1DListCrossoverTwoPoint,
             [1, 2, 3],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G1DListCrossoverTwoPoint,
             [1, 2, 3],
             [4, 5, 6],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
     @patch('pyevolve.Util.randomFlipCoin')
@@ -55,11 +57,13 @@ class G1DListCrossoversTestCase(CrossoverTestCase):
             [1, 2, 3],
         )
 
-    @patch('pyevolve.perturbations.CrossoverG1DList.rand_random')
-    def test_crossfill_crossover_sbx(self, rand_mock):
+    def test_crossfill_crossover_sbx(self):
+        rng = Mock()
+        rand_mock = rng.random
         rand_mock.return_value = 0.6
         self.assertCrossoverResultsEqual(
             G1DListCrossoverRealSBX,
             [0.9696386870268516, 1.9692699516972016, 2.9692611909097177],
             [4.030739398252697, 5.030739398252697, 6.030739398252697],
+            crossover_extra_kwargs={'rng': rng}
         )
@@ -1,7 +1,7 @@
 import pytest
 from itertools import cycle
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 
 from pyevolve.perturbations.CrossoverBinary import G2DBinaryStringXSingleHPoint, G2DBinaryStringXSingleVPoint, G2DBinaryStringXUniform
@@ -26,40 +26,42 @@ class G2DBinaryStringCrossoversTestCase(CrossoverTestCase):
             genome_attr_name='genomeString'
         )
 
-    @patch('pyevolve.perturbations.CrossoverBinary.rand_randint')
-    def test_svp_crossover(self, rand_mock):
+    def test_svp_crossover(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G2DBinaryStringXSingleVPoint,
             [[0, 1, 1], [0, 0, 0], [0, 0, 1]],
             None,
             genome_attr_name='genomeString',
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G2DBinaryStringXSingleVPoint,
             [[0, 1, 1], [0, 0, 0], [0, 0, 1]],
             [[0, 0, 0], [1, 0, 1], [1, 1, 0]],
             genome_attr_name='genomeString',
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
-    @patch('pyevolve.perturbations.CrossoverBinary.rand_randint')
-    def test_shp_crossover(self, rand_mock):
+    def test_shp_crossover(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G2DBinaryStringXSingleHPoint,
             [[0, 0, 0], [1, 0, 0], [1, 0, 1]],
             None,
             genome_attr_name='genomeString',
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G2DBinaryStringXSingleHPoint,
             [[0, 0, 0], [1, 0, 0], [1, 0, 1]],
             [[0, 0, 0], [0, 0, 1], [0, 1, 0]],
             genome_attr_name='genomeString',
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
 
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from itertools import cycle
 
@@ -25,34 +25,36 @@ class G2DListCrossoversTestCase(CrossoverTestCase):
             [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
         )
 
-    @patch('pyevolve.perturbations.CrossoverG2DList.rand_randint')
-    def test_svp_crossover(self, rand_mock):
+    def test_svp_crossover(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G2DListCrossoverSingleVPoint,
             [[1, 4, 7], [4, 5, 8], [7, 6, 9]],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G2DListCrossoverSingleVPoint,
             [[1, 4, 7], [4, 5, 8], [7, 6, 9]],
             [[1, 2, 3], [2, 5, 6], [3, 8, 9]],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
 
-    @patch('pyevolve.perturbations.CrossoverG2DList.rand_randint')
-    def test_shp_crossover(self, rand_mock):
+    def test_shp_crossover(self):
+        rng = Mock()
+        rand_mock = rng.randint
         rand_mock.return_value = 1
         self.assertCrossoverResultsEqual(
             G2DListCrossoverSingleHPoint,
             [[1, 2, 3], [2, 5, 8], [3, 6, 9]],
             None,
-            crossover_extra_kwargs={'count': 1}
+            crossover_extra_kwargs={'rng': rng, 'count': 1}
         )
         self.assertCrossoverResultsEqual(
             G2DListCrossoverSingleHPoint,
             [[1, 2, 3], [2, 5, 8], [3, 6, 9]],
             [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
-            crossover_extra_kwargs={'count': 2}
+            crossover_extra_kwargs={'rng': rng, 'count': 2}
         )
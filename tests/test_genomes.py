@@ -1,12 +1,14 @@
 # flake8: noqa
 from collections import Iterable
 from unittest import TestCase
+import pickle
 
 from pyevolve.representations import G1DBinaryString
 from pyevolve.representations.G1DList import G1DList
 from pyevolve.representations.G2DBinaryString import G2DBinaryString
 from pyevolve.representations.G2DList import G2DList
 from pyevolve.representations.G1DBase import G1DBase
+from pyevolve.representations import GenomeBase
 from pyevolve.representations.GTree import GTreeBase
 from pyevolve.representations.GTree import GTree
 from pyevolve.representations.GTree import GTreeNode
@@ -212,4 +214,42 @@ class G2DBinaryStringTestCase(TestCase):
         _genome.clearString()
         self.assertEqual(len(_genome.genomeString), _genome.getHeight())
         self.assertEqual(len(_genome.genomeString[0]), _genome.getWidth())
-        self.assertEqual(_genome[1][1], None)
\ No newline at end of file
+        self.assertEqual(_genome[1][1], None)
+
+
+class WireFormTestCase(TestCase):
+
+    def setUp(self):
+        self.template = G1DList(50)
+        self.template.setParams(distance_matrix=[[i * j for j in range(50)] for i in range(50)])
+        self.genome = self.template.clone()
+        self.genome.setInternalList(list(range(50)))
+        self.genome.score = 12.0
+
+    def test_pickling_is_not_changed(self):
+        restored = pickle.loads(pickle.dumps(self.genome))
+        self.assertEqual(restored.internalParams, self.template.internalParams)
+        self.assertIsNot(restored.internalParams, self.template.internalParams)
+
+    def test_slim_form_with_template(self):
+        full_size = len(pickle.dumps(self.genome))
+        data = pickle.dumps(GenomeBase.packWire(self.genome, self.template))
+        self.assertLess(len(data) * 10, full_size)
+
+        restored = GenomeBase.unpackWire(pickle.loads(data), self.template)
+        self.assertIsInstance(restored, G1DList)
+        self.assertEqual(restored.getInternalList(), list(range(50)))
+        self.assertEqual(restored.score, 12.0)
+        self.assertEqual(restored.genomeSize, 50)
+        self.assertIs(restored.internalParams, self.template.internalParams)
+        self.assertIs(restored.evaluator, self.template.evaluator)
+
+    def test_template_and_foreign_genomes_are_sent_in_full(self):
+        foreign = G1DList(50)
+        self.assertIs(GenomeBase.packWire(foreign, self.template), foreign)
+        self.assertIs(GenomeBase.packWire(self.template, self.template), self.template)
+        self.assertIs(GenomeBase.unpackWire(foreign, self.template), foreign)
+
+    def test_unpacking_with_other_template(self):
+        data = GenomeBase.packWire(self.genome, self.template)
+        self.assertRaises(TypeError, GenomeBase.unpackWire, data, G2DList(5, 5))
@@ -0,0 +1,194 @@
+import gc
+import pickle
+from unittest import TestCase, skipUnless
+
+from pyevolve.representations import GenotypeMatrix
+from pyevolve.representations.G1DBinaryString import G1DBinaryString
+from pyevolve.representations.G1DList import G1DList
+from pyevolve.representations.G2DList import G2DList
+from pyevolve.selections.Selectors import GTournamentSelector
+from tests.helpers import binary_eval, make_binary_engine, make_engine, make_genome
+
+
+def make_view(genes):
+    genotype_matrix = GenotypeMatrix.GenotypeMatrix(len(genes), 2)
+    genome = G1DList(len(genes))
+    genome.genomeList = list(genes)
+    genome.score = 3.0
+    return genotype_matrix, genotype_matrix.view(genome)
+
+
+def make_matrix_engine():
+    ga = make_binary_engine()
+    ga.setGenerations(10)
+    ga.getPopulation().setMatrixLayout(True)
+    return ga
+
+
+@skipUnless(GenotypeMatrix.HAS_NUMPY, "numpy is not available")
+class GenotypeViewTestCase(TestCase):
+
+    def test_view_of_genome(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        self.assertIsInstance(view, G1DList)
+        self.assertEqual(view.genomeList, [1, 2, 3])
+        self.assertEqual(view.score, 3.0)
+        view.pack()
+        self.assertEqual(genotype_matrix.matrix[view.genotypeRow].tolist(), [1, 2, 3])
+
+    def test_genes_go_to_the_row(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        view.pack()
+        view.evaluated = True
+        view[0] = 7
+        view[1:] = [8, 9]
+        self.assertTrue(view.isPacked())
+        self.assertFalse(view.isEvaluated())
+        self.assertEqual(genotype_matrix.matrix[view.genotypeRow].tolist(), [7, 8, 9])
+        self.assertEqual(view[1:], [8, 9])
+        self.assertIsInstance(view[0], int)
+        self.assertEqual(view.getGenotypeKey(), (7, 8, 9))
+
+    def test_genome_list_is_packed(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        view.pack()
+        view.genomeList.reverse()
+        self.assertFalse(view.isPacked())
+        view.pack()
+        self.assertEqual(genotype_matrix.matrix[view.genotypeRow].tolist(), [3, 2, 1])
+
+        view.genomeList = [1, 2]
+        self.assertRaises(ValueError, view.pack)
+
+    def test_matrix_is_promoted(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        view.pack()
+        view[0] = 0.5
+        self.assertEqual(genotype_matrix.matrix.dtype.kind, "f")
+        self.assertEqual(view.getGenes(), [0.5, 2.0, 3.0])
+        view[1] = "a"
+        self.assertEqual(view.getGenes(), [0.5, "a", 3.0])
+
+    def test_empty_slice_keeps_the_type(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        view.pack()
+        view[1:1] = []
+        self.assertEqual(genotype_matrix.matrix.dtype.kind, "i")
+        self.assertIsInstance(view[1], int)
+        self.assertEqual(view.getGenes(), [1, 2, 3])
+
+    def test_clones_share_the_matrix(self):
+        genotype_matrix, view = make_view([1, 2, 3])
+        clones = [view.clone() for _ in range(5)]
+        self.assertEqual(len(genotype_matrix), 6)
+        self.assertEqual(clones[-1], view)
+        self.assertTrue(all(genotype_matrix.owns(clone) for clone in clones))
+        clones[0][0] = 4
+        self.assertEqual(view[0], 1)
+
+        del clones
+        self.assertEqual(len(genotype_matrix), 1)
+
+    def test_pickled_as_common_genome(self):
+        _, view = make_view([1, 2, 3])
+        genome = pickle.loads(pickle.dumps(view))
+        self.assertIs(type(genome), G1DList)
+        self.assertEqual(genome.genomeList, [1, 2, 3])
+        self.assertEqual(genome.score, 3.0)
+
+    def test_binary_string_genes(self):
+        genotype_matrix = GenotypeMatrix.GenotypeMatrix(4)
+        genome = G1DBinaryString(4)
+        genome.genomeList = [0, 1, 0, 1]
+        view = genotype_matrix.view(genome)
+        view.pack()
+        self.assertIsInstance(view, G1DBinaryString)
+        self.assertEqual(view.getBinary(), "0101")
+        self.assertRaises(ValueError, view.__setitem__, 0, 2)
+        self.assertEqual(view.detach().stringLength, 4)
+
+    def test_unsupported_genome(self):
+        genotype_matrix = GenotypeMatrix.GenotypeMatrix(4)
+        self.assertRaises(TypeError, genotype_matrix.view, G2DList(2, 2))
+
+
+@skipUnless(GenotypeMatrix.HAS_NUMPY, "numpy is not available")
+class PopulationMatrixLayoutTestCase(TestCase):
+
+    def test_same_evolution_as_lists(self):
+        for genome in (make_genome(10), G1DBinaryString(20)):
+            genome.evaluator.set(binary_eval if isinstance(genome, G1DBinaryString) else genome.evaluator[0])
+            bests = []
+            for layout in (False, True):
+                ga = make_engine(genome.clone(), generations=10, population_size=20)
+                ga.selector.set(GTournamentSelector)
+                ga.getPopulation().setMatrixLayout(layout)
+                ga.evolve()
+                best = ga.bestIndividual()
+                bests.append((best.score, list(best)))
+            self.assertEqual(bests[0], bests[1])
+            self.assertIsInstance(best, GenotypeMatrix.GenotypeView)
+
+    def test_generations_reuse_the_rows(self):
+        gc.disable()
+        try:
+            ga = make_matrix_engine()
+            ga.evolve()
+        finally:
+            gc.enable()
+        genotype_matrix = ga.getPopulation().getGenotypeMatrix()
+        self.assertEqual(len(genotype_matrix), 20)
+        self.assertEqual(len(genotype_matrix.matrix), 40)
+
+    def test_vectorized_operator(self):
+        ga = make_matrix_engine()
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        genotype_matrix = population.getGenotypeMatrix()
+        rows = population.getGenotypeRows()
+        before = [ind.getGenes() for ind in population]
+        genotype_matrix.matrix[rows] = 1 - genotype_matrix.matrix[rows]
+        for ind in population:
+            ind.invalidate()
+        population.evaluate()
+        for ind, genes in zip(population, before):
+            self.assertEqual(ind.getGenes(), [1 - gene for gene in genes])
+            self.assertEqual(ind.score, 20 - sum(genes))
+
+    def test_batch_evaluator_takes_the_rows(self):
+        received = []
+
+        def batch_eval(genes):
+            received.append(genes)
+            return genes.sum(axis=1)
+
+        ga = make_matrix_engine()
+        ga.getPopulation().batchEvaluator.set(batch_eval)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        self.assertEqual(received[0].shape, (20, 20))
+        self.assertEqual([ind.score for ind in population], received[0].sum(axis=1).tolist())
+
+    def test_individuals_are_moved_to_the_matrix(self):
+        ga = make_matrix_engine()
+        ga.initialize()
+        population = ga.getPopulation()
+        migrant = G1DBinaryString(20)
+        migrant.genomeList = [1] * 20
+        migrant.evaluator.set(binary_eval)
+        population[0] = migrant
+        population.evaluate()
+        self.assertTrue(population.getGenotypeMatrix().owns(population[0]))
+        self.assertEqual(population[0].score, 20.0)
+
+    def test_disable_layout(self):
+        ga = make_matrix_engine()
+        ga.initialize()
+        population = ga.getPopulation()
+        genes = [ind.getGenes() for ind in population]
+        population.setMatrixLayout(False)
+        self.assertIsNone(population.getGenotypeMatrix())
+        self.assertEqual([type(ind) for ind in population], [G1DBinaryString] * 20)
+        self.assertEqual([ind.genomeList for ind in population], genes)
@@ -0,0 +1,178 @@
+import multiprocessing
+from time import sleep
+from unittest import TestCase, skipIf, skipUnless
+
+from pyevolve import Consts
+from pyevolve import Migration
+from pyevolve import Util
+from pyevolve.Migration import IslandModel, LocalMigration
+from pyevolve.representations.G2DList import G2DList
+from tests.helpers import make_engine, make_genome
+
+
+def failing_eval(genome):
+    raise ValueError("bad genome")
+
+
+def wait_for(queue):
+    for _ in range(100):
+        if queue.qsize():
+            return
+        sleep(0.01)
+
+
+class LocalMigrationTestCase(TestCase):
+
+    def setUp(self):
+        self.inboxes = {0: multiprocessing.Queue(), 1: multiprocessing.Queue()}
+        self.engines = []
+        for island in (0, 1):
+            ga = make_engine(make_genome(10), population_size=10)
+            migration = LocalMigration(island, self.inboxes)
+            migration.setTopology(IslandModel.ringTopology(2))
+            migration.setMigrationRate(2)
+            migration.setNumIndividuals(2)
+            migration.setNumReplacement(2)
+            ga.setMigrationAdapter(migration)
+            ga.initialize()
+            ga.getPopulation().evaluate()
+            ga.getPopulation().sort()
+            self.engines.append(ga)
+
+    def tearDown(self):
+        for ga in self.engines:
+            ga.migrationAdapter.stop()
+
+    def test_not_ready_on_the_first_generation(self):
+        ga = self.engines[0]
+        self.assertFalse(ga.migrationAdapter.isReady())
+        ga.currentGeneration = 2
+        self.assertTrue(ga.migrationAdapter.isReady())
+
+    def test_migrants_replace_the_worst(self):
+        sender, receiver = self.engines
+        sender.currentGeneration = receiver.currentGeneration = 2
+        sender.migrationAdapter.exchange()
+        wait_for(self.inboxes[1])
+
+        sent_keys = set(ind.getGenotypeKey() for ind in sender.getPopulation())
+        receiver.migrationAdapter.exchange()
+        population = receiver.getPopulation()
+        self.assertTrue(all(population[i].getGenotypeKey() in sent_keys for i in (-1, -2)))
+
+    def test_migrants_replace_the_worst_of_unsorted_population(self):
+        sender, receiver = self.engines
+        sender.currentGeneration = receiver.currentGeneration = 2
+        population = receiver.getPopulation()
+        population.internalPop.reverse()
+        population.clearFlags()
+        worst = population.worstRawIndexes(2)
+        self.assertEqual(sorted(worst), [0, 1])
+        sender.migrationAdapter.exchange()
+        wait_for(self.inboxes[1])
+
+        sent_keys = set(ind.getGenotypeKey() for ind in sender.getPopulation())
+        receiver.migrationAdapter.exchange()
+        self.assertTrue(all(population[i].getGenotypeKey() in sent_keys for i in worst))
+
+    def test_nothing_received(self):
+        receiver = self.engines[1]
+        receiver.currentGeneration = 2
+        before = [ind.getGenotypeKey() for ind in receiver.getPopulation()]
+        self.assertEqual(receiver.migrationAdapter.receive(), [])
+        self.assertEqual(before, [ind.getGenotypeKey() for ind in receiver.getPopulation()])
+
+    def test_start_without_topology(self):
+        migration = LocalMigration(0, self.inboxes)
+        self.assertRaises(Exception, migration.start)
+
+
+class IslandModelTestCase(TestCase):
+
+    def test_ring_topology(self):
+        graph = IslandModel.ringTopology(4)
+        self.assertEqual(sorted(graph.getNeighbors(0)), [1, 3])
+        self.assertEqual(sorted(graph.getNeighbors(2)), [1, 3])
+
+    def test_needs_two_islands(self):
+        self.assertRaises(ValueError, IslandModel, make_engine(), 1)
+
+    def test_topology_nodes_must_be_the_islands(self):
+        graph = Util.Graph()
+        graph.addEdge("a", "b")
+        islands = IslandModel(make_engine(), islands=2, topology=graph)
+        self.assertRaises(ValueError, islands.evolve)
+
+    def test_best_of_all_islands(self):
+        islands = IslandModel(make_engine(make_genome(10), generations=10), islands=3)
+        islands.setMigrationRate(2)
+        best = islands.evolve()
+        bests = islands.getBestIndividuals()
+        self.assertEqual(sorted(bests), [0, 1, 2])
+        self.assertEqual(best.score, min(ind.score for ind in bests.values()))
+        self.assertEqual(sorted(best.genomeList), list(range(10)))
+
+    def test_island_errors_are_raised(self):
+        genome = make_genome()
+        genome.evaluator.set(failing_eval)
+        islands = IslandModel(make_engine(genome), islands=2)
+        self.assertRaises(RuntimeError, islands.evolve)
+
+    def test_default_rates(self):
+        islands = IslandModel(make_engine(), islands=2)
+        self.assertEqual(islands.nMigrationRate, Consts.CDefGenMigrationRate)
+
+
+class PackIndividualsTestCase(TestCase):
+
+    def make_population(self):
+        ga = make_engine(make_genome(6), population_size=4)
+        ga.initialize()
+        ga.getPopulation().evaluate()
+        return ga.getPopulation()
+
+    def test_round_trip(self):
+        population = self.make_population()
+        buffer = Migration.packIndividuals(population.internalPop)
+        self.assertEqual(buffer.shape, (4, 8))
+        self.assertTrue(buffer.flags["C_CONTIGUOUS"])
+
+        individuals = Migration.unpackIndividuals(buffer, population.oneSelfGenome, (6,), integer_genes=True)
+        for original, individual in zip(population, individuals):
+            self.assertEqual(individual.genomeList, original.genomeList)
+            self.assertIsInstance(individual.genomeList[0], int)
+            self.assertEqual(individual.score, original.score)
+            self.assertTrue(individual.isEvaluated())
+            self.assertIs(individual.evaluator, population.oneSelfGenome.evaluator)
+
+    def test_2d_genotypes(self):
+        genome = G2DList(2, 3)
+        genome.genomeList = [[1.5, 2.0, 3.0], [4.0, 5.0, 6.25]]
+        genome.score = 7.0
+        buffer = Migration.packIndividuals([genome])
+        individual = Migration.unpackIndividuals(buffer, G2DList(2, 3), (2, 3))[0]
+        self.assertEqual(individual.genomeList, [[1.5, 2.0, 3.0], [4.0, 5.0, 6.25]])
+        self.assertEqual(individual.score, 7.0)
+
+    @skipIf(Migration.HAS_MPI4PY, "mpi4py is installed")
+    def test_async_mpi_needs_mpi4py(self):
+        self.assertRaises(ImportError, Migration.AsyncMPIMigration)
+
+
+@skipUnless(Migration.HAS_MPI4PY, "mpi4py isn't installed")
+class AsyncMPIMigrationTestCase(TestCase):
+    """ Runs on a single node, which sends the migrants to itself, run the
+    examples/pyevolve_ex34_mpi_async_migration.py with mpirun for many nodes """
+
+    def test_evolution(self):
+        ga = make_engine(make_genome(10), generations=12)
+        migration = Migration.AsyncMPIMigration()
+        migration.setMigrationRate(3)
+        migration.setNumIndividuals(2)
+        migration.setNumReplacement(2)
+        ga.setMigrationAdapter(migration)
+        ga.evolve()
+        self.assertEqual(migration.sent, 3)
+        self.assertEqual(migration.received, migration.sent)
+        self.assertEqual(len(migration.getAllStars()), 1)
+        self.assertIsNone(migration.recvRequest)
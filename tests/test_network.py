@@ -0,0 +1,210 @@
+import zlib
+from time import monotonic, sleep, time
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyevolve import Consts
+from pyevolve import Network
+from pyevolve import Util
+from pyevolve.Migration import WANMigration
+from tests.helpers import make_engine, make_genome
+
+
+def wait_receive(transport, timeout=5.0):
+    limit = time() + timeout
+    items = []
+    while not items and time() < limit:
+        sleep(0.01)
+        items = transport.receive()
+    return items
+
+
+def make_datagram(sequence, group="group", fragment=0, session=1, items=None):
+    return Network.compressMessage({
+        "version": Network.NETWORK_VERSION,
+        "code": Consts.CDefNetworkIndividual,
+        "group": group,
+        "session": session,
+        "sequence": sequence,
+        "fragment": fragment,
+        "items": items if items is not None else [sequence],
+    })
+
+
+class MessageTestCase(TestCase):
+
+    def test_round_trip(self):
+        message = {"items": [[1, 2.5, "a"]], "group": "g"}
+        self.assertEqual(Network.decompressMessage(Network.compressMessage(message, 1)), message)
+
+    def test_compression_level(self):
+        message = {"items": list(range(1000))}
+        self.assertLess(len(Network.compressMessage(message, 9)), len(Network.compressMessage(message, 0)))
+
+    def test_invalid_data(self):
+        self.assertRaises(ValueError, Network.decompressMessage, b"not compressed")
+        self.assertRaises(ValueError, Network.decompressMessage, zlib.compress(b"[1, 2]"))
+        self.assertRaises(ValueError, Network.decompressMessage, zlib.compress(b"{invalid"))
+
+    def test_message_too_big(self):
+        data = Network.compressMessage({"items": [0] * 1000})
+        self.assertRaises(ValueError, Network.decompressMessage, data, 100)
+
+    def test_objects_are_not_serialized(self):
+        self.assertRaises(TypeError, Network.compressMessage, {"items": [object()]})
+
+
+class UDPTransportTestCase(TestCase):
+
+    def setUp(self):
+        self.first = Network.UDPTransport("127.0.0.1", 0, "group")
+        self.second = Network.UDPTransport("127.0.0.1", 0, "group")
+        self.first.start()
+        self.second.start()
+
+    def tearDown(self):
+        self.first.stop()
+        self.second.stop()
+
+    def test_binds_free_port(self):
+        self.assertNotEqual(self.first.getAddress()[1], 0)
+        self.assertTrue(self.first.isRunning())
+
+    def test_items_are_batched(self):
+        self.first.send([self.second.getAddress()], [1, 2])
+        self.first.send([self.second.getAddress()], [3])
+        self.assertEqual(wait_receive(self.second), [1, 2, 3])
+        self.assertEqual(self.first.sent, 1)
+
+    def test_big_batches_are_split(self):
+        self.first.maxDatagram = 200
+        items = [list(range(i, i + 20)) for i in range(0, 400, 20)]
+        self.first.send([self.second.getAddress()], items)
+        received = []
+        limit = time() + 5.0
+        while len(received) < len(items) and time() < limit:
+            received.extend(wait_receive(self.second, 0.5))
+        self.assertEqual(received, items)
+        self.assertGreater(self.first.sent, 1)
+
+    def test_other_group_is_dropped(self):
+        other = Network.UDPTransport("127.0.0.1", 0, "other")
+        other.start()
+        try:
+            other.send([self.second.getAddress()], [1])
+            other.stop()
+            limit = time() + 5.0
+            while not self.second.dropped and time() < limit:
+                sleep(0.01)
+            self.assertEqual(self.second.receive(), [])
+            self.assertEqual(self.second.dropped, 1)
+        finally:
+            other.stop()
+
+    def test_send_requires_start(self):
+        transport = Network.UDPTransport("127.0.0.1", 0, "group")
+        self.assertRaises(RuntimeError, transport.send, [("127.0.0.1", 1)], [1])
+
+
+class DatagramValidationTestCase(TestCase):
+
+    def setUp(self):
+        self.transport = Network.UDPTransport("127.0.0.1", 0, "group")
+        self.addr = ("127.0.0.1", 5000)
+
+    def test_stale_items_are_dropped(self):
+        self.transport.datagramReceived(make_datagram(1), self.addr)
+        later = monotonic() + Consts.CDefNetworkMaxAge + 1
+        self.transport.datagramReceived(make_datagram(2), self.addr)
+        self.transport.received[-1] = (later, self.transport.received[-1][1])
+        with patch("pyevolve.Network.monotonic", return_value=later):
+            self.assertEqual(self.transport.receive(), [2])
+        self.assertEqual(self.transport.dropped, 1)
+
+    def test_fragments_are_accepted_in_any_order(self):
+        self.transport.datagramReceived(make_datagram(3, fragment=1, items=[31]), self.addr)
+        self.transport.datagramReceived(make_datagram(3, fragment=0, items=[30]), self.addr)
+        self.transport.datagramReceived(make_datagram(3, fragment=1, items=[31]), self.addr)
+        self.transport.datagramReceived(make_datagram(4, fragment=1, items=[41]), self.addr)
+        self.transport.datagramReceived(make_datagram(3, fragment=2, items=[32]), self.addr)
+        self.transport.datagramReceived(make_datagram(4, fragment=0, items=[40]), self.addr)
+        self.assertEqual(self.transport.receive(), [31, 30, 41, 40])
+        self.assertEqual(self.transport.dropped, 2)
+
+    def test_overtaken_datagram_is_dropped(self):
+        self.transport.datagramReceived(make_datagram(2), self.addr)
+        self.transport.datagramReceived(make_datagram(1), self.addr)
+        self.transport.datagramReceived(make_datagram(2), self.addr)
+        self.transport.datagramReceived(make_datagram(1, session=2), self.addr)
+        self.assertEqual(self.transport.receive(), [2, 1])
+        self.assertEqual(self.transport.dropped, 2)
+
+    def test_garbage_is_dropped(self):
+        self.transport.datagramReceived(b"garbage", self.addr)
+        self.transport.datagramReceived(Network.compressMessage({"version": 1}), self.addr)
+        self.transport.datagramReceived(make_datagram("1"), self.addr)
+        self.transport.datagramReceived(make_datagram(1, fragment=None), self.addr)
+        self.assertEqual(self.transport.dropped, 4)
+
+
+class WANMigrationTestCase(TestCase):
+
+    def setUp(self):
+        self.engines = []
+        for _ in range(2):
+            ga = make_engine(make_genome(10), population_size=10)
+            migration = WANMigration("127.0.0.1", 0, "group")
+            migration.setMigrationRate(2)
+            migration.setNumIndividuals(2)
+            migration.setNumReplacement(2)
+            migration.transport.start()
+            migration.setMyself(*migration.transport.getAddress())
+            ga.setMigrationAdapter(migration)
+            self.engines.append(ga)
+
+        topology = Util.Graph()
+        topology.addEdge(self.engines[0].migrationAdapter.myself, self.engines[1].migrationAdapter.myself)
+        for ga in self.engines:
+            ga.migrationAdapter.setTopology(topology)
+            ga.migrationAdapter.start()
+            ga.initialize()
+            ga.getPopulation().evaluate()
+            ga.getPopulation().sort()
+
+    def tearDown(self):
+        for ga in self.engines:
+            ga.migrationAdapter.stop()
+
+    def test_migrants_replace_the_worst(self):
+        sender, receiver = self.engines
+        sender.currentGeneration = 2
+        sender.migrationAdapter.exchange()
+        sent = dict((ind.getGenotypeKey(), ind.score) for ind in sender.getPopulation())
+
+        limit = time() + 5.0
+        while not receiver.migrationAdapter.transport.received and time() < limit:
+            sleep(0.01)
+
+        receiver.currentGeneration = 2
+        receiver.migrationAdapter.exchange()
+        population = receiver.getPopulation()
+        for i in (-1, -2):
+            key = population[i].getGenotypeKey()
+            self.assertIn(key, sent)
+            self.assertEqual(population[i].score, sent[key])
+            self.assertIs(population[i].evaluator, population.oneSelfGenome.evaluator)
+
+    def test_invalid_individuals_are_ignored(self):
+        migration = self.engines[0].migrationAdapter
+        self.assertIsNone(migration.decodeIndividual([[1, 2], 1.0, 1.0]))
+        self.assertIsNone(migration.decodeIndividual([list(range(10)), "x", 1.0]))
+        self.assertIsNone(migration.decodeIndividual([{"a": 1}, 1.0, 1.0]))
+        individual = migration.decodeIndividual([list(range(10)), 3.0, 2.0])
+        self.assertEqual(individual.genomeList, list(range(10)))
+        self.assertTrue(individual.isEvaluated())
+
+    def test_evolution_with_migration(self):
+        ga = self.engines[0]
+        ga.setGenerations(6)
+        ga.evolve()
+        self.assertGreater(ga.migrationAdapter.transport.sent, 0)
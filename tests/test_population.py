@@ -0,0 +1,849 @@
+import asyncio
+import pickle
+import threading
+import time
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from pyevolve import Consts
+from pyevolve import Scaling
+from pyevolve.FitnessCache import FitnessCache
+from pyevolve.GPopulation import GenotypeIndex, GPopulation, HAS_NUMPY, partialRankIndexes, rankIndexes, scoreArray
+from pyevolve.representations.G1DBinaryString import G1DBinaryString
+from pyevolve.representations.G1DList import G1DList
+from pyevolve.selections.Selectors import GTournamentSelector
+from tests.helpers import CountingEvaluator, ThreadCountingEvaluator, displacement_eval
+from tests.helpers import make_binary_engine, make_engine, make_genome
+
+
+class GPopulationPoolTestCase(TestCase):
+
+    def test_pool_not_created_without_multiprocessing(self):
+        pop = GPopulation(make_genome())
+        pop.openPool()
+        self.assertIsNone(pop.procPool)
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_pool_is_shared_by_cloned_populations(self):
+        pop = GPopulation(make_genome())
+        pop.setMultiProcessing(True, False, 2)
+        pop.openPool()
+        try:
+            self.assertIsNotNone(pop.procPool)
+            self.assertIs(pop.clone().procPool, pop.procPool)
+            self.assertIs(GPopulation(pop).procPool, pop.procPool)
+        finally:
+            pop.closePool()
+        self.assertIsNone(pop.procPool)
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_open_pool_does_not_change_pickling(self):
+        pop = GPopulation(make_genome())
+        pop.setMultiProcessing(True, False, 2)
+        genome = pop.oneSelfGenome.clone()
+        pop.openPool()
+        try:
+            data = pickle.dumps(genome)
+        finally:
+            pop.closePool()
+        self.assertEqual(pickle.loads(data).getInternalList(), genome.getInternalList())
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_engine_reuses_pool_along_generations(self):
+        ga = make_engine()
+        ga.setMultiProcessing(True, False, 2)
+        pools = []
+        ga.stepCallback.set(lambda engine: pools.append(engine.getPopulation().procPool))
+        ga.evolve()
+        self.assertEqual(len(pools), ga.getGenerations())
+        self.assertIsNotNone(pools[0])
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+        self.assertIsNone(ga.getPopulation().procPool)
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_engine_releases_pool_on_error(self):
+        def failing_callback(engine):
+            raise RuntimeError("callback failure")
+
+        ga = make_engine()
+        ga.setMultiProcessing(True, False, 2)
+        ga.stepCallback.set(failing_callback)
+        self.assertRaises(RuntimeError, ga.evolve)
+        self.assertIsNone(ga.getPopulation().procPool)
+
+
+class GPopulationDirtyEvaluationTestCase(TestCase):
+
+    def setUp(self):
+        self.genome = make_genome()
+        self.counter = CountingEvaluator()
+        self.genome.evaluator.set(self.counter)
+
+    def test_clone_preserves_evaluated_state(self):
+        self.genome.initialize()
+        self.assertFalse(self.genome.isEvaluated())
+        self.genome.evaluate()
+        clone = self.genome.clone()
+        self.assertTrue(clone.isEvaluated())
+        self.assertEqual(clone.score, self.genome.score)
+
+    def test_gene_changes_invalidate_score(self):
+        self.genome.initialize()
+        self.genome.evaluate()
+        self.genome[0] = self.genome[0]
+        self.assertFalse(self.genome.isEvaluated())
+        self.genome.evaluate()
+        self.genome.setInternalList(list(self.genome))
+        self.assertFalse(self.genome.isEvaluated())
+
+    def test_mutation_invalidates_only_when_mutated(self):
+        self.genome.initialize()
+        self.genome.evaluate()
+        self.genome.mutate(pmut=0.0)
+        self.assertTrue(self.genome.isEvaluated())
+        self.genome.mutate(pmut=1.0)
+        self.assertFalse(self.genome.isEvaluated())
+
+    def test_population_evaluates_only_dirty_individuals(self):
+        pop = GPopulation(self.genome)
+        pop.setPopulationSize(10)
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        pop.evaluate()
+        self.assertEqual(self.counter.calls, 10)
+        pop[3].invalidate()
+        pop.evaluate()
+        self.assertEqual(self.counter.calls, 11)
+
+    def test_engine_skips_unchanged_offspring(self):
+        ga = make_engine(self.genome, generations=5, population_size=10)
+        ga.setCrossoverRate(0.0)
+        ga.setMutationRate(0.0)
+        ga.evolve()
+        self.assertEqual(self.counter.calls, 10)
+
+
+class FitnessCacheTestCase(TestCase):
+
+    def test_least_recently_used_is_discarded(self):
+        cache = FitnessCache(max_size=2)
+        cache.set((1,), 1.0)
+        cache.set((2,), 2.0)
+        self.assertEqual(cache.get((1,)), 1.0)
+        cache.set((3,), 3.0)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get((2,)))
+        self.assertEqual(cache.get((3,)), 3.0)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, FitnessCache, 0)
+
+
+class GPopulationFitnessCacheTestCase(TestCase):
+
+    def setUp(self):
+        self.genome = make_genome()
+        self.counter = CountingEvaluator()
+        self.genome.evaluator.set(self.counter)
+
+    def test_duplicated_genotypes_are_evaluated_once(self):
+        pop = GPopulation(self.genome)
+        pop.setPopulationSize(10)
+        pop.setFitnessCache(FitnessCache())
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        for ind in pop:
+            ind.setInternalList(list(range(8)))
+        pop[0].setInternalList(list(reversed(range(8))))
+        pop.evaluate()
+        self.assertEqual(self.counter.calls, 2)
+        self.assertTrue(all(ind.isEvaluated() for ind in pop))
+        self.assertEqual(pop[1].score, 0)
+        self.assertEqual(pop[0].score, displacement_eval(pop[0]))
+
+        pop[0].invalidate()
+        pop.evaluate()
+        self.assertEqual(self.counter.calls, 2)
+        stats = pop.getStatistics()
+        self.assertEqual(stats["cacheHits"], 9)
+        self.assertEqual(stats["cacheMisses"], 2)
+        self.assertNotIn("cacheHits", stats.getFields())
+        self.assertIn("Fitness cache hits                            = 9\n", repr(stats))
+
+    def test_engine_shares_cache_along_generations(self):
+        ga = make_engine(self.genome, generations=10, population_size=20)
+        ga.setFitnessCache(True, 100)
+        ga.evolve()
+        cache = ga.getFitnessCache()
+        self.assertIs(ga.getPopulation().fitnessCache, cache)
+        self.assertEqual(self.counter.calls, cache.misses)
+        self.assertLessEqual(len(cache), 100)
+
+    def test_invalid_cache(self):
+        pop = GPopulation(self.genome)
+        self.assertRaises(TypeError, pop.setFitnessCache, {})
+
+
+def displacement_batch(genes):
+    """ Batch version of displacement_eval """
+    return [displacement_eval(row) for row in genes]
+
+
+class GPopulationBatchEvaluatorTestCase(TestCase):
+
+    def setUp(self):
+        self.genome = make_genome()
+        self.counter = CountingEvaluator()
+        self.genome.evaluator.set(self.counter)
+
+    def make_population(self):
+        pop = GPopulation(self.genome)
+        pop.setPopulationSize(10)
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        return pop
+
+    def test_batch_evaluator_scores_dirty_individuals(self):
+        batches = []
+
+        def batch_eval(genes):
+            batches.append(len(genes))
+            return displacement_batch(genes)
+
+        pop = self.make_population()
+        pop.batchEvaluator.set(batch_eval)
+        pop.evaluate()
+        pop[2].invalidate()
+        pop[7].invalidate()
+        pop.evaluate()
+        self.assertEqual(batches, [10, 2])
+        self.assertEqual(self.counter.calls, 0)
+        for ind in pop:
+            self.assertEqual(ind.score, displacement_eval(ind))
+
+    def test_batch_evaluator_scores_are_summed(self):
+        pop = self.make_population()
+        pop.batchEvaluator.set(displacement_batch)
+        pop.batchEvaluator.add(lambda genes: [1] * len(genes))
+        pop.evaluate()
+        for ind in pop:
+            self.assertEqual(ind.score, displacement_eval(ind) + 1)
+
+    def test_batch_evaluator_wrong_length(self):
+        pop = self.make_population()
+        pop.batchEvaluator.set(lambda genes: [0.0])
+        self.assertRaises(ValueError, pop.evaluate)
+
+    @skipUnless(HAS_NUMPY, "numpy is not available")
+    def test_list_genomes_are_stacked(self):
+        pop = self.make_population()
+        genes = pop.getBatchGenotypes(pop.internalPop)
+        self.assertEqual(genes.shape, (10, 8))
+        self.assertEqual(list(genes[3]), pop[3].getInternalList())
+
+    def test_engine_uses_batch_evaluator(self):
+        ga = make_engine(self.genome)
+        ga.getPopulation().batchEvaluator.set(displacement_batch)
+        ga.evolve()
+        self.assertEqual(self.counter.calls, 0)
+        self.assertEqual(ga.bestIndividual().score, displacement_eval(ga.bestIndividual()))
+
+
+class GPopulationUnorderedEvaluationTestCase(TestCase):
+
+    def make_population(self, full_copy=False):
+        pop = GPopulation(make_genome())
+        pop.setPopulationSize(20)
+        pop.setMultiProcessing(True, full_copy, 2, True)
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        return pop
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_scores_are_written_back_by_index(self):
+        for full_copy in (False, True):
+            pop = self.make_population(full_copy)
+            pop.openPool()
+            try:
+                pop.evaluate()
+            finally:
+                pop.closePool()
+            for ind in pop:
+                self.assertTrue(ind.isEvaluated())
+                self.assertEqual(ind.score, displacement_eval(ind))
+            self.assertIsNotNone(pop.evalLatency)
+            self.assertTrue(0.0 < pop.getStatistics()["evalUtilization"] <= 1.0)
+            self.assertNotIn("evalUtilization", pop.getStatistics().getFields())
+
+    def test_utilization_only_measured_by_unordered_mode(self):
+        pop = self.make_population()
+        pop.setMultiProcessing(False)
+        pop.evaluate()
+        self.assertNotIn("evalUtilization", pop.getStatistics())
+        self.assertNotIn("Worker utilization", repr(pop.getStatistics()))
+
+    def test_chunk_size(self):
+        pop = self.make_population()
+        self.assertEqual(pop.getChunkSize(100, 2), 12)
+        pop.evalLatency = Consts.CDefPoolChunkTime / 5
+        self.assertEqual(pop.getChunkSize(100, 2), 5)
+        pop.evalLatency = Consts.CDefPoolChunkTime * 10
+        self.assertEqual(pop.getChunkSize(100, 2), 1)
+        self.assertEqual(pop.getChunkSize(3, 2), 1)
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_engine_with_unordered_evaluation(self):
+        ga = make_engine()
+        ga.setMultiProcessing(True, False, 2, True)
+        ga.evolve()
+        self.assertIsNotNone(ga.getPopulation().evalLatency)
+        best = ga.bestIndividual()
+        self.assertEqual(best.score, displacement_eval(best))
+
+
+class GPopulationBackendTestCase(TestCase):
+
+    def test_thread_backend_evaluates_in_place(self):
+        counter = ThreadCountingEvaluator()
+        genome = make_genome()
+        genome.evaluator.set(counter)
+        pop = GPopulation(genome)
+        pop.setPopulationSize(10)
+        pop.setMultiProcessing(True, False, 3, backend="thread")
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        individuals = list(pop)
+        pop.evaluate()
+        self.assertEqual(counter.calls, 10)
+        self.assertNotIn(threading.current_thread().name, counter.threads)
+        for before, ind in zip(individuals, pop):
+            self.assertIs(before, ind)
+            self.assertTrue(ind.isEvaluated())
+            self.assertEqual(ind.score, displacement_eval(ind))
+
+    def test_effective_backend(self):
+        pop = GPopulation(make_genome())
+        self.assertEqual(pop.getEvaluationBackend(), "serial")
+        pop.setMultiProcessing(True, backend="thread")
+        self.assertEqual(pop.getEvaluationBackend(), "thread")
+        pop.setMultiProcessing(True, backend="serial")
+        self.assertEqual(pop.getEvaluationBackend(), "serial")
+        pop.openPool()
+        self.assertIsNone(pop.procPool)
+        self.assertRaises(ValueError, pop.setMultiProcessing, True, backend="cluster")
+
+    def test_engine_with_thread_backend(self):
+        counter = ThreadCountingEvaluator()
+        genome = make_genome()
+        genome.evaluator.set(counter)
+        ga = make_engine(genome)
+        ga.setMultiProcessing(True, max_processes=2, unordered=True, backend="thread")
+        pools = []
+        ga.stepCallback.set(lambda engine: pools.append(engine.getPopulation().procPool))
+        ga.evolve()
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+        self.assertIsNone(ga.getPopulation().procPool)
+        self.assertNotIn(threading.current_thread().name, counter.threads)
+        best = ga.bestIndividual()
+        self.assertEqual(best.score, displacement_eval(best))
+
+
+class AsyncEvaluator(object):
+    """ Coroutine evaluator which tracks the concurrent calls and fails or
+    hangs on the first calls of each individual """
+
+    def __init__(self, failures=0, hangs=0):
+        self.running = 0
+        self.max_running = 0
+        self.calls = 0
+        self.failures = failures
+        self.hangs = hangs
+        self.attempts = {}
+
+    async def __call__(self, genome):
+        self.calls += 1
+        key = genome.getGenotypeKey()
+        attempt = self.attempts[key] = self.attempts.get(key, 0) + 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            if attempt <= self.hangs:
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.01)
+            if attempt <= self.failures:
+                raise IOError("simulation daemon unavailable")
+            return displacement_eval(genome)
+        finally:
+            self.running -= 1
+
+
+class GPopulationAsyncEvaluationTestCase(TestCase):
+
+    def make_population(self, evaluator, concurrency=4, size=12):
+        genome = make_genome()
+        genome.evaluator.set(evaluator)
+        pop = GPopulation(genome)
+        pop.setPopulationSize(size)
+        pop.setMultiProcessing(True, max_processes=concurrency, backend="async")
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        for i, ind in enumerate(pop):
+            ind.setInternalList([i] + list(range(1, 8)))
+        return pop
+
+    def test_concurrency_is_limited(self):
+        evaluator = AsyncEvaluator()
+        pop = self.make_population(evaluator)
+        pop.evaluate()
+        self.assertEqual(evaluator.calls, 12)
+        self.assertEqual(evaluator.max_running, 4)
+        for ind in pop:
+            self.assertTrue(ind.isEvaluated())
+            self.assertEqual(ind.score, displacement_eval(ind))
+
+    def test_failures_are_retried(self):
+        evaluator = AsyncEvaluator(failures=1)
+        pop = self.make_population(evaluator)
+        pop.setParams(evalRetries=1)
+        pop.evaluate()
+        self.assertEqual(evaluator.calls, 24)
+        self.assertTrue(all(ind.isEvaluated() for ind in pop))
+
+    def test_failure_without_retries(self):
+        pop = self.make_population(AsyncEvaluator(failures=1))
+        self.assertRaises(IOError, pop.evaluate)
+
+    def test_timeouts_are_retried(self):
+        evaluator = AsyncEvaluator(hangs=1)
+        pop = self.make_population(evaluator, concurrency=12)
+        pop.setParams(evalTimeout=0.2, evalRetries=2)
+        pop.evaluate()
+        self.assertEqual(evaluator.calls, 24)
+        for ind in pop:
+            self.assertEqual(ind.score, displacement_eval(ind))
+
+    def test_evaluation_from_running_loop(self):
+        pop = self.make_population(AsyncEvaluator())
+
+        async def main():
+            pop.evaluate()
+
+        asyncio.run(main())
+        self.assertTrue(all(ind.isEvaluated() for ind in pop))
+
+    def test_engine_with_async_backend(self):
+        genome = make_genome()
+        genome.evaluator.set(AsyncEvaluator())
+        ga = make_engine(genome)
+        ga.setMultiProcessing(True, max_processes=5, backend="async")
+        ga.evolve()
+        best = ga.bestIndividual()
+        self.assertEqual(best.score, displacement_eval(best))
+
+
+def hanging_eval(genome):
+    """ Evaluation which never finishes for the individuals starting with 0 """
+    if genome[0] == 0:
+        time.sleep(60)
+    return displacement_eval(genome)
+
+
+class GPopulationTimeoutTestCase(TestCase):
+
+    def make_population(self, evaluator, size=6):
+        genome = make_genome()
+        genome.evaluator.set(evaluator)
+        pop = GPopulation(genome)
+        pop.setPopulationSize(size)
+        pop.setMultiProcessing(True, False, 2)
+        pop.setParams(evalTimeout=0.5)
+        pop.create(minimax=Consts.minimaxType["minimize"])
+        pop.initialize()
+        for i, ind in enumerate(pop):
+            genes = list(range(8))
+            genes[0], genes[i % 8] = genes[i % 8], genes[0]
+            ind.setInternalList(genes)
+        return pop
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_stragglers_take_the_worst_score(self):
+        pop = self.make_population(hanging_eval)
+        pop.openPool()
+        try:
+            start = time.time()
+            pop.evaluate()
+            self.assertLess(time.time() - start, 10)
+            self.assertEqual(pop.procPool.stragglers, 1)
+            worst = max(displacement_eval(ind) for ind in pop[1:])
+            self.assertEqual(pop[0].score, worst)
+            self.assertTrue(pop[0].isEvaluated())
+            self.assertEqual(pop.getStatistics()["evalTimeouts"], 1)
+
+            # The killed worker was replaced
+            pop[1].invalidate()
+            pop.evaluate()
+            self.assertEqual(pop[1].score, displacement_eval(pop[1]))
+        finally:
+            pop.closePool()
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_custom_penalty(self):
+        pop = self.make_population(hanging_eval)
+        pop.setParams(evalPenalty=1000)
+        pop.evaluate()
+        self.assertEqual(pop[0].score, 1000)
+        self.assertEqual(pop[2].score, displacement_eval(pop[2]))
+
+    def test_async_timeouts_take_the_penalty(self):
+        pop = self.make_population(AsyncEvaluator(hangs=1))
+        pop.setMultiProcessing(True, max_processes=6, backend="async")
+        pop.setParams(evalTimeout=0.2, evalPenalty=500)
+        pop.evaluate()
+        self.assertTrue(all(ind.score == 500 for ind in pop))
+        self.assertEqual(pop.getStatistics()["evalTimeouts"], 6)
+        self.assertNotIn("evalTimeouts", pop.getStatistics().getFields())
+
+    def test_timeouts_are_not_cached(self):
+        evaluator = AsyncEvaluator(hangs=1)
+        pop = self.make_population(evaluator)
+        pop.setMultiProcessing(True, max_processes=6, backend="async")
+        pop.setParams(evalTimeout=0.2, evalPenalty=500)
+        pop.setFitnessCache(FitnessCache())
+        pop[1].setInternalList(pop[0].getInternalList())
+        pop.evaluate()
+        self.assertTrue(all(ind.score == 500 for ind in pop))
+        self.assertEqual(evaluator.calls, 5)
+        self.assertEqual(len(pop.fitnessCache), 0)
+
+        for ind in pop:
+            ind.invalidate()
+        pop.evaluate()
+        self.assertTrue(all(ind.score == displacement_eval(ind) for ind in pop))
+        self.assertEqual(len(pop.fitnessCache), 5)
+
+    def test_timeouts_only_measured_with_timeout(self):
+        pop = self.make_population(displacement_eval)
+        pop.setParams(evalTimeout=None)
+        pop.evaluate()
+        self.assertNotIn("evalTimeouts", pop.getStatistics())
+
+    def test_engine_timeout_settings(self):
+        ga = make_engine()
+        ga.setEvaluationTimeout(2.5, 100)
+        self.assertEqual(ga.getPopulation().getParam("evalTimeout"), 2.5)
+        self.assertEqual(ga.getPopulation().getParam("evalPenalty"), 100)
+        self.assertRaises(ValueError, ga.setEvaluationTimeout, 0)
+
+
+class GPopulationHeapQueriesTestCase(TestCase):
+
+    def make_population(self, minimax, sort_type=Consts.sortType["scaled"]):
+        ga = make_engine(make_genome(8), population_size=20)
+        ga.setMinimax(minimax)
+        ga.setSortType(sort_type)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        return population
+
+    def ranking(self, population):
+        rev = population.minimax == Consts.minimaxType["maximize"]
+        return sorted(population, key=lambda ind: ind.score, reverse=rev)
+
+    def test_queries_do_not_sort(self):
+        for minimax in Consts.minimaxType.values():
+            for sort_type in Consts.sortType.values():
+                population = self.make_population(minimax, sort_type)
+                ranking = self.ranking(population)
+                order = list(population.internalPop)
+                with patch.object(population, "sort") as sort:
+                    self.assertIs(population.bestRaw(), ranking[0])
+                    self.assertEqual(population.bestRaw(3).score, ranking[3].score)
+                    self.assertEqual(population.worstRaw().score, ranking[-1].score)
+                    self.assertEqual([ind.score for ind in population.bestRawIndividuals(5)],
+                                     [ind.score for ind in ranking[:5]])
+                    worst = population.worstRawIndexes(3)
+                    self.assertEqual([population[i].score for i in worst],
+                                     [ind.score for ind in ranking[::-1][:3]])
+                self.assertFalse(sort.called)
+                self.assertEqual(order, population.internalPop)
+
+    def test_queries_on_sorted_population(self):
+        population = self.make_population(Consts.minimaxType["minimize"], Consts.sortType["raw"])
+        population.sort()
+        self.assertEqual(population.bestRawIndividuals(3), population.internalPop[:3])
+        self.assertEqual(population.worstRawIndexes(2), [19, 18])
+        self.assertEqual(population.worstRawIndexes(30), list(range(19, -1, -1)))
+
+    def test_elitism_does_not_sort_the_offspring(self):
+        ga = make_engine(make_genome(8), population_size=20)
+        # The tournament doesn't cache the ranking of the generation
+        ga.selector.set(GTournamentSelector)
+        ga.setElitismReplacement(3)
+        ga.initialize()
+        ga.internalPop.evaluate()
+        ga.internalPop.sort()
+        elite = ga.internalPop.bestRawIndividuals(3)
+
+        sorts = []
+        original_sort = GPopulation.sort
+
+        def counting_sort(population):
+            if not population.sorted:
+                sorts.append(population)
+            original_sort(population)
+
+        with patch.object(GPopulation, "sort", counting_sort):
+            ga.step()
+        # The tournament doesn't need a ranking, so no population is sorted
+        self.assertEqual(sorts, [])
+        self.assertLessEqual(ga.bestIndividual().score, elite[0].score)
+
+    def test_step_scales_without_sorting(self):
+        ga = make_engine(make_genome(8), population_size=20)
+        ga.selector.set(GTournamentSelector)
+        ga.initialize()
+        ga.internalPop.evaluate()
+        ga.step()
+        population = ga.internalPop
+        self.assertFalse(population.sorted)
+        self.assertTrue(population.scaled)
+        self.assertIn("fitMax", population.stats)
+        # The selectors which need the ranking sort on demand, without scaling again
+        with patch.object(population, "scale") as scale:
+            population.sort()
+        self.assertFalse(scale.called)
+        self.assertTrue(population.sorted)
+
+    def test_elite_is_compared_with_the_running_best(self):
+        evaluated = []
+        genome = G1DList(1)
+        genome.evaluator.set(lambda chromosome: evaluated.append(chromosome[0]) or chromosome[0])
+        offspring = iter([8.0, 7.0, 1.0, 0.0])
+
+        def offspring_mutator(chromosome, **args):
+            chromosome[0] = next(offspring)
+            return 1
+
+        genome.mutator.set(offspring_mutator)
+        ga = make_engine(genome, population_size=4)
+        ga.setMinimax(Consts.minimaxType["maximize"])
+        ga.selector.set(GTournamentSelector)
+        ga.setCrossoverRate(0.0)
+        ga.setElitismReplacement(2)
+        ga.initialize()
+        for ind, gene in zip(ga.internalPop, [10.0, 7.5, 1.0, 0.0]):
+            ind.genomeList = [gene]
+        ga.internalPop.evaluate()
+        del evaluated[:]
+
+        ga.step()
+        # The 7.5 elite loses against the 8.0 offspring, the second best
+        # once the 10.0 elite is inserted
+        self.assertEqual(sorted(ind.score for ind in ga.internalPop), [1.0, 7.0, 8.0, 10.0])
+        # The elite was already evaluated, only the offspring are
+        self.assertEqual(evaluated, [8.0, 7.0, 1.0, 0.0])
+
+
+class GPopulationScoreArraysTestCase(TestCase):
+
+    def make_population(self, minimax=Consts.minimaxType["minimize"]):
+        ga = make_engine(make_genome(8), population_size=20)
+        ga.setMinimax(minimax)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        return population
+
+    def test_arrays_follow_the_population(self):
+        population = self.make_population()
+        self.assertEqual(list(population.getScores()), [ind.score for ind in population])
+        population.sort()
+        self.assertEqual(list(population.getScores()), [ind.score for ind in population])
+        self.assertEqual(list(population.getFitness()), [ind.fitness for ind in population])
+
+        population[0] = population[-1].clone()
+        population[0].score = -1.0
+        self.assertEqual(population.getScores()[0], -1.0)
+
+    def test_statistics(self):
+        population = self.make_population()
+        scores = [ind.score for ind in population]
+        average = sum(scores) / len(scores)
+        variance = sum((score - average) ** 2 for score in scores) / (len(scores) - 1)
+        stats = population.getStatistics()
+        self.assertEqual(stats["rawMax"], max(scores))
+        self.assertEqual(stats["rawMin"], min(scores))
+        self.assertAlmostEqual(stats["rawAve"], average)
+        self.assertAlmostEqual(stats["rawVar"], variance)
+
+    def test_sort_is_stable(self):
+        for minimax in Consts.minimaxType.values():
+            population = self.make_population(minimax)
+            population.setSortType(Consts.sortType["raw"])
+            expected = sorted(population, key=lambda ind: ind.score,
+                              reverse=minimax == Consts.minimaxType["maximize"])
+            population.sort()
+            self.assertEqual(population.internalPop, expected)
+            self.assertEqual([expected.index(population[i]) for i in population.getRawRanking()],
+                             list(range(len(population))))
+
+    def test_set_fitness(self):
+        population = self.make_population()
+        population.setFitness([float(i) for i in range(len(population))])
+        self.assertEqual([ind.fitness for ind in population], [float(i) for i in range(len(population))])
+        self.assertRaises(ValueError, population.setFitness, [1.0])
+
+    def test_scaling_schemes(self):
+        population = self.make_population(Consts.minimaxType["maximize"])
+        for scheme in (Scaling.LinearScaling, Scaling.SigmaTruncScaling, Scaling.PowerLawScaling,
+                       Scaling.BoltzmannScaling, Scaling.ExponentialScaling, Scaling.SaturatedScaling):
+            population.scaleMethod.set(scheme)
+            population.scale()
+            self.assertEqual(list(population.getFitness()), [ind.fitness for ind in population], scheme)
+            self.assertEqual(population.stats["fitMax"], max(ind.fitness for ind in population))
+
+    def test_rank_scaling(self):
+        population = self.make_population(Consts.minimaxType["maximize"])
+        population.scaleMethod.set(Scaling.RankScaling)
+        population.sort()
+        self.assertEqual(population[0].fitness, 1.0)
+        self.assertEqual(population[0].score, max(ind.score for ind in population))
+        self.assertEqual(population[3].fitness, 0.5)
+
+    def test_linear_scaling_negative_scores(self):
+        population = self.make_population()
+        population[0].score = -1.0
+        population.clearFlags()
+        self.assertRaises(ValueError, population.scale)
+
+
+class PartialRankingTestCase(TestCase):
+
+    def test_partial_ranking_is_the_head_of_the_ranking(self):
+        values = scoreArray([3.0, 1.0, 2.0, 1.0, 3.0, 0.5, 2.0, 1.0])
+        for descending in (True, False):
+            ranking = rankIndexes(values, descending)
+            for count in range(len(values) + 2):
+                self.assertEqual(partialRankIndexes(values, count, descending), ranking[:count])
+
+    def test_raw_ranking_is_cached(self):
+        ga = make_engine(make_genome(8), population_size=20)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        ranking = population.getRawRanking()
+        self.assertIs(population.getRawRanking(), ranking)
+        self.assertIs(population.bestRaw(5), population[ranking[5]])
+        self.assertEqual(population.worstRawIndexes(3), ranking[::-1][:3])
+
+        population.clearFlags()
+        self.assertIsNone(population.rawRanking)
+        self.assertIs(population.bestRaw(), population[ranking[0]])
+        self.assertIsNone(population.rawRanking)
+
+
+class DigestCollision(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def getGenotypeDigest(self):
+        return 0
+
+    def compare(self, other):
+        return 0 if self.value == other.value else -1
+
+
+class ComparableBinaryString(G1DBinaryString):
+    """ A binary string with the compare() method, so its populations are
+    initialized with full diversity """
+
+    def compare(self, other):
+        return 0 if self.genomeList == other.genomeList else -1
+
+    def clone(self):
+        newcopy = ComparableBinaryString(self.stringLength)
+        self.copy(newcopy)
+        return newcopy
+
+
+class GenotypeIndexTestCase(TestCase):
+
+    def test_duplicates(self):
+        genome = make_genome()
+        genome.genomeList = list(range(8))
+        index = GenotypeIndex([genome])
+        self.assertFalse(index.add(genome.clone()))
+        self.assertIn(genome.clone(), index)
+
+        other = genome.clone()
+        other.genomeList.reverse()
+        self.assertNotIn(other, index)
+        self.assertTrue(index.add(other))
+        self.assertEqual(len(index), 2)
+
+        index.clear()
+        self.assertEqual(len(index), 0)
+        self.assertTrue(index.add(genome))
+
+    def test_collisions_are_compared(self):
+        index = GenotypeIndex([DigestCollision(1), DigestCollision(2)])
+        self.assertEqual(len(index), 2)
+        self.assertFalse(index.add(DigestCollision(2)))
+        self.assertIn(DigestCollision(1), index)
+        self.assertNotIn(DigestCollision(3), index)
+
+    def test_genomes_without_digest(self):
+        genome = make_genome()
+        genome.getGenotypeDigest = lambda: None
+        index = GenotypeIndex()
+        self.assertTrue(index.add(genome))
+        self.assertTrue(index.add(genome))
+        self.assertEqual(len(index), 0)
+
+    def test_full_diversity_initialization(self):
+        ga = make_binary_engine(4, 12, ComparableBinaryString)
+        ga.initialize()
+        keys = [ind.getGenotypeKey() for ind in ga.getPopulation()]
+        self.assertEqual(len(set(keys)), 12)
+
+    def test_initialization_of_small_genotype_space(self):
+        ga = make_binary_engine(2, 10, ComparableBinaryString)
+        ga.initialize()
+        keys = [ind.getGenotypeKey() for ind in ga.getPopulation()]
+        self.assertEqual(len(set(keys)), 4)
+
+    def test_only_comparable_genomes_are_diversified(self):
+        # The seeded runs of the other genomes draw the same genes as before
+        populations = []
+        for full_diversity in (True, False):
+            ga = make_binary_engine(4, 12)
+            ga.getPopulation().oneSelfGenome.setParams(full_diversity=full_diversity)
+            ga.initialize()
+            populations.append([ind.getGenotypeKey() for ind in ga.getPopulation()])
+        self.assertEqual(populations[0], populations[1])
+        self.assertLess(len(set(populations[0])), 12)
+
+    def test_initialization_without_full_diversity(self):
+        ga = make_binary_engine(2, 10)
+        ga.getPopulation().oneSelfGenome.setParams(full_diversity=False)
+        ga.initialize()
+        self.assertEqual(len(ga.getPopulation()), 10)
+
+    def test_duplicates_policy(self):
+        for policy in ("mutate", "replace"):
+            ga = make_binary_engine(5, 16)
+            ga.setMutationRate(0.3)
+            ga.setDuplicatesPolicy(Consts.duplicatesPolicy[policy])
+            ga.initialize()
+            ga.getPopulation().evaluate()
+            for generation in range(5):
+                ga.step()
+                keys = [ind.getGenotypeKey() for ind in ga.getPopulation()]
+                self.assertEqual(len(set(keys)), 16)
+                self.assertTrue(all(ind.score == sum(ind) for ind in ga.getPopulation()))
+
+    def test_invalid_duplicates_policy(self):
+        ga = make_engine()
+        self.assertRaises(TypeError, ga.setDuplicatesPolicy, "mutate")
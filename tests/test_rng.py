@@ -0,0 +1,123 @@
+import random
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyevolve import Util
+from pyevolve.GSimpleGA import GSimpleGA
+from pyevolve.GSteadyStateGA import GSteadyStateGA
+from pyevolve.initializations.InitializationTree import GTreeInitializatorInteger
+from pyevolve.perturbations.CrossoverTree import GTreeCrossoverSinglePointStrict
+from pyevolve.perturbations.MutatorTree import GTreeMutatorIntegerRange
+from pyevolve.representations.GTree import GTree
+from tests.helpers import make_engine, make_genome, ThreadCountingEvaluator
+
+
+def run(engine):
+    engine.evolve()
+    return [(ind.getGenotypeKey(), ind.score) for ind in engine.getPopulation()]
+
+
+def tree_eval(genome):
+    return float(sum(node.getData() for node in genome.getAllNodes()))
+
+
+def tree_shape(node):
+    return node.getData(), tuple(tree_shape(child) for child in node.getChilds())
+
+
+def run_tree(between_steps=None):
+    # The tree defaults are not in Consts, they are set here for the clones too
+    with patch.multiple('pyevolve.Consts', create=True,
+                        CDefGTreeInit=GTreeInitializatorInteger,
+                        CDefGGTreeMutator=GTreeMutatorIntegerRange,
+                        CDefGTreeCrossover=GTreeCrossoverSinglePointStrict):
+        genome = GTree()
+        genome.setParams(max_depth=4, max_siblings=2, method="ramped")
+        genome.evaluator.set(tree_eval)
+        engine = GSimpleGA(genome, seed=42)
+        engine.setGenerations(5)
+        engine.setPopulationSize(10)
+        engine.setMutationRate(0.2)
+        if between_steps is not None:
+            between_steps()
+        engine.evolve()
+    return [(tree_shape(ind.getRoot()), ind.score) for ind in engine.getPopulation()]
+
+
+def step_all(engine, between_steps=None):
+    engine.initialize()
+    while not engine.step():
+        if between_steps is not None:
+            between_steps()
+    return [(ind.getGenotypeKey(), ind.score) for ind in engine.getPopulation()]
+
+
+class EngineRandomTestCase(TestCase):
+
+    def test_same_seed_gives_same_evolution(self):
+        self.assertEqual(run(make_engine()), run(make_engine()))
+
+    def test_global_random_state_is_not_used(self):
+        expected = step_all(make_engine())
+        self.assertEqual(expected, step_all(make_engine(), lambda: random.seed(random.random())))
+
+    def test_interleaved_engines_are_independent(self):
+        expected = step_all(make_engine())
+        first, second = make_engine(), make_engine()
+        second.initialize()
+        second.step()
+        self.assertEqual(expected, step_all(first, second.step))
+
+    def test_tree_evolution_does_not_use_global_random(self):
+        expected = run_tree()
+        self.assertEqual(expected, run_tree(lambda: random.seed(random.random())))
+
+    def test_steady_state_same_seed(self):
+        def make():
+            ga = GSteadyStateGA(make_genome(), seed=7)
+            ga.setGenerations(4)
+            ga.setPopulationSize(10)
+            return ga
+        self.assertEqual(run(make()), run(make()))
+
+    def test_results_do_not_depend_on_the_workers(self):
+        expected = run(make_engine())
+        genome = make_genome()
+        evaluator = ThreadCountingEvaluator()
+        genome.evaluator.set(evaluator)
+        engine = make_engine(genome)
+        with patch('pyevolve.GPopulation.MULTI_PROCESSING', True):
+            engine.setMultiProcessing(True, max_processes=2, backend="thread")
+            result = run(engine)
+        self.assertTrue(evaluator.threads)
+        self.assertEqual(expected, result)
+
+    def test_seed_is_generated_when_missing(self):
+        self.assertEqual(42, make_engine().getSeed())
+        self.assertIsInstance(GSimpleGA(make_genome()).getSeed(), int)
+
+    def test_spawn_seed_is_deterministic(self):
+        engine = make_engine()
+        self.assertEqual(engine.spawnSeed(("island", 1)), make_engine().spawnSeed(("island", 1)))
+        self.assertNotEqual(engine.spawnSeed(("island", 1)), engine.spawnSeed(("island", 2)))
+        self.assertEqual(engine.spawnRandom("worker").random(), make_engine().spawnRandom("worker").random())
+
+
+class UtilRandomTestCase(TestCase):
+
+    def test_get_random_prefers_rng_argument(self):
+        rng = random.Random(1)
+        self.assertIs(rng, Util.getRandom({"rng": rng, "ga_engine": make_engine()}))
+
+    def test_get_random_uses_engine(self):
+        engine = make_engine()
+        self.assertIs(engine.getRandom(), Util.getRandom({"ga_engine": engine}))
+
+    def test_get_random_falls_back_to_module(self):
+        self.assertIs(random, Util.getRandom({}))
+
+    def test_flip_coin_uses_rng(self):
+        rng = random.Random(3)
+        flips = [Util.randomFlipCoin(0.5, rng) for _ in range(20)]
+        rng.seed(3)
+        self.assertEqual([rng.random() <= 0.5 for _ in range(20)], flips)
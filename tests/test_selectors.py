@@ -0,0 +1,92 @@
+import random
+from unittest import TestCase
+
+from pyevolve import Consts
+from pyevolve.GPopulation import GPopulation
+from pyevolve.selections import SelectionRank, Selectors
+from tests.helpers import make_engine, make_genome
+
+
+BATCH_SELECTORS = [
+    Selectors.GRankSelector,
+    Selectors.GUniformSelector,
+    Selectors.GTournamentSelector,
+    Selectors.GTournamentSelectorAlternative,
+    Selectors.GRouletteWheel,
+    SelectionRank.SelectorFitnessProportional,
+    SelectionRank.SelectorLinearRanking,
+    SelectionRank.SelectorExponentialRanking,
+    SelectionRank.SelectorSplitRanking,
+    SelectionRank.SelectorNewTournament,
+    SelectionRank.SelectorExplorationExploitationBalance,
+]
+
+
+class BatchSelectorsTestCase(TestCase):
+
+    def setUp(self):
+        random.seed(42)
+        self.population = GPopulation(make_genome())
+        self.population.setPopulationSize(30)
+        self.population.create(minimax=Consts.minimaxType["minimize"])
+        self.population.evaluate()
+        self.population.sort()
+
+    def test_batch_selection(self):
+        members = set(map(id, self.population))
+        for popID, selector in enumerate(BATCH_SELECTORS):
+            selected = selector.batch(self.population, 50, popID=("batch", popID))
+            self.assertEqual(len(selected), 50, selector.__name__)
+            self.assertTrue(all(id(ind) in members for ind in selected), selector.__name__)
+
+    def test_rank_batch_selects_the_best(self):
+        best = self.population.bestRaw().score
+        selected = Selectors.GRankSelector.batch(self.population, 20, popID="rank")
+        self.assertTrue(all(ind.score == best for ind in selected))
+
+    def test_roulette_batch_matches_the_single_selection(self):
+        random.seed(1)
+        single = [Selectors.GRouletteWheel(self.population, popID="wheel") for i in range(20)]
+        random.seed(1)
+        batch = Selectors.GRouletteWheel.batch(self.population, 20, popID="wheel")
+        self.assertEqual([id(ind) for ind in single], [id(ind) for ind in batch])
+
+    def test_ranking_batch_matches_the_single_selection(self):
+        selector = SelectionRank.SelectorLinearRanking
+        random.seed(1)
+        single = [selector(self.population, popID="ranking") for i in range(20)]
+        random.seed(1)
+        batch = selector.batch(self.population, 20, popID="ranking")
+        self.assertEqual([id(ind) for ind in single], [id(ind) for ind in batch])
+
+
+class EngineBatchSelectionTestCase(TestCase):
+
+    def test_engine_uses_the_batch_selector(self):
+        calls = []
+
+        def batch(population, count, **args):
+            calls.append(count)
+            return Selectors.GUniformSelector_Batch(population, count, **args)
+
+        def selector(population, **args):
+            raise AssertionError("the single selection should not be used")
+
+        selector.batch = batch
+        ga = make_engine(generations=3, population_size=12)
+        ga.selector.set(selector)
+        ga.evolve()
+        self.assertEqual(calls, [12, 12, 12])
+
+    def test_engine_falls_back_to_single_selection(self):
+        calls = []
+
+        def selector(population, **args):
+            calls.append(args["popID"])
+            return Selectors.GUniformSelector(population, **args)
+
+        ga = make_engine(generations=2, population_size=10)
+        ga.selector.set(selector)
+        ga.evolve()
+        self.assertEqual(calls, [0] * 10 + [1] * 10)
+        self.assertEqual(len(ga.selectBatch(4, popID=2)), 4)
@@ -0,0 +1,78 @@
+import os
+import pickle
+import subprocess
+import sys
+from multiprocessing import get_context
+from unittest import TestCase, skipUnless
+
+from pyevolve import SharedData
+
+
+def matrix_sum(matrix):
+    return float(matrix.sum())
+
+
+@skipUnless(SharedData.HAS_NUMPY, "numpy is not available")
+class SharedDataTestCase(TestCase):
+
+    backend = None
+
+    def setUp(self):
+        self.data = [[float(i * j) for j in range(30)] for i in range(30)]
+        self.matrix = SharedData.registerSharedArray("test_matrix", self.data, backend=self.backend)
+
+    def tearDown(self):
+        SharedData.unregisterSharedArray("test_matrix")
+
+    def test_registered_array(self):
+        self.assertEqual(self.matrix[3][4], 12.0)
+        self.assertEqual(self.matrix.shape, (30, 30))
+        self.assertIs(SharedData.getSharedArray("test_matrix"), self.matrix)
+        self.assertIsNone(SharedData.getSharedArray("missing"))
+
+    def test_array_is_read_only(self):
+        with self.assertRaises(ValueError):
+            self.matrix[0][0] = 1.0
+
+    def test_duplicated_name(self):
+        self.assertRaises(KeyError, SharedData.registerSharedArray, "test_matrix", [1, 2])
+
+    def test_pickled_as_reference(self):
+        data = pickle.dumps(self.matrix)
+        self.assertLess(len(data), self.matrix.nbytes)
+        self.assertIs(pickle.loads(data), self.matrix)
+
+    def test_slices_are_pickled_as_copies(self):
+        restored = pickle.loads(pickle.dumps(self.matrix[2:4]))
+        self.assertEqual(restored.tolist(), self.data[2:4])
+
+    def test_worker_processes_attach(self):
+        expected = sum(map(sum, self.data))
+        with get_context("spawn").Pool(1) as pool:
+            self.assertEqual(pool.map(matrix_sum, [self.matrix]), [expected])
+
+    def test_independent_process_attaches(self):
+        code = ("import sys; from pyevolve import SharedData; "
+                "print(SharedData.attachSharedArray(eval(sys.argv[1])).sum())")
+        descriptor = SharedData.getSharedArrayDescriptor("test_matrix")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        output = subprocess.check_output([sys.executable, "-c", code, repr(descriptor)], env=env)
+        self.assertEqual(float(output), sum(map(sum, self.data)))
+        # The memory is kept after the other process exits
+        if descriptor[1] == SharedData.BACKEND_SHARED_MEMORY:
+            SharedData.shared_memory.SharedMemory(name=descriptor[2]).close()
+        else:
+            self.assertTrue(os.path.exists(descriptor[2]))
+
+    def test_memory_is_removed_by_the_owner(self):
+        descriptor = SharedData.getSharedArrayDescriptor("test_matrix")
+        SharedData.unregisterSharedArray("test_matrix")
+        self.assertIsNone(SharedData.getSharedArray("test_matrix"))
+        self.assertRaises(FileNotFoundError, SharedData.attachSharedArray, descriptor)
+        self.matrix = SharedData.registerSharedArray("test_matrix", self.data, backend=self.backend)
+
+
+@skipUnless(SharedData.HAS_NUMPY, "numpy is not available")
+class SharedDataMemmapTestCase(SharedDataTestCase):
+
+    backend = SharedData.BACKEND_MEMMAP
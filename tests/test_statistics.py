@@ -1,8 +1,17 @@
+import csv
+import os
+import weakref
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
 from builtins import int
 
+from pyevolve import Consts
+from pyevolve import GSimpleGA
 from pyevolve import Statistics
+from pyevolve.DBAdapters import DBFileCSV
+from pyevolve.GSteadyStateGA import GSteadyStateGA
+from tests.helpers import make_engine, make_genome
 
 
 class StatisticsTestCase(TestCase):
@@ -55,3 +64,230 @@ class StatisticsTestCase(TestCase):
         self.assertEqual(self._stats.descriptions, target.descriptions)
         self.assertIsNot(self._stats.internalDict, target.internalDict)
         self.assertIsNot(self._stats.descriptions, target.descriptions)
+
+
+class TimingsTestCase(TestCase):
+
+    def test_close_stores_record_in_seconds(self):
+        timings = Statistics.Timings()
+        timings.current["evaluation"] = 2500000000
+        stats = Statistics.Statistics()
+        record = timings.close(3, stats)
+        self.assertEqual(record["generation"], 3)
+        self.assertEqual(record["evaluation"], 2.5)
+        self.assertEqual(stats["timeEvaluation"], 2.5)
+        self.assertEqual(timings.current["evaluation"], 0)
+        self.assertEqual(len(timings), 1)
+
+    def test_times_are_optional_statistics(self):
+        stats = Statistics.Statistics()
+        fields = stats.getFields()
+        self.assertNotIn("Evaluation time (seconds)", repr(stats))
+        timings = Statistics.Timings()
+        timings.current["evaluation"] = 2500000000
+        timings.close(0, stats)
+        self.assertEqual(stats.getFields(), fields)
+        self.assertNotIn("timeEvaluation", dict(stats.items()))
+        self.assertEqual(stats.asTuple(["rawMax", "timeEvaluation"]), (0.0, 2.5))
+        self.assertIn("Evaluation time (seconds)", repr(stats))
+        stats.clear()
+        self.assertEqual(stats["timeEvaluation"], 0.0)
+
+    def test_lap_accumulates_the_phase(self):
+        timings = Statistics.Timings()
+        timings.start()
+        timings.lap("sort")
+        timings.lap("sort")
+        self.assertGreater(timings.current["sort"], 0)
+        self.assertEqual(timings.current["selection"], 0)
+
+    def test_totals(self):
+        timings = Statistics.Timings()
+        for generation in range(3):
+            timings.current["mutation"] = 1000000000
+            timings.close(generation)
+        self.assertEqual(timings.totals()["mutation"], 3.0)
+        timings.clear()
+        self.assertEqual(len(timings), 0)
+
+
+class EngineTimingsTestCase(TestCase):
+
+    def test_disabled_by_default(self):
+        ga = make_engine()
+        ga.evolve()
+        self.assertIsNone(ga.getTimings())
+        self.assertEqual(ga.getStatistics()["timeEvaluation"], 0.0)
+
+    def test_records_for_each_generation(self):
+        ga = make_engine(generations=4)
+        ga.setTimings(True)
+        ga.evolve()
+        records = ga.getTimings().records
+        self.assertEqual([record["generation"] for record in records], list(range(5)))
+        self.assertTrue(all(record["evaluation"] > 0 for record in records))
+        self.assertTrue(all(record["selection"] > 0 for record in records[1:]))
+        self.assertEqual(ga.getStatistics()["timeSelection"], records[-1]["selection"])
+
+    def test_steady_state_records(self):
+        ga = GSteadyStateGA(make_genome(), seed=1)
+        ga.setGenerations(3)
+        ga.setPopulationSize(10)
+        ga.setTimings(True)
+        ga.evolve()
+        records = ga.getTimings().records
+        self.assertEqual(len(records), 4)
+        self.assertTrue(all(record["crossover"] > 0 for record in records[1:]))
+
+    def test_invalid_flag(self):
+        self.assertRaises(TypeError, make_engine().setTimings, 1)
+
+
+class ExtendedStatisticsTestCase(TestCase):
+
+    def test_providers_are_called_when_asked(self):
+        stats = Statistics.Statistics()
+        calls = []
+
+        def provider():
+            calls.append(1)
+            return {"rawQ1": 1.0, "rawMed": 2.0, "rawQ3": 3.0}
+
+        stats.setProvider(("rawQ1", "rawMed", "rawQ3"), provider)
+        self.assertNotIn("rawMed", dict(stats.items()))
+        self.assertEqual(len(stats.asTuple()), len(stats))
+        self.assertEqual(calls, [])
+
+        self.assertEqual(stats.asTuple(["rawMax", "rawMed", "rawQ3"]), (0.0, 2.0, 3.0))
+        self.assertEqual(stats["rawQ1"], 1.0)
+        self.assertEqual(calls, [1])
+        stats.clearLazy()
+        self.assertEqual(stats["rawQ1"], 1.0)
+        self.assertEqual(calls, [1, 1])
+
+    def test_defaults_without_provider(self):
+        stats = Statistics.Statistics()
+        self.assertEqual(stats.items(["uniqueGenotypes", "rawBest"]), [("uniqueGenotypes", 0), ("rawBest", 0.0)])
+
+    def test_population_statistics_keep_no_population(self):
+        ga = make_engine()
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        stats = population.getStatistics()
+        population = weakref.ref(population)
+        ga.internalPop = None
+        self.assertIsNone(population())
+        self.assertEqual(stats["rawMed"], 0.0)
+
+    def test_unknown_fields(self):
+        stats = Statistics.Statistics()
+        self.assertRaises(KeyError, stats.getFields, ["rawMax", "unknown"])
+        self.assertRaises(KeyError, stats.setProvider, ("rawMax",), dict)
+        self.assertRaises(KeyError, stats.__getitem__, "unknown")
+
+    def test_population_statistics(self):
+        ga = make_engine(make_genome(8), population_size=20)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.evaluate()
+        scores = sorted(ind.score for ind in population)
+        stats = population.getStatistics()
+        self.assertAlmostEqual(stats["rawMed"], (scores[9] + scores[10]) / 2.0)
+        self.assertAlmostEqual(stats["rawQ1"], scores[4] + (scores[5] - scores[4]) * 0.75)
+        unique = stats["uniqueGenotypes"]
+        self.assertEqual(unique, len(set(ind.getGenotypeKey() for ind in population)))
+        self.assertEqual(stats["rawBest"], scores[0])
+
+        population[0] = population[1].clone()
+        self.assertEqual(population.getStatistics()["uniqueGenotypes"], unique - 1)
+
+    def test_best_so_far(self):
+        ga = make_engine(make_genome(10), generations=15)
+        ga.setElitism(False)
+        bests = []
+        ga.stepCallback.set(lambda engine: bests.append(engine.bestIndividual().score))
+        ga.evolve()
+        bests.append(ga.bestIndividual().score)
+        stats = ga.getStatistics()
+        self.assertEqual(stats["rawBest"], min(bests))
+        history = ga.getPopulation().scoreHistory
+        self.assertEqual(history.getBest(), min(bests))
+        self.assertGreaterEqual(stats["rawImprovement"], 0.0)
+
+    def test_adapter_fields(self):
+        with TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "stats.csv")
+            adapter = DBFileCSV(filename=filename, identify="run")
+            adapter.setStatsFields(["rawMin", "rawMed", "uniqueGenotypes"])
+            ga = make_engine(make_genome(8), generations=3)
+            ga.setDBAdapter(adapter)
+            ga.evolve()
+            with open(filename) as handle:
+                rows = [row for row in csv.reader(handle, delimiter=";") if row]
+        self.assertEqual([row[1] for row in rows], ["0", "1", "2"])
+        self.assertTrue(all(len(row) == 5 for row in rows))
+        self.assertRaises(KeyError, adapter.setStatsFields, ["unknown"])
+
+    def test_improvement_criteria(self):
+        ga = make_engine(make_genome(4), generations=200)
+        ga.terminationCriteria.set(GSimpleGA.ImprovementCriteria)
+        ga.evolve()
+        self.assertLess(ga.getCurrentGeneration(), 200)
+        self.assertEqual(ga.getStatistics()["rawImprovement"], 0.0)
+
+
+class RunningStatisticsTestCase(TestCase):
+
+    def test_single_pass(self):
+        values = [4.0, 7.0, 13.0, 16.0]
+        running = Statistics.RunningStatistics()
+        running.extend(values)
+        self.assertEqual(running.count, 4)
+        self.assertAlmostEqual(running.mean, 10.0)
+        self.assertAlmostEqual(running.getVariance(), 30.0)
+        self.assertEqual((running.minimum, running.maximum), (4.0, 16.0))
+
+        pushed = Statistics.RunningStatistics()
+        for value in values:
+            pushed.push(value)
+        self.assertEqual((pushed.mean, pushed.m2), (running.mean, running.m2))
+
+    def test_large_offset(self):
+        running = Statistics.RunningStatistics()
+        running.extend([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+        self.assertAlmostEqual(running.getVariance(), 30.0)
+
+    def test_replace(self):
+        running = Statistics.RunningStatistics()
+        running.extend([1.0, 2.0, 3.0])
+        running.replace(1.0, 5.0)
+        self.assertAlmostEqual(running.mean, 10.0 / 3)
+        self.assertAlmostEqual(running.getVariance(), 7.0 / 3)
+        running.remove(2.0)
+        running.remove(3.0)
+        running.remove(5.0)
+        self.assertEqual((running.count, running.mean, running.getVariance()), (0, 0.0, 0.0))
+
+
+class ScoreHistoryTestCase(TestCase):
+
+    def test_minimize(self):
+        history = Statistics.ScoreHistory(window=3)
+        minimize = Consts.minimaxType["minimize"]
+        for generation, score in enumerate([10.0, 8.0, 9.0, 5.0, 5.0]):
+            history.update(generation, score, minimize)
+        self.assertEqual(history.getBest(), 5.0)
+        # The window has the generations 1 to 4, the best went from 8 to 5
+        self.assertEqual(history.getImprovementRate(), 1.0)
+
+    def test_same_generation_is_replaced(self):
+        history = Statistics.ScoreHistory()
+        maximize = Consts.minimaxType["maximize"]
+        history.update(0, 1.0, maximize)
+        history.update(1, 2.0, maximize)
+        history.update(1, 4.0, maximize)
+        self.assertEqual(history.getImprovementRate(), 3.0)
+        history.clear()
+        self.assertIsNone(history.getBest())
+        self.assertEqual(history.getImprovementRate(), 0.0)
@@ -0,0 +1,160 @@
+from math import sqrt
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyevolve import Consts
+from pyevolve.GSteadyStateGA import GSteadyStateGA
+from tests.helpers import CountingEvaluator, ThreadCountingEvaluator, displacement_eval, make_genome
+
+
+class GSteadyStateGATestCase(TestCase):
+
+    def setUp(self):
+        self.genome = make_genome()
+        self.counter = CountingEvaluator()
+        self.genome.evaluator.set(self.counter)
+
+    def make_engine(self, generations=10, population_size=20):
+        ga = GSteadyStateGA(self.genome, seed=42)
+        ga.setMinimax(Consts.minimaxType["minimize"])
+        ga.setGenerations(generations)
+        ga.setPopulationSize(population_size)
+        ga.setMutationRate(0.2)
+        return ga
+
+    def assertSortedPopulation(self, ga):
+        scores = [ind.score for ind in ga.getPopulation()]
+        self.assertEqual(scores, sorted(scores))
+        for ind in ga.getPopulation():
+            self.assertTrue(ind.isEvaluated())
+            self.assertEqual(ind.score, displacement_eval(ind))
+
+    def test_population_is_kept_sorted(self):
+        ga = self.make_engine()
+        steps = []
+        ga.stepCallback.set(lambda engine: steps.append(engine.getCurrentStep()))
+        ga.evolve()
+        self.assertSortedPopulation(ga)
+        self.assertEqual(len(ga.getPopulation()), 20)
+        self.assertEqual(ga.getCurrentGeneration(), 10)
+        self.assertEqual(steps[:3], [0, 10, 20])
+
+    def test_only_offspring_are_evaluated(self):
+        ga = self.make_engine(generations=5)
+        ga.setOffspringCount(4)
+        ga.evolve()
+        # The initial population and at most the offspring of 5 steps for each generation
+        self.assertLessEqual(self.counter.calls, 20 + 5 * 5 * 4)
+        self.assertEqual(ga.getCurrentStep(), 25)
+
+    def test_incremental_statistics(self):
+        ga = self.make_engine(generations=3)
+        ga.setReplacement(Consts.replacementType["tournament"])
+        ga.evolve()
+        stats = ga.getStatistics()
+        scores = [ind.score for ind in ga.getPopulation()]
+        average = sum(scores) / float(len(scores))
+        variance = sum((s - average) ** 2 for s in scores) / float(len(scores) - 1)
+        self.assertEqual(stats["rawMin"], min(scores))
+        self.assertEqual(stats["rawMax"], max(scores))
+        self.assertAlmostEqual(stats["rawAve"], average)
+        self.assertAlmostEqual(stats["rawVar"], variance)
+        self.assertAlmostEqual(stats["rawDev"], sqrt(variance))
+
+    def test_steps_leave_the_population_unstatted(self):
+        ga = self.make_engine(generations=1)
+        ga.initialize()
+        population = ga.getPopulation()
+        population.statistics()
+        ga.step()
+        self.assertFalse(population.statted)
+        population.scale()
+        fitness = population.getFitness()
+        self.assertEqual(population.getStatistics()["fitMax"], max(fitness))
+        self.assertEqual(population.getStatistics()["rawMin"], population[0].score)
+
+    def test_tournament_replacement_keeps_the_elite(self):
+        ga = self.make_engine(generations=1)
+        ga.setReplacement(Consts.replacementType["tournament"])
+        ga.setElitismReplacement(3)
+        ga.initialize()
+        ga.getPopulation().evaluate()
+        ga.getPopulation().sort()
+        elite = ga.getPopulation().internalPop[:3]
+        ga.time_init = 0
+        ga.step()
+        self.assertSortedPopulation(ga)
+        best = ga.bestIndividual().score
+        self.assertLessEqual(best, min(ind.score for ind in elite))
+
+    def test_settings(self):
+        ga = self.make_engine()
+        self.assertRaises(ValueError, ga.setOffspringCount, 0)
+        self.assertRaises(TypeError, ga.setReplacement, 5)
+        self.assertRaises(ValueError, ga.setSortType, Consts.sortType["scaled"])
+        self.assertIn("GSteadyStateGA", repr(ga))
+
+
+class GSteadyStateGAAsynchronousTestCase(TestCase):
+
+    def make_engine(self, genome, generations=5):
+        ga = GSteadyStateGA(genome, seed=42)
+        ga.setMinimax(Consts.minimaxType["minimize"])
+        ga.setGenerations(generations)
+        ga.setPopulationSize(20)
+        ga.setAsynchronous(True)
+        return ga
+
+    def assertEvolved(self, ga, generations):
+        scores = [ind.score for ind in ga.getPopulation()]
+        self.assertEqual(scores, sorted(scores))
+        for ind in ga.getPopulation():
+            self.assertEqual(ind.score, displacement_eval(ind))
+        self.assertEqual(generations, list(range(ga.getGenerations())))
+        # Each generation inserts as many individuals as the population size
+        self.assertGreaterEqual(ga.getCurrentStep(), 20 * ga.getGenerations())
+
+    def test_thread_backend(self):
+        genome = make_genome()
+        counter = ThreadCountingEvaluator()
+        genome.evaluator.set(counter)
+        ga = self.make_engine(genome)
+        ga.setMultiProcessing(True, False, 2, backend="thread")
+        generations = []
+        ga.stepCallback.set(lambda engine: generations.append(engine.getCurrentGeneration()))
+        ga.evolve()
+        self.assertEvolved(ga, generations)
+        self.assertGreater(len(counter.threads), 0)
+        self.assertGreater(ga.getStatistics()["evalUtilization"], 0.0)
+
+    @patch("pyevolve.GPopulation.MULTI_PROCESSING", True)
+    def test_process_backend(self):
+        for full_copy in (False, True):
+            ga = self.make_engine(make_genome(), generations=3)
+            ga.setMultiProcessing(True, full_copy, 2)
+            generations = []
+            ga.stepCallback.set(lambda engine: generations.append(engine.getCurrentGeneration()))
+            ga.evolve()
+            self.assertEvolved(ga, generations)
+
+    def test_fitness_cache(self):
+        genome = make_genome(size=4)
+        counter = ThreadCountingEvaluator()
+        genome.evaluator.set(counter)
+        ga = self.make_engine(genome)
+        ga.setMultiProcessing(True, False, 2, backend="thread")
+        ga.setFitnessCache(True)
+        ga.evolve()
+        # There are only 24 permutations of 4 genes
+        self.assertLessEqual(counter.calls, 24)
+        self.assertGreater(ga.getStatistics()["cacheHits"], 0)
+
+    def test_synchronous_without_pool(self):
+        genome = make_genome()
+        counter = CountingEvaluator()
+        genome.evaluator.set(counter)
+        ga = self.make_engine(genome)
+        self.assertRaises(TypeError, ga.setAsynchronous, 1)
+        ga.evolve()
+        self.assertFalse(ga.isAsynchronous())
+        self.assertEqual(ga.getCurrentStep(), 5 * 10)
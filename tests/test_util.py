@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from pyevolve import Consts
 from pyevolve import Util
 
 
@@ -17,3 +18,7 @@ class UtilTestCase(TestCase):
         _list = [[1, 2, 3], [4, 5, 6]]
         Util.list2DSwapElement(_list, (0, 1), (1, 1))
         self.assertEqual(_list, [[1, 5, 3], [4, 2, 6]])
+
+    def test_getTypeName(self):
+        self.assertEqual(Util.getTypeName(Consts.duplicatesPolicy, Consts.duplicatesPolicy["mutate"]), "mutate")
+        self.assertRaises(ValueError, Util.getTypeName, Consts.duplicatesPolicy, -1)